@@ -86,6 +86,14 @@ var ApiErrors = struct {
 	},
 }
 
+// A code shared by several catalog entries resolves to the first one declared.
+var apiErrorsByCode = map[ApiErrorCode]ApiErrorEntry{
+	CommonErrUnknown:     ApiErrorsByID["CommonErr.UNKNOWN"],
+	CommonErrTokenExpire: ApiErrorsByID["CommonErr.TOKEN_EXPIRE"],
+	DemoErrUnknown:       ApiErrorsByID["DemoErr.UNKNOWN"],
+	DemoErrRateLimited:   ApiErrorsByID["DemoErr.RATE_LIMITED"],
+}
+
 var routeApiErrorsByCode = map[string]map[ApiErrorCode]ApiErrorEntry{
 	"api.api.channel.ws": {
 		CommonErrUnknown:     ApiErrorsByID["CommonErr.UNKNOWN"],
@@ -247,12 +255,8 @@ func LookupApiErrorByCode(code ApiErrorCode, routeID string) (ApiErrorEntry, boo
 			return entry, true
 		}
 	}
-	for _, entry := range ApiErrorsByID {
-		if entry.Code == code {
-			return entry, true
-		}
-	}
-	return ApiErrorEntry{}, false
+	entry, ok := apiErrorsByCode[code]
+	return entry, ok
 }
 
 func LookupApiError(payload ApiErrorPayload, routeID string) (ApiErrorEntry, bool) {
@@ -207,19 +207,53 @@ func (prov *RspProvider[Path, Query, Body, Response]) unwrapError(err error) (co
 	return unwrapErrorWithRuntime(route, runtime, err)
 }
 
+// resolvedError records that the ErrorMapper already ran for err, so unwrapping
+// it again reuses the mapped payload (or the mapper's refusal).
+type resolvedError struct {
+	error
+	mapped *errors.ApiErrorPayload
+}
+
+func (e *resolvedError) Unwrap() error {
+	return e.error
+}
+
+// ResolveError runs the route's ErrorMapper once and returns the API error code
+// together with an error that response writers unwrap without mapping again.
+func ResolveError(route RouteInfo, runtime RuntimeOptions, err error) (int, error) {
+	if err == nil || runtime.ErrorMapper == nil {
+		code, _, _, _ := unwrapErrorWithRuntime(route, runtime, err)
+		return code, err
+	}
+	resolved := &resolvedError{error: err, mapped: mapError(route, runtime, err)}
+	code, _, _, _ := unwrapErrorWithRuntime(route, runtime, resolved)
+	return code, resolved
+}
+
+func mapError(route RouteInfo, runtime RuntimeOptions, err error) *errors.ApiErrorPayload {
+	ctx := ErrorMappingContext{
+		Route:     route,
+		Transport: route.Transport,
+	}
+	if mapped, ok := runtime.ErrorMapper(ctx, err); ok && mapped != nil {
+		return mapped
+	}
+	return nil
+}
+
 func unwrapErrorWithRuntime(route RouteInfo, runtime RuntimeOptions, err error) (code int, message string, toast map[string]string, payload *errors.ApiErrorPayload) {
-	if err != nil && runtime.ErrorMapper != nil {
-		ctx := ErrorMappingContext{
-			Route:     route,
-			Transport: route.Transport,
-		}
-		if mapped, ok := runtime.ErrorMapper(ctx, err); ok && mapped != nil {
-			payload = mapped
-			code = mapped.Code
-			message = mapped.Message
-			toast = mapped.Toast.Map()
-			return
-		}
+	var mapped *errors.ApiErrorPayload
+	if resolved, ok := err.(*resolvedError); ok {
+		err, mapped = resolved.error, resolved.mapped
+	} else if err != nil && runtime.ErrorMapper != nil {
+		mapped = mapError(route, runtime, err)
+	}
+	if mapped != nil {
+		payload = mapped
+		code = mapped.Code
+		message = mapped.Message
+		toast = mapped.Toast.Map()
+		return
 	}
 	switch e := err.(type) {
 	case errors.ApiErrorCarrier:
@@ -191,7 +191,7 @@ func CHANNEL[Path, Query, Body, Response, Server, Client, Close any](
 			_ = ginCtx.AbortWithError(http.StatusNotImplemented, err)
 			return
 		}
-		ctx := newContext(ginCtx, executor)
+		ctx := newContext(ginCtx, executor, nil)
 		if err := executor.Run(ctx); err != nil {
 			_ = ginCtx.AbortWithError(http.StatusBadRequest, err)
 			return
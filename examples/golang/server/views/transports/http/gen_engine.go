@@ -12,6 +12,7 @@ import (
 	"net/http"
 	"reflect"
 	"strings"
+	"time"
 
 	"github.com/gin-gonic/gin"
 
@@ -380,6 +381,7 @@ func asHTTPStatusError(err error) *httpStatusError {
 func newContext[Path, Query, Body, Response any](
 	ginCtx *gin.Context,
 	executor *provider.RouteExecutor[Path, Query, Body, Response],
+	probe *routeProbe,
 ) *provider.Context[Path, Query, Body, Response] {
 	ctx := provider.NewHTTPContext[Path, Query, Body, Response](
 		ginCtx.Request.Context(),
@@ -389,6 +391,11 @@ func newContext[Path, Query, Body, Response any](
 	ctx.HeaderFn = ginCtx.GetHeader
 	ctx.Request = provider.NewLazyRequestContext(
 		func() (*provider.REQ[Path, Query, Body], error) {
+			if probe == nil {
+				return bindRequest(ginCtx, executor.Indexer.Req, executor.Route)
+			}
+			started := time.Now()
+			defer probe.bindDone(started)
 			return bindRequest(ginCtx, executor.Indexer.Req, executor.Route)
 		},
 	)
@@ -561,13 +568,24 @@ func makeHandler[Path, Query, Body, Response any](
 	executor *provider.RouteExecutor[Path, Query, Body, Response],
 ) gin.HandlerFunc {
 	return func(ginCtx *gin.Context) {
-		ctx := newContext(ginCtx, executor)
+		probe := startRouteProbe(ginCtx, executor.Route.RouteID)
+		ctx := newContext(ginCtx, executor, probe)
 		execErr := executor.Run(ctx)
 		response, invokeErr := ctx.HandleResult()
 		if invokeErr == nil {
 			invokeErr = execErr
 		}
+		errorCode := 0
+		if probe != nil {
+			probe.handlerDone()
+			// Resolve once so the response writer reuses the mapped error instead of
+			// running the ErrorMapper a second time.
+			errorCode, invokeErr = provider.ResolveError(executor.Route, executor.Runtime, invokeErr)
+		}
 		writeResponse(ginCtx, executor.Indexer.Rsp, response, invokeErr, executor.Route, ctx.Response.Meta())
+		if probe != nil {
+			probe.finish(ginCtx, errorCode)
+		}
 	}
 }
 
@@ -0,0 +1,319 @@
+// Code generated by api-blueprint (Go server HTTP adapter); DO NOT EDIT.
+
+package httptransport
+
+import (
+	"context"
+	"fmt"
+	"io"
+	"sort"
+	"strconv"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"time"
+
+	"github.com/gin-gonic/gin"
+)
+
+// RouteObservation is one finished RPC request. Decode covers binding the
+// request, Handler the route handler and Encode writing the response;
+// ErrorCode is 0 unless the request ended with an error.
+type RouteObservation struct {
+	RouteID   string
+	Method    string
+	Status    int
+	ErrorCode int
+	BytesIn   int64
+	BytesOut  int64
+	Decode    time.Duration
+	Handler   time.Duration
+	Encode    time.Duration
+	Total     time.Duration
+	Span      any
+}
+
+// RouteObserver receives per-route timings. StartRoute may return a derived
+// context (for example one carrying a tracing span) that the route runs with;
+// the returned span is handed back in the observation.
+type RouteObserver interface {
+	StartRoute(ctx context.Context, routeID string) (context.Context, any)
+	FinishRoute(observation RouteObservation)
+}
+
+type routeObserverHolder struct {
+	observer RouteObserver
+}
+
+var activeRouteObserver atomic.Pointer[routeObserverHolder]
+
+// SetRouteObserver installs the observer for every RPC route; nil removes it
+// and leaves the handlers without any clock reads.
+func SetRouteObserver(observer RouteObserver) {
+	if observer == nil {
+		activeRouteObserver.Store(nil)
+		return
+	}
+	activeRouteObserver.Store(&routeObserverHolder{observer: observer})
+}
+
+type routeProbe struct {
+	observer    RouteObserver
+	observation RouteObservation
+	started     time.Time
+	handled     time.Time
+}
+
+func startRouteProbe(ginCtx *gin.Context, routeID string) *routeProbe {
+	holder := activeRouteObserver.Load()
+	if holder == nil {
+		return nil
+	}
+	probe := &routeProbe{
+		observer: holder.observer,
+		observation: RouteObservation{
+			RouteID: routeID,
+			Method:  ginCtx.Request.Method,
+			BytesIn: max(ginCtx.Request.ContentLength, 0),
+		},
+		started: time.Now(),
+	}
+	ctx, span := probe.observer.StartRoute(ginCtx.Request.Context(), routeID)
+	if ctx != nil {
+		ginCtx.Request = ginCtx.Request.WithContext(ctx)
+	}
+	probe.observation.Span = span
+	return probe
+}
+
+func (probe *routeProbe) bindDone(started time.Time) {
+	probe.observation.Decode += time.Since(started)
+}
+
+func (probe *routeProbe) handlerDone() {
+	probe.handled = time.Now()
+}
+
+func (probe *routeProbe) finish(ginCtx *gin.Context, errorCode int) {
+	observation := probe.observation
+	observation.Total = time.Since(probe.started)
+	// Binding runs lazily inside the handler, so its time is taken out here.
+	observation.Handler = probe.handled.Sub(probe.started) - observation.Decode
+	observation.Encode = observation.Total - observation.Decode - observation.Handler
+	observation.Status = ginCtx.Writer.Status()
+	observation.BytesOut = int64(max(ginCtx.Writer.Size(), 0))
+	observation.ErrorCode = errorCode
+	probe.observer.FinishRoute(observation)
+}
+
+var DefaultRouteBuckets = []float64{0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10}
+
+var routePhases = [...]string{"total", "decode", "handler", "encode"}
+
+type routePhaseKey struct {
+	routeID string
+	phase   string
+}
+
+type routeStatusKey struct {
+	routeID string
+	status  int
+}
+
+type routeErrorKey struct {
+	routeID string
+	code    int
+}
+
+type routeBuckets struct {
+	counts []uint64
+	sum    float64
+	count  uint64
+}
+
+// RouteHistogram is an in-memory RouteObserver keeping fixed-bucket latency
+// histograms per route and phase. Quantile estimates e.g. a route's p99 and
+// WritePrometheus renders everything in the Prometheus text format.
+type RouteHistogram struct {
+	buckets   []float64
+	mu        sync.Mutex
+	durations map[routePhaseKey]*routeBuckets
+	requests  map[routeStatusKey]uint64
+	errors    map[routeErrorKey]uint64
+	bytesIn   map[string]int64
+	bytesOut  map[string]int64
+}
+
+func NewRouteHistogram(buckets ...float64) *RouteHistogram {
+	if len(buckets) == 0 {
+		buckets = DefaultRouteBuckets
+	}
+	sorted := append([]float64(nil), buckets...)
+	sort.Float64s(sorted)
+	return &RouteHistogram{
+		buckets:   sorted,
+		durations: make(map[routePhaseKey]*routeBuckets),
+		requests:  make(map[routeStatusKey]uint64),
+		errors:    make(map[routeErrorKey]uint64),
+		bytesIn:   make(map[string]int64),
+		bytesOut:  make(map[string]int64),
+	}
+}
+
+func (histogram *RouteHistogram) StartRoute(ctx context.Context, routeID string) (context.Context, any) {
+	return ctx, nil
+}
+
+func (histogram *RouteHistogram) FinishRoute(observation RouteObservation) {
+	phases := [...]time.Duration{observation.Total, observation.Decode, observation.Handler, observation.Encode}
+	histogram.mu.Lock()
+	defer histogram.mu.Unlock()
+	for index, phase := range routePhases {
+		key := routePhaseKey{routeID: observation.RouteID, phase: phase}
+		entry := histogram.durations[key]
+		if entry == nil {
+			entry = &routeBuckets{counts: make([]uint64, len(histogram.buckets)+1)}
+			histogram.durations[key] = entry
+		}
+		seconds := phases[index].Seconds()
+		entry.counts[sort.SearchFloat64s(histogram.buckets, seconds)]++
+		entry.sum += seconds
+		entry.count++
+	}
+	histogram.requests[routeStatusKey{routeID: observation.RouteID, status: observation.Status}]++
+	if observation.ErrorCode != 0 {
+		histogram.errors[routeErrorKey{routeID: observation.RouteID, code: observation.ErrorCode}]++
+	}
+	histogram.bytesIn[observation.RouteID] += observation.BytesIn
+	histogram.bytesOut[observation.RouteID] += observation.BytesOut
+}
+
+// Quantile interpolates the q quantile of a route phase ("total", "decode",
+// "handler" or "encode") from the buckets; ok is false before any request.
+func (histogram *RouteHistogram) Quantile(routeID string, phase string, q float64) (seconds float64, ok bool) {
+	histogram.mu.Lock()
+	defer histogram.mu.Unlock()
+	entry := histogram.durations[routePhaseKey{routeID: routeID, phase: phase}]
+	if entry == nil || entry.count == 0 {
+		return 0, false
+	}
+	rank := q * float64(entry.count)
+	var seen float64
+	for index, count := range entry.counts {
+		if count > 0 && seen+float64(count) >= rank {
+			if index == len(histogram.buckets) {
+				break
+			}
+			lower := 0.0
+			if index > 0 {
+				lower = histogram.buckets[index-1]
+			}
+			return lower + (histogram.buckets[index]-lower)*(rank-seen)/float64(count), true
+		}
+		seen += float64(count)
+	}
+	if len(histogram.buckets) == 0 {
+		return 0, true
+	}
+	return histogram.buckets[len(histogram.buckets)-1], true
+}
+
+func (histogram *RouteHistogram) WritePrometheus(w io.Writer) error {
+	histogram.mu.Lock()
+	defer histogram.mu.Unlock()
+	var out strings.Builder
+	out.WriteString("# HELP api_blueprint_route_duration_seconds RPC route latency by phase.\n")
+	out.WriteString("# TYPE api_blueprint_route_duration_seconds histogram\n")
+	phaseKeys := make([]routePhaseKey, 0, len(histogram.durations))
+	for key := range histogram.durations {
+		phaseKeys = append(phaseKeys, key)
+	}
+	sort.Slice(phaseKeys, func(i, j int) bool {
+		if phaseKeys[i].routeID != phaseKeys[j].routeID {
+			return phaseKeys[i].routeID < phaseKeys[j].routeID
+		}
+		return phaseKeys[i].phase < phaseKeys[j].phase
+	})
+	for _, key := range phaseKeys {
+		entry := histogram.durations[key]
+		var cumulative uint64
+		for index, bound := range histogram.buckets {
+			cumulative += entry.counts[index]
+			le := strconv.FormatFloat(bound, 'g', -1, 64)
+			fmt.Fprintf(&out, "api_blueprint_route_duration_seconds_bucket%s %d\n", prometheusLabels("route", key.routeID, "phase", key.phase, "le", le), cumulative)
+		}
+		fmt.Fprintf(&out, "api_blueprint_route_duration_seconds_bucket%s %d\n", prometheusLabels("route", key.routeID, "phase", key.phase, "le", "+Inf"), entry.count)
+		labels := prometheusLabels("route", key.routeID, "phase", key.phase)
+		fmt.Fprintf(&out, "api_blueprint_route_duration_seconds_sum%s %s\n", labels, strconv.FormatFloat(entry.sum, 'g', -1, 64))
+		fmt.Fprintf(&out, "api_blueprint_route_duration_seconds_count%s %d\n", labels, entry.count)
+	}
+	out.WriteString("# HELP api_blueprint_route_requests_total RPC requests by route and HTTP status.\n")
+	out.WriteString("# TYPE api_blueprint_route_requests_total counter\n")
+	statusKeys := make([]routeStatusKey, 0, len(histogram.requests))
+	for key := range histogram.requests {
+		statusKeys = append(statusKeys, key)
+	}
+	sort.Slice(statusKeys, func(i, j int) bool {
+		if statusKeys[i].routeID != statusKeys[j].routeID {
+			return statusKeys[i].routeID < statusKeys[j].routeID
+		}
+		return statusKeys[i].status < statusKeys[j].status
+	})
+	for _, key := range statusKeys {
+		fmt.Fprintf(&out, "api_blueprint_route_requests_total%s %d\n", prometheusLabels("route", key.routeID, "status", strconv.Itoa(key.status)), histogram.requests[key])
+	}
+	out.WriteString("# HELP api_blueprint_route_errors_total RPC requests answered with an API error, by code.\n")
+	out.WriteString("# TYPE api_blueprint_route_errors_total counter\n")
+	errorKeys := make([]routeErrorKey, 0, len(histogram.errors))
+	for key := range histogram.errors {
+		errorKeys = append(errorKeys, key)
+	}
+	sort.Slice(errorKeys, func(i, j int) bool {
+		if errorKeys[i].routeID != errorKeys[j].routeID {
+			return errorKeys[i].routeID < errorKeys[j].routeID
+		}
+		return errorKeys[i].code < errorKeys[j].code
+	})
+	for _, key := range errorKeys {
+		fmt.Fprintf(&out, "api_blueprint_route_errors_total%s %d\n", prometheusLabels("route", key.routeID, "code", strconv.Itoa(key.code)), histogram.errors[key])
+	}
+	for _, counter := range []struct {
+		name   string
+		totals map[string]int64
+	}{
+		{name: "bytes_in", totals: histogram.bytesIn},
+		{name: "bytes_out", totals: histogram.bytesOut},
+	} {
+		fmt.Fprintf(&out, "# HELP api_blueprint_route_%s_total RPC %s by route.\n", counter.name, strings.ReplaceAll(counter.name, "_", " "))
+		fmt.Fprintf(&out, "# TYPE api_blueprint_route_%s_total counter\n", counter.name)
+		routeIDs := make([]string, 0, len(counter.totals))
+		for routeID := range counter.totals {
+			routeIDs = append(routeIDs, routeID)
+		}
+		sort.Strings(routeIDs)
+		for _, routeID := range routeIDs {
+			fmt.Fprintf(&out, "api_blueprint_route_%s_total%s %d\n", counter.name, prometheusLabels("route", routeID), counter.totals[routeID])
+		}
+	}
+	_, err := io.WriteString(w, out.String())
+	return err
+}
+
+var prometheusLabelEscaper = strings.NewReplacer(`\`, `\\`, `"`, `\"`, "\n", `\n`)
+
+// prometheusLabels renders name/value pairs as a braced Prometheus label set.
+func prometheusLabels(pairs ...string) string {
+	var out strings.Builder
+	out.WriteByte('{')
+	for index := 0; index+1 < len(pairs); index += 2 {
+		if index > 0 {
+			out.WriteByte(',')
+		}
+		out.WriteString(pairs[index])
+		out.WriteString(`="`)
+		out.WriteString(prometheusLabelEscaper.Replace(pairs[index+1]))
+		out.WriteByte('"')
+	}
+	out.WriteByte('}')
+	return out.String()
+}
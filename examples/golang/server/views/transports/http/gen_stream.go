@@ -128,7 +128,7 @@ func STREAM[Path, Query, Body, Response, Server, Close any](
 			_ = ginCtx.AbortWithError(http.StatusNotImplemented, err)
 			return
 		}
-		ctx := newContext(ginCtx, executor)
+		ctx := newContext(ginCtx, executor, nil)
 		if err := executor.Run(ctx); err != nil {
 			_ = ginCtx.AbortWithError(http.StatusBadRequest, err)
 			return
@@ -101,6 +101,14 @@ public final class GenApiErrors {
 
     }
 
+    // A code shared by several catalog entries resolves to the first one declared.
+    private static final Map<Integer, GenApiErrorEntry> API_ERRORS_BY_CODE = Map.ofEntries(
+        Map.entry(-1, API_ERRORS_BY_ID.get("CommonErr.UNKNOWN")),
+        Map.entry(55555, API_ERRORS_BY_ID.get("CommonErr.TOKEN_EXPIRE")),
+        Map.entry(70002, API_ERRORS_BY_ID.get("DemoErr.UNKNOWN")),
+        Map.entry(42901, API_ERRORS_BY_ID.get("DemoErr.RATE_LIMITED"))
+    );
+
     private static final Map<String, Map<Integer, GenApiErrorEntry>> ROUTE_API_ERRORS_BY_CODE = Map.ofEntries(
         Map.entry(
             "api.binary.post.packet",
@@ -371,7 +379,7 @@ public final class GenApiErrors {
                 return Optional.of(routeEntry);
             }
         }
-        return API_ERRORS_BY_ID.values().stream().filter(item -> item.code() == code).findFirst();
+        return Optional.ofNullable(API_ERRORS_BY_CODE.get(code));
     }
 
     public static Optional<GenApiErrorEntry> lookup(GenApiErrorPayload payload, String routeId) {
@@ -0,0 +1,164 @@
+// Code generated by api-blueprint (Java server); DO NOT EDIT.
+package com.example.apiblueprint.static_.spring;
+
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Comparator;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * In-memory {@link GenSpringRouteMetrics.Hooks} keeping fixed-bucket latency histograms per route and phase.
+ * {@link #quantile} estimates e.g. a route's p99 and {@link #prometheusText} renders everything in the
+ * Prometheus text format.
+ */
+public final class GenSpringRouteHistogram implements GenSpringRouteMetrics.Hooks {
+    public static final double[] DEFAULT_BUCKETS = {
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    };
+    private static final String[] PHASES = {"total", "decode", "handler", "encode"};
+
+    private static final class Buckets {
+        final long[] counts;
+        double sum;
+        long count;
+
+        Buckets(int size) {
+            counts = new long[size];
+        }
+    }
+
+    private final double[] buckets;
+    private final Map<List<String>, Buckets> durations = new HashMap<>();
+    private final Map<List<String>, Long> requests = new HashMap<>();
+    private final Map<List<String>, Long> errors = new HashMap<>();
+    private final Map<String, Long> bytesIn = new HashMap<>();
+    private final Map<String, Long> bytesOut = new HashMap<>();
+
+    public GenSpringRouteHistogram() {
+        this(DEFAULT_BUCKETS);
+    }
+
+    public GenSpringRouteHistogram(double... buckets) {
+        this.buckets = buckets.clone();
+        Arrays.sort(this.buckets);
+    }
+
+    @Override
+    public synchronized void onRequestEnd(GenSpringRouteMetrics.Observation observation) {
+        long[] phases = {
+            observation.totalNanos(),
+            observation.decodeNanos(),
+            observation.handlerNanos(),
+            observation.encodeNanos(),
+        };
+        for (int index = 0; index < PHASES.length; index++) {
+            Buckets entry = durations.computeIfAbsent(
+                List.of(observation.routeId(), PHASES[index]),
+                key -> new Buckets(buckets.length + 1)
+            );
+            double seconds = phases[index] / 1_000_000_000.0;
+            entry.counts[bucketIndex(seconds)]++;
+            entry.sum += seconds;
+            entry.count++;
+        }
+        requests.merge(List.of(observation.routeId(), Integer.toString(observation.status())), 1L, Long::sum);
+        if (observation.errorCode() != null) {
+            errors.merge(List.of(observation.routeId(), observation.errorCode().toString()), 1L, Long::sum);
+        }
+        bytesIn.merge(observation.routeId(), observation.bytesIn(), Long::sum);
+        bytesOut.merge(observation.routeId(), observation.bytesOut(), Long::sum);
+    }
+
+    /** Interpolates the {@code q} quantile in seconds from the buckets; null before any request. */
+    public synchronized Double quantile(String routeId, String phase, double q) {
+        Buckets entry = durations.get(List.of(routeId, phase));
+        if (entry == null || entry.count == 0) {
+            return null;
+        }
+        double rank = q * entry.count;
+        double seen = 0;
+        for (int index = 0; index < entry.counts.length; index++) {
+            long count = entry.counts[index];
+            if (count > 0 && seen + count >= rank) {
+                if (index == buckets.length) {
+                    break;
+                }
+                double lower = index > 0 ? buckets[index - 1] : 0.0;
+                return lower + (buckets[index] - lower) * (rank - seen) / count;
+            }
+            seen += count;
+        }
+        return buckets.length == 0 ? 0.0 : buckets[buckets.length - 1];
+    }
+
+    public synchronized String prometheusText() {
+        StringBuilder out = new StringBuilder();
+        out.append("# HELP api_blueprint_route_duration_seconds RPC route latency by phase.\n");
+        out.append("# TYPE api_blueprint_route_duration_seconds histogram\n");
+        for (Map.Entry<List<String>, Buckets> item : sorted(durations)) {
+            String routeId = item.getKey().get(0);
+            String phase = item.getKey().get(1);
+            Buckets entry = item.getValue();
+            long cumulative = 0;
+            for (int index = 0; index < buckets.length; index++) {
+                cumulative += entry.counts[index];
+                sample(out, "api_blueprint_route_duration_seconds_bucket", cumulative, "route", routeId, "phase", phase, "le", bound(buckets[index]));
+            }
+            sample(out, "api_blueprint_route_duration_seconds_bucket", entry.count, "route", routeId, "phase", phase, "le", "+Inf");
+            sample(out, "api_blueprint_route_duration_seconds_sum", entry.sum, "route", routeId, "phase", phase);
+            sample(out, "api_blueprint_route_duration_seconds_count", entry.count, "route", routeId, "phase", phase);
+        }
+        out.append("# HELP api_blueprint_route_requests_total RPC requests by route and HTTP status.\n");
+        out.append("# TYPE api_blueprint_route_requests_total counter\n");
+        for (Map.Entry<List<String>, Long> item : sorted(requests)) {
+            sample(out, "api_blueprint_route_requests_total", item.getValue(), "route", item.getKey().get(0), "status", item.getKey().get(1));
+        }
+        out.append("# HELP api_blueprint_route_errors_total RPC requests answered with an API error, by code.\n");
+        out.append("# TYPE api_blueprint_route_errors_total counter\n");
+        for (Map.Entry<List<String>, Long> item : sorted(errors)) {
+            sample(out, "api_blueprint_route_errors_total", item.getValue(), "route", item.getKey().get(0), "code", item.getKey().get(1));
+        }
+        for (String name : new String[] {"bytes_in", "bytes_out"}) {
+            Map<String, Long> totals = name.equals("bytes_in") ? bytesIn : bytesOut;
+            out.append("# HELP api_blueprint_route_").append(name).append("_total RPC ").append(name.replace('_', ' ')).append(" by route.\n");
+            out.append("# TYPE api_blueprint_route_").append(name).append("_total counter\n");
+            List<String> routeIds = new ArrayList<>(totals.keySet());
+            routeIds.sort(Comparator.naturalOrder());
+            for (String routeId : routeIds) {
+                sample(out, "api_blueprint_route_" + name + "_total", totals.get(routeId), "route", routeId);
+            }
+        }
+        return out.toString();
+    }
+
+    private int bucketIndex(double seconds) {
+        int index = Arrays.binarySearch(buckets, seconds);
+        return index >= 0 ? index : -index - 1;
+    }
+
+    private static <V> List<Map.Entry<List<String>, V>> sorted(Map<List<String>, V> values) {
+        List<Map.Entry<List<String>, V>> entries = new ArrayList<>(values.entrySet());
+        entries.sort(Comparator.comparing((Map.Entry<List<String>, V> entry) -> entry.getKey().get(0))
+            .thenComparing(entry -> entry.getKey().get(1)));
+        return entries;
+    }
+
+    private static String bound(double value) {
+        return value == Math.rint(value) && !Double.isInfinite(value) ? Long.toString((long) value) : Double.toString(value);
+    }
+
+    private static void sample(StringBuilder out, String name, Object value, String... labels) {
+        out.append(name).append('{');
+        for (int index = 0; index + 1 < labels.length; index += 2) {
+            if (index > 0) {
+                out.append(',');
+            }
+            out.append(labels[index]).append("=\"");
+            out.append(labels[index + 1].replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n"));
+            out.append('"');
+        }
+        out.append("} ").append(value).append('\n');
+    }
+}
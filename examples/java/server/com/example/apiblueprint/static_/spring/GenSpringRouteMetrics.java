@@ -0,0 +1,105 @@
+// Code generated by api-blueprint (Java server); DO NOT EDIT.
+package com.example.apiblueprint.static_.spring;
+
+import com.example.apiblueprint.static_.annotations.ApiBlueprintOperation;
+import com.example.apiblueprint.static_.runtime.GenApiError;
+import jakarta.servlet.http.HttpServletRequest;
+import jakarta.servlet.http.HttpServletResponse;
+import java.util.Objects;
+import org.springframework.web.method.HandlerMethod;
+import org.springframework.web.servlet.HandlerInterceptor;
+
+/**
+ * Spring MVC interceptor reporting every {@link ApiBlueprintOperation} request to {@link Hooks}; register it
+ * through {@code WebMvcConfigurer.addInterceptors}, without it no clock is read. Spring binds the arguments and
+ * writes the body inside its handler adapter, so the whole exchange is reported as handler time.
+ */
+public final class GenSpringRouteMetrics implements HandlerInterceptor {
+    private static final String PROBE_ATTRIBUTE = GenSpringRouteMetrics.class.getName() + ".probe";
+
+    public record Observation(
+        String routeId,
+        String method,
+        int status,
+        Integer errorCode,
+        long bytesIn,
+        long bytesOut,
+        long decodeNanos,
+        long handlerNanos,
+        long encodeNanos,
+        long totalNanos,
+        Object span
+    ) {
+    }
+
+    public interface Hooks {
+        /** Returns a span (or null) that is handed back in the observation. */
+        default Object onRequestStart(String routeId) {
+            return null;
+        }
+
+        void onRequestEnd(Observation observation);
+    }
+
+    private record Probe(String routeId, long started, Object span) {
+    }
+
+    private final Hooks hooks;
+
+    public GenSpringRouteMetrics(Hooks hooks) {
+        this.hooks = Objects.requireNonNull(hooks, "hooks");
+    }
+
+    @Override
+    public boolean preHandle(HttpServletRequest request, HttpServletResponse response, Object handler) {
+        if (handler instanceof HandlerMethod method) {
+            ApiBlueprintOperation operation = method.getMethodAnnotation(ApiBlueprintOperation.class);
+            if (operation != null) {
+                Object span = hooks.onRequestStart(operation.value());
+                request.setAttribute(PROBE_ATTRIBUTE, new Probe(operation.value(), System.nanoTime(), span));
+            }
+        }
+        return true;
+    }
+
+    @Override
+    public void afterCompletion(
+        HttpServletRequest request,
+        HttpServletResponse response,
+        Object handler,
+        Exception ex
+    ) {
+        if (!(request.getAttribute(PROBE_ATTRIBUTE) instanceof Probe probe)) {
+            return;
+        }
+        long total = System.nanoTime() - probe.started();
+        Integer errorCode = ex instanceof GenApiError error ? Integer.valueOf(error.code()) : null;
+        hooks.onRequestEnd(
+            new Observation(
+                probe.routeId(),
+                request.getMethod(),
+                response.getStatus(),
+                errorCode,
+                Math.max(request.getContentLengthLong(), 0L),
+                contentLength(response),
+                0L,
+                total,
+                0L,
+                total,
+                probe.span()
+            )
+        );
+    }
+
+    private static long contentLength(HttpServletResponse response) {
+        String value = response.getHeader("Content-Length");
+        if (value == null || value.isBlank()) {
+            return 0L;
+        }
+        try {
+            return Long.parseLong(value.trim());
+        } catch (NumberFormatException ignored) {
+            return 0L;
+        }
+    }
+}
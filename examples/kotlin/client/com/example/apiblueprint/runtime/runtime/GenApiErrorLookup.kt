@@ -6,6 +6,22 @@ val ApiErrorsByID: Map<String, ApiErrorEntry> = mapOf(
 
 val ApiErrors: Map<String, ApiErrorEntry> = ApiErrorsByID
 
+// A code shared by several catalog entries resolves to the first one declared.
+private val apiErrorsByCode: Map<ApiErrorCode, ApiErrorEntry> = mapOf(
+)
+
+// Payloads are immutable, so responses that only repeat the catalog share one instance.
+private val apiErrorPayloadsById: Map<String, ApiErrorPayload> = ApiErrorsByID.mapValues { (_, entry) ->
+    ApiErrorPayload(
+        id = entry.id,
+        group = entry.group,
+        key = entry.key,
+        code = entry.code,
+        message = entry.message,
+        toast = ApiToastPayload(key = entry.toast.key, level = entry.toast.level, default = entry.toast.default),
+    )
+}
+
 private val routeApiErrorsByCode: Map<String, Map<ApiErrorCode, ApiErrorEntry>> = mapOf(
     "runtime.status.get.current" to mapOf(
     ),
@@ -17,7 +33,7 @@ fun lookupApiErrorByCode(code: ApiErrorCode, routeId: String? = null): ApiErrorE
     if (!routeId.isNullOrEmpty()) {
         routeApiErrorsByCode[routeId]?.get(code)?.let { return it }
     }
-    return ApiErrorsByID.values.firstOrNull { it.code == code }
+    return apiErrorsByCode[code]
 }
 
 fun lookupApiError(payload: ApiErrorPayload?, routeId: String? = null): ApiErrorEntry? {
@@ -41,6 +57,12 @@ fun apiErrorPayload(
 ): ApiErrorPayload {
     val seed = ApiErrorPayload(id = id, group = group, key = key, code = code, message = message, toast = toast)
     val entry = lookupApiError(seed, routeId)
+    if (entry != null) {
+        val catalog = apiErrorPayloadsById.getValue(entry.id)
+        if (seed.repeats(catalog)) {
+            return catalog
+        }
+    }
     return ApiErrorPayload(
         id = id.ifEmpty { entry?.id.orEmpty() },
         group = group.ifEmpty { entry?.group.orEmpty() },
@@ -55,3 +77,16 @@ fun apiErrorPayload(
         ),
     )
 }
+
+// Every field the payload sets is empty or equal to the catalog value, so the
+// merged payload would equal the prebuilt one.
+private fun ApiErrorPayload.repeats(catalog: ApiErrorPayload): Boolean =
+    (id.isEmpty() || id == catalog.id) &&
+        (group.isEmpty() || group == catalog.group) &&
+        (key.isEmpty() || key == catalog.key) &&
+        (code == 0 || code == catalog.code) &&
+        (message.isEmpty() || message == catalog.message) &&
+        (toast.key.isEmpty() || toast.key == catalog.toast.key) &&
+        (toast.level.isEmpty() || toast.level == catalog.toast.level) &&
+        (toast.default.isEmpty() || toast.default == catalog.toast.default) &&
+        toast.text.isEmpty()
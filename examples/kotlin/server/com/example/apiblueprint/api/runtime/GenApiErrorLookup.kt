@@ -54,6 +54,26 @@ val ApiErrorsByID: Map<String, ApiErrorEntry> = mapOf(
 
 val ApiErrors: Map<String, ApiErrorEntry> = ApiErrorsByID
 
+// A code shared by several catalog entries resolves to the first one declared.
+private val apiErrorsByCode: Map<ApiErrorCode, ApiErrorEntry> = mapOf(
+    -1 to ApiErrorsByID.getValue("CommonErr.UNKNOWN"),
+    55555 to ApiErrorsByID.getValue("CommonErr.TOKEN_EXPIRE"),
+    70002 to ApiErrorsByID.getValue("DemoErr.UNKNOWN"),
+    42901 to ApiErrorsByID.getValue("DemoErr.RATE_LIMITED"),
+)
+
+// Payloads are immutable, so responses that only repeat the catalog share one instance.
+private val apiErrorPayloadsById: Map<String, ApiErrorPayload> = ApiErrorsByID.mapValues { (_, entry) ->
+    ApiErrorPayload(
+        id = entry.id,
+        group = entry.group,
+        key = entry.key,
+        code = entry.code,
+        message = entry.message,
+        toast = ApiToastPayload(key = entry.toast.key, level = entry.toast.level, default = entry.toast.default),
+    )
+}
+
 private val routeApiErrorsByCode: Map<String, Map<ApiErrorCode, ApiErrorEntry>> = mapOf(
     "api.api.channel.ws" to mapOf(
         -1 to ApiErrorsByID.getValue("CommonErr.UNKNOWN"),
@@ -203,7 +223,7 @@ fun lookupApiErrorByCode(code: ApiErrorCode, routeId: String? = null): ApiErrorE
     if (!routeId.isNullOrEmpty()) {
         routeApiErrorsByCode[routeId]?.get(code)?.let { return it }
     }
-    return ApiErrorsByID.values.firstOrNull { it.code == code }
+    return apiErrorsByCode[code]
 }
 
 fun lookupApiError(payload: ApiErrorPayload?, routeId: String? = null): ApiErrorEntry? {
@@ -227,6 +247,12 @@ fun apiErrorPayload(
 ): ApiErrorPayload {
     val seed = ApiErrorPayload(id = id, group = group, key = key, code = code, message = message, toast = toast)
     val entry = lookupApiError(seed, routeId)
+    if (entry != null) {
+        val catalog = apiErrorPayloadsById.getValue(entry.id)
+        if (seed.repeats(catalog)) {
+            return catalog
+        }
+    }
     return ApiErrorPayload(
         id = id.ifEmpty { entry?.id.orEmpty() },
         group = group.ifEmpty { entry?.group.orEmpty() },
@@ -242,6 +268,19 @@ fun apiErrorPayload(
     )
 }
 
+// Every field the payload sets is empty or equal to the catalog value, so the
+// merged payload would equal the prebuilt one.
+private fun ApiErrorPayload.repeats(catalog: ApiErrorPayload): Boolean =
+    (id.isEmpty() || id == catalog.id) &&
+        (group.isEmpty() || group == catalog.group) &&
+        (key.isEmpty() || key == catalog.key) &&
+        (code == 0 || code == catalog.code) &&
+        (message.isEmpty() || message == catalog.message) &&
+        (toast.key.isEmpty() || toast.key == catalog.toast.key) &&
+        (toast.level.isEmpty() || toast.level == catalog.toast.level) &&
+        (toast.default.isEmpty() || toast.default == catalog.toast.default) &&
+        toast.text.isEmpty()
+
 object CommonErr {
     const val UNKNOWN: Int = -1
     const val TOKEN_EXPIRE: Int = 55555
@@ -0,0 +1,211 @@
+// Code generated by api-blueprint (Kotlin server); DO NOT EDIT.
+package com.example.apiblueprint.api.runtime
+
+/**
+ * One finished RPC request, timed per phase in nanoseconds. `decodeNanos` covers reading and decoding
+ * the request, `handlerNanos` the service call and `encodeNanos` writing the response.
+ */
+public data class ApiRouteObservation(
+    public val routeId: String,
+    public val method: String,
+    public val status: Int,
+    public val errorCode: ApiErrorCode?,
+    public val bytesIn: Long,
+    public val bytesOut: Long,
+    public val decodeNanos: Long,
+    public val handlerNanos: Long,
+    public val encodeNanos: Long,
+    public val totalNanos: Long,
+    public val span: Any? = null,
+)
+
+public interface ApiRouteHooks {
+    /** Returns a span (or null) that is handed back in the observation. */
+    public fun onRequestStart(routeId: String): Any? = null
+
+    public fun onRequestEnd(observation: ApiRouteObservation)
+}
+
+/** Phase clock the Ktor routes create per request while `ApiServerConfig.routeHooks` is set. */
+public class ApiRouteProbe(
+    private val hooks: ApiRouteHooks,
+    private val routeId: String,
+    private val method: String,
+    private val bytesIn: Long,
+) {
+    private val span: Any? = hooks.onRequestStart(routeId)
+    private val started: Long = System.nanoTime()
+    private var decodedAt: Long = -1L
+    private var handledAt: Long = -1L
+    public var errorCode: ApiErrorCode? = null
+    public var bytesOut: Long = 0L
+
+    public fun decoded() {
+        decodedAt = System.nanoTime()
+    }
+
+    public fun handled() {
+        handledAt = System.nanoTime()
+    }
+
+    public fun finish(status: Int) {
+        val ended = System.nanoTime()
+        // A phase that never completed ends where the request did.
+        val decoded = if (decodedAt < 0L) ended else decodedAt
+        val handled = if (handledAt < 0L) ended else handledAt
+        hooks.onRequestEnd(
+            ApiRouteObservation(
+                routeId = routeId,
+                method = method,
+                status = status,
+                errorCode = errorCode,
+                bytesIn = bytesIn,
+                bytesOut = bytesOut,
+                decodeNanos = decoded - started,
+                handlerNanos = handled - decoded,
+                encodeNanos = ended - handled,
+                totalNanos = ended - started,
+                span = span,
+            ),
+        )
+    }
+}
+
+public val DEFAULT_ROUTE_BUCKETS: List<Double> =
+    listOf(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+private val ROUTE_PHASES: List<String> = listOf("total", "decode", "handler", "encode")
+
+private class ApiRouteBuckets(size: Int) {
+    val counts: LongArray = LongArray(size)
+    var sum: Double = 0.0
+    var count: Long = 0L
+}
+
+/**
+ * In-memory [ApiRouteHooks] keeping fixed-bucket latency histograms per route and phase. [quantile]
+ * estimates e.g. a route's p99 and [prometheusText] renders everything in the Prometheus text format.
+ */
+public class ApiRouteHistogram(buckets: List<Double> = DEFAULT_ROUTE_BUCKETS) : ApiRouteHooks {
+    public val buckets: List<Double> = buckets.sorted()
+    private val lock = Any()
+    private val durations = HashMap<Pair<String, String>, ApiRouteBuckets>()
+    private val requests = HashMap<Pair<String, Int>, Long>()
+    private val errors = HashMap<Pair<String, ApiErrorCode>, Long>()
+    private val bytesIn = HashMap<String, Long>()
+    private val bytesOut = HashMap<String, Long>()
+
+    override fun onRequestEnd(observation: ApiRouteObservation) {
+        val phases = longArrayOf(
+            observation.totalNanos,
+            observation.decodeNanos,
+            observation.handlerNanos,
+            observation.encodeNanos,
+        )
+        synchronized(lock) {
+            ROUTE_PHASES.forEachIndexed { index, phase ->
+                val entry = durations.getOrPut(observation.routeId to phase) { ApiRouteBuckets(buckets.size + 1) }
+                val seconds = phases[index] / 1_000_000_000.0
+                entry.counts[bucketIndex(seconds)] += 1
+                entry.sum += seconds
+                entry.count += 1
+            }
+            val key = observation.routeId to observation.status
+            requests[key] = (requests[key] ?: 0L) + 1
+            observation.errorCode?.let { code ->
+                val errorKey = observation.routeId to code
+                errors[errorKey] = (errors[errorKey] ?: 0L) + 1
+            }
+            bytesIn[observation.routeId] = (bytesIn[observation.routeId] ?: 0L) + observation.bytesIn
+            bytesOut[observation.routeId] = (bytesOut[observation.routeId] ?: 0L) + observation.bytesOut
+        }
+    }
+
+    /** Interpolates the [q] quantile in seconds from the buckets; null before any request. */
+    public fun quantile(routeId: String, q: Double, phase: String = "total"): Double? {
+        val counts: LongArray
+        val total: Long
+        synchronized(lock) {
+            val entry = durations[routeId to phase] ?: return null
+            if (entry.count == 0L) {
+                return null
+            }
+            counts = entry.counts.copyOf()
+            total = entry.count
+        }
+        val rank = q * total
+        var seen = 0.0
+        for (index in counts.indices) {
+            val count = counts[index]
+            if (count > 0 && seen + count >= rank) {
+                if (index == buckets.size) {
+                    break
+                }
+                val lower = if (index > 0) buckets[index - 1] else 0.0
+                return lower + (buckets[index] - lower) * (rank - seen) / count
+            }
+            seen += count
+        }
+        return buckets.lastOrNull() ?: 0.0
+    }
+
+    public fun prometheusText(): String = synchronized(lock) {
+        buildString {
+            append("# HELP api_blueprint_route_duration_seconds RPC route latency by phase.\n")
+            append("# TYPE api_blueprint_route_duration_seconds histogram\n")
+            for ((key, entry) in durations.entries.sortedWith(compareBy({ it.key.first }, { it.key.second }))) {
+                val (routeId, phase) = key
+                var cumulative = 0L
+                buckets.forEachIndexed { index, bound ->
+                    cumulative += entry.counts[index]
+                    appendSample("api_blueprint_route_duration_seconds_bucket", cumulative, "route" to routeId, "phase" to phase, "le" to formatBound(bound))
+                }
+                appendSample("api_blueprint_route_duration_seconds_bucket", entry.count, "route" to routeId, "phase" to phase, "le" to "+Inf")
+                appendSample("api_blueprint_route_duration_seconds_sum", entry.sum, "route" to routeId, "phase" to phase)
+                appendSample("api_blueprint_route_duration_seconds_count", entry.count, "route" to routeId, "phase" to phase)
+            }
+            append("# HELP api_blueprint_route_requests_total RPC requests by route and HTTP status.\n")
+            append("# TYPE api_blueprint_route_requests_total counter\n")
+            for ((key, count) in requests.entries.sortedWith(compareBy({ it.key.first }, { it.key.second }))) {
+                appendSample("api_blueprint_route_requests_total", count, "route" to key.first, "status" to key.second.toString())
+            }
+            append("# HELP api_blueprint_route_errors_total RPC requests answered with an API error, by code.\n")
+            append("# TYPE api_blueprint_route_errors_total counter\n")
+            for ((key, count) in errors.entries.sortedWith(compareBy({ it.key.first }, { it.key.second }))) {
+                appendSample("api_blueprint_route_errors_total", count, "route" to key.first, "code" to key.second.toString())
+            }
+            for ((name, totals) in listOf("bytes_in" to bytesIn, "bytes_out" to bytesOut)) {
+                append("# HELP api_blueprint_route_${name}_total RPC ${name.replace('_', ' ')} by route.\n")
+                append("# TYPE api_blueprint_route_${name}_total counter\n")
+                for ((routeId, total) in totals.entries.sortedBy { it.key }) {
+                    appendSample("api_blueprint_route_${name}_total", total, "route" to routeId)
+                }
+            }
+        }
+    }
+
+    private fun bucketIndex(seconds: Double): Int {
+        val index = buckets.binarySearch(seconds)
+        return if (index >= 0) index else -index - 1
+    }
+}
+
+private fun formatBound(bound: Double): String =
+    if (bound == Math.floor(bound) && !bound.isInfinite()) bound.toLong().toString() else bound.toString()
+
+private fun StringBuilder.appendSample(name: String, value: Any, vararg labels: Pair<String, String>) {
+    append(name)
+    append('{')
+    labels.forEachIndexed { index, (label, labelValue) ->
+        if (index > 0) {
+            append(',')
+        }
+        append(label)
+        append("=\"")
+        append(labelValue.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n"))
+        append('"')
+    }
+    append("} ")
+    append(value)
+    append('\n')
+}
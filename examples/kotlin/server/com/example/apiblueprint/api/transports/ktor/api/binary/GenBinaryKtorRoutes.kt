@@ -12,6 +12,7 @@ import io.ktor.http.Parameters
 import io.ktor.http.content.PartData
 import io.ktor.http.content.forEachPart
 import io.ktor.server.application.ApplicationCall
+import io.ktor.server.request.httpMethod
 import io.ktor.server.request.receive
 import io.ktor.server.request.receiveMultipart
 import io.ktor.server.request.receiveParameters
@@ -116,111 +117,143 @@ public fun Route.registerBinaryRoutes(
 ) {
 
     post("/api/binary/packet") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, BinaryPacketQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@post
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@post
-        }
-        val binary = try {
-            DemoPacketWire.parse(receiveBinarySchemaBytes(call, config, HTTP_ROUTE_API_BINARY_POST_PACKET.request))
-        } catch (_: ApiPayloadTooLargeException) {
-            respondPayloadTooLarge(call)
-            return@post
-        } catch (_: ApiUnsupportedContentEncodingException) {
-            respondUnsupportedContentEncoding(call)
-            return@post
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@post
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.binary.post.packet", call) }
         try {
-            val result = service.packet(
-                query = query,
-                binary = binary
-            )
-            respondSuccess(call, result, BinaryPacketResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.binary.post.packet")
+            val query = try {
+                decodeParameters(call.request.queryParameters, BinaryPacketQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@post
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@post
+            }
+            val binary = try {
+                DemoPacketWire.parse(receiveBinarySchemaBytes(call, config, HTTP_ROUTE_API_BINARY_POST_PACKET.request))
+            } catch (_: ApiPayloadTooLargeException) {
+                respondPayloadTooLarge(call)
+                return@post
+            } catch (_: ApiUnsupportedContentEncodingException) {
+                respondUnsupportedContentEncoding(call)
+                return@post
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@post
+            }
+            probe?.decoded()
+            try {
+                val result = service.packet(
+                    query = query,
+                    binary = binary
+                )
+                probe?.handled()
+                respondSuccess(call, result, BinaryPacketResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.binary.post.packet", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     post("/api/binary/audit-packet") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, BinaryAuditPacketQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@post
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@post
-        }
-        val binary = try {
-            AuditPacketWire.parse(receiveBinarySchemaBytes(call, config, HTTP_ROUTE_API_BINARY_POST_AUDITPACKET.request))
-        } catch (_: ApiPayloadTooLargeException) {
-            respondPayloadTooLarge(call)
-            return@post
-        } catch (_: ApiUnsupportedContentEncodingException) {
-            respondUnsupportedContentEncoding(call)
-            return@post
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@post
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.binary.post.auditpacket", call) }
         try {
-            val result = service.auditPacket(
-                query = query,
-                binary = binary
-            )
-            respondSuccess(call, result, BinaryAuditPacketResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.binary.post.auditpacket")
+            val query = try {
+                decodeParameters(call.request.queryParameters, BinaryAuditPacketQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@post
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@post
+            }
+            val binary = try {
+                AuditPacketWire.parse(receiveBinarySchemaBytes(call, config, HTTP_ROUTE_API_BINARY_POST_AUDITPACKET.request))
+            } catch (_: ApiPayloadTooLargeException) {
+                respondPayloadTooLarge(call)
+                return@post
+            } catch (_: ApiUnsupportedContentEncodingException) {
+                respondUnsupportedContentEncoding(call)
+                return@post
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@post
+            }
+            probe?.decoded()
+            try {
+                val result = service.auditPacket(
+                    query = query,
+                    binary = binary
+                )
+                probe?.handled()
+                respondSuccess(call, result, BinaryAuditPacketResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.binary.post.auditpacket", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     post("/api/binary/wide-packet") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, BinaryWidePacketQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@post
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@post
-        }
-        val binary = try {
-            WidePacketWire.parse(receiveBinarySchemaBytes(call, config, HTTP_ROUTE_API_BINARY_POST_WIDEPACKET.request))
-        } catch (_: ApiPayloadTooLargeException) {
-            respondPayloadTooLarge(call)
-            return@post
-        } catch (_: ApiUnsupportedContentEncodingException) {
-            respondUnsupportedContentEncoding(call)
-            return@post
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@post
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.binary.post.widepacket", call) }
         try {
-            val result = service.widePacket(
-                query = query,
-                binary = binary
-            )
-            respondSuccess(call, result, BinaryWidePacketResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.binary.post.widepacket")
+            val query = try {
+                decodeParameters(call.request.queryParameters, BinaryWidePacketQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@post
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@post
+            }
+            val binary = try {
+                WidePacketWire.parse(receiveBinarySchemaBytes(call, config, HTTP_ROUTE_API_BINARY_POST_WIDEPACKET.request))
+            } catch (_: ApiPayloadTooLargeException) {
+                respondPayloadTooLarge(call)
+                return@post
+            } catch (_: ApiUnsupportedContentEncodingException) {
+                respondUnsupportedContentEncoding(call)
+                return@post
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@post
+            }
+            probe?.decoded()
+            try {
+                val result = service.widePacket(
+                    query = query,
+                    binary = binary
+                )
+                probe?.handled()
+                respondSuccess(call, result, BinaryWidePacketResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.binary.post.widepacket", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/binary/audit-packet-response") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.binary.get.auditpacketresponse", call) }
         try {
-            val result = service.auditPacketResponse(
-            )
-            respondRawBytes(call, AuditPacketWire.toBinaryBody(result).toByteArray(), HTTP_ROUTE_API_BINARY_GET_AUDITPACKETRESPONSE.response)
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.binary.get.auditpacketresponse")
+            probe?.decoded()
+            try {
+                val result = service.auditPacketResponse(
+                )
+                probe?.handled()
+                respondRawBytes(call, AuditPacketWire.toBinaryBody(result).toByteArray(), HTTP_ROUTE_API_BINARY_GET_AUDITPACKETRESPONSE.response, probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.binary.get.auditpacketresponse", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
@@ -472,7 +505,13 @@ private suspend fun receiveFilePart(part: PartData.FileItem, config: ApiServerCo
     }
 }
 
-private suspend fun respondRawBytes(call: ApplicationCall, bytes: ByteArray, responseInfo: HttpResponseInfo) {
+private suspend fun respondRawBytes(
+    call: ApplicationCall,
+    bytes: ByteArray,
+    responseInfo: HttpResponseInfo,
+    probe: ApiRouteProbe? = null,
+) {
+    probe?.bytesOut = bytes.size.toLong()
     call.respondBytes(bytes, contentType = contentType(responseInfo.mediaType))
 }
 
@@ -569,8 +608,10 @@ private suspend fun <T> respondSuccess(
     serializer: KSerializer<T>,
     envelope: ApiResponseEnvelope,
     mediaType: String,
+    probe: ApiRouteProbe? = null,
 ) {
     val body = encodeSuccessBody(data, serializer, envelope, mediaType)
+    probe?.bytesOut = body.encodeToByteArray().size.toLong()
     call.respondText(body, contentType = contentType(mediaType))
 }
 
@@ -612,13 +653,23 @@ private suspend fun respondApiError(
     error: ApiError,
     envelope: ApiResponseEnvelope,
     routeId: String,
+    probe: ApiRouteProbe? = null,
 ) {
     val payload = normalizeApiErrorPayload(error.payload, routeId)
     val body = encodeErrorBody(payload, envelope)
+    probe?.bytesOut = body.encodeToByteArray().size.toLong()
     val status = if (envelope.kind == "none") HttpStatusCode.InternalServerError else HttpStatusCode.OK
     call.respondText(body, contentType = ContentType.Application.Json, status = status)
 }
 
+private fun startRouteProbe(hooks: ApiRouteHooks, routeId: String, call: ApplicationCall): ApiRouteProbe =
+    ApiRouteProbe(
+        hooks = hooks,
+        routeId = routeId,
+        method = call.request.httpMethod.value,
+        bytesIn = call.request.headers[HttpHeaders.ContentLength]?.toLongOrNull() ?: 0L,
+    )
+
 private suspend fun respondBadRequest(call: ApplicationCall) {
     call.respondText(
         "{\"detail\":\"invalid request\"}",
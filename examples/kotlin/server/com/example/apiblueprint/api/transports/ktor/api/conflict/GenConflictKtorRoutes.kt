@@ -12,6 +12,7 @@ import io.ktor.http.Parameters
 import io.ktor.http.content.PartData
 import io.ktor.http.content.forEachPart
 import io.ktor.server.application.ApplicationCall
+import io.ktor.server.request.httpMethod
 import io.ktor.server.request.receive
 import io.ktor.server.request.receiveMultipart
 import io.ktor.server.request.receiveParameters
@@ -79,22 +80,30 @@ public fun Route.registerConflictRoutes(
 ) {
 
     get("/api/conflict/default") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, ConflictDefaultQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@get
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@get
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.conflict.get.default", call) }
         try {
-            val result = service.default(
-                query = query
-            )
-            respondSuccess(call, result, ConflictModel.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.conflict.get.default")
+            val query = try {
+                decodeParameters(call.request.queryParameters, ConflictDefaultQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@get
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@get
+            }
+            probe?.decoded()
+            try {
+                val result = service.default(
+                    query = query
+                )
+                probe?.handled()
+                respondSuccess(call, result, ConflictModel.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.conflict.get.default", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
@@ -293,7 +302,13 @@ private suspend fun receiveFilePart(part: PartData.FileItem, config: ApiServerCo
     }
 }
 
-private suspend fun respondRawBytes(call: ApplicationCall, bytes: ByteArray, responseInfo: HttpResponseInfo) {
+private suspend fun respondRawBytes(
+    call: ApplicationCall,
+    bytes: ByteArray,
+    responseInfo: HttpResponseInfo,
+    probe: ApiRouteProbe? = null,
+) {
+    probe?.bytesOut = bytes.size.toLong()
     call.respondBytes(bytes, contentType = contentType(responseInfo.mediaType))
 }
 
@@ -390,8 +405,10 @@ private suspend fun <T> respondSuccess(
     serializer: KSerializer<T>,
     envelope: ApiResponseEnvelope,
     mediaType: String,
+    probe: ApiRouteProbe? = null,
 ) {
     val body = encodeSuccessBody(data, serializer, envelope, mediaType)
+    probe?.bytesOut = body.encodeToByteArray().size.toLong()
     call.respondText(body, contentType = contentType(mediaType))
 }
 
@@ -433,13 +450,23 @@ private suspend fun respondApiError(
     error: ApiError,
     envelope: ApiResponseEnvelope,
     routeId: String,
+    probe: ApiRouteProbe? = null,
 ) {
     val payload = normalizeApiErrorPayload(error.payload, routeId)
     val body = encodeErrorBody(payload, envelope)
+    probe?.bytesOut = body.encodeToByteArray().size.toLong()
     val status = if (envelope.kind == "none") HttpStatusCode.InternalServerError else HttpStatusCode.OK
     call.respondText(body, contentType = ContentType.Application.Json, status = status)
 }
 
+private fun startRouteProbe(hooks: ApiRouteHooks, routeId: String, call: ApplicationCall): ApiRouteProbe =
+    ApiRouteProbe(
+        hooks = hooks,
+        routeId = routeId,
+        method = call.request.httpMethod.value,
+        bytesIn = call.request.headers[HttpHeaders.ContentLength]?.toLongOrNull() ?: 0L,
+    )
+
 private suspend fun respondBadRequest(call: ApplicationCall) {
     call.respondText(
         "{\"detail\":\"invalid request\"}",
@@ -12,6 +12,7 @@ import io.ktor.http.Parameters
 import io.ktor.http.content.PartData
 import io.ktor.http.content.forEachPart
 import io.ktor.server.application.ApplicationCall
+import io.ktor.server.request.httpMethod
 import io.ktor.server.request.receive
 import io.ktor.server.request.receiveMultipart
 import io.ktor.server.request.receiveParameters
@@ -222,162 +223,226 @@ public fun Route.registerDemoRoutes(
 ) {
 
     get("/api/demo/abc") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, DemoAbcQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@get
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@get
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.get.abc", call) }
         try {
-            val result = service.abc(
-                query = query
-            )
-            respondSuccess(call, result, ApiDemoA.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.get.abc")
+            val query = try {
+                decodeParameters(call.request.queryParameters, DemoAbcQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@get
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@get
+            }
+            probe?.decoded()
+            try {
+                val result = service.abc(
+                    query = query
+                )
+                probe?.handled()
+                respondSuccess(call, result, ApiDemoA.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.get.abc", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     post("/api/demo/test_post") {
-        val json = try {
-            ApiJson.decodeFromString(DemoTestPostJson.serializer(), call.receiveText().ifBlank { "{}" })
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@post
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@post
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.post.testpost", call) }
         try {
-            val result = service.testPost(
-                json = json
-            )
-            respondSuccess(call, result, DemoTestPostResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.testpost")
+            val json = try {
+                ApiJson.decodeFromString(DemoTestPostJson.serializer(), call.receiveText().ifBlank { "{}" })
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@post
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@post
+            }
+            probe?.decoded()
+            try {
+                val result = service.testPost(
+                    json = json
+                )
+                probe?.handled()
+                respondSuccess(call, result, DemoTestPostResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.testpost", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     post("/api/demo/form-submit") {
-        val form = try {
-            decodeParameters(call.receiveParameters(), DemoFormSubmitForm.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@post
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@post
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.post.formsubmit", call) }
         try {
-            val result = service.formSubmit(
-                form = form
-            )
-            respondSuccess(call, result, DemoFormSubmitResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.formsubmit")
+            val form = try {
+                decodeParameters(call.receiveParameters(), DemoFormSubmitForm.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@post
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@post
+            }
+            probe?.decoded()
+            try {
+                val result = service.formSubmit(
+                    form = form
+                )
+                probe?.handled()
+                respondSuccess(call, result, DemoFormSubmitResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.formsubmit", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/demo/request-options") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, DemoRequestOptionsQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@get
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@get
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.get.requestoptions", call) }
         try {
-            val result = service.requestOptions(
-                query = query
-            )
-            respondSuccess(call, result, RequestOptionsResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.get.requestoptions")
+            val query = try {
+                decodeParameters(call.request.queryParameters, DemoRequestOptionsQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@get
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@get
+            }
+            probe?.decoded()
+            try {
+                val result = service.requestOptions(
+                    query = query
+                )
+                probe?.handled()
+                respondSuccess(call, result, RequestOptionsResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.get.requestoptions", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/demo/path-echo/{item}/{badge}") {
-        val path = try {
-            decodeParameters(call.parameters, PathEchoPath.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@get
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@get
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.get.pathecho_item_badge", call) }
         try {
-            val result = service.pathEcho(
-                path = path
-            )
-            respondSuccess(call, result, PathEchoResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.get.pathecho_item_badge")
+            val path = try {
+                decodeParameters(call.parameters, PathEchoPath.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@get
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@get
+            }
+            probe?.decoded()
+            try {
+                val result = service.pathEcho(
+                    path = path
+                )
+                probe?.handled()
+                respondSuccess(call, result, PathEchoResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.get.pathecho_item_badge", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     post("/api/demo/empty-response") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.post.emptyresponse", call) }
         try {
-            val result = service.emptyResponse(
-            )
-            respondSuccess(call, result, DemoEmptyResponseResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.emptyresponse")
+            probe?.decoded()
+            try {
+                val result = service.emptyResponse(
+                )
+                probe?.handled()
+                respondSuccess(call, result, DemoEmptyResponseResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.emptyresponse", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     put("/api/demo/1put") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, DemoPutDemoQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@put
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@put
-        }
-        val json = try {
-            ApiJson.decodeFromString(DemoPutDemoJson.serializer(), call.receiveText().ifBlank { "{}" })
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@put
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@put
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.put.z1put", call) }
         try {
-            val result = service.putDemo(
-                query = query,
-                json = json
-            )
-            respondSuccess(call, result, DemoPutDemoResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.put.z1put")
+            val query = try {
+                decodeParameters(call.request.queryParameters, DemoPutDemoQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@put
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@put
+            }
+            val json = try {
+                ApiJson.decodeFromString(DemoPutDemoJson.serializer(), call.receiveText().ifBlank { "{}" })
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@put
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@put
+            }
+            probe?.decoded()
+            try {
+                val result = service.putDemo(
+                    query = query,
+                    json = json
+                )
+                probe?.handled()
+                respondSuccess(call, result, DemoPutDemoResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.put.z1put", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     delete("/api/demo/delete$") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, DemoDeleteQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@delete
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@delete
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.delete.delete", call) }
         try {
-            val result = service.delete(
-                query = query
-            )
-            respondSuccess(call, result, String.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/xml")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.delete.delete")
+            val query = try {
+                decodeParameters(call.request.queryParameters, DemoDeleteQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@delete
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@delete
+            }
+            probe?.decoded()
+            try {
+                val result = service.delete(
+                    query = query
+                )
+                probe?.handled()
+                respondSuccess(call, result, String.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/xml", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.delete.delete", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
@@ -416,62 +481,94 @@ public fun Route.registerDemoRoutes(
     }
 
     post("/api/demo/post_deprecated") {
-        val json = try {
-            ApiJson.decodeFromString(DemoPostDeprecatedJson.serializer(), call.receiveText().ifBlank { "{}" })
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@post
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@post
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.post.postdeprecated", call) }
         try {
-            val result = service.postDeprecated(
-                json = json
-            )
-            respondSuccess(call, result, DemoPostDeprecatedResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.postdeprecated")
+            val json = try {
+                ApiJson.decodeFromString(DemoPostDeprecatedJson.serializer(), call.receiveText().ifBlank { "{}" })
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@post
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@post
+            }
+            probe?.decoded()
+            try {
+                val result = service.postDeprecated(
+                    json = json
+                )
+                probe?.handled()
+                respondSuccess(call, result, DemoPostDeprecatedResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.postdeprecated", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     post("/api/demo/raw") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.post.raw", call) }
         try {
-            val result = service.raw(
-            )
-            respondSuccess(call, result, DemoRawResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.raw")
+            probe?.decoded()
+            try {
+                val result = service.raw(
+                )
+                probe?.handled()
+                respondSuccess(call, result, DemoRawResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.raw", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     post("/api/demo/map_model") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.post.mapmodel", call) }
         try {
-            val result = service.mapModel(
-            )
-            respondSuccess(call, result, MapSerializer(Int.serializer(), ApiDemoMap.serializer()), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.mapmodel")
+            probe?.decoded()
+            try {
+                val result = service.mapModel(
+                )
+                probe?.handled()
+                respondSuccess(call, result, MapSerializer(Int.serializer(), ApiDemoMap.serializer()), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.post.mapmodel", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/demo/error-demo") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, DemoErrorDemoQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@get
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@get
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.get.errordemo", call) }
         try {
-            val result = service.errorDemo(
-                query = query
-            )
-            respondSuccess(call, result, DemoErrorDemoResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.get.errordemo")
+            val query = try {
+                decodeParameters(call.request.queryParameters, DemoErrorDemoQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@get
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@get
+            }
+            probe?.decoded()
+            try {
+                val result = service.errorDemo(
+                    query = query
+                )
+                probe?.handled()
+                respondSuccess(call, result, DemoErrorDemoResponse.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.demo.get.errordemo", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
@@ -670,7 +767,13 @@ private suspend fun receiveFilePart(part: PartData.FileItem, config: ApiServerCo
     }
 }
 
-private suspend fun respondRawBytes(call: ApplicationCall, bytes: ByteArray, responseInfo: HttpResponseInfo) {
+private suspend fun respondRawBytes(
+    call: ApplicationCall,
+    bytes: ByteArray,
+    responseInfo: HttpResponseInfo,
+    probe: ApiRouteProbe? = null,
+) {
+    probe?.bytesOut = bytes.size.toLong()
     call.respondBytes(bytes, contentType = contentType(responseInfo.mediaType))
 }
 
@@ -767,8 +870,10 @@ private suspend fun <T> respondSuccess(
     serializer: KSerializer<T>,
     envelope: ApiResponseEnvelope,
     mediaType: String,
+    probe: ApiRouteProbe? = null,
 ) {
     val body = encodeSuccessBody(data, serializer, envelope, mediaType)
+    probe?.bytesOut = body.encodeToByteArray().size.toLong()
     call.respondText(body, contentType = contentType(mediaType))
 }
 
@@ -810,13 +915,23 @@ private suspend fun respondApiError(
     error: ApiError,
     envelope: ApiResponseEnvelope,
     routeId: String,
+    probe: ApiRouteProbe? = null,
 ) {
     val payload = normalizeApiErrorPayload(error.payload, routeId)
     val body = encodeErrorBody(payload, envelope)
+    probe?.bytesOut = body.encodeToByteArray().size.toLong()
     val status = if (envelope.kind == "none") HttpStatusCode.InternalServerError else HttpStatusCode.OK
     call.respondText(body, contentType = ContentType.Application.Json, status = status)
 }
 
+private fun startRouteProbe(hooks: ApiRouteHooks, routeId: String, call: ApplicationCall): ApiRouteProbe =
+    ApiRouteProbe(
+        hooks = hooks,
+        routeId = routeId,
+        method = call.request.httpMethod.value,
+        bytesIn = call.request.headers[HttpHeaders.ContentLength]?.toLongOrNull() ?: 0L,
+    )
+
 private suspend fun respondBadRequest(call: ApplicationCall) {
     call.respondText(
         "{\"detail\":\"invalid request\"}",
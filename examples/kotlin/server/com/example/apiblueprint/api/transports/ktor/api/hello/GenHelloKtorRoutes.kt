@@ -12,6 +12,7 @@ import io.ktor.http.Parameters
 import io.ktor.http.content.PartData
 import io.ktor.http.content.forEachPart
 import io.ktor.server.application.ApplicationCall
+import io.ktor.server.request.httpMethod
 import io.ktor.server.request.receive
 import io.ktor.server.request.receiveMultipart
 import io.ktor.server.request.receiveParameters
@@ -145,92 +146,148 @@ public fun Route.registerHelloRoutes(
 ) {
 
     get("/api/hello/abc") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, HelloAbcQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@get
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@get
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.hello.get.abc", call) }
         try {
-            val result = service.abc(
-                query = query
-            )
-            respondSuccess(call, result, MapSerializer(String.serializer(), ApiHelloMap.serializer()), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.abc")
+            val query = try {
+                decodeParameters(call.request.queryParameters, HelloAbcQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@get
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@get
+            }
+            probe?.decoded()
+            try {
+                val result = service.abc(
+                    query = query
+                )
+                probe?.handled()
+                respondSuccess(call, result, MapSerializer(String.serializer(), ApiHelloMap.serializer()), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.abc", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/hello/map-enum") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.hello.get.mapenum", call) }
         try {
-            val result = service.mapEnum(
-            )
-            respondSuccess(call, result, MapSerializer(String.serializer(), ApiHelloMap.serializer()), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.mapenum")
+            probe?.decoded()
+            try {
+                val result = service.mapEnum(
+                )
+                probe?.handled()
+                respondSuccess(call, result, MapSerializer(String.serializer(), ApiHelloMap.serializer()), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.mapenum", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/hello/list-enum") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.hello.get.listenum", call) }
         try {
-            val result = service.listEnum(
-            )
-            respondSuccess(call, result, ListSerializer(MapEnum.serializer()), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.listenum")
+            probe?.decoded()
+            try {
+                val result = service.listEnum(
+                )
+                probe?.handled()
+                respondSuccess(call, result, ListSerializer(MapEnum.serializer()), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.listenum", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/hello/string") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.hello.get.string", call) }
         try {
-            val result = service.string(
-            )
-            respondSuccess(call, result, String.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.string")
+            probe?.decoded()
+            try {
+                val result = service.string(
+                )
+                probe?.handled()
+                respondSuccess(call, result, String.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.string", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/hello/uint64") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.hello.get.uint64", call) }
         try {
-            val result = service.uint64(
-            )
-            respondSuccess(call, result, Long.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.uint64")
+            probe?.decoded()
+            try {
+                val result = service.uint64(
+                )
+                probe?.handled()
+                respondSuccess(call, result, Long.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.uint64", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/hello/string-emun") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.hello.get.stringemun", call) }
         try {
-            val result = service.stringEmun(
-            )
-            respondSuccess(call, result, MapEnum.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.stringemun")
+            probe?.decoded()
+            try {
+                val result = service.stringEmun(
+                )
+                probe?.handled()
+                respondSuccess(call, result, MapEnum.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.stringemun", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/hello/hello-way") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, HelloHelloWayQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@get
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@get
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.hello.get.helloway", call) }
         try {
-            val result = service.helloWay(
-                query = query
-            )
-            respondSuccess(call, result, Unit.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json")
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.helloway")
+            val query = try {
+                decodeParameters(call.request.queryParameters, HelloHelloWayQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@get
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@get
+            }
+            probe?.decoded()
+            try {
+                val result = service.helloWay(
+                    query = query
+                )
+                probe?.handled()
+                respondSuccess(call, result, Unit.serializer(), ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "application/json", probe)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.hello.get.helloway", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
@@ -429,7 +486,13 @@ private suspend fun receiveFilePart(part: PartData.FileItem, config: ApiServerCo
     }
 }
 
-private suspend fun respondRawBytes(call: ApplicationCall, bytes: ByteArray, responseInfo: HttpResponseInfo) {
+private suspend fun respondRawBytes(
+    call: ApplicationCall,
+    bytes: ByteArray,
+    responseInfo: HttpResponseInfo,
+    probe: ApiRouteProbe? = null,
+) {
+    probe?.bytesOut = bytes.size.toLong()
     call.respondBytes(bytes, contentType = contentType(responseInfo.mediaType))
 }
 
@@ -526,8 +589,10 @@ private suspend fun <T> respondSuccess(
     serializer: KSerializer<T>,
     envelope: ApiResponseEnvelope,
     mediaType: String,
+    probe: ApiRouteProbe? = null,
 ) {
     val body = encodeSuccessBody(data, serializer, envelope, mediaType)
+    probe?.bytesOut = body.encodeToByteArray().size.toLong()
     call.respondText(body, contentType = contentType(mediaType))
 }
 
@@ -569,13 +634,23 @@ private suspend fun respondApiError(
     error: ApiError,
     envelope: ApiResponseEnvelope,
     routeId: String,
+    probe: ApiRouteProbe? = null,
 ) {
     val payload = normalizeApiErrorPayload(error.payload, routeId)
     val body = encodeErrorBody(payload, envelope)
+    probe?.bytesOut = body.encodeToByteArray().size.toLong()
     val status = if (envelope.kind == "none") HttpStatusCode.InternalServerError else HttpStatusCode.OK
     call.respondText(body, contentType = ContentType.Application.Json, status = status)
 }
 
+private fun startRouteProbe(hooks: ApiRouteHooks, routeId: String, call: ApplicationCall): ApiRouteProbe =
+    ApiRouteProbe(
+        hooks = hooks,
+        routeId = routeId,
+        method = call.request.httpMethod.value,
+        bytesIn = call.request.headers[HttpHeaders.ContentLength]?.toLongOrNull() ?: 0L,
+    )
+
 private suspend fun respondBadRequest(call: ApplicationCall) {
     call.respondText(
         "{\"detail\":\"invalid request\"}",
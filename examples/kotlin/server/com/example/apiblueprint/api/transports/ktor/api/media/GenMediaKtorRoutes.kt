@@ -12,6 +12,7 @@ import io.ktor.http.Parameters
 import io.ktor.http.content.PartData
 import io.ktor.http.content.forEachPart
 import io.ktor.server.application.ApplicationCall
+import io.ktor.server.request.httpMethod
 import io.ktor.server.request.receive
 import io.ktor.server.request.receiveMultipart
 import io.ktor.server.request.receiveParameters
@@ -145,95 +146,151 @@ public fun Route.registerMediaRoutes(
 ) {
 
     post("/api/media/preview") {
-        val multipart = try {
-            decodeMultipart(call, MediaPreviewRequest.serializer(), config)
-        } catch (_: ApiPayloadTooLargeException) {
-            respondPayloadTooLarge(call)
-            return@post
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@post
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@post
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.media.post.preview", call) }
         try {
-            val result = service.mediaPreview(
-                multipart = multipart
-            )
-            respondRaw(call, result, HTTP_ROUTE_API_MEDIA_POST_PREVIEW.response)
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.post.preview")
+            val multipart = try {
+                decodeMultipart(call, MediaPreviewRequest.serializer(), config)
+            } catch (_: ApiPayloadTooLargeException) {
+                respondPayloadTooLarge(call)
+                return@post
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@post
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@post
+            }
+            probe?.decoded()
+            try {
+                val result = service.mediaPreview(
+                    multipart = multipart
+                )
+                probe?.handled()
+                respondRaw(call, result, HTTP_ROUTE_API_MEDIA_POST_PREVIEW.response)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.post.preview", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/media/frame") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.media.get.frame", call) }
         try {
-            val result = service.mediaFrame(
-            )
-            respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_FRAME.response)
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.frame")
+            probe?.decoded()
+            try {
+                val result = service.mediaFrame(
+                )
+                probe?.handled()
+                respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_FRAME.response)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.frame", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/media/download") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.media.get.download", call) }
         try {
-            val result = service.mediaDownload(
-            )
-            respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_DOWNLOAD.response)
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.download")
+            probe?.decoded()
+            try {
+                val result = service.mediaDownload(
+                )
+                probe?.handled()
+                respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_DOWNLOAD.response)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.download", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/media/download-dynamic") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.media.get.downloaddynamic", call) }
         try {
-            val result = service.mediaDownloadDynamic(
-            )
-            respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_DOWNLOADDYNAMIC.response)
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.downloaddynamic")
+            probe?.decoded()
+            try {
+                val result = service.mediaDownloadDynamic(
+                )
+                probe?.handled()
+                respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_DOWNLOADDYNAMIC.response)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.downloaddynamic", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/media/download-filename-edge") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.media.get.downloadfilenameedge", call) }
         try {
-            val result = service.mediaDownloadFilenameEdge(
-            )
-            respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_DOWNLOADFILENAMEEDGE.response)
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.downloadfilenameedge")
+            probe?.decoded()
+            try {
+                val result = service.mediaDownloadFilenameEdge(
+                )
+                probe?.handled()
+                respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_DOWNLOADFILENAMEEDGE.response)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.downloadfilenameedge", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/media/error-frame") {
-        val query = try {
-            decodeParameters(call.request.queryParameters, MediaMediaErrorFrameQuery.serializer())
-        } catch (_: SerializationException) {
-            respondBadRequest(call)
-            return@get
-        } catch (_: IllegalArgumentException) {
-            respondBadRequest(call)
-            return@get
-        }
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.media.get.errorframe", call) }
         try {
-            val result = service.mediaErrorFrame(
-                query = query
-            )
-            respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_ERRORFRAME.response)
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.errorframe")
+            val query = try {
+                decodeParameters(call.request.queryParameters, MediaMediaErrorFrameQuery.serializer())
+            } catch (_: SerializationException) {
+                respondBadRequest(call)
+                return@get
+            } catch (_: IllegalArgumentException) {
+                respondBadRequest(call)
+                return@get
+            }
+            probe?.decoded()
+            try {
+                val result = service.mediaErrorFrame(
+                    query = query
+                )
+                probe?.handled()
+                respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_ERRORFRAME.response)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.errorframe", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
     get("/api/media/mjpeg") {
+        val probe = config.routeHooks?.let { startRouteProbe(it, "api.media.get.mjpeg", call) }
         try {
-            val result = service.mediaMjpeg(
-            )
-            respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_MJPEG.response)
-        } catch (error: ApiError) {
-            respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.mjpeg")
+            probe?.decoded()
+            try {
+                val result = service.mediaMjpeg(
+                )
+                probe?.handled()
+                respondRaw(call, result, HTTP_ROUTE_API_MEDIA_GET_MJPEG.response)
+            } catch (error: ApiError) {
+                probe?.errorCode = error.code
+                respondApiError(call, error, ApiResponseEnvelope(name = "CodeMessageDataEnvelope", kind = "code_message_data", errorIdentity = "nested", successCode = 0, successMessage = "ok", fields = ApiResponseEnvelopeFields(code = "code", message = "message", data = "data", error = "error", ok = "ok")), "api.media.get.mjpeg", probe)
+            }
+        } finally {
+            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)
         }
     }
 
@@ -432,7 +489,13 @@ private suspend fun receiveFilePart(part: PartData.FileItem, config: ApiServerCo
     }
 }
 
-private suspend fun respondRawBytes(call: ApplicationCall, bytes: ByteArray, responseInfo: HttpResponseInfo) {
+private suspend fun respondRawBytes(
+    call: ApplicationCall,
+    bytes: ByteArray,
+    responseInfo: HttpResponseInfo,
+    probe: ApiRouteProbe? = null,
+) {
+    probe?.bytesOut = bytes.size.toLong()
     call.respondBytes(bytes, contentType = contentType(responseInfo.mediaType))
 }
 
@@ -529,8 +592,10 @@ private suspend fun <T> respondSuccess(
     serializer: KSerializer<T>,
     envelope: ApiResponseEnvelope,
     mediaType: String,
+    probe: ApiRouteProbe? = null,
 ) {
     val body = encodeSuccessBody(data, serializer, envelope, mediaType)
+    probe?.bytesOut = body.encodeToByteArray().size.toLong()
     call.respondText(body, contentType = contentType(mediaType))
 }
 
@@ -572,13 +637,23 @@ private suspend fun respondApiError(
     error: ApiError,
     envelope: ApiResponseEnvelope,
     routeId: String,
+    probe: ApiRouteProbe? = null,
 ) {
     val payload = normalizeApiErrorPayload(error.payload, routeId)
     val body = encodeErrorBody(payload, envelope)
+    probe?.bytesOut = body.encodeToByteArray().size.toLong()
     val status = if (envelope.kind == "none") HttpStatusCode.InternalServerError else HttpStatusCode.OK
     call.respondText(body, contentType = ContentType.Application.Json, status = status)
 }
 
+private fun startRouteProbe(hooks: ApiRouteHooks, routeId: String, call: ApplicationCall): ApiRouteProbe =
+    ApiRouteProbe(
+        hooks = hooks,
+        routeId = routeId,
+        method = call.request.httpMethod.value,
+        bytesIn = call.request.headers[HttpHeaders.ContentLength]?.toLongOrNull() ?: 0L,
+    )
+
 private suspend fun respondBadRequest(call: ApplicationCall) {
     call.respondText(
         "{\"detail\":\"invalid request\"}",
@@ -25,6 +25,9 @@ public data class ApiServerConfig(
     public val decompressedBinaryBodyMaxBytes: Long = 16L * 1024L * 1024L,
     public val binaryContentDecoders: Map<String, ApiBinaryContentDecoder> = emptyMap(),
     public val websocketMessageMaxBytes: Long = 1L * 1024L * 1024L,
+    // Per-route timing and tracing callbacks for RPC routes, e.g. an ApiRouteHistogram; null leaves
+    // the routes without any clock reads.
+    public val routeHooks: ApiRouteHooks? = null,
 )
 
 @Serializable
@@ -1,100 +1,121 @@
 # Code generated by api-blueprint (Python client); DO NOT EDIT.
 from __future__ import annotations
 
+import json
+import math
 from enum import Enum
-from typing import Any, Mapping
+from typing import Any, Iterator, Mapping
+from urllib.parse import unquote_plus
 
 
 _MISSING = object()
 
+# Decoders pass `(parent, key)` pairs down instead of formatting a path string
+# per field or element; `_path_text` renders the chain only for error messages.
+_DecodePath = str | tuple[Any, str | int]
 
-def _field_path(path: str, field: str) -> str:
-    return f"{path}.{field}" if path else field
 
+def _field_path(path: _DecodePath, field: str) -> _DecodePath:
+    return (path, field)
 
-def _decode_required(decoder, value: object, path: str):
+
+def _path_text(path: _DecodePath) -> str:
+    keys: list[str | int] = []
+    while isinstance(path, tuple):
+        path, key = path
+        keys.append(key)
+    text = path
+    for key in reversed(keys):
+        if isinstance(key, int):
+            text = f"{text}[{key}]"
+        else:
+            text = f"{text}.{key}" if text else key
+    return text
+
+
+def _decode_required(decoder, value: object, path: _DecodePath):
     if value is _MISSING:
-        raise ValueError(f"{path}: missing required field")
+        raise ValueError(f"{_path_text(path)}: missing required field")
     if value is None:
-        raise TypeError(f"{path}: expected non-null value")
+        raise TypeError(f"{_path_text(path)}: expected non-null value")
     return decoder(value, path)
 
 
-def _decode_optional(decoder, value: object, path: str):
+def _decode_optional(decoder, value: object, path: _DecodePath):
     if value is _MISSING or value is None:
         return None
     return decoder(value, path)
 
 
-def _decode_any(value: object, path: str) -> Any:
+def _decode_any(value: object, path: _DecodePath) -> Any:
     return value
 
 
-def _decode_object(value: object, path: str) -> dict[str, Any]:
+def _decode_object(value: object, path: _DecodePath) -> dict[str, Any]:
     if isinstance(value, Mapping):
         return dict(value)
-    raise TypeError(f"{path}: expected object")
+    raise TypeError(f"{_path_text(path)}: expected object")
 
 
-def _decode_str(value: object, path: str) -> str:
+def _decode_str(value: object, path: _DecodePath) -> str:
     if isinstance(value, str):
         return value
-    raise TypeError(f"{path}: expected string")
+    raise TypeError(f"{_path_text(path)}: expected string")
 
 
-def _decode_coerce_string(value: object, path: str) -> str:
+def _decode_coerce_string(value: object, path: _DecodePath) -> str:
     if isinstance(value, str):
         return value
     if isinstance(value, bool):
-        raise TypeError(f"{path}: expected string or integer")
+        raise TypeError(f"{_path_text(path)}: expected string or integer")
     if isinstance(value, int):
         return str(value)
-    raise TypeError(f"{path}: expected string or integer")
+    raise TypeError(f"{_path_text(path)}: expected string or integer")
 
 
-def _decode_int(value: object, path: str) -> int:
+def _decode_int(value: object, path: _DecodePath) -> int:
     if isinstance(value, bool):
-        raise TypeError(f"{path}: expected int")
+        raise TypeError(f"{_path_text(path)}: expected int")
     if isinstance(value, int):
         return value
     if isinstance(value, str):
         try:
             return int(value)
         except ValueError as err:
-            raise ValueError(f"{path}: expected int") from err
-    raise TypeError(f"{path}: expected int")
+            raise ValueError(f"{_path_text(path)}: expected int") from err
+    raise TypeError(f"{_path_text(path)}: expected int")
 
 
-def _decode_strict_int(value: object, path: str) -> int:
+def _decode_strict_int(value: object, path: _DecodePath) -> int:
     if isinstance(value, bool):
-        raise TypeError(f"{path}: expected int")
+        raise TypeError(f"{_path_text(path)}: expected int")
     if isinstance(value, int):
         return value
-    raise TypeError(f"{path}: expected int")
+    raise TypeError(f"{_path_text(path)}: expected int")
 
 
-def _decode_float(value: object, path: str) -> float:
+def _decode_float(value: object, path: _DecodePath) -> float:
     if isinstance(value, bool):
-        raise TypeError(f"{path}: expected float")
+        raise TypeError(f"{_path_text(path)}: expected float")
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
         try:
             return float(value)
         except ValueError as err:
-            raise ValueError(f"{path}: expected float") from err
-    raise TypeError(f"{path}: expected float")
+            raise ValueError(f"{_path_text(path)}: expected float") from err
+    raise TypeError(f"{_path_text(path)}: expected float")
 
 
-def _decode_strict_float(value: object, path: str) -> float:
+def _decode_strict_float(value: object, path: _DecodePath) -> float:
     if isinstance(value, bool):
-        raise TypeError(f"{path}: expected float")
+        raise TypeError(f"{_path_text(path)}: expected float")
     if isinstance(value, (int, float)):
         return float(value)
-    raise TypeError(f"{path}: expected float")
+    raise TypeError(f"{_path_text(path)}: expected float")
 
 
-def _decode_bool(value: object, path: str) -> bool:
+def _decode_bool(value: object, path: _DecodePath) -> bool:
     if isinstance(value, bool):
         return value
     if isinstance(value, str):
@@ -103,45 +124,153 @@ def _decode_bool(value: object, path: str) -> bool:
             return True
         if lowered in {"0", "false", "no", "off"}:
             return False
-    raise TypeError(f"{path}: expected bool")
+    raise TypeError(f"{_path_text(path)}: expected bool")
 
 
-def _decode_strict_bool(value: object, path: str) -> bool:
+def _decode_strict_bool(value: object, path: _DecodePath) -> bool:
     if isinstance(value, bool):
         return value
-    raise TypeError(f"{path}: expected bool")
+    raise TypeError(f"{_path_text(path)}: expected bool")
 
 
-def _decode_bytes(value: object, path: str) -> bytes:
+def _decode_bytes(value: object, path: _DecodePath) -> bytes:
     if isinstance(value, bytes):
         return value
     if isinstance(value, str):
         return value.encode("utf-8")
-    raise TypeError(f"{path}: expected bytes")
+    raise TypeError(f"{_path_text(path)}: expected bytes")
 
 
-def _decode_file(value: object, path: str) -> object:
+def _decode_file(value: object, path: _DecodePath) -> object:
     if value is None:
-        raise TypeError(f"{path}: expected file")
+        raise TypeError(f"{_path_text(path)}: expected file")
     return value
 
 
-def _decode_list(value: object, path: str, item_decoder) -> list[Any]:
+def _decode_list(value: object, path: _DecodePath, item_decoder) -> list[Any]:
     if not isinstance(value, list):
-        raise TypeError(f"{path}: expected list")
-    return [item_decoder(item, f"{path}[{index}]") for index, item in enumerate(value)]
+        raise TypeError(f"{_path_text(path)}: expected list")
+    return [item_decoder(item, (path, index)) for index, item in enumerate(value)]
 
 
-def _decode_map(value: object, path: str, key_decoder, item_decoder) -> dict[Any, Any]:
+def _decode_map(value: object, path: _DecodePath, key_decoder, item_decoder) -> dict[Any, Any]:
     if not isinstance(value, Mapping):
-        raise TypeError(f"{path}: expected object")
+        raise TypeError(f"{_path_text(path)}: expected object")
     return {
-        key_decoder(key, f"{path}.<key>"): item_decoder(item, _field_path(path, str(key)))
+        key_decoder(key, (path, "<key>")): item_decoder(item, (path, str(key)))
         for key, item in value.items()
     }
 
 
-def _decode_one_of(value: object, path: str, decoders) -> object:
+def _decode_scalar_list(value: object, path: _DecodePath, item_type: type, item_decoder) -> list[Any]:
+    if not isinstance(value, list):
+        raise TypeError(f"{_path_text(path)}: expected list")
+    for item in value:
+        if type(item) is not item_type:
+            return [item_decoder(item, (path, index)) for index, item in enumerate(value)]
+    return list(value)
+
+
+def _decode_scalar_map(value: object, path: _DecodePath, item_type: type, item_decoder) -> dict[str, Any]:
+    if not isinstance(value, Mapping):
+        raise TypeError(f"{_path_text(path)}: expected object")
+    for key, item in value.items():
+        if type(key) is not str or type(item) is not item_type:
+            return _decode_map(value, path, _decode_str, item_decoder)
+    return dict(value)
+
+
+def _batch_rows(value: object) -> list[dict[str, Any]] | None:
+    # `from_values` decodes plain JSON rows column by column; any other input
+    # takes the per-item path so results and errors stay those of `from_value`.
+    if type(value) is not list:
+        return None
+    for row in value:
+        if type(row) is not dict:
+            return None
+    return value
+
+
+def _decode_column(
+    rows: list[dict[str, Any]],
+    path: _DecodePath,
+    wire_name: str,
+    decoder,
+    exact_type: type | None = None,
+    optional: bool = False,
+) -> list[Any]:
+    # Scalar columns are checked in one C-level pass over the item types; a
+    # column with any other type decodes item by item with the row's path.
+    if optional:
+        column = [row.get(wire_name) for row in rows]
+        if exact_type is not None and set(map(type, column)) <= {exact_type, type(None)}:
+            return column
+        return [_decode_optional(decoder, item, ((path, index), wire_name)) for index, item in enumerate(column)]
+    column = [row.get(wire_name, _MISSING) for row in rows]
+    if exact_type is not None and set(map(type, column)) <= {exact_type}:
+        return column
+    return [_decode_required(decoder, item, ((path, index), wire_name)) for index, item in enumerate(column)]
+
+
+def _query_items(query_string: bytes, keys: frozenset[str]) -> Iterator[tuple[str, str]]:
+    # Splits a raw ASGI query string the way Starlette's `QueryParams` does
+    # (latin-1, then `+`/percent unquoting), but yields only the declared keys
+    # and never unquotes the values of the others.
+    if not query_string:
+        return
+    for part in query_string.decode("latin-1").split("&"):
+        key, _, value = part.partition("=")
+        if "%" in key or "+" in key:
+            key = unquote_plus(key)
+        if key not in keys:
+            continue
+        if "%" in value or "+" in value:
+            value = unquote_plus(value)
+        yield key, value
+
+
+def _decode_query_int(value: str, path: _DecodePath) -> int:
+    try:
+        return int(value)
+    except ValueError as err:
+        raise ValueError(f"{_path_text(path)}: expected int") from err
+
+
+def _decode_query_float(value: str, path: _DecodePath) -> float:
+    try:
+        return float(value)
+    except ValueError as err:
+        raise ValueError(f"{_path_text(path)}: expected float") from err
+
+
+_QUERY_BOOLS = {"1": True, "true": True, "yes": True, "on": True, "0": False, "false": False, "no": False, "off": False}
+
+
+def _decode_query_bool(value: str, path: _DecodePath) -> bool:
+    result = _QUERY_BOOLS.get(value.lower())
+    if result is None:
+        raise TypeError(f"{_path_text(path)}: expected bool")
+    return result
+
+
+def _decode_query_list(
+    values: list[str],
+    path: _DecodePath,
+    item_decoder,
+    optional: bool = False,
+) -> list[Any] | None:
+    # A list field arrives as one `key=value` pair per item; no pair at all
+    # means the field was omitted.
+    if not values:
+        if optional:
+            return None
+        raise ValueError(f"{_path_text(path)}: missing required field")
+    if item_decoder is None:
+        return values
+    return [item_decoder(item, (path, index)) for index, item in enumerate(values)]
+
+
+def _decode_one_of(value: object, path: _DecodePath, decoders) -> object:
     errors: list[str] = []
     for decoder in decoders:
         try:
@@ -149,7 +278,17 @@ def _decode_one_of(value: object, path: str, decoders) -> object:
         except (TypeError, ValueError) as err:
             errors.append(str(err))
     detail = "; ".join(errors) if errors else "no variants"
-    raise TypeError(f"{path}: expected one of declared JSON shapes ({detail})")
+    raise TypeError(f"{_path_text(path)}: expected one of declared JSON shapes ({detail})")
+
+
+def _enum_lookup(enum_cls) -> dict[object, Any]:
+    # Keys every member by its value and by str(value), so generated `from_value`
+    # accepts "1" for IntEnum 1 (or 1 for StrEnum "1") with dict lookups only.
+    lookup: dict[object, Any] = {}
+    for item in enum_cls:
+        lookup.setdefault(item.value, item)
+        lookup.setdefault(str(item.value), item)
+    return lookup
 
 
 def _api_key_to_json(value: object) -> str:
@@ -174,6 +313,13 @@ def _api_to_json(value: object) -> object:
     return value
 
 
+def _api_json_bytes(value: object) -> bytes | None:
+    to_json_bytes = getattr(value, "to_json_bytes", None)
+    if to_json_bytes is None:
+        return None
+    return to_json_bytes()
+
+
 def _api_to_transport(value: object) -> object:
     if value is None:
         return None
@@ -192,3 +338,115 @@ def _api_to_transport(value: object) -> object:
     if isinstance(value, tuple):
         return value
     return value
+
+
+# Generated models serialize through `_write_json(out)` methods that append JSON
+# text fragments to `out` using the field types known at codegen time. Each
+# writer takes a no-dispatch path for values of the exact declared type and
+# falls back to `_api_to_json` plus the compact encoder for anything else, so
+# the bytes match `encode_json(model.to_mapping())`.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+_json_str = json.encoder.encode_basestring
+
+
+def _write_json_any(out: list[str], value: object) -> None:
+    out.append(_JSON_ENCODER.encode(_api_to_json(value)))
+
+
+def _write_json_str(out: list[str], value: object) -> None:
+    if type(value) is str:
+        out.append(_json_str(value))
+    else:
+        _write_json_any(out, value)
+
+
+def _write_json_int(out: list[str], value: object) -> None:
+    if type(value) is int:
+        out.append(int.__repr__(value))
+    else:
+        _write_json_any(out, value)
+
+
+def _write_json_float(out: list[str], value: object) -> None:
+    if type(value) is float and math.isfinite(value):
+        out.append(float.__repr__(value))
+    else:
+        _write_json_any(out, value)
+
+
+def _write_json_bool(out: list[str], value: object) -> None:
+    if value is True:
+        out.append("true")
+    elif value is False:
+        out.append("false")
+    else:
+        _write_json_any(out, value)
+
+
+def _write_json_enum(out: list[str], value: object) -> None:
+    raw = value.value if isinstance(value, Enum) else value
+    if type(raw) is str:
+        out.append(_json_str(raw))
+    elif type(raw) is int:
+        out.append(int.__repr__(raw))
+    else:
+        _write_json_any(out, raw)
+
+
+def _write_json_model(out: list[str], value: object) -> None:
+    write = getattr(value, "_write_json", None)
+    if write is None:
+        _write_json_any(out, value)
+    else:
+        write(out)
+
+
+def _write_json_list(out: list[str], value: object, item_writer) -> None:
+    if not isinstance(value, (list, tuple)):
+        _write_json_any(out, value)
+        return
+    out.append("[")
+    for index, item in enumerate(value):
+        if index:
+            out.append(",")
+        item_writer(out, item)
+    out.append("]")
+
+
+def _write_json_map(out: list[str], value: object, item_writer) -> None:
+    if not isinstance(value, Mapping):
+        _write_json_any(out, value)
+        return
+    sep = "{"
+    for key, item in value.items():
+        if item is None:
+            continue
+        out.append(sep)
+        out.append(_json_str(_api_key_to_json(key)))
+        out.append(":")
+        item_writer(out, item)
+        sep = ","
+    out.append("{}" if sep == "{" else "}")
+
+
+def _write_json_scalar_list(out: list[str], value: object, item_type: type, item_writer) -> None:
+    # Lists of exact scalar items go through the C encoder in one call.
+    if type(value) is list:
+        for item in value:
+            if type(item) is not item_type:
+                break
+        else:
+            out.append(_JSON_ENCODER.encode(value))
+            return
+    _write_json_list(out, value, item_writer)
+
+
+def _write_json_scalar_map(out: list[str], value: object, item_type: type, item_writer) -> None:
+    if type(value) is dict:
+        for key, item in value.items():
+            if type(key) is not str or type(item) is not item_type:
+                break
+        else:
+            out.append(_JSON_ENCODER.encode(value))
+            return
+    _write_json_map(out, value, item_writer)
@@ -5,6 +5,7 @@ from typing import Any, Mapping
 
 from ....runtime.client import ApiChannelBridge, ApiClientTransport, ApiRawResponse, ApiRequest, ApiStreamBridge, ApiStreamResponse
 from ....runtime.gen_codecs import (
+    _api_json_bytes,
     _api_to_json,
     _api_to_transport,
     _decode_any,
@@ -28,6 +29,7 @@ from .gen_types import (
     AuditPacketResponse,
     WidePacketQuery,
     WidePacketResponse,
+    _decode_list_of_int,
     DemoPacket,
     DemoPacketWire,
     AuditPacket,
@@ -40,6 +42,7 @@ from .gen_types import (
 class BinaryClient:
     def __init__(self, transport: ApiClientTransport):
         self._transport = transport
+        self._trusted_decode = getattr(transport, "trusted_decode", False)
 
     async def packet(
         self,
@@ -63,6 +66,8 @@ class BinaryClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return PacketResponse.from_trusted(payload)
         return PacketResponse.from_value(payload, "packet.response")
 
     async def audit_packet(
@@ -87,6 +92,8 @@ class BinaryClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return AuditPacketResponse.from_trusted(payload)
         return AuditPacketResponse.from_value(payload, "audit_packet.response")
 
     async def wide_packet(
@@ -111,6 +118,8 @@ class BinaryClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return WidePacketResponse.from_trusted(payload)
         return WidePacketResponse.from_value(payload, "wide_packet.response")
 
     async def audit_packet_response(
@@ -5,6 +5,7 @@ from typing import Any, Mapping
 
 from ....runtime.client import ApiChannelBridge, ApiClientTransport, ApiRawResponse, ApiRequest, ApiStreamBridge, ApiStreamResponse
 from ....runtime.gen_codecs import (
+    _api_json_bytes,
     _api_to_json,
     _api_to_transport,
     _decode_any,
@@ -29,6 +30,7 @@ from .gen_types import (
 class ConflictClient:
     def __init__(self, transport: ApiClientTransport):
         self._transport = transport
+        self._trusted_decode = getattr(transport, "trusted_decode", False)
 
     async def default(
         self,
@@ -50,4 +52,6 @@ class ConflictClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return DefaultResponse.from_trusted(payload)
         return DefaultResponse.from_value(payload, "default.response")
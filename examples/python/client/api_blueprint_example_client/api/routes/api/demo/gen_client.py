@@ -5,6 +5,7 @@ from typing import Any, Mapping
 
 from ....runtime.client import ApiChannelBridge, ApiClientTransport, ApiRawResponse, ApiRequest, ApiStreamBridge, ApiStreamResponse
 from ....runtime.gen_codecs import (
+    _api_json_bytes,
     _api_to_json,
     _api_to_transport,
     _decode_any,
@@ -62,12 +63,33 @@ from .gen_types import (
     SweepStreamMessage,
     AssistantServerMessage,
     AssistantClientMessage,
+    _decode_list_of_int,
+    _decode_map_of_str_to_int,
+    _decode_list_of_ApiDemoMap,
+    _decode_list_of_ApiDemoSubA,
+    _decode_list_of_StatusEnum,
+    _decode_list_of_str,
+    _decode_map_of_str_to_ApiDemoMap,
+    _decode_list_of_float,
+    _decode_list_of_ANONDeleteAnonList,
+    _decode_list_of_ApiDemoA,
+    _decode_map_of_int_to_list_of_ApiDemoA,
+    _decode_map_of_int_to_ApiDemoMap,
+    _trust_list_of_ApiDemoMap,
+    _trust_list_of_ApiDemoSubA,
+    _trust_list_of_StatusEnum,
+    _trust_map_of_str_to_ApiDemoMap,
+    _trust_list_of_ANONDeleteAnonList,
+    _trust_list_of_ApiDemoA,
+    _trust_map_of_int_to_list_of_ApiDemoA,
+    _trust_map_of_int_to_ApiDemoMap,
 )
 
 
 class DemoClient:
     def __init__(self, transport: ApiClientTransport):
         self._transport = transport
+        self._trusted_decode = getattr(transport, "trusted_decode", False)
 
     async def abc(
         self,
@@ -89,6 +111,8 @@ class DemoClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return AbcResponse.from_trusted(payload)
         return AbcResponse.from_value(payload, "abc.response")
 
     async def test_post(
@@ -105,12 +129,15 @@ class DemoClient:
                 path="/api/demo/test_post",
                 route_id="api.demo.post.testpost",
                 json=_api_to_json(json),
+                json_bytes=_api_json_bytes(json),
                 response_type=response_type,
                 response_envelope={"name": "CodeMessageDataEnvelope", "kind": "code_message_data", "error_identity": "nested", "success_code": 0, "success_message": "ok", "fields": {"code": "code", "message": "message", "data": "data", "error": "error"}},
                 headers=headers,
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return TestPostResponse.from_trusted(payload)
         return TestPostResponse.from_value(payload, "test_post.response")
 
     async def form_submit(
@@ -133,6 +160,8 @@ class DemoClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return FormSubmitResponse.from_trusted(payload)
         return FormSubmitResponse.from_value(payload, "form_submit.response")
 
     async def request_options(
@@ -155,6 +184,8 @@ class DemoClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return RequestOptionsResponse.from_trusted(payload)
         return RequestOptionsResponse.from_value(payload, "request_options.response")
 
     async def path_echo(
@@ -177,6 +208,8 @@ class DemoClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return PathEchoResponse.from_trusted(payload)
         return PathEchoResponse.from_value(payload, "path_echo.response")
 
     async def empty_response(
@@ -215,12 +248,15 @@ class DemoClient:
                 route_id="api.demo.put.z1put",
                 query=_api_to_json(query),
                 json=_api_to_json(json),
+                json_bytes=_api_json_bytes(json),
                 response_type=response_type,
                 response_envelope={"name": "CodeMessageDataEnvelope", "kind": "code_message_data", "error_identity": "nested", "success_code": 0, "success_message": "ok", "fields": {"code": "code", "message": "message", "data": "data", "error": "error"}},
                 headers=headers,
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return PutDemoResponse.from_trusted(payload)
         return PutDemoResponse.from_value(payload, "put_demo.response")
 
     async def delete(
@@ -243,6 +279,8 @@ class DemoClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return DeleteResponse.from_trusted(payload)
         return DeleteResponse.from_value(payload, "delete.response")
 
     def subscribe_sweep_events(
@@ -285,12 +323,15 @@ class DemoClient:
                 path="/api/demo/post_deprecated",
                 route_id="api.demo.post.postdeprecated",
                 json=_api_to_json(json),
+                json_bytes=_api_json_bytes(json),
                 response_type=response_type,
                 response_envelope={"name": "CodeMessageDataEnvelope", "kind": "code_message_data", "error_identity": "nested", "success_code": 0, "success_message": "ok", "fields": {"code": "code", "message": "message", "data": "data", "error": "error"}},
                 headers=headers,
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return PostDeprecatedResponse.from_trusted(payload)
         return PostDeprecatedResponse.from_value(payload, "post_deprecated.response")
 
     async def raw(
@@ -311,6 +352,8 @@ class DemoClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return RawResponse.from_trusted(payload)
         return RawResponse.from_value(payload, "raw.response")
 
     async def map_model(
@@ -331,7 +374,9 @@ class DemoClient:
                 timeout=timeout,
             )
         )
-        return (lambda item, path: _decode_map(item, path, _decode_int, ApiDemoMap.from_value))(payload, "map_model.response")
+        if self._trusted_decode:
+            return _trust_map_of_int_to_ApiDemoMap(payload)
+        return _decode_map_of_int_to_ApiDemoMap(payload, "map_model.response")
 
     async def error_demo(
         self,
@@ -353,4 +398,6 @@ class DemoClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return ErrorDemoResponse.from_trusted(payload)
         return ErrorDemoResponse.from_value(payload, "error_demo.response")
@@ -9,10 +9,12 @@ from ....runtime.gen_codecs import (
     _MISSING,
     _api_to_json,
     _api_to_transport,
+    _batch_rows,
     _decode_any,
     _decode_bool,
     _decode_bytes,
     _decode_coerce_string,
+    _decode_column,
     _decode_file,
     _decode_float,
     _decode_int,
@@ -21,12 +23,33 @@ from ....runtime.gen_codecs import (
     _decode_object,
     _decode_one_of,
     _decode_optional,
+    _decode_query_bool,
+    _decode_query_float,
+    _decode_query_int,
+    _decode_query_list,
     _decode_required,
+    _decode_scalar_list,
+    _decode_scalar_map,
     _decode_str,
     _decode_strict_bool,
     _decode_strict_float,
     _decode_strict_int,
+    _DecodePath,
+    _enum_lookup,
     _field_path,
+    _path_text,
+    _query_items,
+    _write_json_any,
+    _write_json_bool,
+    _write_json_enum,
+    _write_json_float,
+    _write_json_int,
+    _write_json_list,
+    _write_json_map,
+    _write_json_model,
+    _write_json_scalar_list,
+    _write_json_scalar_map,
+    _write_json_str,
 )
 
 
@@ -40,36 +63,48 @@ class ColorEnum(StrEnum):
     BLUE = "blue"  # Blue color
 
     @classmethod
-    def from_value(cls, value: object, path: str = "ColorEnum") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "ColorEnum") -> Self:
         if isinstance(value, cls):
             return value
-        for item in cls:
-            if item.value == value or str(item.value) == str(value):
-                return item
-        raise ValueError(f"{path}: expected ColorEnum value")
+        try:
+            return _ColorEnum_BY_VALUE[value]
+        except (KeyError, TypeError):
+            item = _ColorEnum_BY_VALUE.get(str(value))
+        if item is None:
+            raise ValueError(f"{_path_text(path)}: expected ColorEnum value")
+        return item
 
     def to_json(self) -> object:
         return self.value
 
 
+_ColorEnum_BY_VALUE = _enum_lookup(ColorEnum)
+
+
 class StatusEnum(IntEnum):
     PENDING = 1  # Pending status
     RUNNING = 2  # Running status
     FINISHED = 3  # Finished status
 
     @classmethod
-    def from_value(cls, value: object, path: str = "StatusEnum") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "StatusEnum") -> Self:
         if isinstance(value, cls):
             return value
-        for item in cls:
-            if item.value == value or str(item.value) == str(value):
-                return item
-        raise ValueError(f"{path}: expected StatusEnum value")
+        try:
+            return _StatusEnum_BY_VALUE[value]
+        except (KeyError, TypeError):
+            item = _StatusEnum_BY_VALUE.get(str(value))
+        if item is None:
+            raise ValueError(f"{_path_text(path)}: expected StatusEnum value")
+        return item
 
     def to_json(self) -> object:
         return self.value
 
 
+_StatusEnum_BY_VALUE = _enum_lookup(StatusEnum)
+
+
 @dataclass(kw_only=True)
 class AbcQuery:
     arg1: bool | None = None
@@ -83,19 +118,41 @@ class AbcQuery:
         return cls._from_mapping(value, "AbcQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AbcQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AbcQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AbcQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        arg1_column = _decode_column(rows, path, "arg1", _decode_bool, bool, optional=True)
+        arg3_column = _decode_column(rows, path, "arg3", _decode_str, str, optional=True)
+        arg2_column = _decode_column(rows, path, "arg2", _decode_float, float, optional=True)
+        return [
+            cls(arg1=arg1_item, arg3=arg3_item, arg2=arg2_item)
+            for arg1_item, arg3_item, arg2_item in zip(arg1_column, arg3_column, arg2_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            arg1=value.get("arg1"),
+            arg3=value.get("arg3"),
+            arg2=value.get("arg2"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            arg1=_decode_optional(_decode_bool, value.get("arg1", _MISSING), _field_path(path, "arg1")),
-            arg3=_decode_optional(_decode_str, value.get("arg3", _MISSING), _field_path(path, "arg3")),
-            arg2=_decode_optional(_decode_float, value.get("arg2", _MISSING), _field_path(path, "arg2")),
+            arg1=_decode_optional(_decode_bool, value.get("arg1", _MISSING), (path, "arg1")),
+            arg3=_decode_optional(_decode_str, value.get("arg3", _MISSING), (path, "arg3")),
+            arg2=_decode_optional(_decode_float, value.get("arg2", _MISSING), (path, "arg2")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -124,6 +181,27 @@ class AbcQuery:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.arg1 is not None:
+            out.append(sep + '"arg1":')
+            _write_json_bool(out, self.arg1)
+            sep = ","
+        if self.arg3 is not None:
+            out.append(sep + '"arg3":')
+            _write_json_str(out, self.arg3)
+            sep = ","
+        if self.arg2 is not None:
+            out.append(sep + '"arg2":')
+            _write_json_float(out, self.arg2)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
 
 @dataclass(kw_only=True)
 class AbcResponse:
@@ -143,24 +221,76 @@ class AbcResponse:
         return cls._from_mapping(value, "AbcResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AbcResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AbcResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AbcResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        bc_column = _decode_column(rows, path, "bc", _decode_str, str)
+        a_column = _decode_column(rows, path, "a", _decode_int, int)
+        efg_column = _decode_column(rows, path, "efg", _decode_float, float)
+        hijk_column = _decode_column(rows, path, "hijk", _decode_list_of_int)
+        lmnop_column = _decode_column(rows, path, "lmnop", _decode_list_of_ApiDemoSubA, optional=True)
+        enum_color_column = _decode_column(rows, path, "enum_color", ColorEnum.from_value, optional=True)
+        enum_status_column = _decode_column(rows, path, "enum_status", StatusEnum.from_value)
+        enum_list_column = _decode_column(rows, path, "enum_list", _decode_list_of_StatusEnum)
+        return [
+            cls(
+                bc=bc_item,
+                a=a_item,
+                efg=efg_item,
+                hijk=hijk_item,
+                lmnop=lmnop_item,
+                enum_color=enum_color_item,
+                enum_status=enum_status_item,
+                enum_list=enum_list_item,
+            )
+            for bc_item, a_item, efg_item, hijk_item, lmnop_item, enum_color_item, enum_status_item, enum_list_item in zip(
+                bc_column,
+                a_column,
+                efg_column,
+                hijk_column,
+                lmnop_column,
+                enum_color_column,
+                enum_status_column,
+                enum_list_column,
+            )
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        lmnop_value = value.get("lmnop")
+        enum_color_value = value.get("enum_color")
+        return cls(
+            bc=value["bc"],
+            a=value["a"],
+            efg=value["efg"],
+            hijk=value["hijk"],
+            lmnop=None if lmnop_value is None else _trust_list_of_ApiDemoSubA(lmnop_value),
+            enum_color=None if enum_color_value is None else _ColorEnum_BY_VALUE[enum_color_value],
+            enum_status=_StatusEnum_BY_VALUE[value["enum_status"]],
+            enum_list=_trust_list_of_StatusEnum(value["enum_list"]),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            bc=_decode_required(_decode_str, value.get("bc", _MISSING), _field_path(path, "bc")),
-            a=_decode_required(_decode_int, value.get("a", _MISSING), _field_path(path, "a")),
-            efg=_decode_required(_decode_float, value.get("efg", _MISSING), _field_path(path, "efg")),
-            hijk=_decode_required(lambda item, path: _decode_list(item, path, _decode_int), value.get("hijk", _MISSING), _field_path(path, "hijk")),
-            lmnop=_decode_optional(lambda item, path: _decode_list(item, path, ApiDemoSubA.from_value), value.get("lmnop", _MISSING), _field_path(path, "lmnop")),
-            enum_color=_decode_optional(ColorEnum.from_value, value.get("enum_color", _MISSING), _field_path(path, "enum_color")),
-            enum_status=_decode_required(StatusEnum.from_value, value.get("enum_status", _MISSING), _field_path(path, "enum_status")),
-            enum_list=_decode_required(lambda item, path: _decode_list(item, path, StatusEnum.from_value), value.get("enum_list", _MISSING), _field_path(path, "enum_list")),
+            bc=_decode_required(_decode_str, value.get("bc", _MISSING), (path, "bc")),
+            a=_decode_required(_decode_int, value.get("a", _MISSING), (path, "a")),
+            efg=_decode_required(_decode_float, value.get("efg", _MISSING), (path, "efg")),
+            hijk=_decode_required(_decode_list_of_int, value.get("hijk", _MISSING), (path, "hijk")),
+            lmnop=_decode_optional(_decode_list_of_ApiDemoSubA, value.get("lmnop", _MISSING), (path, "lmnop")),
+            enum_color=_decode_optional(ColorEnum.from_value, value.get("enum_color", _MISSING), (path, "enum_color")),
+            enum_status=_decode_required(StatusEnum.from_value, value.get("enum_status", _MISSING), (path, "enum_status")),
+            enum_list=_decode_required(_decode_list_of_StatusEnum, value.get("enum_list", _MISSING), (path, "enum_list")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -195,6 +325,32 @@ class AbcResponse:
         result["enum_list"] = _api_to_transport(self.enum_list)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"bc":')
+        _write_json_str(out, self.bc)
+        out.append(',"a":')
+        _write_json_int(out, self.a)
+        out.append(',"efg":')
+        _write_json_float(out, self.efg)
+        out.append(',"hijk":')
+        _write_json_list_of_int(out, self.hijk)
+        if self.lmnop is not None:
+            out.append(',"lmnop":')
+            _write_json_list_of_ApiDemoSubA(out, self.lmnop)
+        if self.enum_color is not None:
+            out.append(',"enum_color":')
+            _write_json_enum(out, self.enum_color)
+        out.append(',"enum_status":')
+        _write_json_enum(out, self.enum_status)
+        out.append(',"enum_list":')
+        _write_json_list_of_StatusEnum(out, self.enum_list)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class ApiDemoSubA:
@@ -208,18 +364,38 @@ class ApiDemoSubA:
         return cls._from_mapping(value, "ApiDemoSubA")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "ApiDemoSubA") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "ApiDemoSubA") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "ApiDemoSubA") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        hello_column = _decode_column(rows, path, "hello", _decode_map_of_str_to_int)
+        amap_column = _decode_column(rows, path, "amap", _decode_list_of_ApiDemoMap)
+        return [
+            cls(hello=hello_item, amap=amap_item)
+            for hello_item, amap_item in zip(hello_column, amap_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            hello=_decode_required(lambda item, path: _decode_map(item, path, _decode_str, _decode_int), value.get("hello", _MISSING), _field_path(path, "hello")),
-            amap=_decode_required(lambda item, path: _decode_list(item, path, ApiDemoMap.from_value), value.get("amap", _MISSING), _field_path(path, "amap")),
+            hello=value["hello"],
+            amap=_trust_list_of_ApiDemoMap(value["amap"]),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            hello=_decode_required(_decode_map_of_str_to_int, value.get("hello", _MISSING), (path, "hello")),
+            amap=_decode_required(_decode_list_of_ApiDemoMap, value.get("amap", _MISSING), (path, "amap")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -234,6 +410,18 @@ class ApiDemoSubA:
         result["amap"] = _api_to_transport(self.amap)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"hello":')
+        _write_json_map_of_str_to_int(out, self.hello)
+        out.append(',"amap":')
+        _write_json_list_of_ApiDemoMap(out, self.amap)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class ApiDemoMap:
@@ -246,17 +434,35 @@ class ApiDemoMap:
         return cls._from_mapping(value, "ApiDemoMap")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "ApiDemoMap") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "ApiDemoMap") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "ApiDemoMap") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        haha_column = _decode_column(rows, path, "haha", _decode_int, int)
+        return [
+            cls(haha=haha_item)
+            for haha_item in haha_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            haha=_decode_required(_decode_int, value.get("haha", _MISSING), _field_path(path, "haha")),
+            haha=value["haha"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            haha=_decode_required(_decode_int, value.get("haha", _MISSING), (path, "haha")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -269,6 +475,16 @@ class ApiDemoMap:
         result["haha"] = _api_to_transport(self.haha)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"haha":')
+        _write_json_int(out, self.haha)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class TestPostJSON:
@@ -282,18 +498,38 @@ class TestPostJSON:
         return cls._from_mapping(value, "TestPostJSON")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "TestPostJSON") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "TestPostJSON") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "TestPostJSON") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        req1_column = _decode_column(rows, path, "req1", _decode_str, str)
+        req2_column = _decode_column(rows, path, "req2", _decode_int, int, optional=True)
+        return [
+            cls(req1=req1_item, req2=req2_item)
+            for req1_item, req2_item in zip(req1_column, req2_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            req1=value["req1"],
+            req2=value.get("req2"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            req1=_decode_required(_decode_str, value.get("req1", _MISSING), _field_path(path, "req1")),
-            req2=_decode_optional(_decode_int, value.get("req2", _MISSING), _field_path(path, "req2")),
+            req1=_decode_required(_decode_str, value.get("req1", _MISSING), (path, "req1")),
+            req2=_decode_optional(_decode_int, value.get("req2", _MISSING), (path, "req2")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -312,6 +548,19 @@ class TestPostJSON:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"req1":')
+        _write_json_str(out, self.req1)
+        if self.req2 is not None:
+            out.append(',"req2":')
+            _write_json_int(out, self.req2)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class TestPostResponse:
@@ -325,18 +574,38 @@ class TestPostResponse:
         return cls._from_mapping(value, "TestPostResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "TestPostResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "TestPostResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "TestPostResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        list_column = _decode_column(rows, path, "list", _decode_list_of_str)
+        map_column = _decode_column(rows, path, "map", _decode_map_of_str_to_ApiDemoMap)
+        return [
+            cls(list=list_item, map=map_item)
+            for list_item, map_item in zip(list_column, map_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            list=_decode_required(lambda item, path: _decode_list(item, path, _decode_str), value.get("list", _MISSING), _field_path(path, "list")),
-            map=_decode_required(lambda item, path: _decode_map(item, path, _decode_str, ApiDemoMap.from_value), value.get("map", _MISSING), _field_path(path, "map")),
+            list=value["list"],
+            map=_trust_map_of_str_to_ApiDemoMap(value["map"]),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            list=_decode_required(_decode_list_of_str, value.get("list", _MISSING), (path, "list")),
+            map=_decode_required(_decode_map_of_str_to_ApiDemoMap, value.get("map", _MISSING), (path, "map")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -351,6 +620,18 @@ class TestPostResponse:
         result["map"] = _api_to_transport(self.map)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"list":')
+        _write_json_list_of_str(out, self.list)
+        out.append(',"map":')
+        _write_json_map_of_str_to_ApiDemoMap(out, self.map)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class FormSubmitForm:
@@ -365,19 +646,41 @@ class FormSubmitForm:
         return cls._from_mapping(value, "FormSubmitForm")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "FormSubmitForm") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "FormSubmitForm") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "FormSubmitForm") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        title_column = _decode_column(rows, path, "title", _decode_str, str)
+        count_column = _decode_column(rows, path, "count", _decode_int, int, optional=True)
+        enabled_column = _decode_column(rows, path, "enabled", _decode_bool, bool, optional=True)
+        return [
+            cls(title=title_item, count=count_item, enabled=enabled_item)
+            for title_item, count_item, enabled_item in zip(title_column, count_column, enabled_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            title=_decode_required(_decode_str, value.get("title", _MISSING), _field_path(path, "title")),
-            count=_decode_optional(_decode_int, value.get("count", _MISSING), _field_path(path, "count")),
-            enabled=_decode_optional(_decode_bool, value.get("enabled", _MISSING), _field_path(path, "enabled")),
+            title=value["title"],
+            count=value.get("count"),
+            enabled=value.get("enabled"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            title=_decode_required(_decode_str, value.get("title", _MISSING), (path, "title")),
+            count=_decode_optional(_decode_int, value.get("count", _MISSING), (path, "count")),
+            enabled=_decode_optional(_decode_bool, value.get("enabled", _MISSING), (path, "enabled")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -402,6 +705,22 @@ class FormSubmitForm:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"title":')
+        _write_json_str(out, self.title)
+        if self.count is not None:
+            out.append(',"count":')
+            _write_json_int(out, self.count)
+        if self.enabled is not None:
+            out.append(',"enabled":')
+            _write_json_bool(out, self.enabled)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class FormSubmitResponse:
@@ -416,19 +735,41 @@ class FormSubmitResponse:
         return cls._from_mapping(value, "FormSubmitResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "FormSubmitResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "FormSubmitResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "FormSubmitResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        summary_column = _decode_column(rows, path, "summary", _decode_str, str)
+        count_column = _decode_column(rows, path, "count", _decode_int, int)
+        enabled_column = _decode_column(rows, path, "enabled", _decode_bool, bool)
+        return [
+            cls(summary=summary_item, count=count_item, enabled=enabled_item)
+            for summary_item, count_item, enabled_item in zip(summary_column, count_column, enabled_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            summary=_decode_required(_decode_str, value.get("summary", _MISSING), _field_path(path, "summary")),
-            count=_decode_required(_decode_int, value.get("count", _MISSING), _field_path(path, "count")),
-            enabled=_decode_required(_decode_bool, value.get("enabled", _MISSING), _field_path(path, "enabled")),
+            summary=value["summary"],
+            count=value["count"],
+            enabled=value["enabled"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            summary=_decode_required(_decode_str, value.get("summary", _MISSING), (path, "summary")),
+            count=_decode_required(_decode_int, value.get("count", _MISSING), (path, "count")),
+            enabled=_decode_required(_decode_bool, value.get("enabled", _MISSING), (path, "enabled")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -445,6 +786,20 @@ class FormSubmitResponse:
         result["enabled"] = _api_to_transport(self.enabled)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"summary":')
+        _write_json_str(out, self.summary)
+        out.append(',"count":')
+        _write_json_int(out, self.count)
+        out.append(',"enabled":')
+        _write_json_bool(out, self.enabled)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class RequestOptionsQuery:
@@ -457,17 +812,35 @@ class RequestOptionsQuery:
         return cls._from_mapping(value, "RequestOptionsQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "RequestOptionsQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "RequestOptionsQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "RequestOptionsQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        delay_ms_column = _decode_column(rows, path, "delay_ms", _decode_int, int, optional=True)
+        return [
+            cls(delay_ms=delay_ms_item)
+            for delay_ms_item in delay_ms_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            delay_ms=_decode_optional(_decode_int, value.get("delay_ms", _MISSING), _field_path(path, "delay_ms")),
+            delay_ms=value.get("delay_ms"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            delay_ms=_decode_optional(_decode_int, value.get("delay_ms", _MISSING), (path, "delay_ms")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -484,6 +857,19 @@ class RequestOptionsQuery:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.delay_ms is not None:
+            out.append(sep + '"delay_ms":')
+            _write_json_int(out, self.delay_ms)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
 
 @dataclass(kw_only=True)
 class RequestOptionsResponse:
@@ -497,18 +883,38 @@ class RequestOptionsResponse:
         return cls._from_mapping(value, "RequestOptionsResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "RequestOptionsResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "RequestOptionsResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "RequestOptionsResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        status_column = _decode_column(rows, path, "status", _decode_str, str)
+        delay_ms_column = _decode_column(rows, path, "delay_ms", _decode_int, int)
+        return [
+            cls(status=status_item, delay_ms=delay_ms_item)
+            for status_item, delay_ms_item in zip(status_column, delay_ms_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            status=value["status"],
+            delay_ms=value["delay_ms"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            status=_decode_required(_decode_str, value.get("status", _MISSING), _field_path(path, "status")),
-            delay_ms=_decode_required(_decode_int, value.get("delay_ms", _MISSING), _field_path(path, "delay_ms")),
+            status=_decode_required(_decode_str, value.get("status", _MISSING), (path, "status")),
+            delay_ms=_decode_required(_decode_int, value.get("delay_ms", _MISSING), (path, "delay_ms")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -523,6 +929,18 @@ class RequestOptionsResponse:
         result["delay_ms"] = _api_to_transport(self.delay_ms)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"status":')
+        _write_json_str(out, self.status)
+        out.append(',"delay_ms":')
+        _write_json_int(out, self.delay_ms)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class PathEchoPath:
@@ -536,18 +954,38 @@ class PathEchoPath:
         return cls._from_mapping(value, "PathEchoPath")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "PathEchoPath") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "PathEchoPath") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "PathEchoPath") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        item_column = _decode_column(rows, path, "item", _decode_str, str)
+        badge_column = _decode_column(rows, path, "badge", _decode_str, str)
+        return [
+            cls(item=item_item, badge=badge_item)
+            for item_item, badge_item in zip(item_column, badge_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            item=_decode_required(_decode_str, value.get("item", _MISSING), _field_path(path, "item")),
-            badge=_decode_required(_decode_str, value.get("badge", _MISSING), _field_path(path, "badge")),
+            item=value["item"],
+            badge=value["badge"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            item=_decode_required(_decode_str, value.get("item", _MISSING), (path, "item")),
+            badge=_decode_required(_decode_str, value.get("badge", _MISSING), (path, "badge")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -562,6 +1000,18 @@ class PathEchoPath:
         result["badge"] = _api_to_transport(self.badge)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"item":')
+        _write_json_str(out, self.item)
+        out.append(',"badge":')
+        _write_json_str(out, self.badge)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class PathEchoResponse:
@@ -576,19 +1026,41 @@ class PathEchoResponse:
         return cls._from_mapping(value, "PathEchoResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "PathEchoResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "PathEchoResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "PathEchoResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        item_column = _decode_column(rows, path, "item", _decode_str, str)
+        badge_column = _decode_column(rows, path, "badge", _decode_str, str)
+        combined_column = _decode_column(rows, path, "combined", _decode_str, str)
+        return [
+            cls(item=item_item, badge=badge_item, combined=combined_item)
+            for item_item, badge_item, combined_item in zip(item_column, badge_column, combined_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            item=_decode_required(_decode_str, value.get("item", _MISSING), _field_path(path, "item")),
-            badge=_decode_required(_decode_str, value.get("badge", _MISSING), _field_path(path, "badge")),
-            combined=_decode_required(_decode_str, value.get("combined", _MISSING), _field_path(path, "combined")),
+            item=value["item"],
+            badge=value["badge"],
+            combined=value["combined"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            item=_decode_required(_decode_str, value.get("item", _MISSING), (path, "item")),
+            badge=_decode_required(_decode_str, value.get("badge", _MISSING), (path, "badge")),
+            combined=_decode_required(_decode_str, value.get("combined", _MISSING), (path, "combined")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -605,6 +1077,20 @@ class PathEchoResponse:
         result["combined"] = _api_to_transport(self.combined)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"item":')
+        _write_json_str(out, self.item)
+        out.append(',"badge":')
+        _write_json_str(out, self.badge)
+        out.append(',"combined":')
+        _write_json_str(out, self.combined)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class EmptyResponseResponse:
@@ -617,25 +1103,38 @@ class EmptyResponseResponse:
         return cls._from_mapping(value, "EmptyResponseResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "EmptyResponseResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "EmptyResponseResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def from_empty_response_value(cls, value: object, path: str = "EmptyResponseResponse") -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "EmptyResponseResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        return [cls() for _ in rows]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+        )
+
+    @classmethod
+    def from_empty_response_value(cls, value: object, path: _DecodePath = "EmptyResponseResponse") -> Self:
         if isinstance(value, cls):
             return value
         if value is None:
             return cls()
         if isinstance(value, Mapping) and not value:
             return cls()
-        raise TypeError(f"{path}: expected empty response")
+        raise TypeError(f"{_path_text(path)}: expected empty response")
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
         )
 
@@ -647,6 +1146,14 @@ class EmptyResponseResponse:
         result: dict[str, Any] = {}
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append("{}")
+
 
 @dataclass(kw_only=True)
 class PutDemoQuery:
@@ -661,19 +1168,41 @@ class PutDemoQuery:
         return cls._from_mapping(value, "PutDemoQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "PutDemoQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "PutDemoQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "PutDemoQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        arg1_column = _decode_column(rows, path, "arg1", _decode_str, str, optional=True)
+        arg2_column = _decode_column(rows, path, "arg2", _decode_float, float, optional=True)
+        arg3_column = _decode_column(rows, path, "arg3", _decode_str, str, optional=True)
+        return [
+            cls(arg1=arg1_item, arg2=arg2_item, arg3=arg3_item)
+            for arg1_item, arg2_item, arg3_item in zip(arg1_column, arg2_column, arg3_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            arg1=_decode_optional(_decode_str, value.get("arg1", _MISSING), _field_path(path, "arg1")),
-            arg2=_decode_optional(_decode_float, value.get("arg2", _MISSING), _field_path(path, "arg2")),
-            arg3=_decode_optional(_decode_str, value.get("arg3", _MISSING), _field_path(path, "arg3")),
+            arg1=value.get("arg1"),
+            arg2=value.get("arg2"),
+            arg3=value.get("arg3"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            arg1=_decode_optional(_decode_str, value.get("arg1", _MISSING), (path, "arg1")),
+            arg2=_decode_optional(_decode_float, value.get("arg2", _MISSING), (path, "arg2")),
+            arg3=_decode_optional(_decode_str, value.get("arg3", _MISSING), (path, "arg3")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -702,6 +1231,27 @@ class PutDemoQuery:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.arg1 is not None:
+            out.append(sep + '"arg1":')
+            _write_json_str(out, self.arg1)
+            sep = ","
+        if self.arg2 is not None:
+            out.append(sep + '"arg2":')
+            _write_json_float(out, self.arg2)
+            sep = ","
+        if self.arg3 is not None:
+            out.append(sep + '"arg3":')
+            _write_json_str(out, self.arg3)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
 
 @dataclass(kw_only=True)
 class PutDemoJSON:
@@ -715,18 +1265,38 @@ class PutDemoJSON:
         return cls._from_mapping(value, "PutDemoJSON")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "PutDemoJSON") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "PutDemoJSON") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "PutDemoJSON") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        req1_column = _decode_column(rows, path, "req1", _decode_str, str)
+        req2_column = _decode_column(rows, path, "req2", _decode_int, int, optional=True)
+        return [
+            cls(req1=req1_item, req2=req2_item)
+            for req1_item, req2_item in zip(req1_column, req2_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            req1=value["req1"],
+            req2=value.get("req2"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            req1=_decode_required(_decode_str, value.get("req1", _MISSING), _field_path(path, "req1")),
-            req2=_decode_optional(_decode_int, value.get("req2", _MISSING), _field_path(path, "req2")),
+            req1=_decode_required(_decode_str, value.get("req1", _MISSING), (path, "req1")),
+            req2=_decode_optional(_decode_int, value.get("req2", _MISSING), (path, "req2")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -745,6 +1315,19 @@ class PutDemoJSON:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"req1":')
+        _write_json_str(out, self.req1)
+        if self.req2 is not None:
+            out.append(',"req2":')
+            _write_json_int(out, self.req2)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class PutDemoResponse:
@@ -758,18 +1341,38 @@ class PutDemoResponse:
         return cls._from_mapping(value, "PutDemoResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "PutDemoResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "PutDemoResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "PutDemoResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        list_column = _decode_column(rows, path, "list", _decode_list_of_str)
+        anon_kv_column = _decode_column(rows, path, "anon_kv", ANONFunc1putAnonKv.from_value)
+        return [
+            cls(list=list_item, anon_kv=anon_kv_item)
+            for list_item, anon_kv_item in zip(list_column, anon_kv_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            list=_decode_required(lambda item, path: _decode_list(item, path, _decode_str), value.get("list", _MISSING), _field_path(path, "list")),
-            anon_kv=_decode_required(ANONFunc1putAnonKv.from_value, value.get("anon_kv", _MISSING), _field_path(path, "anon_kv")),
+            list=value["list"],
+            anon_kv=ANONFunc1putAnonKv.from_trusted(value["anon_kv"]),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            list=_decode_required(_decode_list_of_str, value.get("list", _MISSING), (path, "list")),
+            anon_kv=_decode_required(ANONFunc1putAnonKv.from_value, value.get("anon_kv", _MISSING), (path, "anon_kv")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -784,6 +1387,18 @@ class PutDemoResponse:
         result["anon_kv"] = _api_to_transport(self.anon_kv)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"list":')
+        _write_json_list_of_str(out, self.list)
+        out.append(',"anon_kv":')
+        _write_json_model(out, self.anon_kv)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class ANONFunc1putAnonKv:
@@ -797,18 +1412,38 @@ class ANONFunc1putAnonKv:
         return cls._from_mapping(value, "ANONFunc1putAnonKv")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "ANONFunc1putAnonKv") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "ANONFunc1putAnonKv") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "ANONFunc1putAnonKv") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        kv1_column = _decode_column(rows, path, "kv1", _decode_int, int)
+        kv2_column = _decode_column(rows, path, "kv2", _decode_list_of_float)
+        return [
+            cls(kv1=kv1_item, kv2=kv2_item)
+            for kv1_item, kv2_item in zip(kv1_column, kv2_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            kv1=_decode_required(_decode_int, value.get("kv1", _MISSING), _field_path(path, "kv1")),
-            kv2=_decode_required(lambda item, path: _decode_list(item, path, _decode_float), value.get("kv2", _MISSING), _field_path(path, "kv2")),
+            kv1=value["kv1"],
+            kv2=value["kv2"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            kv1=_decode_required(_decode_int, value.get("kv1", _MISSING), (path, "kv1")),
+            kv2=_decode_required(_decode_list_of_float, value.get("kv2", _MISSING), (path, "kv2")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -823,6 +1458,18 @@ class ANONFunc1putAnonKv:
         result["kv2"] = _api_to_transport(self.kv2)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"kv1":')
+        _write_json_int(out, self.kv1)
+        out.append(',"kv2":')
+        _write_json_list_of_float(out, self.kv2)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class DeleteQuery:
@@ -836,18 +1483,38 @@ class DeleteQuery:
         return cls._from_mapping(value, "DeleteQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "DeleteQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "DeleteQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "DeleteQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        arg1_column = _decode_column(rows, path, "arg1", _decode_str, str, optional=True)
+        arg2_column = _decode_column(rows, path, "arg2", _decode_float, float, optional=True)
+        return [
+            cls(arg1=arg1_item, arg2=arg2_item)
+            for arg1_item, arg2_item in zip(arg1_column, arg2_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            arg1=_decode_optional(_decode_str, value.get("arg1", _MISSING), _field_path(path, "arg1")),
-            arg2=_decode_optional(_decode_float, value.get("arg2", _MISSING), _field_path(path, "arg2")),
+            arg1=value.get("arg1"),
+            arg2=value.get("arg2"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            arg1=_decode_optional(_decode_str, value.get("arg1", _MISSING), (path, "arg1")),
+            arg2=_decode_optional(_decode_float, value.get("arg2", _MISSING), (path, "arg2")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -870,6 +1537,23 @@ class DeleteQuery:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.arg1 is not None:
+            out.append(sep + '"arg1":')
+            _write_json_str(out, self.arg1)
+            sep = ","
+        if self.arg2 is not None:
+            out.append(sep + '"arg2":')
+            _write_json_float(out, self.arg2)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
 
 @dataclass(kw_only=True)
 class DeleteResponse:
@@ -883,18 +1567,38 @@ class DeleteResponse:
         return cls._from_mapping(value, "DeleteResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "DeleteResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "DeleteResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "DeleteResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        list_column = _decode_column(rows, path, "list", _decode_list_of_str)
+        anon_list_column = _decode_column(rows, path, "anon_list", _decode_list_of_ANONDeleteAnonList)
+        return [
+            cls(list=list_item, anon_list=anon_list_item)
+            for list_item, anon_list_item in zip(list_column, anon_list_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            list=value["list"],
+            anon_list=_trust_list_of_ANONDeleteAnonList(value["anon_list"]),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            list=_decode_required(lambda item, path: _decode_list(item, path, _decode_str), value.get("list", _MISSING), _field_path(path, "list")),
-            anon_list=_decode_required(lambda item, path: _decode_list(item, path, ANONDeleteAnonList.from_value), value.get("anon_list", _MISSING), _field_path(path, "anon_list")),
+            list=_decode_required(_decode_list_of_str, value.get("list", _MISSING), (path, "list")),
+            anon_list=_decode_required(_decode_list_of_ANONDeleteAnonList, value.get("anon_list", _MISSING), (path, "anon_list")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -909,6 +1613,18 @@ class DeleteResponse:
         result["anon_list"] = _api_to_transport(self.anon_list)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"list":')
+        _write_json_list_of_str(out, self.list)
+        out.append(',"anon_list":')
+        _write_json_list_of_ANONDeleteAnonList(out, self.anon_list)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class ANONDeleteAnonList:
@@ -922,18 +1638,38 @@ class ANONDeleteAnonList:
         return cls._from_mapping(value, "ANONDeleteAnonList")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "ANONDeleteAnonList") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "ANONDeleteAnonList") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "ANONDeleteAnonList") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        kv1_column = _decode_column(rows, path, "kv1", _decode_int, int)
+        kv2_column = _decode_column(rows, path, "kv2", _decode_list_of_str)
+        return [
+            cls(kv1=kv1_item, kv2=kv2_item)
+            for kv1_item, kv2_item in zip(kv1_column, kv2_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            kv1=value["kv1"],
+            kv2=value["kv2"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            kv1=_decode_required(_decode_int, value.get("kv1", _MISSING), _field_path(path, "kv1")),
-            kv2=_decode_required(lambda item, path: _decode_list(item, path, _decode_str), value.get("kv2", _MISSING), _field_path(path, "kv2")),
+            kv1=_decode_required(_decode_int, value.get("kv1", _MISSING), (path, "kv1")),
+            kv2=_decode_required(_decode_list_of_str, value.get("kv2", _MISSING), (path, "kv2")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -948,6 +1684,18 @@ class ANONDeleteAnonList:
         result["kv2"] = _api_to_transport(self.kv2)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"kv1":')
+        _write_json_int(out, self.kv1)
+        out.append(',"kv2":')
+        _write_json_list_of_str(out, self.kv2)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class SweepEventsOpen:
@@ -961,18 +1709,38 @@ class SweepEventsOpen:
         return cls._from_mapping(value, "SweepEventsOpen")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "SweepEventsOpen") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "SweepEventsOpen") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "SweepEventsOpen") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        run_id_column = _decode_column(rows, path, "run_id", _decode_str, str)
+        replay_from_column = _decode_column(rows, path, "replay_from", _decode_str, str, optional=True)
+        return [
+            cls(run_id=run_id_item, replay_from=replay_from_item)
+            for run_id_item, replay_from_item in zip(run_id_column, replay_from_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            run_id=value["run_id"],
+            replay_from=value.get("replay_from"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            run_id=_decode_required(_decode_str, value.get("run_id", _MISSING), _field_path(path, "run_id")),
-            replay_from=_decode_optional(_decode_str, value.get("replay_from", _MISSING), _field_path(path, "replay_from")),
+            run_id=_decode_required(_decode_str, value.get("run_id", _MISSING), (path, "run_id")),
+            replay_from=_decode_optional(_decode_str, value.get("replay_from", _MISSING), (path, "replay_from")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -991,6 +1759,19 @@ class SweepEventsOpen:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"run_id":')
+        _write_json_str(out, self.run_id)
+        if self.replay_from is not None:
+            out.append(',"replay_from":')
+            _write_json_str(out, self.replay_from)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class SweepState:
@@ -1003,17 +1784,35 @@ class SweepState:
         return cls._from_mapping(value, "SweepState")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "SweepState") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "SweepState") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "SweepState") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        status_column = _decode_column(rows, path, "status", _decode_str, str)
+        return [
+            cls(status=status_item)
+            for status_item in status_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            status=value["status"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            status=_decode_required(_decode_str, value.get("status", _MISSING), _field_path(path, "status")),
+            status=_decode_required(_decode_str, value.get("status", _MISSING), (path, "status")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1026,6 +1825,16 @@ class SweepState:
         result["status"] = _api_to_transport(self.status)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"status":')
+        _write_json_str(out, self.status)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class SweepProgress:
@@ -1039,18 +1848,38 @@ class SweepProgress:
         return cls._from_mapping(value, "SweepProgress")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "SweepProgress") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "SweepProgress") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "SweepProgress") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        current_column = _decode_column(rows, path, "current", _decode_int, int)
+        total_column = _decode_column(rows, path, "total", _decode_int, int)
+        return [
+            cls(current=current_item, total=total_item)
+            for current_item, total_item in zip(current_column, total_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            current=_decode_required(_decode_int, value.get("current", _MISSING), _field_path(path, "current")),
-            total=_decode_required(_decode_int, value.get("total", _MISSING), _field_path(path, "total")),
+            current=value["current"],
+            total=value["total"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            current=_decode_required(_decode_int, value.get("current", _MISSING), (path, "current")),
+            total=_decode_required(_decode_int, value.get("total", _MISSING), (path, "total")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1065,6 +1894,18 @@ class SweepProgress:
         result["total"] = _api_to_transport(self.total)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"current":')
+        _write_json_int(out, self.current)
+        out.append(',"total":')
+        _write_json_int(out, self.total)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class SweepLog:
@@ -1078,18 +1919,38 @@ class SweepLog:
         return cls._from_mapping(value, "SweepLog")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "SweepLog") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "SweepLog") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "SweepLog") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        level_column = _decode_column(rows, path, "level", _decode_str, str)
+        message_column = _decode_column(rows, path, "message", _decode_str, str)
+        return [
+            cls(level=level_item, message=message_item)
+            for level_item, message_item in zip(level_column, message_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            level=_decode_required(_decode_str, value.get("level", _MISSING), _field_path(path, "level")),
-            message=_decode_required(_decode_str, value.get("message", _MISSING), _field_path(path, "message")),
+            level=value["level"],
+            message=value["message"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            level=_decode_required(_decode_str, value.get("level", _MISSING), (path, "level")),
+            message=_decode_required(_decode_str, value.get("message", _MISSING), (path, "message")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1104,6 +1965,18 @@ class SweepLog:
         result["message"] = _api_to_transport(self.message)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"level":')
+        _write_json_str(out, self.level)
+        out.append(',"message":')
+        _write_json_str(out, self.message)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class SweepEventsClose:
@@ -1118,19 +1991,41 @@ class SweepEventsClose:
         return cls._from_mapping(value, "SweepEventsClose")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "SweepEventsClose") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "SweepEventsClose") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "SweepEventsClose") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        code_column = _decode_column(rows, path, "code", _decode_int, int)
+        reason_column = _decode_column(rows, path, "reason", _decode_str, str, optional=True)
+        error_column = _decode_column(rows, path, "error", _decode_str, str, optional=True)
+        return [
+            cls(code=code_item, reason=reason_item, error=error_item)
+            for code_item, reason_item, error_item in zip(code_column, reason_column, error_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            code=value["code"],
+            reason=value.get("reason"),
+            error=value.get("error"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            code=_decode_required(_decode_int, value.get("code", _MISSING), _field_path(path, "code")),
-            reason=_decode_optional(_decode_str, value.get("reason", _MISSING), _field_path(path, "reason")),
-            error=_decode_optional(_decode_str, value.get("error", _MISSING), _field_path(path, "error")),
+            code=_decode_required(_decode_int, value.get("code", _MISSING), (path, "code")),
+            reason=_decode_optional(_decode_str, value.get("reason", _MISSING), (path, "reason")),
+            error=_decode_optional(_decode_str, value.get("error", _MISSING), (path, "error")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1155,6 +2050,22 @@ class SweepEventsClose:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"code":')
+        _write_json_int(out, self.code)
+        if self.reason is not None:
+            out.append(',"reason":')
+            _write_json_str(out, self.reason)
+        if self.error is not None:
+            out.append(',"error":')
+            _write_json_str(out, self.error)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class AssistantSessionOpen:
@@ -1167,17 +2078,35 @@ class AssistantSessionOpen:
         return cls._from_mapping(value, "AssistantSessionOpen")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AssistantSessionOpen") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AssistantSessionOpen") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AssistantSessionOpen") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        session_id_column = _decode_column(rows, path, "session_id", _decode_str, str)
+        return [
+            cls(session_id=session_id_item)
+            for session_id_item in session_id_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            session_id=value["session_id"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            session_id=_decode_required(_decode_str, value.get("session_id", _MISSING), _field_path(path, "session_id")),
+            session_id=_decode_required(_decode_str, value.get("session_id", _MISSING), (path, "session_id")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1190,6 +2119,16 @@ class AssistantSessionOpen:
         result["session_id"] = _api_to_transport(self.session_id)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"session_id":')
+        _write_json_str(out, self.session_id)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class AssistantDelta:
@@ -1202,17 +2141,35 @@ class AssistantDelta:
         return cls._from_mapping(value, "AssistantDelta")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AssistantDelta") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AssistantDelta") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AssistantDelta") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        text_column = _decode_column(rows, path, "text", _decode_str, str)
+        return [
+            cls(text=text_item)
+            for text_item in text_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            text=value["text"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            text=_decode_required(_decode_str, value.get("text", _MISSING), _field_path(path, "text")),
+            text=_decode_required(_decode_str, value.get("text", _MISSING), (path, "text")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1225,6 +2182,16 @@ class AssistantDelta:
         result["text"] = _api_to_transport(self.text)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"text":')
+        _write_json_str(out, self.text)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class AssistantDone:
@@ -1237,17 +2204,35 @@ class AssistantDone:
         return cls._from_mapping(value, "AssistantDone")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AssistantDone") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AssistantDone") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AssistantDone") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        message_id_column = _decode_column(rows, path, "message_id", _decode_str, str)
+        return [
+            cls(message_id=message_id_item)
+            for message_id_item in message_id_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            message_id=value["message_id"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            message_id=_decode_required(_decode_str, value.get("message_id", _MISSING), _field_path(path, "message_id")),
+            message_id=_decode_required(_decode_str, value.get("message_id", _MISSING), (path, "message_id")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1260,6 +2245,16 @@ class AssistantDone:
         result["message_id"] = _api_to_transport(self.message_id)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"message_id":')
+        _write_json_str(out, self.message_id)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class AssistantInput:
@@ -1272,17 +2267,35 @@ class AssistantInput:
         return cls._from_mapping(value, "AssistantInput")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AssistantInput") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AssistantInput") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AssistantInput") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        text_column = _decode_column(rows, path, "text", _decode_str, str)
+        return [
+            cls(text=text_item)
+            for text_item in text_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            text=_decode_required(_decode_str, value.get("text", _MISSING), _field_path(path, "text")),
+            text=value["text"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            text=_decode_required(_decode_str, value.get("text", _MISSING), (path, "text")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1295,6 +2308,16 @@ class AssistantInput:
         result["text"] = _api_to_transport(self.text)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"text":')
+        _write_json_str(out, self.text)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class AssistantCancel:
@@ -1307,17 +2330,35 @@ class AssistantCancel:
         return cls._from_mapping(value, "AssistantCancel")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AssistantCancel") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AssistantCancel") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AssistantCancel") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        reason_column = _decode_column(rows, path, "reason", _decode_str, str, optional=True)
+        return [
+            cls(reason=reason_item)
+            for reason_item in reason_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            reason=_decode_optional(_decode_str, value.get("reason", _MISSING), _field_path(path, "reason")),
+            reason=value.get("reason"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            reason=_decode_optional(_decode_str, value.get("reason", _MISSING), (path, "reason")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1334,6 +2375,19 @@ class AssistantCancel:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.reason is not None:
+            out.append(sep + '"reason":')
+            _write_json_str(out, self.reason)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
 
 @dataclass(kw_only=True)
 class AssistantSessionClose:
@@ -1348,19 +2402,41 @@ class AssistantSessionClose:
         return cls._from_mapping(value, "AssistantSessionClose")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AssistantSessionClose") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AssistantSessionClose") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AssistantSessionClose") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        code_column = _decode_column(rows, path, "code", _decode_int, int)
+        reason_column = _decode_column(rows, path, "reason", _decode_str, str, optional=True)
+        error_column = _decode_column(rows, path, "error", _decode_str, str, optional=True)
+        return [
+            cls(code=code_item, reason=reason_item, error=error_item)
+            for code_item, reason_item, error_item in zip(code_column, reason_column, error_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            code=_decode_required(_decode_int, value.get("code", _MISSING), _field_path(path, "code")),
-            reason=_decode_optional(_decode_str, value.get("reason", _MISSING), _field_path(path, "reason")),
-            error=_decode_optional(_decode_str, value.get("error", _MISSING), _field_path(path, "error")),
+            code=value["code"],
+            reason=value.get("reason"),
+            error=value.get("error"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            code=_decode_required(_decode_int, value.get("code", _MISSING), (path, "code")),
+            reason=_decode_optional(_decode_str, value.get("reason", _MISSING), (path, "reason")),
+            error=_decode_optional(_decode_str, value.get("error", _MISSING), (path, "error")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1385,6 +2461,22 @@ class AssistantSessionClose:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"code":')
+        _write_json_int(out, self.code)
+        if self.reason is not None:
+            out.append(',"reason":')
+            _write_json_str(out, self.reason)
+        if self.error is not None:
+            out.append(',"error":')
+            _write_json_str(out, self.error)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class PostDeprecatedJSON:
@@ -1398,18 +2490,38 @@ class PostDeprecatedJSON:
         return cls._from_mapping(value, "PostDeprecatedJSON")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "PostDeprecatedJSON") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "PostDeprecatedJSON") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "PostDeprecatedJSON") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        req1_column = _decode_column(rows, path, "req1", _decode_str, str)
+        req2_column = _decode_column(rows, path, "req2", _decode_int, int, optional=True)
+        return [
+            cls(req1=req1_item, req2=req2_item)
+            for req1_item, req2_item in zip(req1_column, req2_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            req1=value["req1"],
+            req2=value.get("req2"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            req1=_decode_required(_decode_str, value.get("req1", _MISSING), _field_path(path, "req1")),
-            req2=_decode_optional(_decode_int, value.get("req2", _MISSING), _field_path(path, "req2")),
+            req1=_decode_required(_decode_str, value.get("req1", _MISSING), (path, "req1")),
+            req2=_decode_optional(_decode_int, value.get("req2", _MISSING), (path, "req2")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1428,6 +2540,19 @@ class PostDeprecatedJSON:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"req1":')
+        _write_json_str(out, self.req1)
+        if self.req2 is not None:
+            out.append(',"req2":')
+            _write_json_int(out, self.req2)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class PostDeprecatedResponse:
@@ -1440,17 +2565,35 @@ class PostDeprecatedResponse:
         return cls._from_mapping(value, "PostDeprecatedResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "PostDeprecatedResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "PostDeprecatedResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "PostDeprecatedResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        list_column = _decode_column(rows, path, "list", _decode_list_of_str)
+        return [
+            cls(list=list_item)
+            for list_item in list_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            list=value["list"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            list=_decode_required(lambda item, path: _decode_list(item, path, _decode_str), value.get("list", _MISSING), _field_path(path, "list")),
+            list=_decode_required(_decode_list_of_str, value.get("list", _MISSING), (path, "list")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1463,6 +2606,16 @@ class PostDeprecatedResponse:
         result["list"] = _api_to_transport(self.list)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"list":')
+        _write_json_list_of_str(out, self.list)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class RawResponse:
@@ -1476,18 +2629,38 @@ class RawResponse:
         return cls._from_mapping(value, "RawResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "RawResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "RawResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "RawResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        list_column = _decode_column(rows, path, "list", _decode_list_of_str)
+        list2_column = _decode_column(rows, path, "list2", _decode_map_of_int_to_list_of_ApiDemoA)
+        return [
+            cls(list=list_item, list2=list2_item)
+            for list_item, list2_item in zip(list_column, list2_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            list=_decode_required(lambda item, path: _decode_list(item, path, _decode_str), value.get("list", _MISSING), _field_path(path, "list")),
-            list2=_decode_required(lambda item, path: _decode_map(item, path, _decode_int, lambda item, path: _decode_list(item, path, ApiDemoA.from_value)), value.get("list2", _MISSING), _field_path(path, "list2")),
+            list=value["list"],
+            list2=_trust_map_of_int_to_list_of_ApiDemoA(value["list2"]),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            list=_decode_required(_decode_list_of_str, value.get("list", _MISSING), (path, "list")),
+            list2=_decode_required(_decode_map_of_int_to_list_of_ApiDemoA, value.get("list2", _MISSING), (path, "list2")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1502,6 +2675,18 @@ class RawResponse:
         result["list2"] = _api_to_transport(self.list2)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"list":')
+        _write_json_list_of_str(out, self.list)
+        out.append(',"list2":')
+        _write_json_map_of_int_to_list_of_ApiDemoA(out, self.list2)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class ApiDemoA:
@@ -1521,24 +2706,76 @@ class ApiDemoA:
         return cls._from_mapping(value, "ApiDemoA")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "ApiDemoA") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "ApiDemoA") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "ApiDemoA") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        bc_column = _decode_column(rows, path, "bc", _decode_str, str)
+        a_column = _decode_column(rows, path, "a", _decode_int, int)
+        efg_column = _decode_column(rows, path, "efg", _decode_float, float)
+        hijk_column = _decode_column(rows, path, "hijk", _decode_list_of_int)
+        lmnop_column = _decode_column(rows, path, "lmnop", _decode_list_of_ApiDemoSubA, optional=True)
+        enum_color_column = _decode_column(rows, path, "enum_color", ColorEnum.from_value, optional=True)
+        enum_status_column = _decode_column(rows, path, "enum_status", StatusEnum.from_value)
+        enum_list_column = _decode_column(rows, path, "enum_list", _decode_list_of_StatusEnum)
+        return [
+            cls(
+                bc=bc_item,
+                a=a_item,
+                efg=efg_item,
+                hijk=hijk_item,
+                lmnop=lmnop_item,
+                enum_color=enum_color_item,
+                enum_status=enum_status_item,
+                enum_list=enum_list_item,
+            )
+            for bc_item, a_item, efg_item, hijk_item, lmnop_item, enum_color_item, enum_status_item, enum_list_item in zip(
+                bc_column,
+                a_column,
+                efg_column,
+                hijk_column,
+                lmnop_column,
+                enum_color_column,
+                enum_status_column,
+                enum_list_column,
+            )
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        lmnop_value = value.get("lmnop")
+        enum_color_value = value.get("enum_color")
         return cls(
-            bc=_decode_required(_decode_str, value.get("bc", _MISSING), _field_path(path, "bc")),
-            a=_decode_required(_decode_int, value.get("a", _MISSING), _field_path(path, "a")),
-            efg=_decode_required(_decode_float, value.get("efg", _MISSING), _field_path(path, "efg")),
-            hijk=_decode_required(lambda item, path: _decode_list(item, path, _decode_int), value.get("hijk", _MISSING), _field_path(path, "hijk")),
-            lmnop=_decode_optional(lambda item, path: _decode_list(item, path, ApiDemoSubA.from_value), value.get("lmnop", _MISSING), _field_path(path, "lmnop")),
-            enum_color=_decode_optional(ColorEnum.from_value, value.get("enum_color", _MISSING), _field_path(path, "enum_color")),
-            enum_status=_decode_required(StatusEnum.from_value, value.get("enum_status", _MISSING), _field_path(path, "enum_status")),
-            enum_list=_decode_required(lambda item, path: _decode_list(item, path, StatusEnum.from_value), value.get("enum_list", _MISSING), _field_path(path, "enum_list")),
+            bc=value["bc"],
+            a=value["a"],
+            efg=value["efg"],
+            hijk=value["hijk"],
+            lmnop=None if lmnop_value is None else _trust_list_of_ApiDemoSubA(lmnop_value),
+            enum_color=None if enum_color_value is None else _ColorEnum_BY_VALUE[enum_color_value],
+            enum_status=_StatusEnum_BY_VALUE[value["enum_status"]],
+            enum_list=_trust_list_of_StatusEnum(value["enum_list"]),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            bc=_decode_required(_decode_str, value.get("bc", _MISSING), (path, "bc")),
+            a=_decode_required(_decode_int, value.get("a", _MISSING), (path, "a")),
+            efg=_decode_required(_decode_float, value.get("efg", _MISSING), (path, "efg")),
+            hijk=_decode_required(_decode_list_of_int, value.get("hijk", _MISSING), (path, "hijk")),
+            lmnop=_decode_optional(_decode_list_of_ApiDemoSubA, value.get("lmnop", _MISSING), (path, "lmnop")),
+            enum_color=_decode_optional(ColorEnum.from_value, value.get("enum_color", _MISSING), (path, "enum_color")),
+            enum_status=_decode_required(StatusEnum.from_value, value.get("enum_status", _MISSING), (path, "enum_status")),
+            enum_list=_decode_required(_decode_list_of_StatusEnum, value.get("enum_list", _MISSING), (path, "enum_list")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1573,6 +2810,32 @@ class ApiDemoA:
         result["enum_list"] = _api_to_transport(self.enum_list)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"bc":')
+        _write_json_str(out, self.bc)
+        out.append(',"a":')
+        _write_json_int(out, self.a)
+        out.append(',"efg":')
+        _write_json_float(out, self.efg)
+        out.append(',"hijk":')
+        _write_json_list_of_int(out, self.hijk)
+        if self.lmnop is not None:
+            out.append(',"lmnop":')
+            _write_json_list_of_ApiDemoSubA(out, self.lmnop)
+        if self.enum_color is not None:
+            out.append(',"enum_color":')
+            _write_json_enum(out, self.enum_color)
+        out.append(',"enum_status":')
+        _write_json_enum(out, self.enum_status)
+        out.append(',"enum_list":')
+        _write_json_list_of_StatusEnum(out, self.enum_list)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class ErrorDemoQuery:
@@ -1585,17 +2848,35 @@ class ErrorDemoQuery:
         return cls._from_mapping(value, "ErrorDemoQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "ErrorDemoQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "ErrorDemoQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "ErrorDemoQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        mode_column = _decode_column(rows, path, "mode", _decode_str, str, optional=True)
+        return [
+            cls(mode=mode_item)
+            for mode_item in mode_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            mode=_decode_optional(_decode_str, value.get("mode", _MISSING), _field_path(path, "mode")),
+            mode=value.get("mode"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            mode=_decode_optional(_decode_str, value.get("mode", _MISSING), (path, "mode")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1612,6 +2893,19 @@ class ErrorDemoQuery:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.mode is not None:
+            out.append(sep + '"mode":')
+            _write_json_str(out, self.mode)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
 
 @dataclass(kw_only=True)
 class ErrorDemoResponse:
@@ -1624,17 +2918,35 @@ class ErrorDemoResponse:
         return cls._from_mapping(value, "ErrorDemoResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "ErrorDemoResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "ErrorDemoResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "ErrorDemoResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        status_column = _decode_column(rows, path, "status", _decode_str, str)
+        return [
+            cls(status=status_item)
+            for status_item in status_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            status=value["status"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            status=_decode_required(_decode_str, value.get("status", _MISSING), _field_path(path, "status")),
+            status=_decode_required(_decode_str, value.get("status", _MISSING), (path, "status")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -1647,6 +2959,144 @@ class ErrorDemoResponse:
         result["status"] = _api_to_transport(self.status)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"status":')
+        _write_json_str(out, self.status)
+        out.append("}")
+
+
+def _decode_list_of_int(value: object, path: _DecodePath) -> list[int]:
+    return _decode_scalar_list(value, path, int, _decode_int)
+
+
+def _write_json_list_of_int(out: list[str], value: object) -> None:
+    _write_json_scalar_list(out, value, int, _write_json_int)
+
+
+def _decode_map_of_str_to_int(value: object, path: _DecodePath) -> dict[str, int]:
+    return _decode_scalar_map(value, path, int, _decode_int)
+
+
+def _write_json_map_of_str_to_int(out: list[str], value: object) -> None:
+    _write_json_scalar_map(out, value, int, _write_json_int)
+
+
+def _decode_list_of_ApiDemoMap(value: object, path: _DecodePath) -> list[ApiDemoMap]:
+    return ApiDemoMap.from_values(value, path)
+
+
+def _write_json_list_of_ApiDemoMap(out: list[str], value: object) -> None:
+    _write_json_list(out, value, _write_json_model)
+
+
+def _trust_list_of_ApiDemoMap(value: Any) -> list[ApiDemoMap]:
+    return [ApiDemoMap.from_trusted(item) for item in value]
+
+
+def _decode_list_of_ApiDemoSubA(value: object, path: _DecodePath) -> list[ApiDemoSubA]:
+    return ApiDemoSubA.from_values(value, path)
+
+
+def _write_json_list_of_ApiDemoSubA(out: list[str], value: object) -> None:
+    _write_json_list(out, value, _write_json_model)
+
+
+def _trust_list_of_ApiDemoSubA(value: Any) -> list[ApiDemoSubA]:
+    return [ApiDemoSubA.from_trusted(item) for item in value]
+
+
+def _decode_list_of_StatusEnum(value: object, path: _DecodePath) -> list[StatusEnum]:
+    return _decode_list(value, path, StatusEnum.from_value)
+
+
+def _write_json_list_of_StatusEnum(out: list[str], value: object) -> None:
+    _write_json_list(out, value, _write_json_enum)
+
+
+def _trust_list_of_StatusEnum(value: Any) -> list[StatusEnum]:
+    return [_StatusEnum_BY_VALUE[item] for item in value]
+
+
+def _decode_list_of_str(value: object, path: _DecodePath) -> list[str]:
+    return _decode_scalar_list(value, path, str, _decode_str)
+
+
+def _write_json_list_of_str(out: list[str], value: object) -> None:
+    _write_json_scalar_list(out, value, str, _write_json_str)
+
+
+def _decode_map_of_str_to_ApiDemoMap(value: object, path: _DecodePath) -> dict[str, ApiDemoMap]:
+    return _decode_map(value, path, _decode_str, ApiDemoMap.from_value)
+
+
+def _write_json_map_of_str_to_ApiDemoMap(out: list[str], value: object) -> None:
+    _write_json_map(out, value, _write_json_model)
+
+
+def _trust_map_of_str_to_ApiDemoMap(value: Any) -> dict[str, ApiDemoMap]:
+    return {key: ApiDemoMap.from_trusted(item) for key, item in value.items()}
+
+
+def _decode_list_of_float(value: object, path: _DecodePath) -> list[float]:
+    return _decode_scalar_list(value, path, float, _decode_float)
+
+
+def _write_json_list_of_float(out: list[str], value: object) -> None:
+    _write_json_scalar_list(out, value, float, _write_json_float)
+
+
+def _decode_list_of_ANONDeleteAnonList(value: object, path: _DecodePath) -> list[ANONDeleteAnonList]:
+    return ANONDeleteAnonList.from_values(value, path)
+
+
+def _write_json_list_of_ANONDeleteAnonList(out: list[str], value: object) -> None:
+    _write_json_list(out, value, _write_json_model)
+
+
+def _trust_list_of_ANONDeleteAnonList(value: Any) -> list[ANONDeleteAnonList]:
+    return [ANONDeleteAnonList.from_trusted(item) for item in value]
+
+
+def _decode_list_of_ApiDemoA(value: object, path: _DecodePath) -> list[ApiDemoA]:
+    return ApiDemoA.from_values(value, path)
+
+
+def _write_json_list_of_ApiDemoA(out: list[str], value: object) -> None:
+    _write_json_list(out, value, _write_json_model)
+
+
+def _trust_list_of_ApiDemoA(value: Any) -> list[ApiDemoA]:
+    return [ApiDemoA.from_trusted(item) for item in value]
+
+
+def _decode_map_of_int_to_list_of_ApiDemoA(value: object, path: _DecodePath) -> dict[int, list[ApiDemoA]]:
+    return _decode_map(value, path, _decode_int, _decode_list_of_ApiDemoA)
+
+
+def _write_json_map_of_int_to_list_of_ApiDemoA(out: list[str], value: object) -> None:
+    _write_json_map(out, value, _write_json_list_of_ApiDemoA)
+
+
+def _trust_map_of_int_to_list_of_ApiDemoA(value: Any) -> dict[int, list[ApiDemoA]]:
+    return {_decode_int(key, "<key>"): _trust_list_of_ApiDemoA(item) for key, item in value.items()}
+
+
+def _decode_map_of_int_to_ApiDemoMap(value: object, path: _DecodePath) -> dict[int, ApiDemoMap]:
+    return _decode_map(value, path, _decode_int, ApiDemoMap.from_value)
+
+
+def _write_json_map_of_int_to_ApiDemoMap(out: list[str], value: object) -> None:
+    _write_json_map(out, value, _write_json_model)
+
+
+def _trust_map_of_int_to_ApiDemoMap(value: Any) -> dict[int, ApiDemoMap]:
+    return {_decode_int(key, "<key>"): ApiDemoMap.from_trusted(item) for key, item in value.items()}
+
 
 @dataclass(kw_only=True)
 class SweepStreamMessage:
@@ -1654,12 +3104,12 @@ class SweepStreamMessage:
     data: Any = None
 
     @classmethod
-    def from_value(cls, value: object, path: str = "SweepStreamMessage") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "SweepStreamMessage") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
-        return cls(type=_decode_str(value.get("type", ""), _field_path(path, "type")), data=value.get("data"))
+            raise TypeError(f"{_path_text(path)}: expected object")
+        return cls(type=_decode_str(value.get("type", ""), (path, "type")), data=value.get("data"))
 
     def to_mapping(self) -> dict[str, Any]:
         return {"type": self.type, "data": _api_to_json(self.data)}
@@ -1883,12 +3333,12 @@ class AssistantServerMessage:
     data: Any = None
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AssistantServerMessage") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AssistantServerMessage") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
-        return cls(type=_decode_str(value.get("type", ""), _field_path(path, "type")), data=value.get("data"))
+            raise TypeError(f"{_path_text(path)}: expected object")
+        return cls(type=_decode_str(value.get("type", ""), (path, "type")), data=value.get("data"))
 
     def to_mapping(self) -> dict[str, Any]:
         return {"type": self.type, "data": _api_to_json(self.data)}
@@ -2112,12 +3562,12 @@ class AssistantClientMessage:
     data: Any = None
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AssistantClientMessage") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AssistantClientMessage") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
-        return cls(type=_decode_str(value.get("type", ""), _field_path(path, "type")), data=value.get("data"))
+            raise TypeError(f"{_path_text(path)}: expected object")
+        return cls(type=_decode_str(value.get("type", ""), (path, "type")), data=value.get("data"))
 
     def to_mapping(self) -> dict[str, Any]:
         return {"type": self.type, "data": _api_to_json(self.data)}
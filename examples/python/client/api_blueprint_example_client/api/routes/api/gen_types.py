@@ -9,10 +9,12 @@ from ...runtime.gen_codecs import (
     _MISSING,
     _api_to_json,
     _api_to_transport,
+    _batch_rows,
     _decode_any,
     _decode_bool,
     _decode_bytes,
     _decode_coerce_string,
+    _decode_column,
     _decode_file,
     _decode_float,
     _decode_int,
@@ -21,12 +23,33 @@ from ...runtime.gen_codecs import (
     _decode_object,
     _decode_one_of,
     _decode_optional,
+    _decode_query_bool,
+    _decode_query_float,
+    _decode_query_int,
+    _decode_query_list,
     _decode_required,
+    _decode_scalar_list,
+    _decode_scalar_map,
     _decode_str,
     _decode_strict_bool,
     _decode_strict_float,
     _decode_strict_int,
+    _DecodePath,
+    _enum_lookup,
     _field_path,
+    _path_text,
+    _query_items,
+    _write_json_any,
+    _write_json_bool,
+    _write_json_enum,
+    _write_json_float,
+    _write_json_int,
+    _write_json_list,
+    _write_json_map,
+    _write_json_model,
+    _write_json_scalar_list,
+    _write_json_scalar_map,
+    _write_json_str,
 )
 
 
@@ -43,18 +66,24 @@ class HelloChannelMsgTypeEnum(StrEnum):
     UPGRADE = "upgrade"
 
     @classmethod
-    def from_value(cls, value: object, path: str = "HelloChannelMsgTypeEnum") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "HelloChannelMsgTypeEnum") -> Self:
         if isinstance(value, cls):
             return value
-        for item in cls:
-            if item.value == value or str(item.value) == str(value):
-                return item
-        raise ValueError(f"{path}: expected HelloChannelMsgTypeEnum value")
+        try:
+            return _HelloChannelMsgTypeEnum_BY_VALUE[value]
+        except (KeyError, TypeError):
+            item = _HelloChannelMsgTypeEnum_BY_VALUE.get(str(value))
+        if item is None:
+            raise ValueError(f"{_path_text(path)}: expected HelloChannelMsgTypeEnum value")
+        return item
 
     def to_json(self) -> object:
         return self.value
 
 
+_HelloChannelMsgTypeEnum_BY_VALUE = _enum_lookup(HelloChannelMsgTypeEnum)
+
+
 @dataclass(kw_only=True)
 class HelloChannelMessage:
     type: HelloChannelMsgTypeEnum
@@ -67,18 +96,38 @@ class HelloChannelMessage:
         return cls._from_mapping(value, "HelloChannelMessage")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "HelloChannelMessage") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "HelloChannelMessage") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "HelloChannelMessage") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        type_column = _decode_column(rows, path, "type", HelloChannelMsgTypeEnum.from_value)
+        data_column = _decode_column(rows, path, "data", _decode_any)
+        return [
+            cls(type=type_item, data=data_item)
+            for type_item, data_item in zip(type_column, data_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            type=_decode_required(HelloChannelMsgTypeEnum.from_value, value.get("type", _MISSING), _field_path(path, "type")),
-            data=_decode_required(_decode_any, value.get("data", _MISSING), _field_path(path, "data")),
+            type=_HelloChannelMsgTypeEnum_BY_VALUE[value["type"]],
+            data=value["data"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            type=_decode_required(HelloChannelMsgTypeEnum.from_value, value.get("type", _MISSING), (path, "type")),
+            data=_decode_required(_decode_any, value.get("data", _MISSING), (path, "data")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -93,6 +142,18 @@ class HelloChannelMessage:
         result["data"] = _api_to_transport(self.data)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"type":')
+        _write_json_enum(out, self.type)
+        out.append(',"data":')
+        _write_json_any(out, self.data)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class HelloChannelClose:
@@ -107,19 +168,41 @@ class HelloChannelClose:
         return cls._from_mapping(value, "HelloChannelClose")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "HelloChannelClose") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "HelloChannelClose") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "HelloChannelClose") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        code_column = _decode_column(rows, path, "code", _decode_int, int, optional=True)
+        reason_column = _decode_column(rows, path, "reason", _decode_str, str, optional=True)
+        error_column = _decode_column(rows, path, "error", _decode_str, str, optional=True)
+        return [
+            cls(code=code_item, reason=reason_item, error=error_item)
+            for code_item, reason_item, error_item in zip(code_column, reason_column, error_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            code=value.get("code"),
+            reason=value.get("reason"),
+            error=value.get("error"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            code=_decode_optional(_decode_int, value.get("code", _MISSING), _field_path(path, "code")),
-            reason=_decode_optional(_decode_str, value.get("reason", _MISSING), _field_path(path, "reason")),
-            error=_decode_optional(_decode_str, value.get("error", _MISSING), _field_path(path, "error")),
+            code=_decode_optional(_decode_int, value.get("code", _MISSING), (path, "code")),
+            reason=_decode_optional(_decode_str, value.get("reason", _MISSING), (path, "reason")),
+            error=_decode_optional(_decode_str, value.get("error", _MISSING), (path, "error")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -147,3 +230,24 @@ class HelloChannelClose:
             result["error"] = _api_to_transport(self.error)
 
         return result
+
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.code is not None:
+            out.append(sep + '"code":')
+            _write_json_int(out, self.code)
+            sep = ","
+        if self.reason is not None:
+            out.append(sep + '"reason":')
+            _write_json_str(out, self.reason)
+            sep = ","
+        if self.error is not None:
+            out.append(sep + '"error":')
+            _write_json_str(out, self.error)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
@@ -5,6 +5,7 @@ from typing import Any, Mapping
 
 from ....runtime.client import ApiChannelBridge, ApiClientTransport, ApiRawResponse, ApiRequest, ApiStreamBridge, ApiStreamResponse
 from ....runtime.gen_codecs import (
+    _api_json_bytes,
     _api_to_json,
     _api_to_transport,
     _decode_any,
@@ -26,12 +27,19 @@ from .gen_types import (
     HelloChannelMsgTypeEnum,
     MapEnum,
     HelloWayEnum,
+    _decode_map_of_str_to_ApiHelloMap,
+    _decode_map_of_MapEnum_to_ApiHelloMap,
+    _decode_list_of_MapEnum,
+    _trust_map_of_str_to_ApiHelloMap,
+    _trust_map_of_MapEnum_to_ApiHelloMap,
+    _trust_list_of_MapEnum,
 )
 
 
 class HelloClient:
     def __init__(self, transport: ApiClientTransport):
         self._transport = transport
+        self._trusted_decode = getattr(transport, "trusted_decode", False)
 
     async def abc(
         self,
@@ -53,7 +61,9 @@ class HelloClient:
                 timeout=timeout,
             )
         )
-        return (lambda item, path: _decode_map(item, path, _decode_str, ApiHelloMap.from_value))(payload, "abc.response")
+        if self._trusted_decode:
+            return _trust_map_of_str_to_ApiHelloMap(payload)
+        return _decode_map_of_str_to_ApiHelloMap(payload, "abc.response")
 
     async def map_enum(
         self,
@@ -73,7 +83,9 @@ class HelloClient:
                 timeout=timeout,
             )
         )
-        return (lambda item, path: _decode_map(item, path, MapEnum.from_value, ApiHelloMap.from_value))(payload, "map_enum.response")
+        if self._trusted_decode:
+            return _trust_map_of_MapEnum_to_ApiHelloMap(payload)
+        return _decode_map_of_MapEnum_to_ApiHelloMap(payload, "map_enum.response")
 
     async def list_enum(
         self,
@@ -93,7 +105,9 @@ class HelloClient:
                 timeout=timeout,
             )
         )
-        return (lambda item, path: _decode_list(item, path, MapEnum.from_value))(payload, "list_enum.response")
+        if self._trusted_decode:
+            return _trust_list_of_MapEnum(payload)
+        return _decode_list_of_MapEnum(payload, "list_enum.response")
 
     async def string(
         self,
@@ -113,6 +127,8 @@ class HelloClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return payload
         return _decode_str(payload, "string.response")
 
     async def uint64(
@@ -133,6 +149,8 @@ class HelloClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return payload
         return _decode_int(payload, "uint64.response")
 
     async def string_emun(
@@ -9,10 +9,12 @@ from ....runtime.gen_codecs import (
     _MISSING,
     _api_to_json,
     _api_to_transport,
+    _batch_rows,
     _decode_any,
     _decode_bool,
     _decode_bytes,
     _decode_coerce_string,
+    _decode_column,
     _decode_file,
     _decode_float,
     _decode_int,
@@ -21,12 +23,33 @@ from ....runtime.gen_codecs import (
     _decode_object,
     _decode_one_of,
     _decode_optional,
+    _decode_query_bool,
+    _decode_query_float,
+    _decode_query_int,
+    _decode_query_list,
     _decode_required,
+    _decode_scalar_list,
+    _decode_scalar_map,
     _decode_str,
     _decode_strict_bool,
     _decode_strict_float,
     _decode_strict_int,
+    _DecodePath,
+    _enum_lookup,
     _field_path,
+    _path_text,
+    _query_items,
+    _write_json_any,
+    _write_json_bool,
+    _write_json_enum,
+    _write_json_float,
+    _write_json_int,
+    _write_json_list,
+    _write_json_map,
+    _write_json_model,
+    _write_json_scalar_list,
+    _write_json_scalar_map,
+    _write_json_str,
 )
 
 
@@ -46,18 +69,38 @@ class MediaPreviewForm:
         return cls._from_mapping(value, "MediaPreviewForm")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "MediaPreviewForm") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "MediaPreviewForm") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "MediaPreviewForm") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        title_column = _decode_column(rows, path, "title", _decode_str, str, optional=True)
+        image_column = _decode_column(rows, path, "image", _decode_file)
+        return [
+            cls(title=title_item, image=image_item)
+            for title_item, image_item in zip(title_column, image_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            title=_decode_optional(_decode_str, value.get("title", _MISSING), _field_path(path, "title")),
-            image=_decode_required(_decode_file, value.get("image", _MISSING), _field_path(path, "image")),
+            title=value.get("title"),
+            image=value["image"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            title=_decode_optional(_decode_str, value.get("title", _MISSING), (path, "title")),
+            image=_decode_required(_decode_file, value.get("image", _MISSING), (path, "image")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -76,6 +119,21 @@ class MediaPreviewForm:
         result["image"] = _api_to_transport(self.image)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.title is not None:
+            out.append(sep + '"title":')
+            _write_json_str(out, self.title)
+            sep = ","
+        out.append(sep + '"image":')
+        _write_json_any(out, self.image)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class MediaErrorFrameQuery:
@@ -88,17 +146,35 @@ class MediaErrorFrameQuery:
         return cls._from_mapping(value, "MediaErrorFrameQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "MediaErrorFrameQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "MediaErrorFrameQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "MediaErrorFrameQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        mode_column = _decode_column(rows, path, "mode", _decode_str, str, optional=True)
+        return [
+            cls(mode=mode_item)
+            for mode_item in mode_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            mode=_decode_optional(_decode_str, value.get("mode", _MISSING), _field_path(path, "mode")),
+            mode=value.get("mode"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            mode=_decode_optional(_decode_str, value.get("mode", _MISSING), (path, "mode")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -114,3 +190,16 @@ class MediaErrorFrameQuery:
             result["mode"] = _api_to_transport(self.mode)
 
         return result
+
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.mode is not None:
+            out.append(sep + '"mode":')
+            _write_json_str(out, self.mode)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
@@ -5,6 +5,7 @@ from typing import Any, Mapping
 
 from ....runtime.client import ApiChannelBridge, ApiClientTransport, ApiRawResponse, ApiRequest, ApiStreamBridge, ApiStreamResponse
 from ....runtime.gen_codecs import (
+    _api_json_bytes,
     _api_to_json,
     _api_to_transport,
     _decode_any,
@@ -27,6 +28,7 @@ from .gen_types import (
 class AccountClient:
     def __init__(self, transport: ApiClientTransport):
         self._transport = transport
+        self._trusted_decode = getattr(transport, "trusted_decode", False)
 
     async def account_profile(
         self,
@@ -46,4 +48,6 @@ class AccountClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return AccountProfileResponse.from_trusted(payload)
         return AccountProfileResponse.from_value(payload, "account_profile.response")
@@ -9,10 +9,12 @@ from ....runtime.gen_codecs import (
     _MISSING,
     _api_to_json,
     _api_to_transport,
+    _batch_rows,
     _decode_any,
     _decode_bool,
     _decode_bytes,
     _decode_coerce_string,
+    _decode_column,
     _decode_file,
     _decode_float,
     _decode_int,
@@ -21,12 +23,33 @@ from ....runtime.gen_codecs import (
     _decode_object,
     _decode_one_of,
     _decode_optional,
+    _decode_query_bool,
+    _decode_query_float,
+    _decode_query_int,
+    _decode_query_list,
     _decode_required,
+    _decode_scalar_list,
+    _decode_scalar_map,
     _decode_str,
     _decode_strict_bool,
     _decode_strict_float,
     _decode_strict_int,
+    _DecodePath,
+    _enum_lookup,
     _field_path,
+    _path_text,
+    _query_items,
+    _write_json_any,
+    _write_json_bool,
+    _write_json_enum,
+    _write_json_float,
+    _write_json_int,
+    _write_json_list,
+    _write_json_map,
+    _write_json_model,
+    _write_json_scalar_list,
+    _write_json_scalar_map,
+    _write_json_str,
 )
 
 
@@ -46,18 +69,38 @@ class AccountProfileResponse:
         return cls._from_mapping(value, "AccountProfileResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AccountProfileResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AccountProfileResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AccountProfileResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        user_id_column = _decode_column(rows, path, "user_id", _decode_coerce_string)
+        nickname_column = _decode_column(rows, path, "nickname", _decode_str, str)
+        return [
+            cls(user_id=user_id_item, nickname=nickname_item)
+            for user_id_item, nickname_item in zip(user_id_column, nickname_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            user_id=str(value["user_id"]),
+            nickname=value["nickname"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            user_id=_decode_required(_decode_coerce_string, value.get("user_id", _MISSING), _field_path(path, "user_id")),
-            nickname=_decode_required(_decode_str, value.get("nickname", _MISSING), _field_path(path, "nickname")),
+            user_id=_decode_required(_decode_coerce_string, value.get("user_id", _MISSING), (path, "user_id")),
+            nickname=_decode_required(_decode_str, value.get("nickname", _MISSING), (path, "nickname")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -71,3 +114,15 @@ class AccountProfileResponse:
         result["user_id"] = _api_to_transport(self.user_id)
         result["nickname"] = _api_to_transport(self.nickname)
         return result
+
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"user_id":')
+        _write_json_str(out, self.user_id)
+        out.append(',"nickname":')
+        _write_json_str(out, self.nickname)
+        out.append("}")
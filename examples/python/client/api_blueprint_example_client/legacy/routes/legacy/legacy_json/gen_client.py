@@ -5,6 +5,7 @@ from typing import Any, Mapping
 
 from ....runtime.client import ApiChannelBridge, ApiClientTransport, ApiRawResponse, ApiRequest, ApiStreamBridge, ApiStreamResponse
 from ....runtime.gen_codecs import (
+    _api_json_bytes,
     _api_to_json,
     _api_to_transport,
     _decode_any,
@@ -21,12 +22,19 @@ from ....runtime.gen_codecs import (
 
 from .gen_types import (
     LegacyJsonCompatResponse,
+    _decode_list_of_str,
+    _decode_one_of_str_or_list_of_str,
+    _decode_one_of_str_or_strict_int,
+    _decode_list_of_one_of_str_or_strict_int,
+    _decode_list_of_coerce_string,
+    _trust_list_of_coerce_string,
 )
 
 
 class LegacyJsonClient:
     def __init__(self, transport: ApiClientTransport):
         self._transport = transport
+        self._trusted_decode = getattr(transport, "trusted_decode", False)
 
     async def legacy_json_compat(
         self,
@@ -46,4 +54,6 @@ class LegacyJsonClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return LegacyJsonCompatResponse.from_trusted(payload)
         return LegacyJsonCompatResponse.from_value(payload, "legacy_json_compat.response")
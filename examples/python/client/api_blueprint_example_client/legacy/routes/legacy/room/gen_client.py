@@ -5,6 +5,7 @@ from typing import Any, Mapping
 
 from ....runtime.client import ApiChannelBridge, ApiClientTransport, ApiRawResponse, ApiRequest, ApiStreamBridge, ApiStreamResponse
 from ....runtime.gen_codecs import (
+    _api_json_bytes,
     _api_to_json,
     _api_to_transport,
     _decode_any,
@@ -22,12 +23,15 @@ from ....runtime.gen_codecs import (
 from .gen_types import (
     RoomListResponse,
     RoomSummary,
+    _decode_list_of_RoomSummary,
+    _trust_list_of_RoomSummary,
 )
 
 
 class RoomClient:
     def __init__(self, transport: ApiClientTransport):
         self._transport = transport
+        self._trusted_decode = getattr(transport, "trusted_decode", False)
 
     async def room_list(
         self,
@@ -47,4 +51,6 @@ class RoomClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return RoomListResponse.from_trusted(payload)
         return RoomListResponse.from_value(payload, "room_list.response")
@@ -20,8 +20,12 @@ class HttpClientTransport(ApiClientTransport):
         base_url: str = "http://localhost:2333",
         *,
         client: httpx.AsyncClient | None = None,
+        trusted_decode: bool = False,
     ):
         self.base_url = base_url.rstrip("/")
+        # Responses come from a server generated from the same contract:
+        # route clients build DTOs with `from_trusted` and skip type checks.
+        self.trusted_decode = trusted_decode
         self._client = client or httpx.AsyncClient()
         self._owns_client = client is None
 
@@ -37,7 +41,10 @@ class HttpClientTransport(ApiClientTransport):
             request_kwargs["timeout"] = request.timeout
         if request.query:
             request_kwargs["params"] = {key: value for key, value in request.query.items() if value is not None}
-        if request.json is not None:
+        if request.json_bytes is not None:
+            request_kwargs["content"] = request.json_bytes
+            _set_default_header(request_kwargs, "content-type", "application/json")
+        elif request.json is not None:
             request_kwargs["json"] = request.json
         elif request.multipart is not None:
             content_type, content = _multipart_content(request.multipart)
@@ -319,6 +326,12 @@ def _set_header(request_kwargs: dict[str, Any], name: str, value: str) -> None:
     headers[name] = value
 
 
+def _set_default_header(request_kwargs: dict[str, Any], name: str, value: str) -> None:
+    headers = request_kwargs.setdefault("headers", {})
+    if not any(existing.lower() == name.lower() for existing in headers):
+        headers[name] = value
+
+
 def _filename_from_disposition(disposition: str) -> str | None:
     parts = [part.strip() for part in disposition.split(";")]
     for part in parts:
@@ -0,0 +1,95 @@
+# Code generated by api-blueprint (Python client); DO NOT EDIT.
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Mapping
+
+
+ApiWebSocketFrame = str | bytes
+
+
+@dataclass(frozen=True)
+class ApiWebSocketCodec:
+    """CHANNEL wire codec negotiated through the WebSocket subprotocol.
+    Client messages travel as bare values (`dumps` / `loads`); server frames
+    wrap them in the `{"type": "message" | "close", "data": ...}` envelope.
+    Binary codecs are sent as binary frames, the rest as text frames.
+    """
+    subprotocol: str
+    binary: bool
+    dumps: Callable[[Any], ApiWebSocketFrame]
+    loads: Callable[[ApiWebSocketFrame], Any]
+
+    def encode_envelope(self, kind: str, data: Any) -> ApiWebSocketFrame:
+        return self.dumps({"type": kind, "data": data})
+
+    def decode_envelope(self, frame: ApiWebSocketFrame) -> tuple[str, Any]:
+        value = self.loads(frame)
+        if not isinstance(value, Mapping) or not isinstance(value.get("type"), str):
+            raise ValueError("invalid WebSocket envelope")
+        return value["type"], value.get("data")
+
+
+@dataclass(frozen=True)
+class ApiTaggedWebSocketCodec(ApiWebSocketCodec):
+    """Binary frames holding one envelope tag byte followed by the encoded data."""
+
+    def encode_envelope(self, kind: str, data: Any) -> ApiWebSocketFrame:
+        return _ENVELOPE_TAGS[kind] + _as_bytes(self.dumps(data))
+
+    def decode_envelope(self, frame: ApiWebSocketFrame) -> tuple[str, Any]:
+        frame = _as_bytes(frame)
+        kind = _ENVELOPE_KINDS.get(frame[:1])
+        if kind is None:
+            raise ValueError("invalid WebSocket envelope tag")
+        return kind, self.loads(frame[1:])
+
+
+def _json_text(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _json_bytes(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _as_bytes(frame: ApiWebSocketFrame) -> bytes:
+    return frame.encode("utf-8") if isinstance(frame, str) else frame
+
+
+_ENVELOPE_TAGS = {"message": b"\x01", "close": b"\x02"}
+_ENVELOPE_KINDS = {tag: kind for kind, tag in _ENVELOPE_TAGS.items()}
+
+# The default when the client offers no known subprotocol.
+JSON_WEBSOCKET_CODEC = ApiWebSocketCodec("api-blueprint.json", False, _json_text, json.loads)
+TAGGED_JSON_WEBSOCKET_CODEC = ApiTaggedWebSocketCodec("api-blueprint.tagged-json", True, _json_bytes, json.loads)
+
+
+def msgpack_websocket_codec() -> ApiWebSocketCodec:
+    """MessagePack envelopes; requires the `msgpack` package."""
+    import msgpack
+    return ApiWebSocketCodec("api-blueprint.msgpack", True, msgpack.packb, msgpack.unpackb)
+
+
+def cbor_websocket_codec() -> ApiWebSocketCodec:
+    """CBOR envelopes; requires the `cbor2` package."""
+    import cbor2
+    return ApiWebSocketCodec("api-blueprint.cbor", True, cbor2.dumps, cbor2.loads)
+
+
+def default_websocket_codecs() -> dict[str, ApiWebSocketCodec]:
+    return {codec.subprotocol: codec for codec in (JSON_WEBSOCKET_CODEC, TAGGED_JSON_WEBSOCKET_CODEC)}
+
+
+def select_websocket_codec(
+    protocols: Iterable[str],
+    codecs: Mapping[str, ApiWebSocketCodec] | None = None,
+) -> ApiWebSocketCodec | None:
+    """Return the codec of the first offered subprotocol that `codecs` knows."""
+    available = default_websocket_codecs() if codecs is None else codecs
+    for protocol in protocols:
+        codec = available.get(protocol)
+        if codec is not None:
+            return codec
+    return None
@@ -5,6 +5,7 @@ from typing import Any, Mapping
 
 from ...runtime.client import ApiChannelBridge, ApiClientTransport, ApiRawResponse, ApiRequest, ApiStreamBridge, ApiStreamResponse
 from ...runtime.gen_codecs import (
+    _api_json_bytes,
     _api_to_json,
     _api_to_transport,
     _decode_any,
@@ -28,6 +29,7 @@ from .gen_types import (
 class StaticClient:
     def __init__(self, transport: ApiClientTransport):
         self._transport = transport
+        self._trusted_decode = getattr(transport, "trusted_decode", False)
 
     async def doc_json(
         self,
@@ -47,6 +49,8 @@ class StaticClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return DocJsonResponse.from_trusted(payload)
         return DocJsonResponse.from_value(payload, "doc_json.response")
 
     async def dochaha(
@@ -67,4 +71,6 @@ class StaticClient:
                 timeout=timeout,
             )
         )
+        if self._trusted_decode:
+            return DochahaResponse.from_trusted(payload)
         return DochahaResponse.from_value(payload, "dochaha.response")
@@ -9,10 +9,12 @@ from ...runtime.gen_codecs import (
     _MISSING,
     _api_to_json,
     _api_to_transport,
+    _batch_rows,
     _decode_any,
     _decode_bool,
     _decode_bytes,
     _decode_coerce_string,
+    _decode_column,
     _decode_file,
     _decode_float,
     _decode_int,
@@ -21,12 +23,33 @@ from ...runtime.gen_codecs import (
     _decode_object,
     _decode_one_of,
     _decode_optional,
+    _decode_query_bool,
+    _decode_query_float,
+    _decode_query_int,
+    _decode_query_list,
     _decode_required,
+    _decode_scalar_list,
+    _decode_scalar_map,
     _decode_str,
     _decode_strict_bool,
     _decode_strict_float,
     _decode_strict_int,
+    _DecodePath,
+    _enum_lookup,
     _field_path,
+    _path_text,
+    _query_items,
+    _write_json_any,
+    _write_json_bool,
+    _write_json_enum,
+    _write_json_float,
+    _write_json_int,
+    _write_json_list,
+    _write_json_map,
+    _write_json_model,
+    _write_json_scalar_list,
+    _write_json_scalar_map,
+    _write_json_str,
 )
 
 
@@ -45,25 +68,38 @@ class DocJsonResponse:
         return cls._from_mapping(value, "DocJsonResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "DocJsonResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "DocJsonResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def from_empty_response_value(cls, value: object, path: str = "DocJsonResponse") -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "DocJsonResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        return [cls() for _ in rows]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+        )
+
+    @classmethod
+    def from_empty_response_value(cls, value: object, path: _DecodePath = "DocJsonResponse") -> Self:
         if isinstance(value, cls):
             return value
         if value is None:
             return cls()
         if isinstance(value, Mapping) and not value:
             return cls()
-        raise TypeError(f"{path}: expected empty response")
+        raise TypeError(f"{_path_text(path)}: expected empty response")
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
         )
 
@@ -75,6 +111,14 @@ class DocJsonResponse:
         result: dict[str, Any] = {}
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append("{}")
+
 
 @dataclass(kw_only=True)
 class DochahaResponse:
@@ -87,17 +131,35 @@ class DochahaResponse:
         return cls._from_mapping(value, "DochahaResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "DochahaResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "DochahaResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "DochahaResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        a_column = _decode_column(rows, path, "a", _decode_str, str, optional=True)
+        return [
+            cls(a=a_item)
+            for a_item in a_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            a=value.get("a"),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            a=_decode_optional(_decode_str, value.get("a", _MISSING), _field_path(path, "a")),
+            a=_decode_optional(_decode_str, value.get("a", _MISSING), (path, "a")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -113,3 +175,16 @@ class DochahaResponse:
             result["a"] = _api_to_transport(self.a)
 
         return result
+
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.a is not None:
+            out.append(sep + '"a":')
+            _write_json_str(out, self.a)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
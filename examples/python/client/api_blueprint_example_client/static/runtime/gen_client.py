@@ -59,6 +59,9 @@ class ApiRequest:
     path_params: Mapping[str, Any] | None = None
     query: Mapping[str, Any] | None = None
     json: Any = None
+    # Pre-encoded compact JSON for `json` when the body is a generated DTO;
+    # transports may send it instead of encoding `json` themselves.
+    json_bytes: bytes | None = None
     form: Mapping[str, Any] | None = None
     multipart: Mapping[str, Any] | None = None
     binary: bytes | ApiBinaryBody | None = None
@@ -7,6 +7,23 @@ from .gen_errors import ApiErrorEntry, ApiErrorCode, ApiErrorPayload, ApiToastPa
 API_ERRORS_BY_ID: dict[str, ApiErrorEntry] = {
 }
 
+# A code shared by several catalog entries resolves to the first one declared.
+API_ERRORS_BY_CODE: dict[int, ApiErrorEntry] = {
+}
+
+# Payloads are frozen, so responses that only repeat the catalog share one instance.
+API_ERROR_PAYLOADS_BY_ID: dict[str, ApiErrorPayload] = {
+    entry.id: ApiErrorPayload(
+        id=entry.id,
+        group=entry.group,
+        key=entry.key,
+        code=entry.code,
+        message=entry.message,
+        toast=ApiToastPayload(key=entry.toast.key, level=entry.toast.level, default=entry.toast.default),
+    )
+    for entry in API_ERRORS_BY_ID.values()
+}
+
 ROUTE_API_ERRORS_BY_CODE: dict[str, dict[int, ApiErrorEntry]] = {
     "static.static.get.docjson": {
     },
@@ -21,10 +38,12 @@ def lookup_api_error_by_id(error_id: str) -> ApiErrorEntry | None:
 
 def lookup_api_error_by_code(code: ApiErrorCode, route_id: str | None = None) -> ApiErrorEntry | None:
     if route_id:
-        route_entry = ROUTE_API_ERRORS_BY_CODE.get(route_id, {}).get(code)
-        if route_entry is not None:
-            return route_entry
-    return next((entry for entry in API_ERRORS_BY_ID.values() if entry.code == code), None)
+        route_errors = ROUTE_API_ERRORS_BY_CODE.get(route_id)
+        if route_errors is not None:
+            route_entry = route_errors.get(code)
+            if route_entry is not None:
+                return route_entry
+    return API_ERRORS_BY_CODE.get(code)
 
 
 def lookup_api_error(payload: dict[str, object] | ApiErrorPayload | None, route_id: str | None = None) -> ApiErrorEntry | None:
@@ -42,6 +61,8 @@ def lookup_api_error(payload: dict[str, object] | ApiErrorPayload | None, route_
 def make_api_error_payload(payload: dict[str, object] | None, route_id: str | None = None) -> ApiErrorPayload:
     payload = payload or {}
     entry = lookup_api_error(payload, route_id)
+    if entry is not None and _repeats_catalog_entry(payload, entry):
+        return API_ERROR_PAYLOADS_BY_ID[entry.id]
     code = payload.get("code")
     code_value = code if isinstance(code, int) else entry.code if entry is not None else 0
     toast = payload.get("toast")
@@ -61,5 +82,27 @@ def make_api_error_payload(payload: dict[str, object] | None, route_id: str | No
     )
 
 
+def _repeats_catalog_entry(payload: dict[str, object], entry: ApiErrorEntry) -> bool:
+    # Every field the payload sets is empty or equal to the catalog value, so
+    # the merged payload would equal the prebuilt one.
+    code = payload.get("code")
+    if isinstance(code, int) and code != entry.code:
+        return False
+    for name, value in (("id", entry.id), ("group", entry.group), ("key", entry.key), ("message", entry.message)):
+        sent = payload.get(name)
+        if sent and sent != value:
+            return False
+    toast = payload.get("toast")
+    if not isinstance(toast, dict):
+        return True
+    if toast.get("text"):
+        return False
+    for name, value in (("key", entry.toast.key), ("level", entry.toast.level), ("default", entry.toast.default)):
+        sent = toast.get(name)
+        if sent and sent != value:
+            return False
+    return True
+
+
 class ApiErrors:
     pass
@@ -9,10 +9,12 @@ from ....runtime.gen_codecs import (
     _MISSING,
     _api_to_json,
     _api_to_transport,
+    _batch_rows,
     _decode_any,
     _decode_bool,
     _decode_bytes,
     _decode_coerce_string,
+    _decode_column,
     _decode_file,
     _decode_float,
     _decode_int,
@@ -21,12 +23,33 @@ from ....runtime.gen_codecs import (
     _decode_object,
     _decode_one_of,
     _decode_optional,
+    _decode_query_bool,
+    _decode_query_float,
+    _decode_query_int,
+    _decode_query_list,
     _decode_required,
+    _decode_scalar_list,
+    _decode_scalar_map,
     _decode_str,
     _decode_strict_bool,
     _decode_strict_float,
     _decode_strict_int,
+    _DecodePath,
+    _enum_lookup,
     _field_path,
+    _path_text,
+    _query_items,
+    _write_json_any,
+    _write_json_bool,
+    _write_json_enum,
+    _write_json_float,
+    _write_json_int,
+    _write_json_list,
+    _write_json_map,
+    _write_json_model,
+    _write_json_scalar_list,
+    _write_json_scalar_map,
+    _write_json_str,
 )
 
 
@@ -39,18 +62,24 @@ class KeywordEnum(StrEnum):
     CLASS = "class"
 
     @classmethod
-    def from_value(cls, value: object, path: str = "KeywordEnum") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "KeywordEnum") -> Self:
         if isinstance(value, cls):
             return value
-        for item in cls:
-            if item.value == value or str(item.value) == str(value):
-                return item
-        raise ValueError(f"{path}: expected KeywordEnum value")
+        try:
+            return _KeywordEnum_BY_VALUE[value]
+        except (KeyError, TypeError):
+            item = _KeywordEnum_BY_VALUE.get(str(value))
+        if item is None:
+            raise ValueError(f"{_path_text(path)}: expected KeywordEnum value")
+        return item
 
     def to_json(self) -> object:
         return self.value
 
 
+_KeywordEnum_BY_VALUE = _enum_lookup(KeywordEnum)
+
+
 @dataclass(kw_only=True)
 class DefaultQuery:
     class_: str | None = None
@@ -62,17 +91,46 @@ class DefaultQuery:
         return cls._from_mapping(value, "DefaultQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "DefaultQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "DefaultQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "DefaultQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        class__column = _decode_column(rows, path, "class_", _decode_str, str, optional=True)
+        return [
+            cls(class_=class__item)
+            for class__item in class__column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            class_=value.get("class_"),
+        )
+
+    @classmethod
+    def from_query_string(cls, query_string: bytes, path: _DecodePath = "DefaultQuery") -> Self:
+        # One pass over the raw query string; repeated keys collect into list fields.
+        class__value: object = _MISSING
+        for key, item in _query_items(query_string, _DefaultQuery_QUERY_KEYS):
+            if key == "class_":
+                class__value = item
+        return cls(
+            class_=_decode_optional(_decode_str, class__value, (path, "class_")),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            class_=_decode_optional(_decode_str, value.get("class_", _MISSING), _field_path(path, "class_")),
+            class_=_decode_optional(_decode_str, value.get("class_", _MISSING), (path, "class_")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -89,6 +147,22 @@ class DefaultQuery:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.class_ is not None:
+            out.append(sep + '"class_":')
+            _write_json_str(out, self.class_)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
+
+_DefaultQuery_QUERY_KEYS = frozenset({"class_"})
+
 
 @dataclass(kw_only=True)
 class DefaultResponse:
@@ -103,19 +177,41 @@ class DefaultResponse:
         return cls._from_mapping(value, "DefaultResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "DefaultResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "DefaultResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "DefaultResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        default_column = _decode_column(rows, path, "default", _decode_str, str)
+        class__column = _decode_column(rows, path, "class_", _decode_str, str)
+        enum_column = _decode_column(rows, path, "enum", KeywordEnum.from_value)
+        return [
+            cls(default=default_item, class_=class__item, enum=enum_item)
+            for default_item, class__item, enum_item in zip(default_column, class__column, enum_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            default=value["default"],
+            class_=value["class_"],
+            enum=_KeywordEnum_BY_VALUE[value["enum"]],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            default=_decode_required(_decode_str, value.get("default", _MISSING), _field_path(path, "default")),
-            class_=_decode_required(_decode_str, value.get("class_", _MISSING), _field_path(path, "class_")),
-            enum=_decode_required(KeywordEnum.from_value, value.get("enum", _MISSING), _field_path(path, "enum")),
+            default=_decode_required(_decode_str, value.get("default", _MISSING), (path, "default")),
+            class_=_decode_required(_decode_str, value.get("class_", _MISSING), (path, "class_")),
+            enum=_decode_required(KeywordEnum.from_value, value.get("enum", _MISSING), (path, "enum")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -131,3 +227,17 @@ class DefaultResponse:
         result["class_"] = _api_to_transport(self.class_)
         result["enum"] = _api_to_transport(self.enum)
         return result
+
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"default":')
+        _write_json_str(out, self.default)
+        out.append(',"class_":')
+        _write_json_str(out, self.class_)
+        out.append(',"enum":')
+        _write_json_enum(out, self.enum)
+        out.append("}")
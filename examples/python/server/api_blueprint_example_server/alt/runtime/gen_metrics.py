@@ -0,0 +1,203 @@
+# Code generated by api-blueprint (Python server); DO NOT EDIT.
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Iterable, Protocol
+
+
+@dataclass(frozen=True)
+class ApiRouteObservation:
+    """One finished RPC request, timed per phase in seconds.
+    `decode_seconds` covers reading and decoding the request, `handler_seconds`
+    the service call and `encode_seconds` building the response body.
+    """
+    route_id: str
+    method: str
+    status: int
+    error_code: Any
+    bytes_in: int
+    bytes_out: int
+    decode_seconds: float
+    handler_seconds: float
+    encode_seconds: float
+    total_seconds: float
+    span: Any = None
+
+
+class ApiRouteHooks(Protocol):
+    def on_request_start(self, route_id: str) -> Any:
+        """Return a span (or None) that is handed back in the observation."""
+
+    def on_request_end(self, observation: ApiRouteObservation) -> None:
+        ...
+
+
+class ApiRouteProbe:
+    """Phase clock the transports create per request while hooks are configured."""
+    __slots__ = ("hooks", "route_id", "method", "bytes_in", "span", "started", "decoded_at", "handled_at")
+
+    def __init__(self, hooks: ApiRouteHooks, route_id: str, method: str, bytes_in: int) -> None:
+        self.hooks = hooks
+        self.route_id = route_id
+        self.method = method
+        self.bytes_in = bytes_in
+        self.span = hooks.on_request_start(route_id)
+        self.decoded_at: float | None = None
+        self.handled_at: float | None = None
+        self.started = time.perf_counter()
+
+    def decoded(self) -> None:
+        self.decoded_at = time.perf_counter()
+
+    def handled(self) -> None:
+        self.handled_at = time.perf_counter()
+
+    def finish(self, status: int, bytes_out: int, error_code: Any = None) -> None:
+        ended = time.perf_counter()
+        # A phase that never completed ends where the request did.
+        decoded_at = ended if self.decoded_at is None else self.decoded_at
+        handled_at = ended if self.handled_at is None else self.handled_at
+        self.hooks.on_request_end(
+            ApiRouteObservation(
+                route_id=self.route_id,
+                method=self.method,
+                status=status,
+                error_code=error_code,
+                bytes_in=self.bytes_in,
+                bytes_out=bytes_out,
+                decode_seconds=decoded_at - self.started,
+                handler_seconds=handled_at - decoded_at,
+                encode_seconds=ended - handled_at,
+                total_seconds=ended - self.started,
+                span=self.span,
+            )
+        )
+
+
+DEFAULT_ROUTE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ROUTE_PHASES = ("total", "decode", "handler", "encode")
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class ApiRouteHistogram:
+    """In-memory `ApiRouteHooks` with fixed-bucket latency histograms per route and phase.
+    `quantile` estimates e.g. the p99 of a route from its buckets and
+    `prometheus_text` renders everything in the Prometheus text format for a
+    `/metrics` endpoint.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_ROUTE_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._durations: dict[tuple[str, str], _Histogram] = {}
+        self._requests: dict[tuple[str, int], int] = {}
+        self._errors: dict[tuple[str, str], int] = {}
+        self._bytes_in: dict[str, int] = {}
+        self._bytes_out: dict[str, int] = {}
+
+    def on_request_start(self, route_id: str) -> None:
+        return None
+
+    def on_request_end(self, observation: ApiRouteObservation) -> None:
+        route_id = observation.route_id
+        phases = (
+            observation.total_seconds,
+            observation.decode_seconds,
+            observation.handler_seconds,
+            observation.encode_seconds,
+        )
+        with self._lock:
+            for phase, seconds in zip(ROUTE_PHASES, phases):
+                histogram = self._durations.get((route_id, phase))
+                if histogram is None:
+                    histogram = self._durations[(route_id, phase)] = _Histogram(len(self.buckets) + 1)
+                histogram.counts[bisect_left(self.buckets, seconds)] += 1
+                histogram.sum += seconds
+                histogram.count += 1
+            key = (route_id, observation.status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            if observation.error_code is not None:
+                error_key = (route_id, str(observation.error_code))
+                self._errors[error_key] = self._errors.get(error_key, 0) + 1
+            self._bytes_in[route_id] = self._bytes_in.get(route_id, 0) + observation.bytes_in
+            self._bytes_out[route_id] = self._bytes_out.get(route_id, 0) + observation.bytes_out
+
+    def quantile(self, route_id: str, q: float, phase: str = "total") -> float | None:
+        """Interpolate the `q` quantile from the buckets; None before any request."""
+        with self._lock:
+            histogram = self._durations.get((route_id, phase))
+            if histogram is None or histogram.count == 0:
+                return None
+            counts = list(histogram.counts)
+            total = histogram.count
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1] if self.buckets else 0.0
+                lower = self.buckets[index - 1] if index else 0.0
+                return lower + (self.buckets[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1] if self.buckets else 0.0
+
+    def prometheus_text(self) -> str:
+        with self._lock:
+            durations = {key: (list(item.counts), item.sum, item.count) for key, item in self._durations.items()}
+            requests = dict(self._requests)
+            errors = dict(self._errors)
+            bytes_in = dict(self._bytes_in)
+            bytes_out = dict(self._bytes_out)
+        lines = [
+            "# HELP api_blueprint_route_duration_seconds RPC route latency by phase.",
+            "# TYPE api_blueprint_route_duration_seconds histogram",
+        ]
+        for (route_id, phase), (counts, total_seconds, count) in sorted(durations.items()):
+            labels = (("route", route_id), ("phase", phase))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(_sample("api_blueprint_route_duration_seconds_bucket", (*labels, ("le", f"{bound:g}")), cumulative))
+            lines.append(_sample("api_blueprint_route_duration_seconds_bucket", (*labels, ("le", "+Inf")), count))
+            lines.append(_sample("api_blueprint_route_duration_seconds_sum", labels, repr(total_seconds)))
+            lines.append(_sample("api_blueprint_route_duration_seconds_count", labels, count))
+        lines += [
+            "# HELP api_blueprint_route_requests_total RPC requests by route and HTTP status.",
+            "# TYPE api_blueprint_route_requests_total counter",
+        ]
+        for (route_id, status), count in sorted(requests.items()):
+            lines.append(_sample("api_blueprint_route_requests_total", (("route", route_id), ("status", status)), count))
+        lines += [
+            "# HELP api_blueprint_route_errors_total RPC requests answered with an API error, by code.",
+            "# TYPE api_blueprint_route_errors_total counter",
+        ]
+        for (route_id, code), count in sorted(errors.items()):
+            lines.append(_sample("api_blueprint_route_errors_total", (("route", route_id), ("code", code)), count))
+        for name, totals in (("bytes_in", bytes_in), ("bytes_out", bytes_out)):
+            lines += [
+                f"# HELP api_blueprint_route_{name}_total RPC {name.replace('_', ' ')} by route.",
+                f"# TYPE api_blueprint_route_{name}_total counter",
+            ]
+            for route_id, total in sorted(totals.items()):
+                lines.append(_sample(f"api_blueprint_route_{name}_total", (("route", route_id),), total))
+        return "\n".join(lines) + "\n"
+
+
+def _sample(name: str, labels: Iterable[tuple[str, Any]], value: Any) -> str:
+    rendered = ",".join(f'{key}="{_label(str(item))}"' for key, item in labels)
+    return name + "{" + rendered + "} " + str(value)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,293 @@
+# Code generated by api-blueprint (Python server); DO NOT EDIT.
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, MutableMapping
+from urllib.parse import parse_qsl
+
+from ...runtime.errors import ApiError
+from ...runtime.metrics import ApiRouteHooks, ApiRouteProbe
+from ...runtime.server import ApiServerConfig, api_error_payload, encode_json, envelope_json_bytes, jsonable
+from ...routes.alt.conflict.service import ConflictService, ConflictServiceStub
+from ...routes.alt.conflict import gen_types as alt_conflict_types
+
+
+AsgiScope = MutableMapping[str, Any]
+AsgiMessage = MutableMapping[str, Any]
+AsgiReceive = Callable[[], Awaitable[AsgiMessage]]
+AsgiSend = Callable[[AsgiMessage], Awaitable[None]]
+AsgiApp = Callable[[AsgiScope, AsgiReceive, AsgiSend], Awaitable[None]]
+AsgiHandler = Callable[[AsgiScope, AsgiReceive, dict[str, str]], Awaitable[tuple[int, bytes]]]
+
+
+@dataclass(frozen=True)
+class AsgiRoute:
+    path: str
+    methods: tuple[str, ...]
+    handler: AsgiHandler
+    pattern: re.Pattern[str] | None = None
+
+
+class ApiAsgiApp:
+    """Plain ASGI app dispatching generated JSON routes from a static table.
+    Exact paths are resolved with one dict lookup and templated paths by their
+    precompiled patterns. Handlers read the query string and body straight from
+    the ASGI scope and receive channel and return encoded bytes; any request
+    that does not match goes to `fallback`.
+    """
+
+    def __init__(self, routes: Iterable[AsgiRoute], *, fallback: AsgiApp | None = None) -> None:
+        self.fallback = fallback
+        self._static: dict[str, dict[str, AsgiHandler]] = {}
+        self._dynamic: dict[str, tuple[re.Pattern[str], dict[str, AsgiHandler]]] = {}
+        for route in routes:
+            if route.pattern is None:
+                handlers = self._static.setdefault(route.path, {})
+            else:
+                handlers = self._dynamic.setdefault(route.path, (route.pattern, {}))[1]
+            for method in route.methods:
+                handlers[method] = route.handler
+
+    async def __call__(self, scope: AsgiScope, receive: AsgiReceive, send: AsgiSend) -> None:
+        if scope["type"] == "http":
+            handlers, path_params = self._match(_route_path(scope))
+            handler = handlers.get(scope["method"]) if handlers is not None else None
+            if handler is not None:
+                try:
+                    status, body = await handler(scope, receive, path_params)
+                except AsgiHttpError as error:
+                    status, body = error.status_code, _detail_body(error.detail)
+                except _ClientDisconnected:
+                    return
+                await _send_json(send, status, body)
+                return
+            if self.fallback is None:
+                if handlers is not None:
+                    await _send_json(
+                        send,
+                        405,
+                        _detail_body("Method Not Allowed"),
+                        ((b"allow", ", ".join(handlers).encode("latin-1")),),
+                    )
+                else:
+                    await _send_json(send, 404, _detail_body("Not Found"))
+                return
+        elif self.fallback is None:
+            if scope["type"] == "lifespan":
+                await _lifespan(receive, send)
+            elif scope["type"] == "websocket":
+                await send({"type": "websocket.close", "code": 1000})
+            return
+        await self.fallback(scope, receive, send)
+
+    def _match(self, path: str) -> tuple[dict[str, AsgiHandler] | None, dict[str, str]]:
+        handlers = self._static.get(path)
+        if handlers is not None:
+            return handlers, {}
+        for pattern, handlers in self._dynamic.values():
+            match = pattern.match(path)
+            if match is not None:
+                return handlers, match.groupdict()
+        return None, {}
+
+
+def create_app(
+    conflict_service: ConflictService | None = None,
+    config: ApiServerConfig | None = None,
+    fallback: AsgiApp | None = None,
+) -> ApiAsgiApp:
+    api_config = config or ApiServerConfig()
+    routes: list[AsgiRoute] = []
+    routes.extend(create_conflict_routes(conflict_service, config=api_config))
+    return ApiAsgiApp(routes, fallback=fallback)
+
+
+def create_conflict_routes(
+    service: ConflictService | None = None,
+    *,
+    config: ApiServerConfig | None = None,
+) -> list[AsgiRoute]:
+    api_config = config or ApiServerConfig()
+    service_impl = service or ConflictServiceStub()
+    route_hooks = api_config.route_hooks
+    routes: list[AsgiRoute] = []
+
+    async def conflict_default(
+        scope: AsgiScope,
+        receive: AsgiReceive,
+        path_params: dict[str, str],
+    ) -> tuple[int, bytes]:
+        service = service_impl
+        probe = None if route_hooks is None else _start_probe(route_hooks, "alt.conflict.get.default", scope)
+        try:
+            query = alt_conflict_types.DefaultQuery.from_query_string(scope.get("query_string", b""), "query")
+
+        except (TypeError, ValueError) as error:
+            response = _bad_request(error)
+            return response if probe is None else _finish_probe(probe, response)
+
+        if probe is not None:
+            probe.decoded()
+        try:
+            result = await service.default(
+                query=query,
+            )
+            if probe is not None:
+                probe.handled()
+            response = 200, _encode_ok_ok_data_error_envelope(result, api_config)
+            return response if probe is None else _finish_probe(probe, response)
+        except ApiError as error:
+            response = _encode_error_ok_data_error_envelope(error, "alt.conflict.get.default", api_config)
+            return response if probe is None else _finish_probe(probe, response, error.code)
+        except Exception:
+            if probe is not None:
+                probe.finish(500, 0)
+            raise
+
+    routes.append(AsgiRoute("/alt/conflict/default", ("GET",), conflict_default))
+    return routes
+
+
+def _route_path(scope: AsgiScope) -> str:
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path) and path[len(root_path) : len(root_path) + 1] == "/":
+        return path[len(root_path) :]
+    return path
+
+
+def _header(scope: AsgiScope, name: bytes) -> bytes | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+def _query_params(scope: AsgiScope) -> dict[str, Any]:
+    # Repeated keys collect into a list so untyped query fallbacks keep every value.
+    values: dict[str, Any] = {}
+    for key, value in parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True):
+        if key not in values:
+            values[key] = value
+        elif isinstance(values[key], list):
+            values[key].append(value)
+        else:
+            values[key] = [values[key], value]
+    return values
+
+
+async def _body(scope: AsgiScope, receive: AsgiReceive, max_bytes: int) -> bytes:
+    content_length = _header(scope, b"content-length")
+    if content_length is not None:
+        try:
+            if int(content_length) > max_bytes:
+                raise PayloadTooLargeError("request body exceeds configured limit")
+        except ValueError:
+            pass
+    chunks: list[bytes] = []
+    total = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise _ClientDisconnected()
+        chunk = message.get("body", b"")
+        total += len(chunk)
+        if total > max_bytes:
+            raise PayloadTooLargeError("request body exceeds configured limit")
+        chunks.append(chunk)
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+async def _json_body(scope: AsgiScope, receive: AsgiReceive, config: ApiServerConfig) -> Any:
+    body = await _body(scope, receive, config.body_max_bytes)
+    if not body:
+        return None
+    try:
+        return json.loads(body.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as err:
+        raise AsgiHttpError(400, "invalid JSON body") from err
+
+
+async def _send_json(
+    send: AsgiSend,
+    status: int,
+    body: bytes,
+    headers: tuple[tuple[bytes, bytes], ...] = (),
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                *headers,
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _lifespan(receive: AsgiReceive, send: AsgiSend) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+def _detail_body(detail: str) -> bytes:
+    return json.dumps({"detail": detail}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _start_probe(hooks: ApiRouteHooks, route_id: str, scope: AsgiScope) -> ApiRouteProbe:
+    content_length = _header(scope, b"content-length")
+    try:
+        bytes_in = int(content_length) if content_length else 0
+    except ValueError:
+        bytes_in = 0
+    return ApiRouteProbe(hooks, route_id, scope["method"], bytes_in)
+
+
+def _finish_probe(probe: ApiRouteProbe, response: tuple[int, bytes], error_code: Any = None) -> tuple[int, bytes]:
+    probe.finish(response[0], len(response[1]), error_code)
+    return response
+
+
+def _bad_request(error: Exception) -> tuple[int, bytes]:
+    return 400, _detail_body(str(error) or "invalid request")
+
+
+def _encode_ok_ok_data_error_envelope(data: Any, config: ApiServerConfig) -> bytes:
+    write = getattr(data, "_write_json", None)
+    if write is not None and config.json_encoder is encode_json:
+        return envelope_json_bytes(write, '{"ok":true,"data":', "}")
+
+    return config.json_encoder({"ok": True, "data": jsonable(data)})
+
+
+def _encode_error_ok_data_error_envelope(error: ApiError, route_id: str, config: ApiServerConfig) -> tuple[int, bytes]:
+    payload = api_error_payload(error, route_id)
+    return 200, config.json_encoder({"ok": False, "error": payload})
+
+
+class AsgiHttpError(Exception):
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class PayloadTooLargeError(AsgiHttpError):
+    def __init__(self, detail: str = "payload too large") -> None:
+        super().__init__(413, detail)
+
+
+class _ClientDisconnected(Exception):
+    pass
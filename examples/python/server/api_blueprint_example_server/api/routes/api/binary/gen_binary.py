@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import BinaryIO
 
 from ....runtime.binary import (
     ApiBinaryBody,
@@ -42,6 +43,8 @@ class DemoPacket:
 
 class DemoPacketWire:
     CONTENT_TYPE = "application/octet-stream"
+    FIXED_SIZE: int | None = None
+    MAX_SIZE: int | None = 369
 
     @staticmethod
     def body(write, content_length: int | None = None) -> ApiBinaryBody:
@@ -56,12 +59,19 @@ class DemoPacketWire:
     def to_binary_body(value: DemoPacket | ApiBinaryBody) -> ApiBinaryBody:
         if is_api_binary_body(value):
             return value
-        return DemoPacketWire.body(lambda writer: write_demopacket(value, writer))
+        return DemoPacketWire.body(
+            lambda writer: write_demopacket(value, writer),
+            content_length=DemoPacketWire.FIXED_SIZE,
+        )
 
     @staticmethod
     def from_bytes(data: bytes | bytearray | memoryview) -> DemoPacket:
         return parse_demopacket(data)
 
+    @staticmethod
+    def from_stream(source: BinaryIO) -> DemoPacket:
+        return parse_demopacket(BinaryReader(source, endian="little"))
+
 
 def parse_demopacket(data: bytes | bytearray | memoryview | BinaryReader) -> DemoPacket:
     reader = data if isinstance(data, BinaryReader) else BinaryReader(data, endian="little")
@@ -395,6 +405,8 @@ class AuditPacket:
 
 class AuditPacketWire:
     CONTENT_TYPE = "application/octet-stream"
+    FIXED_SIZE: int | None = None
+    MAX_SIZE: int | None = 36
 
     @staticmethod
     def body(write, content_length: int | None = None) -> ApiBinaryBody:
@@ -409,12 +421,19 @@ class AuditPacketWire:
     def to_binary_body(value: AuditPacket | ApiBinaryBody) -> ApiBinaryBody:
         if is_api_binary_body(value):
             return value
-        return AuditPacketWire.body(lambda writer: write_auditpacket(value, writer))
+        return AuditPacketWire.body(
+            lambda writer: write_auditpacket(value, writer),
+            content_length=AuditPacketWire.FIXED_SIZE,
+        )
 
     @staticmethod
     def from_bytes(data: bytes | bytearray | memoryview) -> AuditPacket:
         return parse_auditpacket(data)
 
+    @staticmethod
+    def from_stream(source: BinaryIO) -> AuditPacket:
+        return parse_auditpacket(BinaryReader(source, endian="little"))
+
 
 def parse_auditpacket(data: bytes | bytearray | memoryview | BinaryReader) -> AuditPacket:
     reader = data if isinstance(data, BinaryReader) else BinaryReader(data, endian="little")
@@ -630,6 +649,8 @@ class WidePacket:
 
 class WidePacketWire:
     CONTENT_TYPE = "application/octet-stream"
+    FIXED_SIZE: int | None = None
+    MAX_SIZE: int | None = 68
 
     @staticmethod
     def body(write, content_length: int | None = None) -> ApiBinaryBody:
@@ -644,12 +665,19 @@ class WidePacketWire:
     def to_binary_body(value: WidePacket | ApiBinaryBody) -> ApiBinaryBody:
         if is_api_binary_body(value):
             return value
-        return WidePacketWire.body(lambda writer: write_widepacket(value, writer))
+        return WidePacketWire.body(
+            lambda writer: write_widepacket(value, writer),
+            content_length=WidePacketWire.FIXED_SIZE,
+        )
 
     @staticmethod
     def from_bytes(data: bytes | bytearray | memoryview) -> WidePacket:
         return parse_widepacket(data)
 
+    @staticmethod
+    def from_stream(source: BinaryIO) -> WidePacket:
+        return parse_widepacket(BinaryReader(source, endian="little"))
+
 
 def parse_widepacket(data: bytes | bytearray | memoryview | BinaryReader) -> WidePacket:
     reader = data if isinstance(data, BinaryReader) else BinaryReader(data, endian="little")
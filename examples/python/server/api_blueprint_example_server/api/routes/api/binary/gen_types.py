@@ -9,10 +9,12 @@ from ....runtime.gen_codecs import (
     _MISSING,
     _api_to_json,
     _api_to_transport,
+    _batch_rows,
     _decode_any,
     _decode_bool,
     _decode_bytes,
     _decode_coerce_string,
+    _decode_column,
     _decode_file,
     _decode_float,
     _decode_int,
@@ -21,12 +23,33 @@ from ....runtime.gen_codecs import (
     _decode_object,
     _decode_one_of,
     _decode_optional,
+    _decode_query_bool,
+    _decode_query_float,
+    _decode_query_int,
+    _decode_query_list,
     _decode_required,
+    _decode_scalar_list,
+    _decode_scalar_map,
     _decode_str,
     _decode_strict_bool,
     _decode_strict_float,
     _decode_strict_int,
+    _DecodePath,
+    _enum_lookup,
     _field_path,
+    _path_text,
+    _query_items,
+    _write_json_any,
+    _write_json_bool,
+    _write_json_enum,
+    _write_json_float,
+    _write_json_int,
+    _write_json_list,
+    _write_json_map,
+    _write_json_model,
+    _write_json_scalar_list,
+    _write_json_scalar_map,
+    _write_json_str,
 )
 
 from .gen_binary import *
@@ -47,17 +70,46 @@ class PacketQuery:
         return cls._from_mapping(value, "PacketQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "PacketQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "PacketQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "PacketQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        trace_column = _decode_column(rows, path, "trace", _decode_str, str, optional=True)
+        return [
+            cls(trace=trace_item)
+            for trace_item in trace_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            trace=value.get("trace"),
+        )
+
+    @classmethod
+    def from_query_string(cls, query_string: bytes, path: _DecodePath = "PacketQuery") -> Self:
+        # One pass over the raw query string; repeated keys collect into list fields.
+        trace_value: object = _MISSING
+        for key, item in _query_items(query_string, _PacketQuery_QUERY_KEYS):
+            if key == "trace":
+                trace_value = item
+        return cls(
+            trace=_decode_optional(_decode_str, trace_value, (path, "trace")),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            trace=_decode_optional(_decode_str, value.get("trace", _MISSING), _field_path(path, "trace")),
+            trace=_decode_optional(_decode_str, value.get("trace", _MISSING), (path, "trace")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -74,6 +126,22 @@ class PacketQuery:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.trace is not None:
+            out.append(sep + '"trace":')
+            _write_json_str(out, self.trace)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
+
+_PacketQuery_QUERY_KEYS = frozenset({"trace"})
+
 
 @dataclass(kw_only=True)
 class PacketResponse:
@@ -93,24 +161,74 @@ class PacketResponse:
         return cls._from_mapping(value, "PacketResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "PacketResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "PacketResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "PacketResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        trace_column = _decode_column(rows, path, "trace", _decode_str, str)
+        version_column = _decode_column(rows, path, "version", _decode_int, int)
+        item_count_column = _decode_column(rows, path, "item_count", _decode_int, int)
+        payload_column = _decode_column(rows, path, "payload", _decode_str, str)
+        score_sum_column = _decode_column(rows, path, "score_sum", _decode_float, float)
+        first_label_column = _decode_column(rows, path, "first_label", _decode_str, str)
+        item_ids_column = _decode_column(rows, path, "item_ids", _decode_list_of_int)
+        checksum_column = _decode_column(rows, path, "checksum", _decode_int, int)
+        return [
+            cls(
+                trace=trace_item,
+                version=version_item,
+                item_count=item_count_item,
+                payload=payload_item,
+                score_sum=score_sum_item,
+                first_label=first_label_item,
+                item_ids=item_ids_item,
+                checksum=checksum_item,
+            )
+            for trace_item, version_item, item_count_item, payload_item, score_sum_item, first_label_item, item_ids_item, checksum_item in zip(
+                trace_column,
+                version_column,
+                item_count_column,
+                payload_column,
+                score_sum_column,
+                first_label_column,
+                item_ids_column,
+                checksum_column,
+            )
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            trace=value["trace"],
+            version=value["version"],
+            item_count=value["item_count"],
+            payload=value["payload"],
+            score_sum=value["score_sum"],
+            first_label=value["first_label"],
+            item_ids=value["item_ids"],
+            checksum=value["checksum"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            trace=_decode_required(_decode_str, value.get("trace", _MISSING), _field_path(path, "trace")),
-            version=_decode_required(_decode_int, value.get("version", _MISSING), _field_path(path, "version")),
-            item_count=_decode_required(_decode_int, value.get("item_count", _MISSING), _field_path(path, "item_count")),
-            payload=_decode_required(_decode_str, value.get("payload", _MISSING), _field_path(path, "payload")),
-            score_sum=_decode_required(_decode_float, value.get("score_sum", _MISSING), _field_path(path, "score_sum")),
-            first_label=_decode_required(_decode_str, value.get("first_label", _MISSING), _field_path(path, "first_label")),
-            item_ids=_decode_required(lambda item, path: _decode_list(item, path, _decode_int), value.get("item_ids", _MISSING), _field_path(path, "item_ids")),
-            checksum=_decode_required(_decode_int, value.get("checksum", _MISSING), _field_path(path, "checksum")),
+            trace=_decode_required(_decode_str, value.get("trace", _MISSING), (path, "trace")),
+            version=_decode_required(_decode_int, value.get("version", _MISSING), (path, "version")),
+            item_count=_decode_required(_decode_int, value.get("item_count", _MISSING), (path, "item_count")),
+            payload=_decode_required(_decode_str, value.get("payload", _MISSING), (path, "payload")),
+            score_sum=_decode_required(_decode_float, value.get("score_sum", _MISSING), (path, "score_sum")),
+            first_label=_decode_required(_decode_str, value.get("first_label", _MISSING), (path, "first_label")),
+            item_ids=_decode_required(_decode_list_of_int, value.get("item_ids", _MISSING), (path, "item_ids")),
+            checksum=_decode_required(_decode_int, value.get("checksum", _MISSING), (path, "checksum")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -137,6 +255,30 @@ class PacketResponse:
         result["checksum"] = _api_to_transport(self.checksum)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"trace":')
+        _write_json_str(out, self.trace)
+        out.append(',"version":')
+        _write_json_int(out, self.version)
+        out.append(',"item_count":')
+        _write_json_int(out, self.item_count)
+        out.append(',"payload":')
+        _write_json_str(out, self.payload)
+        out.append(',"score_sum":')
+        _write_json_float(out, self.score_sum)
+        out.append(',"first_label":')
+        _write_json_str(out, self.first_label)
+        out.append(',"item_ids":')
+        _write_json_list_of_int(out, self.item_ids)
+        out.append(',"checksum":')
+        _write_json_int(out, self.checksum)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class AuditPacketQuery:
@@ -149,17 +291,46 @@ class AuditPacketQuery:
         return cls._from_mapping(value, "AuditPacketQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AuditPacketQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AuditPacketQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AuditPacketQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        trace_column = _decode_column(rows, path, "trace", _decode_str, str, optional=True)
+        return [
+            cls(trace=trace_item)
+            for trace_item in trace_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            trace=value.get("trace"),
+        )
+
+    @classmethod
+    def from_query_string(cls, query_string: bytes, path: _DecodePath = "AuditPacketQuery") -> Self:
+        # One pass over the raw query string; repeated keys collect into list fields.
+        trace_value: object = _MISSING
+        for key, item in _query_items(query_string, _AuditPacketQuery_QUERY_KEYS):
+            if key == "trace":
+                trace_value = item
+        return cls(
+            trace=_decode_optional(_decode_str, trace_value, (path, "trace")),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            trace=_decode_optional(_decode_str, value.get("trace", _MISSING), _field_path(path, "trace")),
+            trace=_decode_optional(_decode_str, value.get("trace", _MISSING), (path, "trace")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -176,6 +347,22 @@ class AuditPacketQuery:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.trace is not None:
+            out.append(sep + '"trace":')
+            _write_json_str(out, self.trace)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
+
+_AuditPacketQuery_QUERY_KEYS = frozenset({"trace"})
+
 
 @dataclass(kw_only=True)
 class AuditPacketResponse:
@@ -190,19 +377,41 @@ class AuditPacketResponse:
         return cls._from_mapping(value, "AuditPacketResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AuditPacketResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AuditPacketResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AuditPacketResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        trace_column = _decode_column(rows, path, "trace", _decode_str, str)
+        item_count_column = _decode_column(rows, path, "item_count", _decode_int, int)
+        checksum_column = _decode_column(rows, path, "checksum", _decode_int, int)
+        return [
+            cls(trace=trace_item, item_count=item_count_item, checksum=checksum_item)
+            for trace_item, item_count_item, checksum_item in zip(trace_column, item_count_column, checksum_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            trace=_decode_required(_decode_str, value.get("trace", _MISSING), _field_path(path, "trace")),
-            item_count=_decode_required(_decode_int, value.get("item_count", _MISSING), _field_path(path, "item_count")),
-            checksum=_decode_required(_decode_int, value.get("checksum", _MISSING), _field_path(path, "checksum")),
+            trace=value["trace"],
+            item_count=value["item_count"],
+            checksum=value["checksum"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            trace=_decode_required(_decode_str, value.get("trace", _MISSING), (path, "trace")),
+            item_count=_decode_required(_decode_int, value.get("item_count", _MISSING), (path, "item_count")),
+            checksum=_decode_required(_decode_int, value.get("checksum", _MISSING), (path, "checksum")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -219,6 +428,20 @@ class AuditPacketResponse:
         result["checksum"] = _api_to_transport(self.checksum)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"trace":')
+        _write_json_str(out, self.trace)
+        out.append(',"item_count":')
+        _write_json_int(out, self.item_count)
+        out.append(',"checksum":')
+        _write_json_int(out, self.checksum)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class WidePacketQuery:
@@ -231,17 +454,46 @@ class WidePacketQuery:
         return cls._from_mapping(value, "WidePacketQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "WidePacketQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "WidePacketQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "WidePacketQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        trace_column = _decode_column(rows, path, "trace", _decode_str, str, optional=True)
+        return [
+            cls(trace=trace_item)
+            for trace_item in trace_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            trace=value.get("trace"),
+        )
+
+    @classmethod
+    def from_query_string(cls, query_string: bytes, path: _DecodePath = "WidePacketQuery") -> Self:
+        # One pass over the raw query string; repeated keys collect into list fields.
+        trace_value: object = _MISSING
+        for key, item in _query_items(query_string, _WidePacketQuery_QUERY_KEYS):
+            if key == "trace":
+                trace_value = item
+        return cls(
+            trace=_decode_optional(_decode_str, trace_value, (path, "trace")),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            trace=_decode_optional(_decode_str, value.get("trace", _MISSING), _field_path(path, "trace")),
+            trace=_decode_optional(_decode_str, value.get("trace", _MISSING), (path, "trace")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -258,6 +510,22 @@ class WidePacketQuery:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.trace is not None:
+            out.append(sep + '"trace":')
+            _write_json_str(out, self.trace)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
+
+_WidePacketQuery_QUERY_KEYS = frozenset({"trace"})
+
 
 @dataclass(kw_only=True)
 class WidePacketResponse:
@@ -273,20 +541,54 @@ class WidePacketResponse:
         return cls._from_mapping(value, "WidePacketResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "WidePacketResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "WidePacketResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "WidePacketResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        trace_column = _decode_column(rows, path, "trace", _decode_str, str)
+        payload_size_column = _decode_column(rows, path, "payload_size", _decode_int, int)
+        signed_wide_column = _decode_column(rows, path, "signed_wide", _decode_int, int)
+        checksum_column = _decode_column(rows, path, "checksum", _decode_int, int)
+        return [
+            cls(
+                trace=trace_item,
+                payload_size=payload_size_item,
+                signed_wide=signed_wide_item,
+                checksum=checksum_item,
+            )
+            for trace_item, payload_size_item, signed_wide_item, checksum_item in zip(
+                trace_column,
+                payload_size_column,
+                signed_wide_column,
+                checksum_column,
+            )
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            trace=value["trace"],
+            payload_size=value["payload_size"],
+            signed_wide=value["signed_wide"],
+            checksum=value["checksum"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            trace=_decode_required(_decode_str, value.get("trace", _MISSING), _field_path(path, "trace")),
-            payload_size=_decode_required(_decode_int, value.get("payload_size", _MISSING), _field_path(path, "payload_size")),
-            signed_wide=_decode_required(_decode_int, value.get("signed_wide", _MISSING), _field_path(path, "signed_wide")),
-            checksum=_decode_required(_decode_int, value.get("checksum", _MISSING), _field_path(path, "checksum")),
+            trace=_decode_required(_decode_str, value.get("trace", _MISSING), (path, "trace")),
+            payload_size=_decode_required(_decode_int, value.get("payload_size", _MISSING), (path, "payload_size")),
+            signed_wide=_decode_required(_decode_int, value.get("signed_wide", _MISSING), (path, "signed_wide")),
+            checksum=_decode_required(_decode_int, value.get("checksum", _MISSING), (path, "checksum")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -304,3 +606,27 @@ class WidePacketResponse:
         result["signed_wide"] = _api_to_transport(self.signed_wide)
         result["checksum"] = _api_to_transport(self.checksum)
         return result
+
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"trace":')
+        _write_json_str(out, self.trace)
+        out.append(',"payload_size":')
+        _write_json_int(out, self.payload_size)
+        out.append(',"signed_wide":')
+        _write_json_int(out, self.signed_wide)
+        out.append(',"checksum":')
+        _write_json_int(out, self.checksum)
+        out.append("}")
+
+
+def _decode_list_of_int(value: object, path: _DecodePath) -> list[int]:
+    return _decode_scalar_list(value, path, int, _decode_int)
+
+
+def _write_json_list_of_int(out: list[str], value: object) -> None:
+    _write_json_scalar_list(out, value, int, _write_json_int)
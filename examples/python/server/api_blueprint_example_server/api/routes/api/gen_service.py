@@ -14,10 +14,16 @@ from .gen_types import (
 
 
 class ApiService(Protocol):
-    async def hello_channel(self) -> Any:
+    async def hello_channel(
+        self,
+        channel: ApiServerChannel[HelloChannelMessage, HelloChannelMessage, HelloChannelClose] | None = None,
+    ) -> Any:
         ...
 
 
 class ApiServiceStub:
-    async def hello_channel(self) -> Any:
+    async def hello_channel(
+        self,
+        channel: ApiServerChannel[HelloChannelMessage, HelloChannelMessage, HelloChannelClose] | None = None,
+    ) -> Any:
         raise NotImplementedError("hello_channel")
@@ -9,10 +9,12 @@ from ....runtime.gen_codecs import (
     _MISSING,
     _api_to_json,
     _api_to_transport,
+    _batch_rows,
     _decode_any,
     _decode_bool,
     _decode_bytes,
     _decode_coerce_string,
+    _decode_column,
     _decode_file,
     _decode_float,
     _decode_int,
@@ -21,12 +23,33 @@ from ....runtime.gen_codecs import (
     _decode_object,
     _decode_one_of,
     _decode_optional,
+    _decode_query_bool,
+    _decode_query_float,
+    _decode_query_int,
+    _decode_query_list,
     _decode_required,
+    _decode_scalar_list,
+    _decode_scalar_map,
     _decode_str,
     _decode_strict_bool,
     _decode_strict_float,
     _decode_strict_int,
+    _DecodePath,
+    _enum_lookup,
     _field_path,
+    _path_text,
+    _query_items,
+    _write_json_any,
+    _write_json_bool,
+    _write_json_enum,
+    _write_json_float,
+    _write_json_int,
+    _write_json_list,
+    _write_json_map,
+    _write_json_model,
+    _write_json_scalar_list,
+    _write_json_scalar_map,
+    _write_json_str,
 )
 
 
@@ -43,51 +66,69 @@ class HelloChannelMsgTypeEnum(StrEnum):
     UPGRADE = "upgrade"
 
     @classmethod
-    def from_value(cls, value: object, path: str = "HelloChannelMsgTypeEnum") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "HelloChannelMsgTypeEnum") -> Self:
         if isinstance(value, cls):
             return value
-        for item in cls:
-            if item.value == value or str(item.value) == str(value):
-                return item
-        raise ValueError(f"{path}: expected HelloChannelMsgTypeEnum value")
+        try:
+            return _HelloChannelMsgTypeEnum_BY_VALUE[value]
+        except (KeyError, TypeError):
+            item = _HelloChannelMsgTypeEnum_BY_VALUE.get(str(value))
+        if item is None:
+            raise ValueError(f"{_path_text(path)}: expected HelloChannelMsgTypeEnum value")
+        return item
 
     def to_json(self) -> object:
         return self.value
 
 
+_HelloChannelMsgTypeEnum_BY_VALUE = _enum_lookup(HelloChannelMsgTypeEnum)
+
+
 class MapEnum(StrEnum):
     A = "a"
     B = "b"
 
     @classmethod
-    def from_value(cls, value: object, path: str = "MapEnum") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "MapEnum") -> Self:
         if isinstance(value, cls):
             return value
-        for item in cls:
-            if item.value == value or str(item.value) == str(value):
-                return item
-        raise ValueError(f"{path}: expected MapEnum value")
+        try:
+            return _MapEnum_BY_VALUE[value]
+        except (KeyError, TypeError):
+            item = _MapEnum_BY_VALUE.get(str(value))
+        if item is None:
+            raise ValueError(f"{_path_text(path)}: expected MapEnum value")
+        return item
 
     def to_json(self) -> object:
         return self.value
 
 
+_MapEnum_BY_VALUE = _enum_lookup(MapEnum)
+
+
 class HelloWayEnum(StrEnum):
     ASD = "ASD"
 
     @classmethod
-    def from_value(cls, value: object, path: str = "HelloWayEnum") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "HelloWayEnum") -> Self:
         if isinstance(value, cls):
             return value
-        for item in cls:
-            if item.value == value or str(item.value) == str(value):
-                return item
-        raise ValueError(f"{path}: expected HelloWayEnum value")
+        try:
+            return _HelloWayEnum_BY_VALUE[value]
+        except (KeyError, TypeError):
+            item = _HelloWayEnum_BY_VALUE.get(str(value))
+        if item is None:
+            raise ValueError(f"{_path_text(path)}: expected HelloWayEnum value")
+        return item
 
     def to_json(self) -> object:
         return self.value
 
 
+_HelloWayEnum_BY_VALUE = _enum_lookup(HelloWayEnum)
+
+
 @dataclass(kw_only=True)
 class AbcQuery:
     arg1: bool | None = None
@@ -102,20 +143,77 @@ class AbcQuery:
         return cls._from_mapping(value, "AbcQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "AbcQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "AbcQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "AbcQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        arg1_column = _decode_column(rows, path, "arg1", _decode_bool, bool, optional=True)
+        arg3_column = _decode_column(rows, path, "arg3", _decode_str, str, optional=True)
+        arg2_column = _decode_column(rows, path, "arg2", _decode_float, float, optional=True)
+        type_column = _decode_column(rows, path, "type", HelloChannelMsgTypeEnum.from_value)
+        return [
+            cls(
+                arg1=arg1_item,
+                arg3=arg3_item,
+                arg2=arg2_item,
+                type=type_item,
+            )
+            for arg1_item, arg3_item, arg2_item, type_item in zip(
+                arg1_column,
+                arg3_column,
+                arg2_column,
+                type_column,
+            )
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            arg1=value.get("arg1"),
+            arg3=value.get("arg3"),
+            arg2=value.get("arg2"),
+            type=_HelloChannelMsgTypeEnum_BY_VALUE[value["type"]],
+        )
+
+    @classmethod
+    def from_query_string(cls, query_string: bytes, path: _DecodePath = "AbcQuery") -> Self:
+        # One pass over the raw query string; repeated keys collect into list fields.
+        arg1_value: object = _MISSING
+        arg3_value: object = _MISSING
+        arg2_value: object = _MISSING
+        type_value: object = _MISSING
+        for key, item in _query_items(query_string, _AbcQuery_QUERY_KEYS):
+            if key == "arg1":
+                arg1_value = item
+            elif key == "arg3":
+                arg3_value = item
+            elif key == "arg2":
+                arg2_value = item
+            elif key == "type":
+                type_value = item
+        return cls(
+            arg1=_decode_optional(_decode_query_bool, arg1_value, (path, "arg1")),
+            arg3=_decode_optional(_decode_str, arg3_value, (path, "arg3")),
+            arg2=_decode_optional(_decode_query_float, arg2_value, (path, "arg2")),
+            type=_decode_required(HelloChannelMsgTypeEnum.from_value, type_value, (path, "type")),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            arg1=_decode_optional(_decode_bool, value.get("arg1", _MISSING), _field_path(path, "arg1")),
-            arg3=_decode_optional(_decode_str, value.get("arg3", _MISSING), _field_path(path, "arg3")),
-            arg2=_decode_optional(_decode_float, value.get("arg2", _MISSING), _field_path(path, "arg2")),
-            type=_decode_required(HelloChannelMsgTypeEnum.from_value, value.get("type", _MISSING), _field_path(path, "type")),
+            arg1=_decode_optional(_decode_bool, value.get("arg1", _MISSING), (path, "arg1")),
+            arg3=_decode_optional(_decode_str, value.get("arg3", _MISSING), (path, "arg3")),
+            arg2=_decode_optional(_decode_float, value.get("arg2", _MISSING), (path, "arg2")),
+            type=_decode_required(HelloChannelMsgTypeEnum.from_value, value.get("type", _MISSING), (path, "type")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -146,6 +244,32 @@ class AbcQuery:
         result["type"] = _api_to_transport(self.type)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.arg1 is not None:
+            out.append(sep + '"arg1":')
+            _write_json_bool(out, self.arg1)
+            sep = ","
+        if self.arg3 is not None:
+            out.append(sep + '"arg3":')
+            _write_json_str(out, self.arg3)
+            sep = ","
+        if self.arg2 is not None:
+            out.append(sep + '"arg2":')
+            _write_json_float(out, self.arg2)
+            sep = ","
+        out.append(sep + '"type":')
+        _write_json_enum(out, self.type)
+        out.append("}")
+
+
+_AbcQuery_QUERY_KEYS = frozenset({"arg1", "arg3", "arg2", "type"})
+
 
 @dataclass(kw_only=True)
 class ApiHelloMap:
@@ -158,17 +282,35 @@ class ApiHelloMap:
         return cls._from_mapping(value, "ApiHelloMap")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "ApiHelloMap") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "ApiHelloMap") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "ApiHelloMap") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        haha_column = _decode_column(rows, path, "haha", _decode_int, int)
+        return [
+            cls(haha=haha_item)
+            for haha_item in haha_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            haha=value["haha"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            haha=_decode_required(_decode_int, value.get("haha", _MISSING), _field_path(path, "haha")),
+            haha=_decode_required(_decode_int, value.get("haha", _MISSING), (path, "haha")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -181,6 +323,16 @@ class ApiHelloMap:
         result["haha"] = _api_to_transport(self.haha)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"haha":')
+        _write_json_int(out, self.haha)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class HelloWayQuery:
@@ -193,17 +345,47 @@ class HelloWayQuery:
         return cls._from_mapping(value, "HelloWayQuery")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "HelloWayQuery") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "HelloWayQuery") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "HelloWayQuery") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        arg1_column = _decode_column(rows, path, "arg1", HelloWayEnum.from_value, optional=True)
+        return [
+            cls(arg1=arg1_item)
+            for arg1_item in arg1_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        arg1_value = value.get("arg1")
+        return cls(
+            arg1=None if arg1_value is None else _HelloWayEnum_BY_VALUE[arg1_value],
+        )
+
+    @classmethod
+    def from_query_string(cls, query_string: bytes, path: _DecodePath = "HelloWayQuery") -> Self:
+        # One pass over the raw query string; repeated keys collect into list fields.
+        arg1_value: object = _MISSING
+        for key, item in _query_items(query_string, _HelloWayQuery_QUERY_KEYS):
+            if key == "arg1":
+                arg1_value = item
+        return cls(
+            arg1=_decode_optional(HelloWayEnum.from_value, arg1_value, (path, "arg1")),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            arg1=_decode_optional(HelloWayEnum.from_value, value.get("arg1", _MISSING), _field_path(path, "arg1")),
+            arg1=_decode_optional(HelloWayEnum.from_value, value.get("arg1", _MISSING), (path, "arg1")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -219,3 +401,55 @@ class HelloWayQuery:
             result["arg1"] = _api_to_transport(self.arg1)
 
         return result
+
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        sep = "{"
+        if self.arg1 is not None:
+            out.append(sep + '"arg1":')
+            _write_json_enum(out, self.arg1)
+            sep = ","
+        out.append("{}" if sep == "{" else "}")
+
+
+_HelloWayQuery_QUERY_KEYS = frozenset({"arg1"})
+
+
+def _decode_map_of_str_to_ApiHelloMap(value: object, path: _DecodePath) -> dict[str, ApiHelloMap]:
+    return _decode_map(value, path, _decode_str, ApiHelloMap.from_value)
+
+
+def _write_json_map_of_str_to_ApiHelloMap(out: list[str], value: object) -> None:
+    _write_json_map(out, value, _write_json_model)
+
+
+def _trust_map_of_str_to_ApiHelloMap(value: Any) -> dict[str, ApiHelloMap]:
+    return {key: ApiHelloMap.from_trusted(item) for key, item in value.items()}
+
+
+def _decode_map_of_MapEnum_to_ApiHelloMap(value: object, path: _DecodePath) -> dict[MapEnum, ApiHelloMap]:
+    return _decode_map(value, path, MapEnum.from_value, ApiHelloMap.from_value)
+
+
+def _write_json_map_of_MapEnum_to_ApiHelloMap(out: list[str], value: object) -> None:
+    _write_json_map(out, value, _write_json_model)
+
+
+def _trust_map_of_MapEnum_to_ApiHelloMap(value: Any) -> dict[MapEnum, ApiHelloMap]:
+    return {_MapEnum_BY_VALUE[key]: ApiHelloMap.from_trusted(item) for key, item in value.items()}
+
+
+def _decode_list_of_MapEnum(value: object, path: _DecodePath) -> list[MapEnum]:
+    return _decode_list(value, path, MapEnum.from_value)
+
+
+def _write_json_list_of_MapEnum(out: list[str], value: object) -> None:
+    _write_json_list(out, value, _write_json_enum)
+
+
+def _trust_list_of_MapEnum(value: Any) -> list[MapEnum]:
+    return [_MapEnum_BY_VALUE[item] for item in value]
@@ -4,7 +4,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, AsyncIterable, Iterable, Protocol
 
-from ....runtime.server import ApiRawResponse, ApiServerChannel, ApiServerStream
+from ....runtime.server import ApiRawResponse, ApiServerChannel, ApiServerStream, ApiUploadSink
 
 from .gen_types import (
     MediaPreviewForm,
@@ -19,6 +19,10 @@ class MediaService(Protocol):
     ) -> bytes | ApiRawResponse[bytes]:
         ...
 
+    def media_preview_upload_sink(self, field: str, filename: str, content_type: str | None) -> ApiUploadSink | None:
+        """Return a sink to stream this file part into, or None to spool it to a temporary file."""
+        ...
+
     async def media_frame(self) -> bytes | ApiRawResponse[bytes]:
         ...
 
@@ -48,6 +52,9 @@ class MediaServiceStub:
     ) -> bytes | ApiRawResponse[bytes]:
         raise NotImplementedError("media_preview")
 
+    def media_preview_upload_sink(self, field: str, filename: str, content_type: str | None) -> ApiUploadSink | None:
+        return None
+
     async def media_frame(self) -> bytes | ApiRawResponse[bytes]:
         raise NotImplementedError("media_frame")
 
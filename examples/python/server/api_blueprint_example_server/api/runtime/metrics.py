@@ -0,0 +1 @@
+from .gen_metrics import *
@@ -9,10 +9,12 @@ from ....runtime.gen_codecs import (
     _MISSING,
     _api_to_json,
     _api_to_transport,
+    _batch_rows,
     _decode_any,
     _decode_bool,
     _decode_bytes,
     _decode_coerce_string,
+    _decode_column,
     _decode_file,
     _decode_float,
     _decode_int,
@@ -21,12 +23,33 @@ from ....runtime.gen_codecs import (
     _decode_object,
     _decode_one_of,
     _decode_optional,
+    _decode_query_bool,
+    _decode_query_float,
+    _decode_query_int,
+    _decode_query_list,
     _decode_required,
+    _decode_scalar_list,
+    _decode_scalar_map,
     _decode_str,
     _decode_strict_bool,
     _decode_strict_float,
     _decode_strict_int,
+    _DecodePath,
+    _enum_lookup,
     _field_path,
+    _path_text,
+    _query_items,
+    _write_json_any,
+    _write_json_bool,
+    _write_json_enum,
+    _write_json_float,
+    _write_json_int,
+    _write_json_list,
+    _write_json_map,
+    _write_json_model,
+    _write_json_scalar_list,
+    _write_json_scalar_map,
+    _write_json_str,
 )
 
 
@@ -47,19 +70,41 @@ class LegacyJsonCompatResponse:
         return cls._from_mapping(value, "LegacyJsonCompatResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "LegacyJsonCompatResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "LegacyJsonCompatResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "LegacyJsonCompatResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        target_column = _decode_column(rows, path, "target", _decode_one_of_str_or_list_of_str)
+        ids_column = _decode_column(rows, path, "ids", _decode_list_of_one_of_str_or_strict_int)
+        normalized_ids_column = _decode_column(rows, path, "normalized_ids", _decode_list_of_coerce_string)
+        return [
+            cls(target=target_item, ids=ids_item, normalized_ids=normalized_ids_item)
+            for target_item, ids_item, normalized_ids_item in zip(target_column, ids_column, normalized_ids_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
         return cls(
-            target=_decode_required(lambda item, path: _decode_one_of(item, path, (_decode_str, lambda item, path: _decode_list(item, path, _decode_str),)), value.get("target", _MISSING), _field_path(path, "target")),
-            ids=_decode_required(lambda item, path: _decode_list(item, path, lambda item, path: _decode_one_of(item, path, (_decode_str, _decode_strict_int,))), value.get("ids", _MISSING), _field_path(path, "ids")),
-            normalized_ids=_decode_required(lambda item, path: _decode_list(item, path, _decode_coerce_string), value.get("normalized_ids", _MISSING), _field_path(path, "normalized_ids")),
+            target=value["target"],
+            ids=value["ids"],
+            normalized_ids=_trust_list_of_coerce_string(value["normalized_ids"]),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
+        return cls(
+            target=_decode_required(_decode_one_of_str_or_list_of_str, value.get("target", _MISSING), (path, "target")),
+            ids=_decode_required(_decode_list_of_one_of_str_or_strict_int, value.get("ids", _MISSING), (path, "ids")),
+            normalized_ids=_decode_required(_decode_list_of_coerce_string, value.get("normalized_ids", _MISSING), (path, "normalized_ids")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -75,3 +120,53 @@ class LegacyJsonCompatResponse:
         result["ids"] = _api_to_transport(self.ids)
         result["normalized_ids"] = _api_to_transport(self.normalized_ids)
         return result
+
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"target":')
+        _write_json_any(out, self.target)
+        out.append(',"ids":')
+        _write_json_list_of_one_of_str_or_strict_int(out, self.ids)
+        out.append(',"normalized_ids":')
+        _write_json_list_of_coerce_string(out, self.normalized_ids)
+        out.append("}")
+
+
+def _decode_list_of_str(value: object, path: _DecodePath) -> list[str]:
+    return _decode_scalar_list(value, path, str, _decode_str)
+
+
+def _write_json_list_of_str(out: list[str], value: object) -> None:
+    _write_json_scalar_list(out, value, str, _write_json_str)
+
+
+def _decode_one_of_str_or_list_of_str(value: object, path: _DecodePath) -> str | list[str]:
+    return _decode_one_of(value, path, (_decode_str, _decode_list_of_str,))
+
+
+def _decode_one_of_str_or_strict_int(value: object, path: _DecodePath) -> str | int:
+    return _decode_one_of(value, path, (_decode_str, _decode_strict_int,))
+
+
+def _decode_list_of_one_of_str_or_strict_int(value: object, path: _DecodePath) -> list[str | int]:
+    return _decode_list(value, path, _decode_one_of_str_or_strict_int)
+
+
+def _write_json_list_of_one_of_str_or_strict_int(out: list[str], value: object) -> None:
+    _write_json_list(out, value, _write_json_any)
+
+
+def _decode_list_of_coerce_string(value: object, path: _DecodePath) -> list[str]:
+    return _decode_list(value, path, _decode_coerce_string)
+
+
+def _write_json_list_of_coerce_string(out: list[str], value: object) -> None:
+    _write_json_list(out, value, _write_json_str)
+
+
+def _trust_list_of_coerce_string(value: Any) -> list[str]:
+    return [str(item) for item in value]
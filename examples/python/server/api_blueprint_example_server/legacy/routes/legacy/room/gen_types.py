@@ -9,10 +9,12 @@ from ....runtime.gen_codecs import (
     _MISSING,
     _api_to_json,
     _api_to_transport,
+    _batch_rows,
     _decode_any,
     _decode_bool,
     _decode_bytes,
     _decode_coerce_string,
+    _decode_column,
     _decode_file,
     _decode_float,
     _decode_int,
@@ -21,12 +23,33 @@ from ....runtime.gen_codecs import (
     _decode_object,
     _decode_one_of,
     _decode_optional,
+    _decode_query_bool,
+    _decode_query_float,
+    _decode_query_int,
+    _decode_query_list,
     _decode_required,
+    _decode_scalar_list,
+    _decode_scalar_map,
     _decode_str,
     _decode_strict_bool,
     _decode_strict_float,
     _decode_strict_int,
+    _DecodePath,
+    _enum_lookup,
     _field_path,
+    _path_text,
+    _query_items,
+    _write_json_any,
+    _write_json_bool,
+    _write_json_enum,
+    _write_json_float,
+    _write_json_int,
+    _write_json_list,
+    _write_json_map,
+    _write_json_model,
+    _write_json_scalar_list,
+    _write_json_scalar_map,
+    _write_json_str,
 )
 
 
@@ -45,17 +68,35 @@ class RoomListResponse:
         return cls._from_mapping(value, "RoomListResponse")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "RoomListResponse") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "RoomListResponse") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "RoomListResponse") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        rooms_column = _decode_column(rows, path, "rooms", _decode_list_of_RoomSummary)
+        return [
+            cls(rooms=rooms_item)
+            for rooms_item in rooms_column
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            rooms=_trust_list_of_RoomSummary(value["rooms"]),
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            rooms=_decode_required(lambda item, path: _decode_list(item, path, RoomSummary.from_value), value.get("rooms", _MISSING), _field_path(path, "rooms")),
+            rooms=_decode_required(_decode_list_of_RoomSummary, value.get("rooms", _MISSING), (path, "rooms")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -68,6 +109,16 @@ class RoomListResponse:
         result["rooms"] = _api_to_transport(self.rooms)
         return result
 
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"rooms":')
+        _write_json_list_of_RoomSummary(out, self.rooms)
+        out.append("}")
+
 
 @dataclass(kw_only=True)
 class RoomSummary:
@@ -81,18 +132,38 @@ class RoomSummary:
         return cls._from_mapping(value, "RoomSummary")
 
     @classmethod
-    def from_value(cls, value: object, path: str = "RoomSummary") -> Self:
+    def from_value(cls, value: object, path: _DecodePath = "RoomSummary") -> Self:
         if isinstance(value, cls):
             return value
         if not isinstance(value, Mapping):
-            raise TypeError(f"{path}: expected object")
+            raise TypeError(f"{_path_text(path)}: expected object")
         return cls._from_mapping(value, path)
 
     @classmethod
-    def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:
+    def from_values(cls, value: object, path: _DecodePath = "RoomSummary") -> list[Self]:
+        rows = _batch_rows(value)
+        if rows is None:
+            return _decode_list(value, path, cls.from_value)
+        room_id_column = _decode_column(rows, path, "room_id", _decode_coerce_string)
+        title_column = _decode_column(rows, path, "title", _decode_str, str)
+        return [
+            cls(room_id=room_id_item, title=title_item)
+            for room_id_item, title_item in zip(room_id_column, title_column)
+        ]
+
+    @classmethod
+    def from_trusted(cls, value: Mapping[str, Any]) -> Self:
+        # Well-typed input only: no type checks, only enums and nested DTOs are converted.
+        return cls(
+            room_id=str(value["room_id"]),
+            title=value["title"],
+        )
+
+    @classmethod
+    def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:
         return cls(
-            room_id=_decode_required(_decode_coerce_string, value.get("room_id", _MISSING), _field_path(path, "room_id")),
-            title=_decode_required(_decode_str, value.get("title", _MISSING), _field_path(path, "title")),
+            room_id=_decode_required(_decode_coerce_string, value.get("room_id", _MISSING), (path, "room_id")),
+            title=_decode_required(_decode_str, value.get("title", _MISSING), (path, "title")),
         )
 
     def to_mapping(self) -> dict[str, Any]:
@@ -106,3 +177,27 @@ class RoomSummary:
         result["room_id"] = _api_to_transport(self.room_id)
         result["title"] = _api_to_transport(self.title)
         return result
+
+    def to_json_bytes(self) -> bytes:
+        out: list[str] = []
+        self._write_json(out)
+        return "".join(out).encode("utf-8")
+
+    def _write_json(self, out: list[str]) -> None:
+        out.append('{"room_id":')
+        _write_json_str(out, self.room_id)
+        out.append(',"title":')
+        _write_json_str(out, self.title)
+        out.append("}")
+
+
+def _decode_list_of_RoomSummary(value: object, path: _DecodePath) -> list[RoomSummary]:
+    return RoomSummary.from_values(value, path)
+
+
+def _write_json_list_of_RoomSummary(out: list[str], value: object) -> None:
+    _write_json_list(out, value, _write_json_model)
+
+
+def _trust_list_of_RoomSummary(value: Any) -> list[RoomSummary]:
+    return [RoomSummary.from_trusted(item) for item in value]
@@ -0,0 +1 @@
+from .gen_server import *
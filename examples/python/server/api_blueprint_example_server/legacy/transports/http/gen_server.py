@@ -5,16 +5,33 @@ import asyncio
 import gzip
 import io
 import json
-from dataclasses import asdict, dataclass, is_dataclass
-from enum import Enum
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, AsyncIterable, Iterable, Mapping
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Mapping
 
 from fastapi import APIRouter, WebSocket, Request, HTTPException, WebSocketDisconnect
+from starlette.datastructures import Headers, UploadFile
 from starlette.responses import StreamingResponse, JSONResponse, FileResponse, Response
 
-from ...runtime.errors import ApiError, make_api_error_payload
-from ...runtime.server import ApiRawResponse, ApiServerConfig
+from ...runtime.binary import BinaryWriter
+from ...runtime.errors import ApiError
+from ...runtime.metrics import ApiRouteHooks, ApiRouteProbe
+from ...runtime.server import (
+    ApiRawResponse,
+    ApiServerConfig,
+    ApiTopicBroker,
+    ApiTopicQueue,
+    ApiUploadSink,
+    api_error_payload,
+    encode_json,
+    envelope_json_bytes,
+    jsonable,
+)
+from ...runtime.websocket import JSON_WEBSOCKET_CODEC, ApiWebSocketCodec, ApiWebSocketFrame, select_websocket_codec
 from ...routes.legacy.account.service import AccountService, AccountServiceStub
 from ...routes.legacy.account import gen_types as legacy_account_types
 
@@ -25,6 +42,14 @@ from ...routes.legacy.legacy_json.service import LegacyJsonService, LegacyJsonSe
 from ...routes.legacy.legacy_json import gen_types as legacy_legacy_json_types
 
 
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+_BINARY_STREAM_CHUNK_BYTES = 64 * 1024
+_BINARY_RESPONSE_CHUNK_BYTES = 16 * 1024
+_BINARY_RESPONSE_QUEUE_CHUNKS = 4
+
+ApiUploadSinkFactory = Callable[[str, str, str | None], ApiUploadSink | None]
+
+
 @dataclass(frozen=True)
 class HttpRequestInfo:
     binary_content_encodings: tuple[str, ...] = ()
@@ -35,6 +60,7 @@ class HttpResponseInfo:
     kind: str = "json"
     content_type: str = "application/json"
     default_filename: str | None = None
+    binary_content_encodings: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -51,6 +77,7 @@ _HTTP_ROUTE_LEGACY_ACCOUNT_GET_PROFILE = HttpRouteInfo(
         kind="json",
         content_type="application/json",
         default_filename=None,
+        binary_content_encodings=(),
     ),
 )
 
@@ -62,6 +89,7 @@ _HTTP_ROUTE_LEGACY_ROOM_GET_LIST = HttpRouteInfo(
         kind="json",
         content_type="application/json",
         default_filename=None,
+        binary_content_encodings=(),
     ),
 )
 
@@ -73,6 +101,7 @@ _HTTP_ROUTE_LEGACY_LEGACY_JSON_GET_COMPAT = HttpRouteInfo(
         kind="json",
         content_type="application/json",
         default_filename=None,
+        binary_content_encodings=(),
     ),
 )
 
@@ -99,20 +128,32 @@ def create_account_router(
     router = APIRouter()
     api_config = config or ApiServerConfig()
     service_impl = service or AccountServiceStub()
+    route_hooks = api_config.route_hooks
 
     @router.api_route("/account/profile", methods=["GET"])
     async def account_account_profile(request: Request) -> Any:
         service = service_impl
         route_info = _HTTP_ROUTE_LEGACY_ACCOUNT_GET_PROFILE
+        probe = None if route_hooks is None else _start_probe(route_hooks, "legacy.account.get.profile", request)
+        if probe is not None:
+            probe.decoded()
         try:
             result = await service.account_profile(
             )
-            return _wrap_response({"name": "CodeMessageDataEnvelope", "kind": "code_message_data", "error_identity": "nested", "success_code": 0, "success_message": "ok", "fields": {"code": "code", "message": "message", "data": "data", "error": "error"}}, result)
-
+            if probe is not None:
+                probe.handled()
+            response = _wrap_ok_code_message_data_envelope(result, api_config)
+            return response if probe is None else _finish_probe(probe, response)
         except ApiError as error:
-            return _wrap_api_error({"name": "CodeMessageDataEnvelope", "kind": "code_message_data", "error_identity": "nested", "success_code": 0, "success_message": "ok", "fields": {"code": "code", "message": "message", "data": "data", "error": "error"}}, error, "legacy.account.get.profile")
+            response = _wrap_error_code_message_data_envelope(error, "legacy.account.get.profile", api_config)
+            return response if probe is None else _finish_probe(probe, response, error.code)
         except PayloadTooLargeError as error:
-            return _payload_too_large_response(error)
+            response = _payload_too_large_response(error)
+            return response if probe is None else _finish_probe(probe, response)
+        except Exception:
+            if probe is not None:
+                probe.finish(500, 0)
+            raise
 
     return router
 
@@ -125,20 +166,32 @@ def create_room_router(
     router = APIRouter()
     api_config = config or ApiServerConfig()
     service_impl = service or RoomServiceStub()
+    route_hooks = api_config.route_hooks
 
     @router.api_route("/room/list", methods=["GET"])
     async def room_room_list(request: Request) -> Any:
         service = service_impl
         route_info = _HTTP_ROUTE_LEGACY_ROOM_GET_LIST
+        probe = None if route_hooks is None else _start_probe(route_hooks, "legacy.room.get.list", request)
+        if probe is not None:
+            probe.decoded()
         try:
             result = await service.room_list(
             )
-            return _wrap_response({"name": "CodeMessageDataEnvelope", "kind": "code_message_data", "error_identity": "nested", "success_code": 0, "success_message": "ok", "fields": {"code": "code", "message": "message", "data": "data", "error": "error"}}, result)
-
+            if probe is not None:
+                probe.handled()
+            response = _wrap_ok_code_message_data_envelope(result, api_config)
+            return response if probe is None else _finish_probe(probe, response)
         except ApiError as error:
-            return _wrap_api_error({"name": "CodeMessageDataEnvelope", "kind": "code_message_data", "error_identity": "nested", "success_code": 0, "success_message": "ok", "fields": {"code": "code", "message": "message", "data": "data", "error": "error"}}, error, "legacy.room.get.list")
+            response = _wrap_error_code_message_data_envelope(error, "legacy.room.get.list", api_config)
+            return response if probe is None else _finish_probe(probe, response, error.code)
         except PayloadTooLargeError as error:
-            return _payload_too_large_response(error)
+            response = _payload_too_large_response(error)
+            return response if probe is None else _finish_probe(probe, response)
+        except Exception:
+            if probe is not None:
+                probe.finish(500, 0)
+            raise
 
     return router
 
@@ -151,20 +204,32 @@ def create_legacy_json_router(
     router = APIRouter()
     api_config = config or ApiServerConfig()
     service_impl = service or LegacyJsonServiceStub()
+    route_hooks = api_config.route_hooks
 
     @router.api_route("/legacy-json/compat", methods=["GET"])
     async def legacy_json_legacy_json_compat(request: Request) -> Any:
         service = service_impl
         route_info = _HTTP_ROUTE_LEGACY_LEGACY_JSON_GET_COMPAT
+        probe = None if route_hooks is None else _start_probe(route_hooks, "legacy.legacy_json.get.compat", request)
+        if probe is not None:
+            probe.decoded()
         try:
             result = await service.legacy_json_compat(
             )
-            return _wrap_response({"name": "CodeMessageDataEnvelope", "kind": "code_message_data", "error_identity": "nested", "success_code": 0, "success_message": "ok", "fields": {"code": "code", "message": "message", "data": "data", "error": "error"}}, result)
-
+            if probe is not None:
+                probe.handled()
+            response = _wrap_ok_code_message_data_envelope(result, api_config)
+            return response if probe is None else _finish_probe(probe, response)
         except ApiError as error:
-            return _wrap_api_error({"name": "CodeMessageDataEnvelope", "kind": "code_message_data", "error_identity": "nested", "success_code": 0, "success_message": "ok", "fields": {"code": "code", "message": "message", "data": "data", "error": "error"}}, error, "legacy.legacy_json.get.compat")
+            response = _wrap_error_code_message_data_envelope(error, "legacy.legacy_json.get.compat", api_config)
+            return response if probe is None else _finish_probe(probe, response, error.code)
         except PayloadTooLargeError as error:
-            return _payload_too_large_response(error)
+            response = _payload_too_large_response(error)
+            return response if probe is None else _finish_probe(probe, response)
+        except Exception:
+            if probe is not None:
+                probe.finish(500, 0)
+            raise
 
     return router
 
@@ -206,16 +271,180 @@ async def _form_body(request: Request, config: ApiServerConfig) -> dict[str, Any
     return result
 
 
-async def _multipart_body(request: Request, config: ApiServerConfig) -> dict[str, Any]:
+async def _multipart_body(
+    request: Request,
+    config: ApiServerConfig,
+    upload_sink: ApiUploadSinkFactory | None = None,
+) -> dict[str, Any]:
     _ensure_content_length(request, config.body_max_bytes)
-    values = await request.form(max_part_size=config.multipart_part_max_bytes)
-    result: dict[str, Any] = {}
-    for key, value in values.multi_items():
-        size = getattr(value, "size", None)
-        if isinstance(size, int) and size > config.multipart_file_max_bytes:
+    reader = _MultipartReader(request.headers.get("content-type", ""), config, upload_sink)
+    return await reader.read(_limited_chunks(request.stream(), config.body_max_bytes, "request body"))
+
+
+class _MultipartPart:
+    __slots__ = ("name", "filename", "headers", "size", "data", "upload", "sink")
+
+    def __init__(self) -> None:
+        self.name = ""
+        self.filename: str | None = None
+        self.headers: list[tuple[bytes, bytes]] = []
+        self.size = 0
+        self.data = bytearray()
+        self.upload: UploadFile | None = None
+        self.sink: ApiUploadSink | None = None
+
+
+class _MultipartReader:
+    """Parses a multipart body while it streams in.
+    File parts are written to a `SpooledTemporaryFile` (handed to the service as
+    `UploadFile`) or to the route's upload sink, and their size is checked on
+    every chunk so an oversized file ends the request before the rest arrives.
+    Text parts are decoded in memory.
+    """
+
+    def __init__(self, content_type: str, config: ApiServerConfig, upload_sink: ApiUploadSinkFactory | None) -> None:
+        import python_multipart
+        from python_multipart.multipart import parse_options_header
+        _, params = parse_options_header(content_type)
+        boundary = params.get(b"boundary")
+        if not boundary:
+            raise HTTPException(status_code=400, detail="missing multipart boundary")
+        charset = params.get(b"charset", b"utf-8")
+        self.charset = charset.decode("latin-1") if isinstance(charset, bytes) else charset
+        self.config = config
+        self.upload_sink = upload_sink
+        self.values: dict[str, Any] = {}
+        self._parse_options_header = parse_options_header
+        self._part = _MultipartPart()
+        self._header_name = b""
+        self._header_value = b""
+        self._events: list[tuple[_MultipartPart, bytes | None]] = []
+        self._open: list[_MultipartPart] = []
+        self._parser = python_multipart.MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+            },
+        )
+
+    async def read(self, chunks: AsyncIterator[bytes]) -> dict[str, Any]:
+        from python_multipart.exceptions import FormParserError
+        try:
+            async for chunk in chunks:
+                self._parser.write(chunk)
+                await self._flush()
+            self._parser.finalize()
+            await self._flush()
+        except BaseException as error:
+            await self._discard()
+            if isinstance(error, FormParserError):
+                raise HTTPException(status_code=400, detail="invalid multipart body") from error
+            raise
+        return self.values
+
+    async def _flush(self) -> None:
+        # Parser callbacks are synchronous; file writes and sink calls are
+        # awaited here, after each chunk has been parsed.
+        for part, data in self._events:
+            if data is None:
+                await self._finish_file(part)
+            elif part.sink is not None:
+                await part.sink.write(data)
+            elif part.upload is not None:
+                await part.upload.write(data)
+        self._events.clear()
+
+    async def _finish_file(self, part: _MultipartPart) -> None:
+        self._open.remove(part)
+        if part.sink is not None:
+            self.values[part.name] = await part.sink.close()
+        elif part.upload is not None:
+            await part.upload.seek(0)
+            self.values[part.name] = part.upload
+
+    async def _discard(self) -> None:
+        for part in self._open:
+            if part.sink is not None:
+                await part.sink.abort()
+            elif part.upload is not None:
+                await part.upload.close()
+        self._open.clear()
+        for value in self.values.values():
+            if isinstance(value, UploadFile):
+                await value.close()
+
+    def _on_part_begin(self) -> None:
+        self._part = _MultipartPart()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._part.headers.append((self._header_name.lower(), self._header_value))
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        part = self._part
+        headers = dict(part.headers)
+        _, options = self._parse_options_header(headers.get(b"content-disposition", b""))
+        name = options.get(b"name")
+        if name is None:
+            raise HTTPException(status_code=400, detail="multipart part without a name")
+        part.name = self._decode_text(name)
+        filename = options.get(b"filename")
+        if filename is None:
+            return
+        part.filename = self._decode_text(filename)
+        content_type = headers.get(b"content-type")
+        sink = None
+        if self.upload_sink is not None:
+            media_type = None if content_type is None else content_type.decode("latin-1")
+            sink = self.upload_sink(part.name, part.filename, media_type)
+        if sink is not None:
+            part.sink = sink
+        else:
+            part.upload = UploadFile(
+                file=SpooledTemporaryFile(max_size=self.config.multipart_spool_max_bytes),
+                size=0,
+                filename=part.filename,
+                headers=Headers(raw=part.headers),
+            )
+        self._open.append(part)
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        part = self._part
+        part.size += end - start
+        if part.filename is None:
+            if part.size > self.config.multipart_part_max_bytes:
+                raise PayloadTooLargeError("multipart part exceeds configured limit")
+            part.data += data[start:end]
+            return
+        if part.size > self.config.multipart_file_max_bytes:
             raise PayloadTooLargeError("multipart file exceeds configured limit")
-        result[key] = value
-    return result
+        self._events.append((part, data[start:end]))
+
+    def _on_part_end(self) -> None:
+        part = self._part
+        if part.filename is None:
+            self.values[part.name] = self._decode_text(bytes(part.data))
+        else:
+            self._events.append((part, None))
+
+    def _decode_text(self, value: bytes) -> str:
+        try:
+            return value.decode(self.charset)
+        except (LookupError, UnicodeDecodeError) as error:
+            raise HTTPException(status_code=400, detail="invalid multipart text") from error
 
 
 async def _binary_body(
@@ -224,6 +453,33 @@ async def _binary_body(
     *,
     request_info: HttpRequestInfo,
 ) -> bytes:
+    encoding = _binary_request_encoding(request, request_info)
+    return await _decode_binary_body(request, config, encoding)
+
+
+async def _binary_schema_body(
+    request: Request,
+    config: ApiServerConfig,
+    *,
+    request_info: HttpRequestInfo,
+    from_bytes: Callable[[bytes], Any],
+    from_stream: Callable[[Any], Any],
+) -> Any:
+    encoding = _binary_request_encoding(request, request_info)
+    if encoding in ("identity", "gzip") and _streams_binary_request(request, config):
+        _ensure_content_length(request, config.body_max_bytes)
+        pool = _binary_stream_pool(config.binary_stream_workers)
+        if pool is not None and pool.acquire():
+            chunks = _limited_chunks(request.stream(), config.body_max_bytes, "request body")
+            if encoding == "gzip":
+                chunks = _gzip_decoded_chunks(chunks, config.decompressed_binary_max_bytes)
+            else:
+                chunks = _limited_chunks(chunks, config.decompressed_binary_max_bytes, "decompressed binary request body")
+            return await pool.submit(from_stream, _BinaryStreamSource(chunks, asyncio.get_running_loop()))
+    return from_bytes(await _decode_binary_body(request, config, encoding))
+
+
+def _binary_request_encoding(request: Request, request_info: HttpRequestInfo) -> str:
     encoding = _request_content_encoding(request)
     allowed_content_encodings = request_info.binary_content_encodings or ("identity",)
     allowed = {item.strip().lower() for item in allowed_content_encodings if item.strip()}
@@ -231,7 +487,20 @@ async def _binary_body(
         allowed = {"identity"}
     if encoding not in allowed:
         raise UnsupportedContentEncodingError(f"unsupported binary Content-Encoding: {encoding}")
+    return encoding
+
 
+def _streams_binary_request(request: Request, config: ApiServerConfig) -> bool:
+    content_length = request.headers.get("content-length")
+    if content_length is None:
+        return True
+    try:
+        return int(content_length) >= config.binary_stream_min_bytes
+    except ValueError:
+        return True
+
+
+async def _decode_binary_body(request: Request, config: ApiServerConfig, encoding: str) -> bytes:
     encoded = await _body(request, config.body_max_bytes)
     if encoding == "identity":
         return encoded
@@ -275,6 +544,125 @@ def _read_limited_binary_stream(source: Any, max_bytes: int, label: str) -> byte
     return b"".join(chunks)
 
 
+async def _limited_chunks(chunks: AsyncIterator[bytes], max_bytes: int, label: str) -> AsyncIterator[bytes]:
+    total = 0
+    async for chunk in chunks:
+        total += len(chunk)
+        if max_bytes > 0 and total > max_bytes:
+            raise PayloadTooLargeError(f"{label} exceeds configured limit")
+        if chunk:
+            yield chunk
+
+
+async def _gzip_decoded_chunks(chunks: AsyncIterator[bytes], max_bytes: int) -> AsyncIterator[bytes]:
+    decompressor = zlib.decompressobj(_GZIP_WBITS)
+    in_member = False
+    total = 0
+    try:
+        async for chunk in chunks:
+            pending = chunk
+            while pending:
+                in_member = True
+                # Bound every inflate step so a small compressed chunk cannot
+                # expand past the limit before it is checked.
+                decoded = decompressor.decompress(pending, _BINARY_STREAM_CHUNK_BYTES)
+                pending = decompressor.unconsumed_tail
+                if decompressor.eof:
+                    pending = decompressor.unused_data + pending
+                    decompressor = zlib.decompressobj(_GZIP_WBITS)
+                    in_member = False
+                total += len(decoded)
+                if max_bytes > 0 and total > max_bytes:
+                    raise PayloadTooLargeError("decompressed binary request body exceeds configured limit")
+                if decoded:
+                    yield decoded
+    except zlib.error as error:
+        raise HTTPException(status_code=400, detail="invalid gzip request body") from error
+    if in_member:
+        raise HTTPException(status_code=400, detail="invalid gzip request body")
+
+
+class _BinaryStreamPool:
+    """Dedicated threads for streamed binary readers and writers, kept off the default executor.
+    A reader or writer blocks its thread until the body is fully transferred, so
+    the pool never queues: `acquire()` fails once every worker is taken and the
+    caller buffers instead.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-binary-stream")
+        self._slots = threading.BoundedSemaphore(workers)
+
+    def acquire(self) -> bool:
+        return self._slots.acquire(blocking=False)
+
+    def submit(self, func: Callable[[Any], Any], arg: Any) -> asyncio.Future[Any]:
+        def call() -> Any:
+            try:
+                return func(arg)
+            finally:
+                self._slots.release()
+
+        return asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+
+_BINARY_STREAM_POOLS: dict[int, _BinaryStreamPool] = {}
+
+
+def _binary_stream_pool(workers: int) -> _BinaryStreamPool | None:
+    if workers <= 0:
+        return None
+    pool = _BINARY_STREAM_POOLS.get(workers)
+    if pool is None:
+        pool = _BINARY_STREAM_POOLS.setdefault(workers, _BinaryStreamPool(workers))
+    return pool
+
+
+class _BinaryStreamSource:
+    """Blocking `read()` view over decoded request chunks for generated binary readers.
+    The reader runs on a `_BinaryStreamPool` thread and pulls the next chunk
+    from the event loop only when the current one is used up, so decoding
+    overlaps the upload and at most one chunk is buffered.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], loop: asyncio.AbstractEventLoop) -> None:
+        self._chunks = chunks
+        self._loop = loop
+        self._current = io.BytesIO()
+        self._exhausted = False
+
+    def read(self, count: int = -1) -> bytes:
+        data = self._current.read(count)
+        if count >= 0 and len(data) == count:
+            return data
+        parts = [data]
+        missing = count - len(data)
+        while count < 0 or missing > 0:
+            chunk = self._next_chunk()
+            if chunk is None:
+                break
+            self._current = io.BytesIO(chunk)
+            data = self._current.read(missing if count >= 0 else -1)
+            parts.append(data)
+            missing -= len(data)
+        return b"".join(parts)
+
+    def _next_chunk(self) -> bytes | None:
+        if self._exhausted:
+            return None
+        chunk = asyncio.run_coroutine_threadsafe(_next_chunk(self._chunks), self._loop).result()
+        if chunk is None:
+            self._exhausted = True
+        return chunk
+
+
+async def _next_chunk(chunks: AsyncIterator[bytes]) -> bytes | None:
+    try:
+        return await chunks.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
 def _request_content_encoding(request: Request) -> str:
     encoding = request.headers.get("content-encoding", "")
     encoding = encoding.strip().lower()
@@ -292,26 +680,21 @@ def _ensure_content_length(request: Request, max_bytes: int) -> None:
         return
 
 
-def _jsonable(value: Any) -> Any:
-    if isinstance(value, Enum):
-        return value.value
-    if hasattr(value, "to_mapping"):
-        return value.to_mapping()
-    if is_dataclass(value):
-        return _jsonable(asdict(value))
-    if isinstance(value, dict):
-        return {_json_key(key): _jsonable(item) for key, item in value.items() if item is not None}
-    if isinstance(value, (list, tuple)):
-        return [_jsonable(item) for item in value]
-    if isinstance(value, bytes):
-        return value.decode("utf-8")
-    return value
+def _start_probe(hooks: ApiRouteHooks, route_id: str, request: Request) -> ApiRouteProbe:
+    return ApiRouteProbe(hooks, route_id, request.method, _header_size(request.headers.get("content-length")))
 
 
-def _json_key(value: Any) -> str:
-    if isinstance(value, Enum):
-        return str(value.value)
-    return str(value)
+def _finish_probe(probe: ApiRouteProbe, response: Response, error_code: Any = None) -> Response:
+    # Streamed responses carry no Content-Length and are counted as 0 bytes.
+    probe.finish(response.status_code, _header_size(response.headers.get("content-length")), error_code)
+    return response
+
+
+def _header_size(value: str | None) -> int:
+    try:
+        return int(value) if value else 0
+    except ValueError:
+        return 0
 
 
 def _bad_request_response(error: Exception) -> JSONResponse:
@@ -322,24 +705,37 @@ def _payload_too_large_response(error: Exception) -> JSONResponse:
     return JSONResponse({"detail": "payload too large"}, status_code=413)
 
 
-def _wrap_response(envelope: dict[str, Any], data: Any) -> Any:
-    payload = _jsonable(data)
-    kind = envelope.get("kind") or "none"
-    fields = envelope.get("fields") or {}
-    if kind == "none":
-        return payload
-    if kind == "code_message_data":
-        return {
-            fields.get("code", "code"): envelope.get("success_code", 0),
-            fields.get("message", "message"): envelope.get("success_message", "ok"),
-            fields.get("data", "data"): payload,
-        }
-    if kind == "ok_data_error":
-        return {
-            fields.get("ok", "ok"): True,
-            fields.get("data", "data"): payload,
-        }
-    return payload
+def _json_response(payload: Any, config: ApiServerConfig, status_code: int = 200) -> Response:
+    return Response(content=config.json_encoder(payload), status_code=status_code, media_type="application/json")
+
+
+def _wrap_ok_code_message_data_envelope(data: Any, config: ApiServerConfig) -> Response:
+    write = getattr(data, "_write_json", None)
+    if write is not None and config.json_encoder is encode_json:
+        body = envelope_json_bytes(write, '{"code":0,"message":"ok","data":', "}")
+        return Response(content=body, media_type="application/json")
+
+    return _json_response(
+        {
+            "code": 0,
+            "message": "ok",
+            "data": jsonable(data),
+        },
+        config,
+    )
+
+
+def _wrap_error_code_message_data_envelope(error: ApiError, route_id: str, config: ApiServerConfig) -> Response:
+    payload = api_error_payload(error, route_id)
+    return _json_response(
+        {
+            "code": payload.get("code", 0),
+            "message": payload.get("message", ""),
+            "data": None,
+            "error": payload,
+        },
+        config,
+    )
 
 
 def _raw_response(
@@ -387,11 +783,14 @@ def _raw_response(
     )
 
 
-def _binary_schema_response(
+async def _binary_schema_response(
+    request: Request,
+    config: ApiServerConfig,
     *,
     response_info: HttpResponseInfo,
     result: Any,
     encoder: Any,
+    max_size: int | None = None,
 ) -> Response:
     if isinstance(result, Response):
         return result
@@ -405,130 +804,488 @@ def _binary_schema_response(
         body = result.body
         effective_content_type = result.content_type or response_info.content_type
     if isinstance(body, (bytes, bytearray, memoryview)):
-        content = bytes(body)
-    else:
-        binary_body = encoder(body)
+        return Response(
+            content=bytes(body),
+            status_code=status,
+            media_type=effective_content_type,
+            headers=dict(headers or {}),
+        )
+    binary_body = encoder(body)
+    effective_content_type = binary_body.content_type or effective_content_type
+    response_headers = dict(headers or {})
+    size_hint = binary_body.content_length if binary_body.content_length is not None else max_size
+    if size_hint is not None and size_hint < config.binary_stream_min_bytes:
+        return Response(
+            content=binary_body.to_bytes(),
+            status_code=status,
+            media_type=effective_content_type,
+            headers=response_headers,
+        )
+    encoding = _negotiate_binary_response_encoding(request, response_info, config)
+    compressor = None
+    if any(item != "identity" for item in response_info.binary_content_encodings):
+        response_headers["vary"] = "Accept-Encoding"
+    if encoding == "gzip":
+        compressor = zlib.compressobj(6, zlib.DEFLATED, _GZIP_WBITS)
+    elif encoding != "identity":
+        compressor = config.binary_response_encoders[encoding]()
+    if compressor is not None:
+        response_headers["content-encoding"] = encoding
+    pool = _binary_stream_pool(config.binary_stream_workers)
+    if pool is None or not pool.acquire():
         content = binary_body.to_bytes()
-        effective_content_type = binary_body.content_type or effective_content_type
-    return Response(
-        content=content,
+        if compressor is not None:
+            content = compressor.compress(content) + compressor.flush()
+        return Response(
+            content=content,
+            status_code=status,
+            media_type=effective_content_type,
+            headers=response_headers,
+        )
+    if compressor is None and binary_body.content_length is not None:
+        response_headers["content-length"] = str(binary_body.content_length)
+    stream = _BinaryResponseStream(compressor, asyncio.get_running_loop())
+    encoded = pool.submit(stream.encode, binary_body)
+    # Wait for the first chunk before the status line goes out so a
+    # `BinaryEncodeError` there still becomes an error response; later errors
+    # abort the stream.
+    try:
+        first = await stream.next_chunk()
+        if first is None:
+            await encoded
+    except BaseException:
+        stream.close(encoded)
+        raise
+    return StreamingResponse(
+        stream.chunks(first, encoded),
         status_code=status,
         media_type=effective_content_type,
-        headers=dict(headers or {}),
+        headers=response_headers,
     )
 
 
-def _wrap_api_error(envelope: dict[str, Any], error: ApiError, route_id: str) -> Any:
-    payload = _jsonable(make_api_error_payload(_jsonable(error.payload), route_id))
-    kind = envelope.get("kind") or "none"
-    fields = envelope.get("fields") or {}
-    if kind == "none":
-        return JSONResponse(payload, status_code=500)
-    if kind == "code_message_data":
-        body = {
-            fields.get("code", "code"): payload.get("code", 0),
-            fields.get("message", "message"): payload.get("message", ""),
-            fields.get("data", "data"): None,
-        }
-        if envelope.get("error_identity") != "none":
-            body[fields.get("error", "error")] = payload
-        return body
-    if kind == "ok_data_error":
-        return {
-            fields.get("ok", "ok"): False,
-            fields.get("error", "error"): payload,
-        }
-    return JSONResponse(payload, status_code=500)
+def _negotiate_binary_response_encoding(
+    request: Request,
+    response_info: HttpResponseInfo,
+    config: ApiServerConfig,
+) -> str:
+    header = request.headers.get("accept-encoding")
+    if not header:
+        return "identity"
+    accepted: dict[str, float] = {}
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in response_info.binary_content_encodings:
+        encoding = encoding.strip().lower()
+        if encoding == "identity" or (encoding != "gzip" and encoding not in config.binary_response_encoders):
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return "identity"
+
+
+class _BinaryResponseClosed(Exception):
+    pass
+
+
+class _BinaryResponseStream:
+    """Bounded hand-off from a generated binary writer to a `StreamingResponse`.
+    The writer runs on a `_BinaryStreamPool` thread and cuts its output into
+    `_BINARY_RESPONSE_CHUNK_BYTES` chunks, compressed when an encoding was
+    negotiated. It blocks while `_BINARY_RESPONSE_QUEUE_CHUNKS` chunks wait to
+    be sent, so the buffered part of a packet stays bounded however large it is.
+    """
+
+    def __init__(self, compressor: Any, loop: asyncio.AbstractEventLoop) -> None:
+        self._compressor = compressor
+        self._loop = loop
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(_BINARY_RESPONSE_QUEUE_CHUNKS)
+        self._buffer = bytearray()
+        self._closed = False
+
+    def encode(self, body: Any) -> None:
+        try:
+            body.write_to(BinaryWriter(self, endian=getattr(body, "endian", "little")))
+            self._emit(bytes(self._buffer))
+            if self._compressor is not None:
+                self._send(self._compressor.flush())
+        finally:
+            self._offer(None)
+
+    def write(self, data: bytes) -> None:
+        self._buffer += data
+        if len(self._buffer) >= _BINARY_RESPONSE_CHUNK_BYTES:
+            self._emit(bytes(self._buffer))
+            self._buffer.clear()
+
+    def _emit(self, data: bytes) -> None:
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        self._send(data)
+
+    def _send(self, chunk: bytes) -> None:
+        if chunk and not self._offer(chunk):
+            raise _BinaryResponseClosed("binary response closed before the packet was written")
+
+    def _offer(self, chunk: bytes | None) -> bool:
+        return asyncio.run_coroutine_threadsafe(self._put(chunk), self._loop).result()
+
+    async def _put(self, chunk: bytes | None) -> bool:
+        if self._closed:
+            return False
+        await self._queue.put(chunk)
+        return True
+
+    async def next_chunk(self) -> bytes | None:
+        return await self._queue.get()
+
+    async def chunks(self, first: bytes | None, encoded: asyncio.Future[Any]) -> AsyncIterator[bytes]:
+        try:
+            chunk = first
+            while chunk is not None:
+                yield chunk
+                chunk = await self._queue.get()
+            await encoded
+        finally:
+            self.close(encoded)
+
+    def close(self, encoded: asyncio.Future[Any]) -> None:
+        # Unblock a writer waiting on a full queue after the client went away.
+        self._closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        encoded.add_done_callback(_consume_future_result)
+
+
+def _consume_future_result(future: asyncio.Future[Any]) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+def _sse_message_frame(message: Any) -> bytes:
+    return ("data: " + json.dumps(jsonable(message), ensure_ascii=False) + "\n\n").encode("utf-8")
+
+
+class _WebSocketMessageFrame:
+    """One outgoing message, encoded at most once per codec across fan-out subscribers."""
+    __slots__ = ("data", "_encoded")
+
+    def __init__(self, message: Any) -> None:
+        self.data = jsonable(message)
+        self._encoded: dict[str, ApiWebSocketFrame] = {}
+
+    def encode(self, codec: ApiWebSocketCodec) -> ApiWebSocketFrame:
+        frame = self._encoded.get(codec.subprotocol)
+        if frame is None:
+            frame = self._encoded[codec.subprotocol] = codec.encode_envelope("message", self.data)
+        return frame
+
+
+class _TopicMembership:
+    """Topic subscriptions of one connection on an APP/TOPIC-scoped route."""
+
+    def __init__(self, queue: ApiTopicQueue | None, broker: ApiTopicBroker | None, route_id: str) -> None:
+        self._topic_queue = queue
+        self._broker = broker
+        self._route_id = route_id
+        self._topics: dict[str, None] = {}
 
+    def subscribe(self, topic: str = "") -> None:
+        if self._broker is None or self._topic_queue is None:
+            raise RuntimeError("subscribe is only available on APP/TOPIC-scoped routes")
+        self._topics[topic] = None
+        self._broker.subscribe(self._route_id, topic, self._topic_queue)
 
-class _SseStream:
-    def __init__(self, queue_capacity: int) -> None:
-        self._queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=max(1, queue_capacity))
+    def unsubscribe(self, topic: str = "") -> None:
+        if self._broker is None or self._topic_queue is None or topic not in self._topics:
+            return
+        del self._topics[topic]
+        self._broker.unsubscribe(self._route_id, topic, self._topic_queue)
+
+    def detach(self) -> None:
+        for topic in tuple(self._topics):
+            self.unsubscribe(topic)
+
+
+class _SseStream(_TopicMembership):
+    """SSE connection that writes queued frames in batches and sends idle heartbeats."""
+
+    def __init__(
+        self,
+        queue: ApiTopicQueue,
+        config: ApiServerConfig,
+        *,
+        broker: ApiTopicBroker | None = None,
+        route_id: str = "",
+    ) -> None:
+        super().__init__(queue, broker, route_id)
+        self._queue = queue
+        self._config = config
+        self._counted_dropped = 0
+        self._counted_coalesced = 0
         self.closed = False
 
+    @property
+    def dropped(self) -> int:
+        return self._queue.dropped
+
+    @property
+    def coalesced(self) -> int:
+        return self._queue.coalesced
+
+    @property
+    def overflowed(self) -> bool:
+        return self._queue.overflowed
+
     def __aiter__(self):
         return self
 
-    async def __anext__(self) -> str:
-        item = await self._queue.get()
-        if item is None:
-            raise StopAsyncIteration
-        return item
+    async def __anext__(self) -> bytes:
+        config = self._config
+        counters = config.sse_counters
+        frame = self._queue.get_nowait()
+        while frame is None:
+            if self._queue.closed:
+                self.closed = True
+                self._count_queue_losses()
+                raise StopAsyncIteration
+            if config.sse_heartbeat_seconds <= 0:
+                await self._queue.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._queue.wait(), config.sse_heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    counters.heartbeats += 1
+                    counters.writes += 1
+                    return _SSE_HEARTBEAT
+            frame = self._queue.get_nowait()
+        batch = [frame]
+        size = len(frame)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.sse_flush_interval_ms / 1000
+        while len(batch) < config.sse_flush_messages and size < config.sse_flush_bytes:
+            frame = self._queue.get_nowait()
+            if frame is None:
+                remaining = deadline - loop.time()
+                if remaining <= 0 or self._queue.closed:
+                    break
+                try:
+                    await asyncio.wait_for(self._queue.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                continue
+            batch.append(frame)
+            size += len(frame)
+        counters.messages += len(batch)
+        counters.writes += 1
+        self._count_queue_losses()
+        return batch[0] if len(batch) == 1 else b"".join(batch)
 
     async def send(self, message: Any) -> None:
         if self.closed:
             return
-        await self._queue.put("data: " + json.dumps(_jsonable(message), ensure_ascii=False) + "\n\n")
+        frame = _sse_message_frame(message)
+        overflow = self._config.sse_overflow
+        if overflow == "block":
+            await self._queue.put(frame)
+        elif overflow == "coalesce_latest":
+            self._queue.offer(frame, (self._config.sse_coalesce_key or _message_type_key)(message))
+        else:
+            self._queue.offer(frame)
 
     async def close(self, close: Any) -> None:
         if self.closed:
             return
         self.closed = True
+        self.detach()
         await self._queue.put(
-            "event: close\n"
-            + "data: "
-            + json.dumps(_jsonable(close), ensure_ascii=False)
-            + "\n\n"
+            (
+                "event: close\n"
+                + "data: "
+                + json.dumps(jsonable(close), ensure_ascii=False)
+                + "\n\n"
+            ).encode("utf-8")
         )
-        await self._queue.put(None)
+        self._queue.close()
 
     async def abort(self, code: int = 1011, reason: str | None = None) -> None:
         await self.close({"code": code, "reason": reason or ""})
 
+    def _count_queue_losses(self) -> None:
+        counters = self._config.sse_counters
+        counters.dropped += self._queue.dropped - self._counted_dropped
+        counters.coalesced += self._queue.coalesced - self._counted_coalesced
+        self._counted_dropped = self._queue.dropped
+        self._counted_coalesced = self._queue.coalesced
+
+
+_SSE_HEARTBEAT = b": keep-alive\n\n"
+
+
+def _message_type_key(message: Any) -> Any:
+    if isinstance(message, Mapping):
+        return message.get("type")
+    return getattr(message, "type", None)
+
 
 def _identity_decoder(value: Any, path: str) -> Any:
     return value
 
 
-class _WebSocketChannel:
-    def __init__(self, websocket: WebSocket, message_decoder=_identity_decoder, config: ApiServerConfig | None = None) -> None:
+class _WebSocketChannel(_TopicMembership):
+    def __init__(
+        self,
+        websocket: WebSocket,
+        message_decoder=_identity_decoder,
+        config: ApiServerConfig | None = None,
+        *,
+        codec: ApiWebSocketCodec = JSON_WEBSOCKET_CODEC,
+        outbox: ApiTopicQueue | None = None,
+        broker: ApiTopicBroker | None = None,
+        route_id: str = "",
+    ) -> None:
+        super().__init__(outbox, broker, route_id)
         self.websocket = websocket
         self.message_decoder = message_decoder
         self.config = config or ApiServerConfig()
+        self.codec = codec
+        # Topic routes send through the outbox so broker fan-out never waits on a slow socket.
+        self.outbox = outbox
         self.closed = False
 
     async def receive(self) -> Any:
-        try:
-            payload = await self.websocket.receive_text()
-        except WebSocketDisconnect as err:
+        message = await self.websocket.receive()
+        if message["type"] == "websocket.disconnect":
             self.closed = True
-            raise _WebSocketClosed() from err
-        if len(payload.encode("utf-8")) > self.config.websocket_message_max_bytes:
+            raise _WebSocketClosed()
+        payload = message.get("bytes") if self.codec.binary else message.get("text")
+        if payload is None:
+            await self.abort(1003, "unexpected WebSocket frame type")
+            raise _WebSocketClosed()
+        if _frame_exceeds(payload, self.config.websocket_message_max_bytes):
             await self.abort(1009, "WebSocket message exceeds configured limit")
             raise _WebSocketClosed()
         try:
-            value = json.loads(payload)
+            value = self.codec.loads(payload)
             return self.message_decoder(value, "message")
-        except (UnicodeDecodeError, json.JSONDecodeError, TypeError, ValueError) as err:
+        except (TypeError, ValueError) as err:
             await self.abort(1003, "invalid WebSocket message")
             raise _WebSocketClosed() from err
 
     async def send(self, message: Any) -> None:
         if self.closed:
             return
-        await self.websocket.send_text(
-            json.dumps({"type": "message", "data": _jsonable(message)}, ensure_ascii=False)
-        )
+        frame = _WebSocketMessageFrame(message)
+        if self.outbox is not None:
+            await self.outbox.put(frame)
+            return
+        await self.send_frame(frame.encode(self.codec))
+
+    async def send_frame(self, frame: ApiWebSocketFrame) -> None:
+        if isinstance(frame, str):
+            await self.websocket.send_text(frame)
+        else:
+            await self.websocket.send_bytes(frame)
 
     async def close(self, close: Any) -> None:
-        if self.closed:
-            return
-        self.closed = True
-        await self._send_close(close, 1000)
+        await self._finish(_WebSocketCloseFrame(close, 1000))
 
     async def abort(self, code: int = 1011, reason: str | None = None) -> None:
+        await self._finish(_WebSocketCloseFrame({"code": code, "reason": reason or ""}, code))
+
+    async def _finish(self, frame: _WebSocketCloseFrame) -> None:
         if self.closed:
             return
         self.closed = True
-        await self._send_close({"code": code, "reason": reason or ""}, code)
+        self.detach()
+        if self.outbox is None:
+            await self.send_close(frame)
+            return
+        # The pump is the only writer on topic routes: queue the close frame
+        # behind pending messages and let the pump send it and close the socket.
+        await self.outbox.put(frame)
+        self.outbox.close()
 
-    async def _send_close(self, close: Any, code: int) -> None:
+    async def send_close(self, frame: _WebSocketCloseFrame) -> None:
         try:
-            await self.websocket.send_text(
-                json.dumps({"type": "close", "data": _jsonable(close)}, ensure_ascii=False)
-            )
+            await self.send_frame(self.codec.encode_envelope("close", jsonable(frame.payload)))
         finally:
-            await self.websocket.close(code=code)
+            await self.websocket.close(code=frame.code)
+
+
+class _WebSocketCloseFrame:
+    """Terminal close payload and code, queued last on a topic channel outbox."""
+    __slots__ = ("payload", "code")
+
+    def __init__(self, payload: Any, code: int) -> None:
+        self.payload = payload
+        self.code = code
+
+
+async def _accept_websocket(websocket: WebSocket, config: ApiServerConfig) -> ApiWebSocketCodec:
+    codec = select_websocket_codec(websocket.scope.get("subprotocols") or (), config.websocket_codecs)
+    if codec is None:
+        await websocket.accept()
+        return JSON_WEBSOCKET_CODEC
+    await websocket.accept(subprotocol=codec.subprotocol)
+    return codec
+
+
+def _frame_exceeds(payload: ApiWebSocketFrame, max_bytes: int) -> bool:
+    if isinstance(payload, bytes):
+        return len(payload) > max_bytes
+    # UTF-8 needs one to four bytes per character, so only borderline text is encoded to measure it.
+    if len(payload) > max_bytes:
+        return True
+    if len(payload) * 4 <= max_bytes:
+        return False
+    return len(payload.encode("utf-8")) > max_bytes
+
+
+async def _pump_websocket_frames(channel: _WebSocketChannel) -> None:
+    outbox = channel.outbox
+    assert outbox is not None
+    try:
+        while True:
+            frame = await outbox.get()
+            if frame is None:
+                break
+            if isinstance(frame, _WebSocketCloseFrame):
+                await channel.send_close(frame)
+                return
+            await channel.send_frame(frame.encode(channel.codec))
+        if outbox.overflowed:
+            channel.closed = True
+            channel.detach()
+            await channel.send_close(_WebSocketCloseFrame({"code": 1013, "reason": "slow consumer"}, 1013))
+    except (WebSocketDisconnect, RuntimeError):
+        channel.closed = True
+
+
+async def _hold_websocket_channel(channel: _WebSocketChannel, pump: asyncio.Task[None]) -> None:
+    """Keep a topic connection open after the service returns, until the client leaves or the pump stops."""
+    if channel.closed:
+        return
+
+    async def wait_disconnect() -> None:
+        while (await channel.websocket.receive())["type"] != "websocket.disconnect":
+            pass
+        channel.closed = True
+
+    watcher = asyncio.create_task(wait_disconnect())
+    try:
+        await asyncio.wait({watcher, pump}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
 
 
 class _WebSocketClosed(Exception):
@@ -1,8 +1,17 @@
 # Code generated by api-blueprint (Python server); DO NOT EDIT.
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, AsyncIterable, BinaryIO, Callable, Generic, Iterable, Mapping, Protocol, TypeVar
+import asyncio
+import json
+from collections import deque
+from dataclasses import asdict, dataclass, field, is_dataclass
+from enum import Enum
+from typing import Any, AsyncIterable, BinaryIO, Callable, Generic, Iterable, Literal, Mapping, Protocol, TypeVar
+
+from .gen_error_lookup import make_api_error_payload
+from .gen_errors import ApiError
+from .gen_metrics import ApiRouteHooks
+from .gen_websocket import ApiWebSocketCodec, default_websocket_codecs
 
 
 RecvT = TypeVar("RecvT")
@@ -12,17 +21,268 @@ RawT = TypeVar("RawT")
 
 
 ApiUploadFile = bytes | bytearray | memoryview | BinaryIO | tuple[str, bytes] | tuple[str, bytes, str] | Any
+ApiJsonEncoder = Callable[[Any], bytes]
+ApiSlowConsumerPolicy = Literal["drop_oldest", "disconnect"]
+ApiSseOverflowPolicy = Literal["block", "drop_oldest", "coalesce_latest"]
+
+
+class ApiBinaryCompressor(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        ...
+
+    def flush(self) -> bytes:
+        ...
+
+
+class ApiUploadSink(Protocol):
+    """Receives one multipart file part while it is uploaded instead of a temporary file."""
+
+    async def write(self, chunk: bytes) -> None:
+        ...
+
+    async def close(self) -> Any:
+        """Finish the part; the returned value becomes the DTO field value."""
+
+    async def abort(self) -> None:
+        """Discard the partial part after the upload failed or hit a limit."""
+
+
+def encode_json(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def jsonable(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "to_mapping"):
+        return value.to_mapping()
+    if is_dataclass(value):
+        return jsonable(asdict(value))
+    if isinstance(value, dict):
+        return {json_key(key): jsonable(item) for key, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        return [jsonable(item) for item in value]
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
+
+
+def json_key(value: Any) -> str:
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+def envelope_json_bytes(write: Callable[[list[str]], None], prefix: str, suffix: str) -> bytes:
+    # Generated models append their JSON straight after the envelope prefix, which
+    # matches `encode_json` without building the intermediate mappings.
+    out = [prefix]
+    write(out)
+    out.append(suffix)
+    return "".join(out).encode("utf-8")
+
+
+def api_error_payload(error: ApiError, route_id: str) -> dict[str, Any]:
+    return jsonable(make_api_error_payload(jsonable(error.payload), route_id))
+
+
+class ApiTopicQueue:
+    """Bounded outgoing frame queue of one streaming connection.
+    `put` waits for room; `offer` never waits and applies the slow-consumer
+    policy when the queue is full: `drop_oldest` discards the oldest queued
+    frame and `disconnect` closes the queue so the transport ends the
+    connection. A frame offered with a `key` replaces a still-queued frame
+    with the same key instead of taking another slot.
+    """
+
+    def __init__(self, capacity: int, slow_consumer: ApiSlowConsumerPolicy = "drop_oldest") -> None:
+        self.capacity = max(1, capacity)
+        self.slow_consumer = slow_consumer
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+        self.overflowed = False
+        self._frames: deque[list[Any]] = deque()
+        self._keyed: dict[Any, list[Any]] = {}
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    async def put(self, frame: Any) -> None:
+        while len(self._frames) >= self.capacity and not self.closed:
+            self._writable.clear()
+            await self._writable.wait()
+        if not self.closed:
+            self._append(frame, None)
+
+    def offer(self, frame: Any, key: Any = None) -> bool:
+        if self.closed:
+            return False
+        if key is not None and key in self._keyed:
+            self._keyed[key][1] = frame
+            self.coalesced += 1
+            return True
+        if len(self._frames) >= self.capacity:
+            if self.slow_consumer == "disconnect":
+                self.overflowed = True
+                self._frames.clear()
+                self._keyed.clear()
+                self.close()
+                return False
+            self._pop()
+            self.dropped += 1
+        self._append(frame, key)
+        return True
+
+    def get_nowait(self) -> Any:
+        """Return the next queued frame, or None when nothing is queued."""
+        if not self._frames:
+            return None
+        return self._pop()
+
+    async def wait(self) -> None:
+        """Wait until a frame is queued or the queue is closed."""
+        while not self._frames and not self.closed:
+            self._readable.clear()
+            await self._readable.wait()
+
+    async def get(self) -> Any:
+        """Return the next frame, or None once the queue is closed and drained."""
+        await self.wait()
+        return self.get_nowait()
+
+    def close(self) -> None:
+        self.closed = True
+        self._readable.set()
+        self._writable.set()
+
+    def _append(self, frame: Any, key: Any) -> None:
+        entry = [key, frame]
+        self._frames.append(entry)
+        if key is not None:
+            self._keyed[key] = entry
+        self._readable.set()
+
+    def _pop(self) -> Any:
+        key, frame = self._frames.popleft()
+        if key is not None:
+            del self._keyed[key]
+        self._writable.set()
+        return frame
+
+
+class ApiTopicBroker:
+    """In-process fan-out for APP/TOPIC-scoped STREAM and CHANNEL routes.
+    Each route registers one frame encoder, so `publish` serializes a message
+    once and hands the same frame to every subscriber queue. Publishing and
+    subscribing must happen on the event loop that serves the connections.
+    """
+
+    def __init__(self, *, queue_capacity: int = 256, slow_consumer: ApiSlowConsumerPolicy = "drop_oldest") -> None:
+        if slow_consumer not in ("drop_oldest", "disconnect"):
+            raise ValueError(f"unknown slow consumer policy: {slow_consumer}")
+        self.queue_capacity = queue_capacity
+        self.slow_consumer = slow_consumer
+        self._encoders: dict[str, Callable[[Any], Any]] = {}
+        self._subscribers: dict[tuple[str, str], dict[ApiTopicQueue, None]] = {}
+
+    def register(self, route_id: str, encoder: Callable[[Any], Any]) -> None:
+        self._encoders[route_id] = encoder
+
+    def queue(self) -> ApiTopicQueue:
+        return ApiTopicQueue(self.queue_capacity, self.slow_consumer)
+
+    def subscribe(self, route_id: str, topic: str, queue: ApiTopicQueue) -> None:
+        self._subscribers.setdefault((route_id, topic), {})[queue] = None
+
+    def unsubscribe(self, route_id: str, topic: str, queue: ApiTopicQueue) -> None:
+        subscribers = self._subscribers.get((route_id, topic))
+        if subscribers is None:
+            return
+        subscribers.pop(queue, None)
+        if not subscribers:
+            del self._subscribers[(route_id, topic)]
+
+    def subscriber_count(self, route_id: str, topic: str = "") -> int:
+        return len(self._subscribers.get((route_id, topic), ()))
+
+    def publish(self, route_id: str, message: Any, *, topic: str = "") -> int:
+        """Encode `message` once and queue it for every subscriber; returns the number of queues reached."""
+        subscribers = self._subscribers.get((route_id, topic))
+        if not subscribers:
+            return 0
+        frame = self._encoders[route_id](message)
+        delivered = 0
+        for queue in tuple(subscribers):
+            if queue.offer(frame):
+                delivered += 1
+            elif queue.closed:
+                self.unsubscribe(route_id, topic, queue)
+        return delivered
+
+
+@dataclass
+class ApiSseCounters:
+    """Totals across every SSE stream served with one `ApiServerConfig`."""
+    messages: int = 0
+    writes: int = 0
+    heartbeats: int = 0
+    dropped: int = 0
+    coalesced: int = 0
 
 
 @dataclass(frozen=True)
 class ApiServerConfig:
     body_max_bytes: int = 16 * 1024 * 1024
     decompressed_binary_max_bytes: int = 16 * 1024 * 1024
+    # File parts are limited while they arrive; text parts are capped by
+    # `multipart_part_max_bytes` and decoded in memory.
     multipart_file_max_bytes: int = 32 * 1024 * 1024
     multipart_part_max_bytes: int = 32 * 1024 * 1024
+    # File parts stay in memory up to this size, then roll over to a temporary file.
+    multipart_spool_max_bytes: int = 1 * 1024 * 1024
     sse_queue_capacity: int = 256
+    # `block` makes `send` wait for room in a full SSE queue and `drop_oldest`
+    # discards the oldest frame; `coalesce_latest` keeps only the newest queued
+    # frame per `sse_coalesce_key` (default: the message `type` tag) and drops
+    # the oldest frame when the queue is full of distinct keys.
+    sse_overflow: ApiSseOverflowPolicy = "block"
+    sse_coalesce_key: Callable[[Any], Any] | None = None
+    # Queued SSE frames are written as one body chunk until a limit is hit; a
+    # positive interval also waits that long for more frames before writing.
+    sse_flush_messages: int = 64
+    sse_flush_bytes: int = 64 * 1024
+    sse_flush_interval_ms: int = 0
+    # Idle streams get a `: keep-alive` comment this often; 0 disables it.
+    sse_heartbeat_seconds: float = 15.0
+    sse_counters: ApiSseCounters = field(default_factory=ApiSseCounters)
     websocket_message_max_bytes: int = 1 * 1024 * 1024
+    # CHANNEL codecs by WebSocket subprotocol; clients that offer none of them
+    # get JSON text frames.
+    websocket_codecs: Mapping[str, ApiWebSocketCodec] = field(default_factory=default_websocket_codecs)
     binary_content_decoders: Mapping[str, Callable[[bytes], bytes]] = field(default_factory=dict)
+    # identity/gzip binary_schema requests and binary_schema responses at least
+    # this large (or of unknown size) are streamed instead of buffered; 0 always streams.
+    binary_stream_min_bytes: int = 64 * 1024
+    # Streamed binary_schema uploads and responses each hold one thread of a
+    # dedicated pool until the whole body is transferred; once all are busy
+    # further bodies are buffered on the event loop. 0 disables streaming.
+    binary_stream_workers: int = 4
+    # Extra Accept-Encoding codecs for streamed binary_schema responses, e.g.
+    # {"zstd": zstd.ZstdCompressor}; gzip is built in.
+    binary_response_encoders: Mapping[str, Callable[[], ApiBinaryCompressor]] = field(default_factory=dict)
+    # Serializes JSON-ready envelopes straight to response bytes; `orjson.dumps`
+    # or `msgspec.json.encode` can be plugged in when installed.
+    json_encoder: ApiJsonEncoder = encode_json
+    # Shared by every APP/TOPIC-scoped STREAM and CHANNEL route; pass the same
+    # broker to the generated `*Topics` publishers.
+    topic_broker: ApiTopicBroker = field(default_factory=ApiTopicBroker)
+    # Per-route timing and tracing callbacks for RPC routes, e.g. an
+    # `ApiRouteHistogram`; None leaves the handlers without any clock reads.
+    route_hooks: ApiRouteHooks | None = None
 
 
 @dataclass
@@ -56,3 +316,19 @@ class ApiServerStream(Protocol, Generic[SendT, CloseT]):
 class ApiServerChannel(ApiServerStream[SendT, CloseT], Protocol, Generic[RecvT, SendT, CloseT]):
     async def receive(self) -> RecvT:
         ...
+
+
+class ApiServerTopicStream(ApiServerStream[SendT, CloseT], Protocol, Generic[SendT, CloseT]):
+    def subscribe(self, topic: str = "") -> None:
+        ...
+
+    def unsubscribe(self, topic: str = "") -> None:
+        ...
+
+
+class ApiServerTopicChannel(ApiServerChannel[RecvT, SendT, CloseT], Protocol, Generic[RecvT, SendT, CloseT]):
+    def subscribe(self, topic: str = "") -> None:
+        ...
+
+    def unsubscribe(self, topic: str = "") -> None:
+        ...
@@ -0,0 +1 @@
+"""Generated package for api-blueprint Python server artifacts."""
@@ -8,53 +8,50 @@ public enum APIErrorCodes {
     public static let rateLimited = 42901
 }
 
+// Built once; a code shared by several catalog entries resolves to the first one declared.
+private let apiErrorPayloadsByCode: [Int: APIErrorPayload] = [
+    APIErrorCodes.commonErrUnknown: APIErrorPayload(
+        id: "CommonErr.UNKNOWN",
+        group: "CommonErr",
+        key: "UNKNOWN",
+        code: -1,
+        message: "未知错误",
+        toastKey: "CommonErr.UNKNOWN",
+        toastDefault: "未知错误",
+        toastLevel: "error"
+    ),
+    APIErrorCodes.tokenExpire: APIErrorPayload(
+        id: "CommonErr.TOKEN_EXPIRE",
+        group: "CommonErr",
+        key: "TOKEN_EXPIRE",
+        code: 55555,
+        message: "token登录态失效",
+        toastKey: "auth.token_expire",
+        toastDefault: "登录状态已失效，请重新登录",
+        toastLevel: "warning"
+    ),
+    APIErrorCodes.demoErrUnknown: APIErrorPayload(
+        id: "DemoErr.UNKNOWN",
+        group: "DemoErr",
+        key: "UNKNOWN",
+        code: 70002,
+        message: "demo unknown error",
+        toastKey: "DemoErr.UNKNOWN",
+        toastDefault: "demo unknown error",
+        toastLevel: "error"
+    ),
+    APIErrorCodes.rateLimited: APIErrorPayload(
+        id: "DemoErr.RATE_LIMITED",
+        group: "DemoErr",
+        key: "RATE_LIMITED",
+        code: 42901,
+        message: "请求过于频繁",
+        toastKey: "demo.rate_limited",
+        toastDefault: "请求过于频繁，请稍后再试",
+        toastLevel: "warning"
+    ),
+]
+
 public func lookupAPIError(code: Int) -> APIErrorPayload? {
-    switch code {
-    case APIErrorCodes.commonErrUnknown:
-        return APIErrorPayload(
-            id: "CommonErr.UNKNOWN",
-            group: "CommonErr",
-            key: "UNKNOWN",
-            code: -1,
-            message: "未知错误",
-            toastKey: "CommonErr.UNKNOWN",
-            toastDefault: "未知错误",
-            toastLevel: "error"
-        )
-    case APIErrorCodes.tokenExpire:
-        return APIErrorPayload(
-            id: "CommonErr.TOKEN_EXPIRE",
-            group: "CommonErr",
-            key: "TOKEN_EXPIRE",
-            code: 55555,
-            message: "token登录态失效",
-            toastKey: "auth.token_expire",
-            toastDefault: "登录状态已失效，请重新登录",
-            toastLevel: "warning"
-        )
-    case APIErrorCodes.demoErrUnknown:
-        return APIErrorPayload(
-            id: "DemoErr.UNKNOWN",
-            group: "DemoErr",
-            key: "UNKNOWN",
-            code: 70002,
-            message: "demo unknown error",
-            toastKey: "DemoErr.UNKNOWN",
-            toastDefault: "demo unknown error",
-            toastLevel: "error"
-        )
-    case APIErrorCodes.rateLimited:
-        return APIErrorPayload(
-            id: "DemoErr.RATE_LIMITED",
-            group: "DemoErr",
-            key: "RATE_LIMITED",
-            code: 42901,
-            message: "请求过于频繁",
-            toastKey: "demo.rate_limited",
-            toastDefault: "请求过于频繁，请稍后再试",
-            toastLevel: "warning"
-        )
-    default:
-        return nil
-    }
+    apiErrorPayloadsByCode[code]
 }
@@ -65,6 +65,14 @@ export const ApiErrors = {
   },
 } as const;
 
+// A code shared by several catalog entries resolves to the first one declared.
+const ApiErrorsByCode: Record<number, ApiErrorEntry> = {
+  "-1": ApiErrorsByID["CommonErr.UNKNOWN"],
+  "55555": ApiErrorsByID["CommonErr.TOKEN_EXPIRE"],
+  "70002": ApiErrorsByID["DemoErr.UNKNOWN"],
+  "42901": ApiErrorsByID["DemoErr.RATE_LIMITED"],
+};
+
 const RouteApiErrorsByCode = {
   "api.api.channel.ws": {
     "-1": ApiErrorsByID["CommonErr.UNKNOWN"],
@@ -219,7 +227,7 @@ export function lookupApiErrorByCode(code: ApiErrorCode, routeId?: string): ApiE
       return routeEntry;
     }
   }
-  return Object.values(ApiErrorsByID as Record<string, ApiErrorEntry>).find((entry) => entry.code === code);
+  return ApiErrorsByCode[code];
 }
 
 export function lookupApiError(payload: Partial<ApiErrorPayload> | undefined, routeId?: string): ApiErrorEntry | undefined {
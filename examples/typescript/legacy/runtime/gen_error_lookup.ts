@@ -9,6 +9,10 @@ export const ApiErrorsByID = {
 export const ApiErrors = {
 } as const;
 
+// A code shared by several catalog entries resolves to the first one declared.
+const ApiErrorsByCode: Record<number, ApiErrorEntry> = {
+};
+
 const RouteApiErrorsByCode = {
   "legacy.account.get.profile": {
   },
@@ -29,7 +33,7 @@ export function lookupApiErrorByCode(code: ApiErrorCode, routeId?: string): ApiE
       return routeEntry;
     }
   }
-  return Object.values(ApiErrorsByID as Record<string, ApiErrorEntry>).find((entry) => entry.code === code);
+  return ApiErrorsByCode[code];
 }
 
 export function lookupApiError(payload: Partial<ApiErrorPayload> | undefined, routeId?: string): ApiErrorEntry | undefined {
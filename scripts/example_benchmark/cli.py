@@ -7,7 +7,15 @@ import subprocess
 import sys
 from pathlib import Path
 
-from scripts.example_benchmark import binary, protocol, swift_runtime
+from scripts.example_benchmark import (
+    binary,
+    protocol,
+    python_asgi,
+    python_codecs,
+    python_envelope,
+    python_models,
+    swift_runtime,
+)
 from scripts.example_conformance import runner
 from scripts.example_conformance import manifest, scenarios
 
@@ -69,6 +77,50 @@ def build_parser() -> argparse.ArgumentParser:
         default=256 * 1024,
         help="payload size for stream, multipart, and payload-limit scenarios",
     )
+
+    envelope_parser = subparsers.add_parser(
+        "python-envelope",
+        help="Compare generated Python server envelope writers against the generic envelope helper.",
+    )
+    envelope_parser.add_argument(
+        "--scenario",
+        default="all",
+        help="Comma-separated scenarios, or all. Supported: " + ",".join(python_envelope.SCENARIOS),
+    )
+    envelope_parser.add_argument("--count", type=int, default=20_000, help="calls per timing round")
+
+    asgi_parser = subparsers.add_parser(
+        "python-asgi",
+        help="Compare the generated Python plain ASGI transport against the FastAPI transport.",
+    )
+    asgi_parser.add_argument(
+        "--scenario",
+        default="all",
+        help="Comma-separated scenarios, or all. Supported: " + ",".join(python_asgi.SCENARIOS),
+    )
+    asgi_parser.add_argument("--count", type=int, default=2_000, help="requests per timing round")
+
+    models_parser = subparsers.add_parser(
+        "python-models",
+        help="Compare memory and access cost of default and slotted frozen generated Python models.",
+    )
+    models_parser.add_argument(
+        "--scenario",
+        default="all",
+        help="Comma-separated scenarios, or all. Supported: " + ",".join(python_models.SCENARIOS),
+    )
+    models_parser.add_argument("--count", type=int, default=50_000, help="objects or calls per round")
+
+    codecs_parser = subparsers.add_parser(
+        "python-codecs",
+        help="Compare builtin and pydantic-core generated Python codecs per payload shape.",
+    )
+    codecs_parser.add_argument(
+        "--scenario",
+        default="all",
+        help="Comma-separated scenarios, or all. Supported: " + ",".join(python_codecs.SCENARIOS),
+    )
+    codecs_parser.add_argument("--count", type=int, default=5_000, help="calls per round")
     return parser
 
 
@@ -144,6 +196,52 @@ def main(argv: list[str] | None = None) -> int:
                 )
             )
             return result.returncode
+        if args.command == "python-envelope":
+            _validate_positive(args.count, "--count")
+            python_envelope.print_results(
+                python_envelope.run(
+                    python_envelope.PythonEnvelopeBenchmarkContext(
+                        repo_root=repo_root,
+                        scenarios=python_envelope.parse_scenarios(args.scenario),
+                        count=args.count,
+                    )
+                )
+            )
+            return 0
+        if args.command == "python-asgi":
+            _validate_positive(args.count, "--count")
+            python_asgi.print_results(
+                python_asgi.run(
+                    python_asgi.PythonAsgiBenchmarkContext(
+                        repo_root=repo_root,
+                        scenarios=python_asgi.parse_scenarios(args.scenario),
+                        count=args.count,
+                    )
+                )
+            )
+            return 0
+        if args.command == "python-models":
+            _validate_positive(args.count, "--count")
+            python_models.print_results(
+                python_models.run(
+                    python_models.PythonModelsBenchmarkContext(
+                        scenarios=python_models.parse_scenarios(args.scenario),
+                        count=args.count,
+                    )
+                )
+            )
+            return 0
+        if args.command == "python-codecs":
+            _validate_positive(args.count, "--count")
+            python_codecs.print_results(
+                python_codecs.run(
+                    python_codecs.PythonCodecsBenchmarkContext(
+                        scenarios=python_codecs.parse_scenarios(args.scenario),
+                        count=args.count,
+                    )
+                )
+            )
+            return 0
     except (RuntimeError, ValueError, FileNotFoundError, ModuleNotFoundError, subprocess.CalledProcessError) as exc:
         print(str(exc), file=sys.stderr)
         return 1
@@ -171,6 +269,18 @@ def _print_list() -> None:
     print("swift runtime scenarios:")
     for scenario_name in swift_runtime.SCENARIOS:
         print(f"- {scenario_name}")
+    print("python envelope scenarios:")
+    for scenario_name in python_envelope.SCENARIOS:
+        print(f"- {scenario_name}")
+    print("python asgi scenarios:")
+    for scenario_name in python_asgi.SCENARIOS:
+        print(f"- {scenario_name}")
+    print("python models scenarios:")
+    for scenario_name in python_models.SCENARIOS:
+        print(f"- {scenario_name}")
+    print("python codecs scenarios:")
+    for scenario_name in python_codecs.SCENARIOS:
+        print(f"- {scenario_name}")
 
 
 def _validate_positive(value: int, flag: str) -> None:
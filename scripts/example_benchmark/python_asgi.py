@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+SCENARIOS = ("query", "json", "path")
+SERVER_PACKAGE = "api_blueprint_example_server"
+HTTP_MODULE = f"{SERVER_PACKAGE}.api.transports.http.gen_server"
+ASGI_MODULE = f"{SERVER_PACKAGE}.api.transports.asgi.gen_server"
+REPEATS = 5
+REQUESTS: dict[str, tuple[str, str, bytes, bytes]] = {
+    "query": ("GET", "/api/demo/abc", b"arg3=hello&arg2=1.5", b""),
+    "json": ("POST", "/api/demo/test_post", b"", b'{"req1":"hello","req2":2}'),
+    "path": ("GET", "/api/demo/path-echo/item-1/gold", b"", b""),
+}
+
+
+@dataclass(frozen=True)
+class PythonAsgiBenchmarkContext:
+    repo_root: Path
+    scenarios: tuple[str, ...]
+    count: int
+
+
+@dataclass(frozen=True)
+class PythonAsgiBenchmarkResult:
+    scenario: str
+    count: int
+    fastapi_ns: float
+    asgi_ns: float
+
+    @property
+    def speedup(self) -> float:
+        return self.fastapi_ns / self.asgi_ns if self.asgi_ns else 0.0
+
+
+class _DemoService:
+    async def abc(self, query: Any) -> dict[str, Any]:
+        return {"bc": query.arg3, "a": 1, "efg": query.arg2, "hijk": [1, 2, 3], "enum_status": 1, "enum_list": []}
+
+    async def test_post(self, json: Any) -> dict[str, Any]:
+        return {"list": [json.req1], "map": {}}
+
+    async def path_echo(self, path: Any) -> dict[str, Any]:
+        return {"item": path.item, "badge": path.badge}
+
+
+def parse_scenarios(raw: str) -> tuple[str, ...]:
+    if raw.strip() == "all":
+        return SCENARIOS
+    names = tuple(dict.fromkeys(item.strip() for item in raw.split(",") if item.strip()))
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown or not names:
+        raise ValueError(f"unknown Python ASGI benchmark scenario: {','.join(unknown) or raw}")
+    return names
+
+
+def run(context: PythonAsgiBenchmarkContext) -> list[PythonAsgiBenchmarkResult]:
+    http_transport, asgi_transport = _load_generated_modules(context.repo_root)
+    from fastapi import FastAPI
+
+    service = _DemoService()
+    fastapi_app = FastAPI()
+    fastapi_app.include_router(http_transport.create_router(demo_service=service))
+    asgi_app = asgi_transport.create_app(demo_service=service, fallback=fastapi_app)
+    return asyncio.run(_run(context, fastapi_app, asgi_app))
+
+
+def print_results(results: list[PythonAsgiBenchmarkResult]) -> None:
+    for result in results:
+        print(
+            " ".join(
+                [
+                    f"scenario={result.scenario}",
+                    f"count={result.count}",
+                    f"fastapi={result.fastapi_ns:.0f}ns/req",
+                    f"asgi={result.asgi_ns:.0f}ns/req",
+                    f"speedup={result.speedup:.2f}x",
+                ]
+            )
+        )
+
+
+def _load_generated_modules(repo_root: Path) -> tuple[Any, Any]:
+    server_root = str(repo_root / "examples" / "python" / "server")
+    if server_root not in sys.path:
+        sys.path.insert(0, server_root)
+    return importlib.import_module(HTTP_MODULE), importlib.import_module(ASGI_MODULE)
+
+
+async def _run(context: PythonAsgiBenchmarkContext, fastapi_app: Any, asgi_app: Any) -> list[PythonAsgiBenchmarkResult]:
+    results = []
+    for scenario in context.scenarios:
+        request = REQUESTS[scenario]
+        expected = await _call(fastapi_app, request)
+        actual = await _call(asgi_app, request)
+        if expected != actual:
+            raise RuntimeError(f"{scenario}: ASGI transport response differs from the FastAPI transport")
+        # Interleave the rounds so CPU frequency drift affects both transports alike.
+        fastapi_ns = asgi_ns = float("inf")
+        for _ in range(REPEATS):
+            fastapi_ns = min(fastapi_ns, await _time_per_request(fastapi_app, request, context.count))
+            asgi_ns = min(asgi_ns, await _time_per_request(asgi_app, request, context.count))
+        results.append(
+            PythonAsgiBenchmarkResult(
+                scenario=scenario,
+                count=context.count,
+                fastapi_ns=fastapi_ns,
+                asgi_ns=asgi_ns,
+            )
+        )
+    return results
+
+
+async def _time_per_request(app: Any, request: tuple[str, str, bytes, bytes], count: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(count):
+        await _call(app, request)
+    return (time.perf_counter_ns() - started) / count
+
+
+async def _call(app: Any, request: tuple[str, str, bytes, bytes]) -> tuple[int, bytes]:
+    method, path, query_string, body = request
+    headers = [(b"host", b"testserver")]
+    if body:
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("latin-1"))]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("latin-1"),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = 0
+    chunks: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        if messages:
+            return messages.pop()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
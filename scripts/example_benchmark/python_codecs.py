@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import enum
+import importlib
+import logging
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+SCENARIOS = ("flat", "nested", "lists")
+BACKENDS = ("builtin", "pydantic-core")
+TYPES_MODULE = "api.routes.api.shapes.gen_types"
+MODELS = {"flat": "FlatResponse", "nested": "NestedResponse", "lists": "ListsResponse"}
+REPEATS = 5
+
+
+@dataclass(frozen=True)
+class PythonCodecsBenchmarkContext:
+    scenarios: tuple[str, ...]
+    count: int
+
+
+@dataclass(frozen=True)
+class PythonCodecsBenchmarkResult:
+    scenario: str
+    count: int
+    decode: dict[str, float]
+    encode: dict[str, float]
+
+
+def parse_scenarios(raw: str) -> tuple[str, ...]:
+    if raw.strip() == "all":
+        return SCENARIOS
+    names = tuple(dict.fromkeys(item.strip() for item in raw.split(",") if item.strip()))
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown or not names:
+        raise ValueError(f"unknown Python codecs benchmark scenario: {','.join(unknown) or raw}")
+    return names
+
+
+def run(context: PythonCodecsBenchmarkContext) -> list[PythonCodecsBenchmarkResult]:
+    with tempfile.TemporaryDirectory(prefix="api-blueprint-codecs-") as tmp:
+        modules = {backend: _generate_types(Path(tmp), backend) for backend in BACKENDS}
+        results = []
+        for scenario in context.scenarios:
+            payload = _payload(scenario)
+            models = {backend: getattr(module, MODELS[scenario]) for backend, module in modules.items()}
+            encoded = {backend: model.from_value(payload).to_json_bytes() for backend, model in models.items()}
+            if len(set(encoded.values())) != 1:
+                raise RuntimeError(f"{scenario}: codec backends disagree on the encoded payload")
+            decode = _best_per_call(
+                {backend: _decode_case(model, payload) for backend, model in models.items()},
+                context.count,
+            )
+            encode = _best_per_call(
+                {backend: model.from_value(payload).to_json_bytes for backend, model in models.items()},
+                context.count,
+            )
+            results.append(PythonCodecsBenchmarkResult(scenario=scenario, count=context.count, decode=decode, encode=encode))
+        return results
+
+
+def print_results(results: list[PythonCodecsBenchmarkResult]) -> None:
+    for result in results:
+        fields = [f"scenario={result.scenario}", f"count={result.count}"]
+        for operation, values in (("decode", result.decode), ("encode", result.encode)):
+            fields.extend(f"{operation}-{backend}={value:.0f}ns/op" for backend, value in values.items())
+            fields.append(f"{operation}-speedup={values['builtin'] / values['pydantic-core']:.2f}x")
+        print(" ".join(fields))
+
+
+def _generate_types(root: Path, backend: str) -> Any:
+    from api_blueprint.engine import Blueprint
+    from api_blueprint.engine.model import Array, Bool, Enum, Float, Int, Map, Model, String
+    from api_blueprint.writer.python import PythonClientWriter
+
+    class LineStatus(enum.StrEnum):
+        open = "open"
+        shipped = "shipped"
+
+    class Flat(Model):
+        id = String(description="id")
+        name = String(description="name")
+        quantity = Int(description="quantity")
+        price = Float(description="price")
+        active = Bool(description="active")
+        note = String(description="note", omitempty=True)
+
+    class Customer(Model):
+        id = String(description="id")
+        email = String(description="email")
+
+    class Line(Model):
+        sku = String(description="sku")
+        quantity = Int(description="quantity")
+        status = Enum[LineStatus](description="status")
+
+    class Nested(Model):
+        id = String(description="id")
+        customer = Customer(description="customer")
+        lines = Array[Line](description="lines")
+
+    class Lists(Model):
+        items = Array[Flat](description="items")
+        tags = Array[String](description="tags")
+        stock = Map[String, Int](description="stock")
+
+    bp = Blueprint(root="/api")
+    with bp.group("/shapes") as views:
+        views.GET("/flat").RSP(Flat)
+        views.GET("/nested").RSP(Nested)
+        views.GET("/lists").RSP(Lists)
+
+    output_dir = root / backend
+    package_root = f"api_blueprint_codecs_{backend.replace('-', '_')}"
+    writer = PythonClientWriter(output_dir, python_package_root=package_root, codec_backend=backend)
+    writer.register(bp)
+    writer_logger = logging.getLogger("PythonWriter")
+    writer_logger.disabled = True
+    try:
+        writer.gen()
+    finally:
+        writer_logger.disabled = False
+    sys.path.insert(0, str(output_dir))
+    try:
+        return importlib.import_module(f"{package_root}.{TYPES_MODULE}")
+    finally:
+        sys.path.remove(str(output_dir))
+
+
+def _payload(scenario: str) -> dict[str, Any]:
+    flat = {"id": "item-1", "name": "widget", "quantity": 3, "price": 12.5, "active": True}
+    if scenario == "flat":
+        return flat
+    if scenario == "nested":
+        return {
+            "id": "order-1",
+            "customer": {"id": "c-1", "email": "c@example.test"},
+            "lines": [{"sku": f"sku-{index}", "quantity": index, "status": "open"} for index in range(5)],
+        }
+    return {
+        "items": [{**flat, "id": f"item-{index}"} for index in range(50)],
+        "tags": [f"tag-{index}" for index in range(20)],
+        "stock": {f"sku-{index}": index for index in range(20)},
+    }
+
+
+def _decode_case(model: Any, payload: dict[str, Any]) -> Callable[[], Any]:
+    return lambda: model.from_value(payload)
+
+
+def _best_per_call(cases: dict[str, Callable[[], Any]], count: int) -> dict[str, float]:
+    # Interleave the rounds so CPU frequency drift affects every backend alike.
+    best = dict.fromkeys(cases, float("inf"))
+    for _ in range(REPEATS):
+        for backend, func in cases.items():
+            best[backend] = min(best[backend], _time_per_call(func, count))
+    return best
+
+
+def _time_per_call(func: Callable[[], Any], count: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(count):
+        func()
+    return (time.perf_counter_ns() - started) / count
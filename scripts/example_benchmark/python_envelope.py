@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+SCENARIOS = ("wrap-ok", "wrap-error")
+SERVER_PACKAGE = "api_blueprint_example_server"
+ADAPTER_MODULE = f"{SERVER_PACKAGE}.api.transports.http.gen_server"
+ERRORS_MODULE = f"{SERVER_PACKAGE}.api.runtime.errors"
+ROUTE_ID = "api.demo.rpc"
+REPEATS = 5
+
+
+@dataclass(frozen=True)
+class PythonEnvelopeBenchmarkContext:
+    repo_root: Path
+    scenarios: tuple[str, ...]
+    count: int
+
+
+@dataclass(frozen=True)
+class PythonEnvelopeBenchmarkResult:
+    scenario: str
+    count: int
+    generic_ns: float
+    specialized_ns: float
+
+    @property
+    def speedup(self) -> float:
+        return self.generic_ns / self.specialized_ns if self.specialized_ns else 0.0
+
+
+def parse_scenarios(raw: str) -> tuple[str, ...]:
+    if raw.strip() == "all":
+        return SCENARIOS
+    names = tuple(dict.fromkeys(item.strip() for item in raw.split(",") if item.strip()))
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown or not names:
+        raise ValueError(f"unknown Python envelope benchmark scenario: {','.join(unknown) or raw}")
+    return names
+
+
+def run(context: PythonEnvelopeBenchmarkContext) -> list[PythonEnvelopeBenchmarkResult]:
+    adapter, errors = _load_generated_modules(context.repo_root)
+    config = adapter.ApiServerConfig()
+    data = {"message": "hello"}
+    error = errors.ApiError(errors.make_api_error_payload({"id": "DemoErr.RATE_LIMITED"}, ROUTE_ID))
+    cases: dict[str, tuple[Callable[[], Any], Callable[[], Any]]] = {
+        "wrap-ok": (
+            lambda: _generic_wrap_response(adapter, _envelope_literal(), data, config),
+            lambda: adapter._wrap_ok_code_message_data_envelope(data, config),
+        ),
+        "wrap-error": (
+            lambda: _generic_wrap_api_error(adapter, errors, _envelope_literal(), error, ROUTE_ID, config),
+            lambda: adapter._wrap_error_code_message_data_envelope(error, ROUTE_ID, config),
+        ),
+    }
+    results = []
+    for scenario in context.scenarios:
+        generic, specialized = cases[scenario]
+        if generic().body != specialized().body:
+            raise RuntimeError(f"{scenario}: specialized envelope writer output differs from the generic writer")
+        generic_ns, specialized_ns = _best_per_call(generic, specialized, context.count)
+        results.append(
+            PythonEnvelopeBenchmarkResult(
+                scenario=scenario,
+                count=context.count,
+                generic_ns=generic_ns,
+                specialized_ns=specialized_ns,
+            )
+        )
+    return results
+
+
+def print_results(results: list[PythonEnvelopeBenchmarkResult]) -> None:
+    for result in results:
+        print(
+            " ".join(
+                [
+                    f"scenario={result.scenario}",
+                    f"count={result.count}",
+                    f"generic={result.generic_ns:.0f}ns/op",
+                    f"specialized={result.specialized_ns:.0f}ns/op",
+                    f"speedup={result.speedup:.2f}x",
+                ]
+            )
+        )
+
+
+def _load_generated_modules(repo_root: Path) -> tuple[Any, Any]:
+    server_root = str(repo_root / "examples" / "python" / "server")
+    if server_root not in sys.path:
+        sys.path.insert(0, server_root)
+    return importlib.import_module(ADAPTER_MODULE), importlib.import_module(ERRORS_MODULE)
+
+
+def _best_per_call(generic: Callable[[], Any], specialized: Callable[[], Any], count: int) -> tuple[float, float]:
+    # Interleave the rounds so CPU frequency drift affects both writers alike.
+    generic_ns = specialized_ns = float("inf")
+    for _ in range(REPEATS):
+        generic_ns = min(generic_ns, _time_per_call(generic, count))
+        specialized_ns = min(specialized_ns, _time_per_call(specialized, count))
+    return generic_ns, specialized_ns
+
+
+def _time_per_call(func: Callable[[], Any], count: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(count):
+        func()
+    return (time.perf_counter_ns() - started) / count
+
+
+# Reference copies of the envelope handling the adapter used before writers were
+# specialized per envelope; kept here only as the benchmark baseline.
+def _envelope_literal() -> dict[str, Any]:
+    return {
+        "name": "CodeMessageDataEnvelope",
+        "kind": "code_message_data",
+        "error_identity": "nested",
+        "success_code": 0,
+        "success_message": "ok",
+        "fields": {"code": "code", "message": "message", "data": "data", "error": "error"},
+    }
+
+
+def _generic_wrap_response(adapter: Any, envelope: dict[str, Any], data: Any, config: Any) -> Any:
+    payload = adapter.jsonable(data)
+    kind = envelope.get("kind") or "none"
+    fields = envelope.get("fields") or {}
+    if kind == "code_message_data":
+        payload = {
+            fields.get("code", "code"): envelope.get("success_code", 0),
+            fields.get("message", "message"): envelope.get("success_message", "ok"),
+            fields.get("data", "data"): payload,
+        }
+    elif kind == "ok_data_error":
+        payload = {
+            fields.get("ok", "ok"): True,
+            fields.get("data", "data"): payload,
+        }
+    return adapter._json_response(payload, config)
+
+
+def _generic_wrap_api_error(
+    adapter: Any, errors: Any, envelope: dict[str, Any], error: Any, route_id: str, config: Any
+) -> Any:
+    payload = adapter.jsonable(errors.make_api_error_payload(adapter.jsonable(error.payload), route_id))
+    kind = envelope.get("kind") or "none"
+    fields = envelope.get("fields") or {}
+    if kind == "code_message_data":
+        body = {
+            fields.get("code", "code"): payload.get("code", 0),
+            fields.get("message", "message"): payload.get("message", ""),
+            fields.get("data", "data"): None,
+        }
+        if envelope.get("error_identity") != "none":
+            body[fields.get("error", "error")] = payload
+        return adapter._json_response(body, config)
+    if kind == "ok_data_error":
+        return adapter._json_response(
+            {
+                fields.get("ok", "ok"): False,
+                fields.get("error", "error"): payload,
+            },
+            config,
+        )
+    return adapter._json_response(payload, config, status_code=500)
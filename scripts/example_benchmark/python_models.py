@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import gc
+import importlib
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+SCENARIOS = ("memory", "from-value", "attribute")
+MODES = {
+    "dict": {},
+    "slots": {"model_slots": True},
+    "slots-frozen": {"model_slots": True, "model_frozen": True},
+}
+TYPES_MODULE = "api.routes.api.batch.gen_types"
+REPEATS = 5
+
+
+@dataclass(frozen=True)
+class PythonModelsBenchmarkContext:
+    scenarios: tuple[str, ...]
+    count: int
+
+
+@dataclass(frozen=True)
+class PythonModelsBenchmarkResult:
+    scenario: str
+    count: int
+    unit: str
+    values: dict[str, float]
+
+
+def parse_scenarios(raw: str) -> tuple[str, ...]:
+    if raw.strip() == "all":
+        return SCENARIOS
+    names = tuple(dict.fromkeys(item.strip() for item in raw.split(",") if item.strip()))
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown or not names:
+        raise ValueError(f"unknown Python models benchmark scenario: {','.join(unknown) or raw}")
+    return names
+
+
+def run(context: PythonModelsBenchmarkContext) -> list[PythonModelsBenchmarkResult]:
+    with tempfile.TemporaryDirectory(prefix="api-blueprint-models-") as tmp:
+        models = {mode: _generate_models(Path(tmp), mode, options) for mode, options in MODES.items()}
+        payload = _item_payload()
+        for mode, module in models.items():
+            if module.ItemResponse.from_value(payload).to_mapping() != payload:
+                raise RuntimeError(f"{mode}: generated model does not round-trip the benchmark payload")
+        results = []
+        for scenario in context.scenarios:
+            if scenario == "memory":
+                values = {
+                    mode: _bytes_per_object(module.ItemResponse, payload, context.count) for mode, module in models.items()
+                }
+                unit = "B/obj"
+            elif scenario == "from-value":
+                values = _best_per_call(
+                    {mode: _from_value_case(module.ItemResponse, payload) for mode, module in models.items()},
+                    context.count,
+                )
+                unit = "ns/op"
+            else:
+                values = _best_per_call(
+                    {mode: _attribute_case(module.ItemResponse.from_value(payload)) for mode, module in models.items()},
+                    context.count,
+                )
+                unit = "ns/op"
+            results.append(PythonModelsBenchmarkResult(scenario=scenario, count=context.count, unit=unit, values=values))
+        return results
+
+
+def print_results(results: list[PythonModelsBenchmarkResult]) -> None:
+    for result in results:
+        print(
+            " ".join(
+                [
+                    f"scenario={result.scenario}",
+                    f"count={result.count}",
+                    *(f"{mode}={value:.0f}{result.unit}" for mode, value in result.values.items()),
+                ]
+            )
+        )
+
+
+def _generate_models(root: Path, mode: str, options: dict[str, bool]) -> Any:
+    from api_blueprint.engine import Blueprint
+    from api_blueprint.engine.model import Int, Model, String
+    from api_blueprint.writer.python import PythonClientWriter
+
+    class BatchItem(Model):
+        id = String(description="id")
+        name = String(description="name")
+        quantity = Int(description="quantity")
+        price = Int(description="price in cents")
+        note = String(description="note", omitempty=True)
+
+    bp = Blueprint(root="/api")
+    with bp.group("/batch") as views:
+        views.GET("/item").RSP(BatchItem)
+
+    output_dir = root / mode
+    package_root = f"api_blueprint_models_{mode.replace('-', '_')}"
+    writer = PythonClientWriter(output_dir, python_package_root=package_root, **options)
+    writer.register(bp)
+    writer_logger = logging.getLogger("PythonWriter")
+    writer_logger.disabled = True
+    try:
+        writer.gen()
+    finally:
+        writer_logger.disabled = False
+    sys.path.insert(0, str(output_dir))
+    try:
+        return importlib.import_module(f"{package_root}.{TYPES_MODULE}")
+    finally:
+        sys.path.remove(str(output_dir))
+
+
+def _item_payload() -> dict[str, Any]:
+    return {"id": "item-1", "name": "widget", "quantity": 3, "price": 1250}
+
+
+def _bytes_per_object(model: Any, payload: dict[str, Any], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = [model.from_value(payload) for _ in range(count)]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    # The list holding the objects is the same for both modes; leave it out.
+    return (allocated - sys.getsizeof(items)) / count
+
+
+def _from_value_case(model: Any, payload: dict[str, Any]) -> Callable[[], Any]:
+    return lambda: model.from_value(payload)
+
+
+def _attribute_case(item: Any) -> Callable[[], Any]:
+    return lambda: (item.id, item.name, item.quantity, item.price, item.note)
+
+
+def _best_per_call(cases: dict[str, Callable[[], Any]], count: int) -> dict[str, float]:
+    # Interleave the rounds so CPU frequency drift affects every mode alike.
+    best = dict.fromkeys(cases, float("inf"))
+    for _ in range(REPEATS):
+        for mode, func in cases.items():
+            best[mode] = min(best[mode], _time_per_call(func, count))
+    return best
+
+
+def _time_per_call(func: Callable[[], Any], count: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(count):
+        func()
+    return (time.perf_counter_ns() - started) / count
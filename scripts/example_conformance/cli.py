@@ -44,6 +44,12 @@ def build_parser() -> argparse.ArgumentParser:
             default="modern",
             help="Swift client runtime profile for temporary conformance workspaces.",
         )
+        command.add_argument(
+            "--python-codec-backend",
+            choices=example_validation.PYTHON_CODEC_BACKENDS,
+            default="builtin",
+            help="codec_backend option for the python.server and python.client targets in temporary conformance workspaces.",
+        )
         if name != "refresh":
             command.add_argument("--keep-workspace", action="store_true", help="Keep temporary workspace after the run.")
     return parser
@@ -72,6 +78,7 @@ def main(argv: list[str] | None = None) -> int:
                 scenario_names=scenario_names,
                 keep_workspace=args.keep_workspace,
                 swift_runtime_profile=args.swift_runtime_profile,
+                python_codec_backend=args.python_codec_backend,
             )
             return 0
         if args.command == "check":
@@ -82,6 +89,7 @@ def main(argv: list[str] | None = None) -> int:
                 scenario_names=scenario_names,
                 keep_workspace=args.keep_workspace,
                 swift_runtime_profile=args.swift_runtime_profile,
+                python_codec_backend=args.python_codec_backend,
             )
             return 0
         if args.command == "refresh":
@@ -91,6 +99,7 @@ def main(argv: list[str] | None = None) -> int:
                 clients=clients,
                 scenario_names=scenario_names,
                 swift_runtime_profile=args.swift_runtime_profile,
+                python_codec_backend=args.python_codec_backend,
             )
             return 0
     except (RuntimeError, ValueError, FileNotFoundError, ModuleNotFoundError, subprocess.CalledProcessError) as exc:
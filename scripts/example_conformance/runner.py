@@ -28,8 +28,10 @@ def run_conformance(
     scenario_names: tuple[str, ...],
     keep_workspace: bool,
     swift_runtime_profile: str = "modern",
+    python_codec_backend: str = "builtin",
 ) -> None:
     swift_runtime_profile = _effective_swift_runtime_profile(clients, swift_runtime_profile)
+    python_codec_backend = _effective_python_codec_backend(servers, clients, python_codec_backend)
     for item in servers:
         manifest.require_enabled_server(item)
     available_clients = set(manifest.client_manifest())
@@ -43,6 +45,7 @@ def run_conformance(
         lambda: workspace.prepare_generated_workspace(
             repo_root,
             swift_runtime_profile=swift_runtime_profile,
+            python_codec_backend=python_codec_backend,
         ),
     )
     try:
@@ -72,8 +75,10 @@ def check_conformance(
     scenario_names: tuple[str, ...],
     keep_workspace: bool,
     swift_runtime_profile: str = "modern",
+    python_codec_backend: str = "builtin",
 ) -> None:
     swift_runtime_profile = _effective_swift_runtime_profile(clients, swift_runtime_profile)
+    python_codec_backend = _effective_python_codec_backend(servers, clients, python_codec_backend)
     for item in servers:
         manifest.require_enabled_server(item)
     selected_scenarios = scenarios.filter_scenarios(scenario_names)
@@ -83,16 +88,22 @@ def check_conformance(
         lambda: workspace.prepare_generated_workspace(
             repo_root,
             swift_runtime_profile=swift_runtime_profile,
+            python_codec_backend=python_codec_backend,
         ),
     )
     try:
-        if swift_runtime_profile == "modern":
-            reporter.run_stage("check snapshot drift", lambda: workspace.validate_snapshot(repo_root, conf_workspace))
-        else:
+        if swift_runtime_profile != "modern":
             reporter.print_skipped(
                 "check snapshot drift",
                 "swift runtime profile override uses a temporary generated package",
             )
+        elif python_codec_backend != "builtin":
+            reporter.print_skipped(
+                "check snapshot drift",
+                "python codec backend override uses temporary generated packages",
+            )
+        else:
+            reporter.run_stage("check snapshot drift", lambda: workspace.validate_snapshot(repo_root, conf_workspace))
         reporter.run_stage("compile generated examples", lambda: workspace.compile_workspace(conf_workspace))
         _run_against_workspace(
             conf_workspace,
@@ -127,13 +138,15 @@ def refresh_and_check(
     clients: tuple[str, ...],
     scenario_names: tuple[str, ...],
     swift_runtime_profile: str = "modern",
+    python_codec_backend: str = "builtin",
 ) -> None:
     swift_runtime_profile = _effective_swift_runtime_profile(clients, swift_runtime_profile)
+    python_codec_backend = _effective_python_codec_backend(servers, clients, python_codec_backend)
     for item in servers:
         manifest.require_enabled_server(item)
     selected_scenarios = scenarios.filter_scenarios(scenario_names)
     tools.ensure_tools_for_targets(servers, clients)
-    if swift_runtime_profile == "modern":
+    if swift_runtime_profile == "modern" and python_codec_backend == "builtin":
         conf_workspace = reporter.run_stage("refresh examples", lambda: workspace.refresh_repo_workspace(repo_root))
         reporter.run_stage("compile generated examples", lambda: workspace.compile_workspace(conf_workspace))
         _run_against_workspace(
@@ -149,6 +162,7 @@ def refresh_and_check(
         lambda: workspace.prepare_generated_workspace(
             repo_root,
             swift_runtime_profile=swift_runtime_profile,
+            python_codec_backend=python_codec_backend,
         ),
     )
     try:
@@ -250,6 +264,17 @@ def _effective_swift_runtime_profile(clients: tuple[str, ...], swift_runtime_pro
     return swift_runtime_profile
 
 
+def _effective_python_codec_backend(
+    servers: tuple[str, ...],
+    clients: tuple[str, ...],
+    python_codec_backend: str,
+) -> str:
+    python_codec_backend = example_validation.validate_python_codec_backend(python_codec_backend)
+    if "python" not in servers and "python" not in clients:
+        return "builtin"
+    return python_codec_backend
+
+
 def _server_scenario_groups(
     selected_scenarios: tuple[scenarios.Scenario, ...],
 ) -> tuple[tuple[str, dict[str, str], tuple[scenarios.Scenario, ...]], ...]:
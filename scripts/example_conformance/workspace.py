@@ -16,8 +16,14 @@ class ConformanceWorkspace:
         return self.blueprint.root
 
 
-def prepare_generated_workspace(repo_root: Path, *, swift_runtime_profile: str = "modern") -> ConformanceWorkspace:
+def prepare_generated_workspace(
+    repo_root: Path,
+    *,
+    swift_runtime_profile: str = "modern",
+    python_codec_backend: str = "builtin",
+) -> ConformanceWorkspace:
     swift_runtime_profile = example_validation.validate_swift_runtime_profile(swift_runtime_profile)
+    python_codec_backend = example_validation.validate_python_codec_backend(python_codec_backend)
     workspace = example_validation.prepare_blueprint_workspace(repo_root)
     if swift_runtime_profile != "modern":
         example_validation.write_swift_client_config_override(
@@ -25,6 +31,12 @@ def prepare_generated_workspace(repo_root: Path, *, swift_runtime_profile: str =
             workspace.config_path,
             runtime_profile=swift_runtime_profile,
         )
+    if python_codec_backend != "builtin":
+        example_validation.write_python_codec_backend_override(
+            workspace.config_path,
+            workspace.config_path,
+            codec_backend=python_codec_backend,
+        )
     example_validation.regenerate_blueprint_examples(workspace)
     return ConformanceWorkspace(workspace, temporary=True)
 
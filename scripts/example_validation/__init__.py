@@ -34,6 +34,11 @@ from .models import (
     GrpcExampleWorkspace,
     WailsHelloExampleWorkspace,
 )
+from .python_codec import (
+    PYTHON_CODEC_BACKENDS,
+    validate_python_codec_backend,
+    write_python_codec_backend_override,
+)
 from .runner import (
     compile_blueprint_target_examples,
     compile_blueprint_go_server_examples,
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import tomllib
+from pathlib import Path
+from typing import Any
+
+from api_blueprint.writer.python.writer import CODEC_BACKENDS
+
+from .models import ExampleValidationError
+
+PYTHON_CODEC_BACKENDS = CODEC_BACKENDS
+PYTHON_TARGET_TABLES = ("[[python.server]]", "[[python.client]]")
+
+
+def validate_python_codec_backend(codec_backend: str) -> str:
+    if codec_backend not in PYTHON_CODEC_BACKENDS:
+        raise ValueError(
+            "python codec backend must be one of: " + ", ".join(PYTHON_CODEC_BACKENDS)
+        )
+    return codec_backend
+
+
+def write_python_codec_backend_override(
+    source_config: Path,
+    output_config: Path,
+    *,
+    codec_backend: str,
+) -> None:
+    codec_backend = validate_python_codec_backend(codec_backend)
+    lines = source_config.read_text(encoding="utf-8").splitlines()
+    rendered: list[str] = []
+    in_python_block = False
+    saw_python_block = False
+    saw_options = False
+
+    def emit_missing_options() -> None:
+        nonlocal saw_options
+        if not saw_options:
+            rendered.append(f"options = {_toml_inline_table({'codec_backend': codec_backend})}")
+        saw_options = False
+
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("[[") and stripped.endswith("]]"):
+            if in_python_block:
+                emit_missing_options()
+            in_python_block = stripped in PYTHON_TARGET_TABLES
+            saw_python_block = saw_python_block or in_python_block
+            rendered.append(line)
+            continue
+        if in_python_block and "=" in stripped and stripped.split("=", 1)[0].strip() == "options":
+            options = dict(tomllib.loads(stripped)["options"])
+            options["codec_backend"] = codec_backend
+            rendered.append(f"options = {_toml_inline_table(options)}")
+            saw_options = True
+            continue
+        rendered.append(line)
+
+    if in_python_block:
+        emit_missing_options()
+    if not saw_python_block:
+        raise ExampleValidationError(f"missing [[python.server]] / [[python.client]] tables in {source_config}")
+    output_config.write_text("\n".join(rendered) + "\n", encoding="utf-8")
+
+
+def _toml_inline_table(values: dict[str, Any]) -> str:
+    return "{ " + ", ".join(f"{key} = {_toml_value(value)}" for key, value in values.items()) + " }"
+
+
+def _toml_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    raise ExampleValidationError(f"unsupported python target option value: {value!r}")
@@ -1,15 +1,20 @@
-from api_blueprint.application.docs import run_docs_server
+from api_blueprint.application.docs import export_docs, run_docs_server
 from api_blueprint.application.entrypoints import import_path_scope, load_entrypoints
+from api_blueprint.application.mock import MockOptions, build_mock_app, run_mock_server
 from api_blueprint.application.project import LoadedProject, build_entrypoints, load_project, require_blueprint_config
 from . import generator
 
 __all__ = (
     "LoadedProject",
+    "MockOptions",
     "build_entrypoints",
+    "build_mock_app",
+    "export_docs",
     "generator",
     "import_path_scope",
     "load_entrypoints",
     "load_project",
     "require_blueprint_config",
     "run_docs_server",
+    "run_mock_server",
 )
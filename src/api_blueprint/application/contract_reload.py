@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import sysconfig
+import threading
+import time
+import types
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import click
+from fastapi import FastAPI
+
+from api_blueprint.engine import Blueprint
+from api_blueprint.engine.runtime import replace_shared_app
+from api_blueprint.engine.runtime.docs import swap_blueprint_docs
+
+from .entrypoints import import_entrypoint, import_path_scope
+from .project import build_entrypoints
+
+_LIBRARY_ROOTS = tuple(
+    Path(path).resolve()
+    for key in ("stdlib", "platstdlib", "purelib", "platlib")
+    if (path := sysconfig.get_paths().get(key))
+)
+
+
+@dataclass
+class _EntrypointWatch:
+    blueprints: list[Blueprint]
+    files: dict[Path, int] = field(default_factory=dict)
+
+
+class ContractReloader:
+    """Hot-swap docs contracts when entrypoint sources change.
+
+    Pass `record` as the `on_import` hook of the initial entrypoint load. Only
+    specs whose own modules or binary schema files changed are re-imported; the
+    fresh blueprints are built on a staging app and swapped into the live apps.
+
+    The watcher thread only checks mtimes. Imports and swaps run on the event
+    loop serving the live app, so they never interleave with request handling.
+    """
+
+    def __init__(self, relative_path: Path | None = None, *, interval: float = 0.5) -> None:
+        self.relative_path = relative_path
+        self.interval = interval
+        self._watches: dict[str, _EntrypointWatch] = {}
+        self._live_apps: dict[str, FastAPI] = {}
+        self._loops: dict[FastAPI, asyncio.AbstractEventLoop] = {}
+        self._attached: set[FastAPI] = set()
+        self._reloading = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def record(self, spec: str, blueprints: list[Blueprint], modules: tuple[types.ModuleType, ...]) -> None:
+        self._watches[spec] = _EntrypointWatch(blueprints=blueprints, files=_snapshot(_watched_files(blueprints, modules)))
+        if not self._reloading:
+            for blueprint in blueprints:
+                self._live_apps.setdefault(blueprint.name, blueprint.app)
+                self._attach(blueprint.app)
+
+    def changed_specs(self) -> list[str]:
+        return [
+            spec
+            for spec, watch in self._watches.items()
+            if any(_mtime(path) != mtime for path, mtime in watch.files.items())
+        ]
+
+    def poll(self) -> list[str]:
+        with self._lock:
+            specs = self.changed_specs()
+            if not specs:
+                return []
+            started = time.perf_counter()
+            try:
+                self.reload(specs)
+            except Exception as exc:
+                for spec in specs:
+                    watch = self._watches[spec]
+                    watch.files = _snapshot(watch.files)
+                click.echo(f"[api-doc-server] 契约热更新失败，继续使用旧文档: {exc}", err=True)
+                return []
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            click.echo(f"[api-doc-server] contract reloaded: {', '.join(specs)} ({elapsed_ms:.0f}ms)")
+            return specs
+
+    def reload(self, specs: list[str]) -> None:
+        previous = {spec: self._watches[spec] for spec in specs}
+        fresh: dict[str, list[Blueprint]] = {}
+        self._reloading = True
+        shared_app = replace_shared_app(None)
+        try:
+            with import_path_scope(Path.cwd(), self.relative_path):
+                for spec in specs:
+                    fresh[spec] = import_entrypoint(spec, on_import=self.record)
+        except Exception:
+            self._watches.update(previous)
+            raise
+        finally:
+            replace_shared_app(shared_app)
+            self._reloading = False
+
+        removed: dict[FastAPI, list[str]] = defaultdict(list)
+        sources: dict[FastAPI, list[tuple[FastAPI, str]]] = defaultdict(list)
+        for spec in specs:
+            old_blueprints = {blueprint.name: blueprint for blueprint in previous[spec].blueprints}
+            fallback_app = next((self._live_apps[name] for name in old_blueprints), None)
+            for name in old_blueprints:
+                removed[self._live_apps[name]].append(name)
+            for blueprint in fresh[spec]:
+                old = old_blueprints.get(blueprint.name)
+                if old is not None and old.upstream is not None:
+                    blueprint.upstream = old.upstream
+                    blueprint.upstream_client = old.upstream_client
+                live_app = self._live_apps.get(blueprint.name) or fallback_app or blueprint.app
+                self._live_apps[blueprint.name] = live_app
+                sources[live_app].append((blueprint.app, blueprint.name))
+
+        build_entrypoints([blueprint for blueprints in fresh.values() for blueprint in blueprints])
+        for live_app in removed.keys() | sources.keys():
+            self._call_on_loop(
+                self._loops.get(live_app),
+                lambda app=live_app: swap_blueprint_docs(app, removed=removed[app], sources=sources[app]),
+            )
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="api-blueprint-contract-reload", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            if not self.changed_specs():
+                continue
+            loop = next(iter(self._loops.values()), None)
+            if loop is None:
+                # Servers are not up yet; keep the change pending until one is.
+                continue
+            self._call_on_loop(loop, self.poll)
+
+    def _attach(self, app: FastAPI) -> None:
+        if app in self._attached:
+            return
+        self._attached.add(app)
+
+        async def bind_loop() -> None:
+            self._loops[app] = asyncio.get_running_loop()
+
+        async def unbind_loop() -> None:
+            self._loops.pop(app, None)
+
+        app.router.on_startup.append(bind_loop)
+        app.router.on_shutdown.append(unbind_loop)
+
+    @staticmethod
+    def _call_on_loop(loop: asyncio.AbstractEventLoop | None, fn: Callable[[], Any]) -> Any:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is None or loop is running or loop.is_closed():
+            return fn()
+
+        async def call() -> Any:
+            return fn()
+
+        return asyncio.run_coroutine_threadsafe(call(), loop).result()
+
+
+def _watched_files(blueprints: list[Blueprint], modules: tuple[types.ModuleType, ...]) -> list[Path]:
+    files: list[Path] = []
+    for module in modules:
+        module_file = getattr(module, "__file__", None)
+        if not module_file:
+            continue
+        path = Path(module_file).resolve()
+        if path.suffix == ".py" and not any(path.is_relative_to(root) for root in _LIBRARY_ROOTS):
+            files.append(path)
+    for blueprint in blueprints:
+        for _group, router in blueprint.iter_router():
+            for schema in (router.req_binary_schema, router.rsp_binary_schema):
+                if schema is not None and schema.source_path.is_file():
+                    files.append(schema.source_path)
+    return files
+
+
+def _snapshot(paths: Iterable[Path]) -> dict[Path, int]:
+    return {path: _mtime(path) for path in paths}
+
+
+def _mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import re
 import time
 from concurrent.futures.thread import ThreadPoolExecutor
+from pathlib import Path
 
 import click
 import uvicorn
@@ -9,23 +11,27 @@ from fastapi import FastAPI
 
 from api_blueprint import hub
 from api_blueprint.config import Config
-from api_blueprint.engine import Blueprint
+from api_blueprint.engine import Blueprint, UpstreamClientOptions
 from api_blueprint.engine.runtime.docs import (
     configure_protocol_docs_plugins,
     docs_home_path,
     docs_route_count,
     ensure_docs_gzip,
 )
+from api_blueprint.engine.runtime.docs_export import DocsExportResult, export_static_docs
 
 
-def _docs_upstream(conf: Config) -> str | None:
-    # `api-doc-server` no longer has a vnext config source for an upstream URL.
+def _docs_upstream(conf: Config) -> tuple[str, UpstreamClientOptions | None] | None:
+    upstream = conf.blueprint.upstream if conf.blueprint is not None else None
+    if upstream is not None:
+        return upstream.url, UpstreamClientOptions(**upstream.model_dump(exclude={"url"}))
     # Keep a defensive legacy fallback so the command does not crash if an
     # out-of-tree caller still passes an object exposing `golang.upstream`.
     legacy_golang = getattr(conf, "golang", None)
-    if legacy_golang is None:
+    legacy_upstream = getattr(legacy_golang, "upstream", None) if legacy_golang is not None else None
+    if legacy_upstream is None:
         return None
-    return getattr(legacy_golang, "upstream", None)
+    return legacy_upstream, None
 
 
 def _docs_display_host(conf: Config, host: str) -> str:
@@ -58,8 +64,9 @@ def _serve_uvicorn(app: FastAPI | str, host: str, port: int, url: str, label: st
 def run_docs_server(conf: Config, entrypoints: list[Blueprint]) -> None:
     upstream = _docs_upstream(conf)
     if upstream is not None:
+        upstream_url, upstream_options = upstream
         for entrypoint in entrypoints:
-            entrypoint.set_upstream(upstream)
+            entrypoint.set_upstream(upstream_url, upstream_options)
 
     if conf.blueprint is None:
         raise ValueError("[apidoc_server] 配置中未找到blueprint段落")
@@ -124,3 +131,30 @@ def run_docs_server(conf: Config, entrypoints: list[Blueprint]) -> None:
         _join_http_url(display_host, "{port}", _app_docs_path(apps[0])),
         "Docs",
     )
+
+
+def export_docs(conf: Config, entrypoints: list[Blueprint], out_dir: str | Path) -> list[DocsExportResult]:
+    if conf.blueprint is None:
+        raise ValueError("[docs_export] 配置中未找到blueprint段落")
+
+    apps = list(dict.fromkeys(bp.app for bp in entrypoints))
+    protocol_docs_plugins = tuple(conf.blueprint.protocol_docs_plugins)
+    out = Path(out_dir)
+    results: list[DocsExportResult] = []
+    used: set[str] = set()
+    for app in apps:
+        configure_protocol_docs_plugins(app, protocol_docs_plugins)
+        app_dir = out if len(apps) == 1 else out / _export_app_dir(app, used)
+        results.append(export_static_docs(app, app_dir))
+    return results
+
+
+def _export_app_dir(app: FastAPI, used: set[str]) -> str:
+    base = re.sub(r"[^A-Za-z0-9]+", "-", app.title or "").strip("-").lower() or "app"
+    name = base
+    index = 2
+    while name in used:
+        name = f"{base}-{index}"
+        index += 1
+    used.add(name)
+    return name
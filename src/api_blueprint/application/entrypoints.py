@@ -5,7 +5,7 @@ import sys
 import types
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 
 from api_blueprint.engine import Blueprint
 from api_blueprint.engine.runtime import reset_response_envelope_cache, reset_shared_app
@@ -30,7 +30,15 @@ def import_path_scope(*paths: Path | str | None) -> Generator[None, None, None]:
                 sys.path.remove(path)
 
 
-def load_entrypoints(specs: list[str] | None, relative_path: Path | None = None) -> list[Blueprint]:
+EntrypointImportHook = Callable[[str, list[Blueprint], tuple[types.ModuleType, ...]], None]
+
+
+def load_entrypoints(
+    specs: list[str] | None,
+    relative_path: Path | None = None,
+    *,
+    on_import: EntrypointImportHook | None = None,
+) -> list[Blueprint]:
     if not specs:
         return []
 
@@ -41,29 +49,36 @@ def load_entrypoints(specs: list[str] | None, relative_path: Path | None = None)
     entrypoints: list[Blueprint] = []
     with import_path_scope(Path.cwd(), relative_path):
         for spec in specs:
-            if ":" not in spec:
-                raise Exception(f"Invalid entrypoint spec: {spec!r}, 必须形如 'module.path:attribute'")
-            module_path, attr_name = spec.split(":", 1)
-            try:
-                importlib.invalidate_caches()
-                unload_module_tree(module_path)
-                module: types.ModuleType = importlib.import_module(module_path)
-            except ImportError as exc:
-                raise Exception(f"无法导入模块 '{module_path}': {exc}") from exc
-
-            if attr_name == "*":
-                for value in module.__dict__.values():
-                    if isinstance(value, Blueprint):
-                        entrypoints.append(value)
-                continue
-
-            if not hasattr(module, attr_name):
-                raise Exception(f"模块 '{module_path}' 中不存在属性 '{attr_name}'")
-            entrypoints.append(getattr(module, attr_name))
+            entrypoints.extend(import_entrypoint(spec, on_import=on_import))
 
     return entrypoints
 
 
+def import_entrypoint(spec: str, *, on_import: EntrypointImportHook | None = None) -> list[Blueprint]:
+    if ":" not in spec:
+        raise Exception(f"Invalid entrypoint spec: {spec!r}, 必须形如 'module.path:attribute'")
+    module_path, attr_name = spec.split(":", 1)
+    try:
+        importlib.invalidate_caches()
+        unload_module_tree(module_path)
+        loaded_before = set(sys.modules)
+        module: types.ModuleType = importlib.import_module(module_path)
+    except ImportError as exc:
+        raise Exception(f"无法导入模块 '{module_path}': {exc}") from exc
+
+    if attr_name == "*":
+        blueprints = [value for value in module.__dict__.values() if isinstance(value, Blueprint)]
+    elif not hasattr(module, attr_name):
+        raise Exception(f"模块 '{module_path}' 中不存在属性 '{attr_name}'")
+    else:
+        blueprints = [getattr(module, attr_name)]
+
+    if on_import is not None:
+        imported = tuple(sys.modules[name] for name in sys.modules.keys() - loaded_before)
+        on_import(spec, blueprints, imported)
+    return blueprints
+
+
 def unload_module_tree(module_path: str) -> None:
     root = module_path.split(".", 1)[0]
     for name in list(sys.modules):
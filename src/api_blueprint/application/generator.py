@@ -52,8 +52,8 @@ EXPLAIN_TARGET_KIND_FIELDS: dict[str, tuple[str, ...]] = {
     "java-client": ("package", "base_url", "base_url_expr", "include", "exclude"),
     "flutter-client": ("package", "base_url", "base_url_expr", "include", "exclude"),
     "swift-client": ("package", "module", "base_url", "base_url_expr", "runtime_profile", "include", "exclude"),
-    "python-server": ("python_package_root", "include", "exclude"),
-    "python-client": ("python_package_root", "base_url", "base_url_expr", "include", "exclude"),
+    "python-server": ("python_package_root", "include", "exclude", "options"),
+    "python-client": ("python_package_root", "base_url", "base_url_expr", "include", "exclude", "options"),
     "http-transport": ("server", "clients"),
     "wails-transport": ("version", "overlay_name", "frontend_mode", "server", "clients", "include", "exclude"),
     "grpc-proto": ("package", "go_package_prefix", "proto_files"),
@@ -316,6 +316,7 @@ def generate(config_path: str | Path | None, target_ids: Sequence[str] = ()) ->
                 include=target.include,
                 exclude=target.exclude,
                 contract_graph=graph,
+                **target.options,
             )
             writer.register(*project.entrypoints)
             writer.gen()
@@ -328,6 +329,7 @@ def generate(config_path: str | Path | None, target_ids: Sequence[str] = ()) ->
                 include=target.include,
                 exclude=target.exclude,
                 contract_graph=graph,
+                **target.options,
             )
             writer.register(*project.entrypoints)
             writer.gen()
@@ -0,0 +1,462 @@
+from __future__ import annotations
+
+import ast
+import asyncio
+import json
+import operator
+import random
+import struct
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+from xml.etree import ElementTree
+
+import click
+import uvicorn
+from starlette.applications import Starlette
+from starlette.routing import BaseRoute, Route, WebSocketRoute
+from starlette.types import Message, Receive, Scope, Send
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from api_blueprint.contract import ContractGraph
+from api_blueprint.engine.binary_schema import INTEGER_FIELD_BITS, BinaryField, BinarySchema
+
+_MOCK_BYTES = b"api-blueprint mock payload\n"
+_MAX_EXAMPLE_DEPTH = 4
+_SCALAR_EXAMPLES: dict[str, Any] = {
+    "string": "string",
+    "boolean": True,
+    "int": 0,
+    "int64": 0,
+    "uint": 0,
+    "uint64": 0,
+    "float": 0.0,
+    "float32": 0.0,
+    "float64": 0.0,
+}
+_FLOAT_FORMATS = {"f32": "f", "f64": "d"}
+_BYTE_FIELD_TYPES = frozenset({"bytes", "string", "padding", "reserved"})
+_EXPR_OPERATORS: dict[type[ast.operator], Any] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.floordiv,
+}
+
+
+@dataclass(frozen=True)
+class MockOptions:
+    latency_ms: float = 0.0
+    error_rate: float = 0.0
+    seed: int | None = None
+
+
+@dataclass(frozen=True)
+class MockResponse:
+    status: int
+    headers: tuple[tuple[bytes, bytes], ...]
+    body: bytes
+
+    @classmethod
+    def build(cls, body: bytes, media_type: str, *, status: int = 200, headers: Mapping[str, str] | None = None) -> MockResponse:
+        raw = [(b"content-type", media_type.encode("latin-1")), (b"content-length", str(len(body)).encode("latin-1"))]
+        raw.extend((key.lower().encode("latin-1"), value.encode("utf-8")) for key, value in (headers or {}).items())
+        return cls(status=status, headers=tuple(raw), body=body)
+
+
+class _MockEndpoint:
+    """Raw ASGI endpoint replaying pre-serialized responses for one route."""
+
+    def __init__(self, success: MockResponse, errors: tuple[MockResponse, ...], options: MockOptions, rng: random.Random) -> None:
+        self.success = success
+        self.errors = errors
+        self.options = options
+        self.rng = rng
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await _drain_body(receive)
+        if self.options.latency_ms > 0:
+            await asyncio.sleep(self.options.latency_ms / 1000)
+        response = self.success
+        if self.errors and self.options.error_rate > 0 and self.rng.random() < self.options.error_rate:
+            response = self.rng.choice(self.errors)
+        await send({"type": "http.response.start", "status": response.status, "headers": response.headers})
+        await send({"type": "http.response.body", "body": response.body})
+
+
+class _SseReplay:
+    def __init__(self, frames: tuple[bytes, ...], options: MockOptions) -> None:
+        self.frames = frames
+        self.options = options
+        self.headers = (
+            (b"content-type", b"text/event-stream"),
+            (b"cache-control", b"no-cache"),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await _drain_body(receive)
+        await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+        for frame in self.frames:
+            if self.options.latency_ms > 0:
+                await asyncio.sleep(self.options.latency_ms / 1000)
+            await send({"type": "http.response.body", "body": frame, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+
+class _WebSocketReplay:
+    def __init__(self, frames: tuple[str, ...], options: MockOptions) -> None:
+        self.frames = frames
+        self.options = options
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        websocket = WebSocket(scope, receive, send)
+        await websocket.accept()
+        try:
+            await self._replay(websocket)
+            while True:
+                await websocket.receive_text()
+                await self._replay(websocket)
+        except WebSocketDisconnect:
+            return
+
+    async def _replay(self, websocket: WebSocket) -> None:
+        for frame in self.frames:
+            if self.options.latency_ms > 0:
+                await asyncio.sleep(self.options.latency_ms / 1000)
+            await websocket.send_text(frame)
+
+
+def build_mock_app(graph: ContractGraph, options: MockOptions | None = None) -> Starlette:
+    """Serve every ContractGraph route from examples derived from its schemas.
+
+    All payloads are rendered and serialized once at startup, so a request only
+    writes precomputed bytes; latency and error injection are opt-in.
+    """
+    options = options or MockOptions()
+    rng = random.Random(options.seed)
+    examples = _ExampleBuilder(graph.schemas)
+    routes: list[BaseRoute] = []
+    for route in graph.routes:
+        connection = route.get("connection")
+        if route.get("kind") == "stream" and connection:
+            routes.append(Route(route["url"], _SseReplay(_sse_frames(connection, examples), options), methods=["GET"]))
+            continue
+        if route.get("kind") == "channel" and connection:
+            routes.append(WebSocketRoute(route["url"], _WebSocketReplay(_websocket_frames(connection, examples), options)))
+            continue
+        runtime = graph.route_runtime.get(route["id"])
+        envelope = runtime.response_envelope.envelope_spec() if runtime is not None else {"kind": "none"}
+        binary_schema = runtime.response_binary_schema if runtime is not None else None
+        endpoint = _MockEndpoint(
+            _success_response(route, envelope, examples, binary_schema, runtime.response_filename if runtime else None),
+            tuple(_error_response(envelope, error) for error in route.get("errors") or ()),
+            options,
+            rng,
+        )
+        routes.append(Route(route["url"], endpoint, methods=list(route.get("methods") or ["GET"])))
+    return Starlette(routes=routes)
+
+
+def run_mock_server(graph: ContractGraph, host: str, port: int, options: MockOptions | None = None) -> None:
+    app = build_mock_app(graph, options)
+    uvicorn_config = uvicorn.Config(app, host=host, port=port)
+    socket = uvicorn_config.bind_socket()
+    click.echo(f"[api-gen mock] {len(app.routes)} route(s): http://{host}:{socket.getsockname()[1]}")
+    uvicorn.Server(uvicorn_config).run(sockets=[socket])
+
+
+class _ExampleBuilder:
+    def __init__(self, schemas: Mapping[str, Mapping[str, Any]]) -> None:
+        self.schemas = schemas
+        self._cache: dict[str, Any] = {}
+
+    def model(self, name: str | None, depth: int = 0) -> Any:
+        if not name:
+            return None
+        if name in self._cache:
+            return self._cache[name]
+        schema = self.schemas.get(name)
+        if schema is None or depth > _MAX_EXAMPLE_DEPTH:
+            return None
+        if schema.get("type") == "object":
+            value: Any = {
+                str(field.get("wire_name") or key): self.field(field, depth + 1)
+                for key, field in (schema.get("fields") or {}).items()
+            }
+        else:
+            value = self.field(schema, depth + 1)
+        if depth == 0:
+            self._cache[name] = value
+        return value
+
+    def field(self, field: Mapping[str, Any], depth: int) -> Any:
+        kind = field.get("type")
+        if kind in _SCALAR_EXAMPLES:
+            return _SCALAR_EXAMPLES[kind]
+        if kind == "enum":
+            values = field.get("values") or [None]
+            return values[0]
+        if kind == "object":
+            return self.model(field.get("ref"), depth) or {}
+        if kind == "array":
+            items = field.get("items")
+            return [self.field(items, depth + 1)] if isinstance(items, Mapping) and depth <= _MAX_EXAMPLE_DEPTH else []
+        if kind == "map":
+            keys = field.get("keys") or {}
+            values = field.get("values")
+            if not isinstance(values, Mapping) or depth > _MAX_EXAMPLE_DEPTH:
+                return {}
+            return {str(self.field(keys, depth + 1)): self.field(values, depth + 1)}
+        if kind == "one_of":
+            variants = field.get("variants") or [{}]
+            return self.field(variants[0], depth)
+        if kind == "coerce_string":
+            return self.field(field.get("canonical") or {"type": "string"}, depth)
+        return None
+
+
+def _success_response(
+    route: Mapping[str, Any],
+    envelope: Mapping[str, Any],
+    examples: _ExampleBuilder,
+    binary_schema: BinarySchema | None,
+    filename: str | None,
+) -> MockResponse:
+    response = route.get("response") or {}
+    kind = response.get("kind") or "json"
+    media_type = str(response.get("media_type") or "application/json")
+    if binary_schema is not None:
+        return MockResponse.build(encode_binary_example(binary_schema), binary_schema.content_type or media_type)
+    if kind in {"bytes", "byte_stream"}:
+        return MockResponse.build(_MOCK_BYTES, media_type)
+    if kind == "file":
+        name = filename or response.get("default_filename") or "download"
+        return MockResponse.build(
+            _MOCK_BYTES,
+            media_type,
+            headers={"content-disposition": f'attachment; filename="{name}"'},
+        )
+    payload = _wrap_success(envelope, examples.model(response.get("model")))
+    if kind == "xml":
+        return MockResponse.build(_xml_bytes(payload, str(envelope.get("name") or "response")), media_type)
+    return MockResponse.build(_json_bytes(payload), "application/json")
+
+
+def _error_response(envelope: Mapping[str, Any], error: Mapping[str, Any]) -> MockResponse:
+    toast = error.get("toast") or {}
+    payload = {
+        "id": error.get("id", ""),
+        "group": error.get("group", ""),
+        "key": error.get("key", ""),
+        "code": error.get("code", 0),
+        "message": error.get("message", ""),
+        "toast": {
+            "key": toast.get("key", ""),
+            "level": toast.get("level", "error"),
+            "default": toast.get("default", ""),
+            "text": "",
+        },
+    }
+    kind = envelope.get("kind") or "none"
+    fields = envelope.get("fields") or {}
+    if kind == "code_message_data":
+        body = {
+            fields.get("code", "code"): payload["code"],
+            fields.get("message", "message"): payload["message"],
+            fields.get("data", "data"): None,
+        }
+        if envelope.get("error_identity") != "none":
+            body[fields.get("error", "error")] = payload
+        return MockResponse.build(_json_bytes(body), "application/json")
+    if kind == "ok_data_error":
+        return MockResponse.build(
+            _json_bytes({fields.get("ok", "ok"): False, fields.get("error", "error"): payload}),
+            "application/json",
+        )
+    return MockResponse.build(_json_bytes(payload), "application/json", status=500)
+
+
+def _wrap_success(envelope: Mapping[str, Any], data: Any) -> Any:
+    kind = envelope.get("kind") or "none"
+    fields = envelope.get("fields") or {}
+    if kind == "code_message_data":
+        return {
+            fields.get("code", "code"): envelope.get("success_code", 0),
+            fields.get("message", "message"): envelope.get("success_message", "ok"),
+            fields.get("data", "data"): data,
+        }
+    if kind == "ok_data_error":
+        return {fields.get("ok", "ok"): True, fields.get("data", "data"): data}
+    return data
+
+
+def _message_examples(message: Mapping[str, Any] | None, examples: _ExampleBuilder) -> list[Any]:
+    if not message:
+        return []
+    result: list[Any] = []
+    for variant in message.get("variants") or ():
+        metadata = variant.get("metadata") or {}
+        data = metadata["example"] if "example" in metadata else examples.model(variant.get("model"))
+        result.append({"type": variant["key"], "data": data} if variant.get("key") else data)
+    return result
+
+
+def _close_example(connection: Mapping[str, Any], examples: _ExampleBuilder) -> Any:
+    return examples.model(connection.get("close_model")) or {"code": 1000, "reason": ""}
+
+
+def _sse_frames(connection: Mapping[str, Any], examples: _ExampleBuilder) -> tuple[bytes, ...]:
+    frames = [b"data: " + _json_bytes(message) + b"\n\n" for message in _message_examples(connection.get("server_message"), examples)]
+    frames.append(b"event: close\ndata: " + _json_bytes(_close_example(connection, examples)) + b"\n\n")
+    return tuple(frames)
+
+
+def _websocket_frames(connection: Mapping[str, Any], examples: _ExampleBuilder) -> tuple[str, ...]:
+    return tuple(
+        _json_bytes({"type": "message", "data": message}).decode("utf-8")
+        for message in _message_examples(connection.get("server_message"), examples)
+    )
+
+
+def encode_binary_example(schema: BinarySchema) -> bytes:
+    """Encode the smallest packet that satisfies the schema's rules."""
+    encoder = _BinaryExampleEncoder(schema)
+    fields = [field for section in schema.sections for field in section.fields]
+    return encoder.encode_object(fields)
+
+
+class _BinaryExampleEncoder:
+    def __init__(self, schema: BinarySchema) -> None:
+        self.schema = schema
+        self.order = "<" if schema.endian == "little" else ">"
+        self.byteorder: Any = "little" if schema.endian == "little" else "big"
+
+    def encode_object(self, fields: Iterable[BinaryField]) -> bytes:
+        fields = tuple(fields)
+        values = self._values(fields)
+        chunks: list[bytes] = []
+        for field in fields:
+            count = self._count(field, values)
+            if field.type in _BYTE_FIELD_TYPES:
+                chunks.append(_byte_example(field, count))
+            elif field.type in self.schema.structs:
+                struct_fields = self.schema.structs[field.type].fields
+                chunks.extend(self.encode_object(struct_fields) for _ in range(count))
+            else:
+                chunks.extend(self._scalar(field.type, values[field.name]) for _ in range(count))
+        return b"".join(chunks)
+
+    def _values(self, fields: tuple[BinaryField, ...]) -> dict[str, int | float]:
+        values: dict[str, int | float] = {}
+        for field in fields:
+            if "assert" in field.rule or field.type in self.schema.structs or field.type in _BYTE_FIELD_TYPES:
+                continue
+            if "const" in field.rule:
+                values[field.name] = self._const(field)
+            elif "sizeof" in field.rule:
+                values[field.name] = max(int(_evaluate(field.rule.get("min", "1"), values)), 1)
+            elif "min" in field.rule:
+                values[field.name] = _evaluate(field.rule["min"], values)
+            elif field.type in self.schema.enums:
+                values[field.name] = int(self.schema.enums[field.type].values[0].value, 0)
+            else:
+                values[field.name] = 0
+        for field in fields:
+            if "assert" in field.rule:
+                values[field.name] = _evaluate(field.rule["assert"], values)
+        return values
+
+    def _const(self, field: BinaryField) -> int | float:
+        raw = field.rule["const"]
+        value_set = self.schema.enums.get(field.type)
+        if value_set is not None:
+            for value in value_set.values:
+                if value.name == raw:
+                    return int(value.value, 0)
+        return _number(raw)
+
+    def _count(self, field: BinaryField, values: Mapping[str, int | float]) -> int:
+        if not field.is_array:
+            return 1
+        if field.count.isdigit():
+            return int(field.count)
+        return int(_evaluate(field.count, values))
+
+    def _scalar(self, kind: str, value: int | float) -> bytes:
+        if kind in _FLOAT_FORMATS:
+            return struct.pack(self.order + _FLOAT_FORMATS[kind], float(value))
+        if kind == "bool":
+            return b"\x01" if value else b"\x00"
+        value_set = self.schema.enums.get(kind) or self.schema.bitflags.get(kind)
+        base = value_set.base_type if value_set is not None else kind
+        width = INTEGER_FIELD_BITS[base] // 8
+        return int(value).to_bytes(width, self.byteorder, signed=base.startswith("i"))
+
+
+def _byte_example(field: BinaryField, count: int) -> bytes:
+    if "const" in field.rule:
+        return field.rule["const"].encode("utf-8")[:count].ljust(count, b"\x00")
+    if field.type == "string":
+        return b"a" * count
+    return b"\x00" * count
+
+
+def _number(value: str) -> int | float:
+    try:
+        return int(value, 0)
+    except ValueError:
+        return float(value)
+
+
+def _evaluate(expr: str, values: Mapping[str, int | float]) -> int | float:
+    """Evaluate a rule expression: names, numbers and + - * / ( ) only."""
+    try:
+        tree = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise ValueError(f"invalid rule expression: {expr}") from exc
+    return _evaluate_node(tree.body, expr, values)
+
+
+def _evaluate_node(node: ast.expr, expr: str, values: Mapping[str, int | float]) -> int | float:
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id not in values:
+            raise ValueError(f"unknown name {node.id!r} in rule expression: {expr}")
+        return values[node.id]
+    if isinstance(node, ast.BinOp) and type(node.op) in _EXPR_OPERATORS:
+        left = _evaluate_node(node.left, expr, values)
+        right = _evaluate_node(node.right, expr, values)
+        return _EXPR_OPERATORS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = _evaluate_node(node.operand, expr, values)
+        return -value if isinstance(node.op, ast.USub) else value
+    raise ValueError(f"unsupported rule expression: {expr}")
+
+
+async def _drain_body(receive: Receive) -> None:
+    message: Message = {"more_body": True}
+    while message.get("more_body", False):
+        message = await receive()
+        if message["type"] != "http.request":
+            return
+
+
+def _json_bytes(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _xml_bytes(payload: Any, root: str) -> bytes:
+    element = ElementTree.Element(root)
+    _xml_fill(element, payload)
+    return ElementTree.tostring(element, encoding="utf-8", xml_declaration=True)
+
+
+def _xml_fill(element: ElementTree.Element, value: Any) -> None:
+    if isinstance(value, Mapping):
+        for key, item in value.items():
+            _xml_fill(ElementTree.SubElement(element, str(key)), item)
+    elif isinstance(value, list):
+        for item in value:
+            _xml_fill(ElementTree.SubElement(element, "item"), item)
+    elif value is not None:
+        element.text = json.dumps(value) if isinstance(value, bool) else str(value)
@@ -6,7 +6,7 @@ from pathlib import Path
 from api_blueprint.config import BlueprintConfig, Config, ResolvedConfig, resolve_config
 from api_blueprint.engine import Blueprint
 
-from .entrypoints import load_entrypoints
+from .entrypoints import EntrypointImportHook, load_entrypoints
 
 
 @dataclass(frozen=True)
@@ -22,10 +22,15 @@ def require_blueprint_config(config: Config, *, command: str) -> BlueprintConfig
     return config.blueprint
 
 
-def load_project(config_path: str | Path | None, *, command: str = "load_project") -> LoadedProject:
+def load_project(
+    config_path: str | Path | None,
+    *,
+    command: str = "load_project",
+    on_import: EntrypointImportHook | None = None,
+) -> LoadedProject:
     resolved = resolve_config(config_path)
     blueprint = require_blueprint_config(resolved.raw, command=command)
-    entrypoints = load_entrypoints(blueprint.entrypoints, resolved.entrypoint_root)
+    entrypoints = load_entrypoints(blueprint.entrypoints, resolved.entrypoint_root, on_import=on_import)
     return LoadedProject(
         config=resolved.raw,
         resolved=resolved,
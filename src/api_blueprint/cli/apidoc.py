@@ -1,5 +1,6 @@
 import click
 
+from api_blueprint.application.contract_reload import ContractReloader
 from api_blueprint.application.docs import run_docs_server as run_apidoc_server
 from api_blueprint.application.project import build_entrypoints, load_project
 from api_blueprint.cli.version import api_blueprint_version_option
@@ -8,9 +9,14 @@ from api_blueprint.cli.version import api_blueprint_version_option
 @click.command()
 @api_blueprint_version_option("api-doc-server")
 @click.option('-c', '--config', default='./api-blueprint.toml', help='配置文件')
-def apidoc_server(config: str = './api-blueprint.toml'):
-    project = load_project(config, command="apidoc_server")
+@click.option('--reload-contract', is_flag=True, help='监听 entrypoint 模块与 binary schema 文件变更，原地热更新文档')
+def apidoc_server(config: str = './api-blueprint.toml', reload_contract: bool = False):
+    reloader = ContractReloader() if reload_contract else None
+    project = load_project(config, command="apidoc_server", on_import=reloader.record if reloader else None)
     if not project.entrypoints:
         raise ModuleNotFoundError('[apidoc_server] 未指定蓝图entrypoints')
     build_entrypoints(project.entrypoints)
+    if reloader is not None:
+        reloader.relative_path = project.resolved.entrypoint_root
+        reloader.start()
     run_apidoc_server(project.config, project.entrypoints)
@@ -8,6 +8,9 @@ import click
 
 from api_blueprint.application import generator
 from api_blueprint.application import inspection
+from api_blueprint.application.docs import export_docs
+from api_blueprint.application.mock import MockOptions, run_mock_server
+from api_blueprint.application.project import build_entrypoints, load_project
 from api_blueprint.cli.version import api_blueprint_version_option
 
 
@@ -81,6 +84,45 @@ def generate(config: str = "./api-blueprint.toml", target_ids: tuple[str, ...] =
     click.echo(f"ok: generated {len(planned)} target(s)")
 
 
+@api_gen.group("docs")
+def docs_group() -> None:
+    """Export the api-blueprint docs center without a running docs server."""
+
+
+@docs_group.command("export")
+@click.option("-c", "--config", default="./api-blueprint.toml", help="配置文件")
+@click.option("--out", "out_dir", required=True, type=click.Path(path_type=Path), help="静态文档输出目录")
+def docs_export(config: str = "./api-blueprint.toml", out_dir: Path = Path("docs-site")) -> None:
+    def run() -> None:
+        project = load_project(config, command="docs_export")
+        if not project.entrypoints:
+            raise ValueError("[docs_export] 未指定蓝图entrypoints")
+        build_entrypoints(project.entrypoints)
+        for result in export_docs(project.config, project.entrypoints, out_dir):
+            click.echo(f"ok: exported {len(result.files)} file(s) to {result.out_dir.as_posix()}")
+
+    _generator_call(run)
+
+
+@api_gen.command("mock")
+@click.option("-c", "--config", default="./api-blueprint.toml", help="配置文件")
+@click.option("--host", default="127.0.0.1", show_default=True, help="监听地址")
+@click.option("--port", default=8000, show_default=True, type=int, help="监听端口")
+@click.option("--latency-ms", default=0.0, show_default=True, type=click.FloatRange(min=0), help="每个响应/消息注入的延迟(ms)")
+@click.option("--error-rate", default=0.0, show_default=True, type=click.FloatRange(0, 1), help="返回已声明错误的概率")
+@click.option("--seed", type=int, default=None, help="错误注入随机种子")
+def mock(
+    config: str = "./api-blueprint.toml",
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    latency_ms: float = 0.0,
+    error_rate: float = 0.0,
+    seed: int | None = None,
+) -> None:
+    options = MockOptions(latency_ms=latency_ms, error_rate=error_rate, seed=seed)
+    _generator_call(lambda: run_mock_server(generator.load_contract_graph(config, command="mock"), host, port, options))
+
+
 @api_gen.group("inspect")
 def inspect_group() -> None:
     """Query compact ContractGraph views before reading generated source."""
@@ -163,6 +163,20 @@ class GrpcProtoFileConfig(BaseModel):
     service: str | None = None
 
 
+class UpstreamConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    url: str
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    http2: bool = False
+    connect_timeout: float | None = 10.0
+    read_timeout: float | None = 10.0
+    write_timeout: float | None = 10.0
+    pool_timeout: float | None = 10.0
+
+
 class BlueprintConfig(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -170,6 +184,7 @@ class BlueprintConfig(BaseModel):
     docs_server: str | None = None
     docs_domain: str | None = None
     protocol_docs_plugins: list[str] = Field(default_factory=list)
+    upstream: UpstreamConfig | None = None
 
 
 class Config(BaseModel):
@@ -22,6 +22,7 @@ from api_blueprint.engine.runtime import (
     Req,
     ResponseEnvelope,
     Rsp,
+    UpstreamClientOptions,
     build_default_app,
     get_shared_app,
     reset_shared_app,
@@ -57,6 +58,7 @@ __all__ = (
     "RouterGroup",
     "Rsp",
     "Toast",
+    "UpstreamClientOptions",
     "build_default_app",
     "get_shared_app",
     "message_variant",
@@ -9,7 +9,14 @@ from api_blueprint.engine.blueprint.group import RouterGroup
 from api_blueprint.engine.blueprint.identity import blueprint_root_slug, normalize_blueprint_name
 from api_blueprint.engine.blueprint.router import Router
 from api_blueprint.engine.connection import ModelRef
-from api_blueprint.engine.runtime import CodeMessageDataEnvelope, Provider, ResponseEnvelope, get_shared_app
+from api_blueprint.engine.runtime import (
+    CodeMessageDataEnvelope,
+    Provider,
+    ResponseEnvelope,
+    UpstreamClient,
+    UpstreamClientOptions,
+    get_shared_app,
+)
 from api_blueprint.engine.schema import Error, HeaderModel, Model, unwrap_errors
 
 
@@ -35,6 +42,7 @@ class Blueprint:
 
     is_built: bool = False
     upstream: Optional[str] = None
+    upstream_client: Optional[UpstreamClient] = None
     exported_models: list[ExportedModel]
 
     def __init__(
@@ -98,5 +106,15 @@ class Blueprint:
         for group in self.pending_groups:
             group.build(self.app)
 
-    def set_upstream(self, upstream: str) -> None:
+    def set_upstream(self, upstream: str, options: UpstreamClientOptions | None = None) -> None:
+        previous = self.upstream_client
         self.upstream = upstream
+        self.upstream_client = UpstreamClient(upstream, options)
+        if previous is None:
+            self.app.router.on_shutdown.append(self._close_upstream)
+        else:
+            previous.close_soon()
+
+    async def _close_upstream(self) -> None:
+        if self.upstream_client is not None:
+            await self.upstream_client.aclose()
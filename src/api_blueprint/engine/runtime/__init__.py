@@ -11,7 +11,13 @@ from api_blueprint.engine.runtime.providers import (
 )
 from api_blueprint.engine.runtime.registration import proxy_upstream_request, register_router
 from api_blueprint.engine.runtime.responses import XMLResponse
-from api_blueprint.engine.runtime.shared_app import build_default_app, get_shared_app, reset_shared_app
+from api_blueprint.engine.runtime.shared_app import (
+    build_default_app,
+    get_shared_app,
+    replace_shared_app,
+    reset_shared_app,
+)
+from api_blueprint.engine.runtime.upstream import UpstreamClient, UpstreamClientOptions
 from api_blueprint.engine.runtime.wrappers import (
     CodeMessageDataEnvelope,
     LegacyCodeMessageDataEnvelope,
@@ -34,6 +40,8 @@ __all__ = (
     "Req",
     "ResponseEnvelope",
     "Rsp",
+    "UpstreamClient",
+    "UpstreamClientOptions",
     "XMLResponse",
     "build_default_app",
     "ellipsis_replaces",
@@ -41,6 +49,7 @@ __all__ = (
     "make_endpoint",
     "proxy_upstream_request",
     "register_router",
+    "replace_shared_app",
     "reset_response_envelope_cache",
     "reset_shared_app",
 )
@@ -3,15 +3,15 @@ from __future__ import annotations
 import copy
 import enum
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Mapping, Protocol
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Protocol, Sequence
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from starlette.routing import BaseRoute
 
@@ -39,6 +39,7 @@ _DOCS_SCHEMA_CONTEXTS = "api_blueprint_docs_schema_contexts"
 _DOCS_PROTOCOL_PLUGINS = "api_blueprint_docs_protocol_plugins"
 _DOCS_OPENAPI_WRAPPED = "api_blueprint_docs_openapi_wrapped"
 _DOCS_VERSION = "api_blueprint_docs_version"
+_DOCS_OWNERS = "api_blueprint_docs_owners"
 
 _TEMPLATES = Jinja2Templates(directory=str(Path(__file__).resolve().parent / "templates"))
 _HASHED_SCHEMA_NAME_RE = re.compile(r"__[0-9a-f]{8,}$")
@@ -73,6 +74,14 @@ class DocsFilter:
         )
 
 
+@dataclass
+class _DocsOwner:
+    routes: list[BaseRoute] = field(default_factory=list)
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    enums: set[str] = field(default_factory=set)
+    schemas: set[str] = field(default_factory=set)
+
+
 @dataclass(frozen=True)
 class ProtocolFilter:
     route_ids: tuple[str, ...] = ()
@@ -136,19 +145,7 @@ def install_api_blueprint_docs(app: FastAPI) -> None:
 
     @app.get("/docs/swagger", include_in_schema=False)
     async def api_blueprint_docs_swagger(request: Request):
-        return get_swagger_ui_html(
-            openapi_url=_docs_openapi_url(request),
-            title=f"{app.title or 'api-blueprint'} - Swagger",
-            swagger_js_url="/static/swagger-ui-bundle.js",
-            swagger_css_url="/static/swagger-ui.css",
-            swagger_ui_parameters={
-                "docExpansion": "none",
-                "filter": True,
-                "defaultModelsExpandDepth": -1,
-                "validatorUrl": None,
-                "syntaxHighlight": False,
-            },
-        )
+        return swagger_ui_response(app, _docs_openapi_url(request))
 
     @app.get("/docs/protocol", include_in_schema=False)
     async def api_blueprint_docs_protocol_ui(request: Request):
@@ -169,6 +166,32 @@ def docs_home_path(app: FastAPI) -> str:
     return app.docs_url or "/docs"
 
 
+def swagger_ui_response(
+    app: FastAPI,
+    openapi_url: str,
+    *,
+    swagger_js_url: str = "/static/swagger-ui-bundle.js",
+    swagger_css_url: str = "/static/swagger-ui.css",
+) -> HTMLResponse:
+    return get_swagger_ui_html(
+        openapi_url=openapi_url,
+        title=f"{app.title or 'api-blueprint'} - Swagger",
+        swagger_js_url=swagger_js_url,
+        swagger_css_url=swagger_css_url,
+        swagger_ui_parameters={
+            "docExpansion": "none",
+            "filter": True,
+            "defaultModelsExpandDepth": -1,
+            "validatorUrl": None,
+            "syntaxHighlight": False,
+        },
+    )
+
+
+def render_docs_page(app: FastAPI, template_name: str) -> str:
+    return _TEMPLATES.get_template(template_name).render({"title": app.title or "api-blueprint"})
+
+
 def _docs_center_response(request: Request, app: FastAPI):
     return _TEMPLATES.TemplateResponse(
         request,
@@ -199,19 +222,92 @@ def _asyncapi_docs_response(request: Request, app: FastAPI):
     )
 
 
-def register_docs_route(app: FastAPI, router: Router, contract: DocsRouteContract) -> None:
+def register_docs_route(
+    app: FastAPI,
+    router: Router,
+    contract: DocsRouteContract,
+    routes: Sequence[BaseRoute] = (),
+) -> None:
     _install_openapi_enrichment(app)
-    routes = _docs_routes(app)
+    owner = _docs_owners(app).setdefault(router.bp.name, _DocsOwner())
+    owner.routes.extend(routes)
+    entries = _docs_routes(app)
     entry = _route_index_entry(router, contract)
     identity = (entry["id"], tuple(entry["methods"]), entry["path"])
-    if any((item["id"], tuple(item["methods"]), item["path"]) == identity for item in routes):
+    if any((item["id"], tuple(item["methods"]), item["path"]) == identity for item in entries):
         return
-    routes.append(entry)
-    _register_route_enums(app, router)
-    _register_route_schemas(app, router, str(entry["id"]))
+    entries.append(entry)
+    owner.entries.append(entry)
+    owner.enums.update(_register_route_enums(app, router))
+    owner.schemas.update(_register_route_schemas(app, router, str(entry["id"])))
+    _invalidate_docs(app)
+
+
+def swap_blueprint_docs(
+    app: FastAPI,
+    *,
+    removed: Iterable[str],
+    sources: Iterable[tuple[FastAPI, str]],
+) -> None:
+    """Replace the routes and docs registrations owned by reloaded blueprints.
+
+    `removed` names the stale blueprints on `app`; each `(source, name)` pair
+    contributes a freshly built blueprint registered on a staging app. New
+    containers are swapped in whole, so in-flight requests keep the snapshot
+    they already resolved.
+    """
+    owners = dict(_docs_owners(app))
+    stale_routes: set[int] = set()
+    stale_entries: set[int] = set()
+    stale_enums: set[str] = set()
+    stale_schemas: set[str] = set()
+    for name in removed:
+        owner = owners.pop(name, None)
+        if owner is None:
+            continue
+        stale_routes.update(id(route) for route in owner.routes)
+        stale_entries.update(id(entry) for entry in owner.entries)
+        stale_enums.update(owner.enums)
+        stale_schemas.update(owner.schemas)
+    for owner in owners.values():
+        stale_enums.difference_update(owner.enums)
+        stale_schemas.difference_update(owner.schemas)
+
+    routes = [route for route in app.router.routes if id(route) not in stale_routes]
+    entries = [entry for entry in _docs_routes(app) if id(entry) not in stale_entries]
+    enums = {key: value for key, value in _docs_enum_registry(app).items() if key not in stale_enums}
+    schemas = {key: value for key, value in _docs_schema_registry(app).items() if key not in stale_schemas}
+    contexts = {key: value for key, value in _docs_schema_contexts(app).items() if key not in stale_schemas}
+    for source, name in sources:
+        owner = _docs_owners(source).get(name)
+        if owner is None:
+            continue
+        owners[name] = owner
+        routes.extend(owner.routes)
+        entries.extend(owner.entries)
+        source_enums = _docs_enum_registry(source)
+        source_schemas = _docs_schema_registry(source)
+        source_contexts = _docs_schema_contexts(source)
+        for key in owner.enums:
+            enums.setdefault(key, source_enums[key])
+        for key in owner.schemas:
+            schemas.setdefault(key, source_schemas[key])
+            if key in source_contexts:
+                contexts.setdefault(key, source_contexts[key])
+
+    app.router.routes = routes
+    setattr(app.state, _DOCS_ROUTES, entries)
+    setattr(app.state, _DOCS_ENUMS, enums)
+    setattr(app.state, _DOCS_SCHEMAS, schemas)
+    setattr(app.state, _DOCS_SCHEMA_CONTEXTS, contexts)
+    setattr(app.state, _DOCS_OWNERS, owners)
+    _invalidate_docs(app)
+
+
+def _invalidate_docs(app: FastAPI) -> None:
     app.openapi_schema = None
     setattr(app.state, _DOCS_VERSION, getattr(app.state, _DOCS_VERSION, 0) + 1)
-    _docs_cache(app).clear()
+    setattr(app.state, _DOCS_CACHE, {})
 
 
 def docs_route_count(app: FastAPI) -> int:
@@ -264,19 +360,17 @@ def protocol_index(app: FastAPI, protocol_filter: ProtocolFilter | None = None)
         entry = _protocol_route_entry(route)
         if entry["messages"]:
             routes.append(entry)
-    raw_schemas = dict(sorted(_docs_schema_registry(app).items()))
-    schema_contexts = _docs_schema_contexts(app)
-    schemas, schema_name_map = _public_schema_components(raw_schemas, schema_contexts)
-    routes = _public_protocol_route_models(routes, raw_schemas, schema_contexts, schema_name_map)
+    public = _protocol_public_schemas(app)
+    routes = _public_protocol_route_models(routes, public)
     catalog = {
         "title": app.title,
         "route_count": len(routes),
         "routes": routes,
         "schemas": {
             name: {"$ref": f"#/components/schemas/{name}"}
-            for name in schemas
+            for name in public.schemas
         },
-        "components": {"schemas": schemas},
+        "components": {"schemas": public.schemas},
     }
     return _filter_protocol_catalog(
         apply_protocol_docs_plugins(catalog, _protocol_docs_plugins(app)),
@@ -432,27 +526,60 @@ def remap_public_schema_names(spec: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(schemas, dict) or not schemas:
         return spec
     contexts = _openapi_schema_contexts(spec, schemas)
-    public_schemas, name_map = _public_schema_components(schemas, contexts)
-    _rewrite_schema_refs_and_names(spec, name_map)
-    spec.setdefault("components", {})["schemas"] = public_schemas
+    public = _public_schema_components(schemas, contexts)
+    # The public components are already rewritten; detach them so the pass over
+    # the rest of the spec does not rename them a second time.
+    components = spec["components"]
+    components["schemas"] = {}
+    public.rewriter.rewrite(spec)
+    components["schemas"] = public.schemas
     return spec
 
 
+@dataclass(frozen=True)
+class _PublicSchemaComponents:
+    contexts: Mapping[str, Mapping[str, str]]
+    schemas: dict[str, Any]
+    name_map: dict[str, str]
+    rewriter: _SchemaNameRewriter
+    keys_by_base: dict[str, list[str]]
+
+
+def _protocol_public_schemas(app: FastAPI) -> _PublicSchemaComponents:
+    cache_key = (getattr(app.state, _DOCS_VERSION, 0), "protocol-schemas")
+    cache = _docs_cache(app)
+    cached = cache.get(cache_key)
+    if cached is None:
+        raw_schemas = dict(sorted(_docs_schema_registry(app).items()))
+        cached = _public_schema_components(raw_schemas, dict(_docs_schema_contexts(app)))
+        cache[cache_key] = cached
+    return cached
+
+
 def _public_schema_components(
     schemas: Mapping[str, Any],
     contexts: Mapping[str, Mapping[str, str]] | None = None,
-) -> tuple[dict[str, Any], dict[str, str]]:
+) -> _PublicSchemaComponents:
     contexts = contexts or {}
     name_map = _public_schema_name_map(schemas, contexts)
+    rewriter = _SchemaNameRewriter(name_map)
     public_schemas: dict[str, Any] = {}
+    keys_by_base: dict[str, list[str]] = {}
     for old_name, schema in schemas.items():
         public_name = name_map.get(old_name, old_name)
+        keys_by_base.setdefault(_schema_public_base_name(str(old_name), schema), []).append(old_name)
         schema = copy.deepcopy(schema)
         if isinstance(schema, dict):
             schema["title"] = public_name
         public_schemas[public_name] = schema
-    _rewrite_schema_refs_and_names(public_schemas, name_map)
-    return public_schemas, name_map
+    rewriter.rewrite(public_schemas)
+    return _PublicSchemaComponents(
+        contexts=contexts,
+        schemas=public_schemas,
+        name_map=name_map,
+        rewriter=rewriter,
+        keys_by_base=keys_by_base,
+    )
 
 
 def _public_schema_name_map(
@@ -519,35 +646,45 @@ def _pascal_identifier(value: str) -> str:
     return "".join(part[:1].upper() + part[1:] for part in parts)
 
 
-def _rewrite_schema_refs_and_names(node: object, name_map: Mapping[str, str]) -> None:
-    if not name_map:
-        return
-    if isinstance(node, dict):
-        ref = node.get("$ref")
-        if isinstance(ref, str):
-            prefix = "#/components/schemas/"
-            if ref.startswith(prefix):
-                old_name = ref[len(prefix):]
-                if old_name in name_map:
-                    node["$ref"] = prefix + name_map[old_name]
-        for key, value in list(node.items()):
-            if key == "$ref":
-                continue
-            if isinstance(value, str):
-                node[key] = _replace_schema_name_text(value, name_map)
-            else:
-                _rewrite_schema_refs_and_names(value, name_map)
-    elif isinstance(node, list):
-        for item in node:
-            _rewrite_schema_refs_and_names(item, name_map)
+class _SchemaNameRewriter:
+    """Rewrite `$ref`s and embedded raw schema names in one tree pass.
 
+    Changed names are matched by a single longest-first alternation, so every
+    string is scanned once instead of once per schema name.
+    """
 
-def _replace_schema_name_text(value: str, name_map: Mapping[str, str]) -> str:
-    result = value
-    for old_name, public_name in name_map.items():
-        if old_name != public_name and old_name in result:
-            result = result.replace(old_name, public_name)
-    return result
+    _REF_PREFIX = "#/components/schemas/"
+
+    def __init__(self, name_map: Mapping[str, str]) -> None:
+        self.refs = {self._REF_PREFIX + old: self._REF_PREFIX + new for old, new in name_map.items()}
+        self.names = {old: new for old, new in name_map.items() if old != new}
+        self.pattern = (
+            re.compile("|".join(re.escape(name) for name in sorted(self.names, key=len, reverse=True)))
+            if self.names
+            else None
+        )
+
+    def rewrite(self, node: object) -> None:
+        if self.pattern is None:
+            return
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, str):
+                    node[key] = self.refs.get(value, value) if key == "$ref" else self.text(value)
+                elif isinstance(value, (dict, list)):
+                    self.rewrite(value)
+        elif isinstance(node, list):
+            for item in node:
+                if isinstance(item, (dict, list)):
+                    self.rewrite(item)
+
+    def text(self, value: str) -> str:
+        if self.pattern is None:
+            return value
+        return self.pattern.sub(self._replace, value)
+
+    def _replace(self, match: re.Match[str]) -> str:
+        return self.names[match.group(0)]
 
 
 def _openapi_schema_contexts(spec: Mapping[str, Any], schemas: Mapping[str, Any]) -> dict[str, dict[str, str]]:
@@ -622,7 +759,16 @@ def _install_openapi_enrichment(app: FastAPI) -> None:
     original_openapi = app.openapi
 
     def api_blueprint_openapi() -> dict[str, Any]:
-        return public_openapi_schema(app, original_openapi())
+        # FastAPI memoizes the raw spec on `app.openapi_schema` and the public
+        # rewrite happens in place, so the same object means already remapped.
+        spec = original_openapi()
+        cache_key = (getattr(app.state, _DOCS_VERSION, 0), "openapi")
+        cache = _docs_cache(app)
+        if cache.get(cache_key) is spec:
+            return spec
+        spec = public_openapi_schema(app, spec)
+        cache[cache_key] = spec
+        return spec
 
     app.openapi = api_blueprint_openapi  # type: ignore[method-assign]
     setattr(app.state, _DOCS_OPENAPI_WRAPPED, True)
@@ -647,14 +793,16 @@ def _enum_meta_for_schema(
     return None
 
 
-def _register_route_enums(app: FastAPI, router: Router) -> None:
+def _register_route_enums(app: FastAPI, router: Router) -> set[str]:
     registry = _docs_enum_registry(app)
+    identities: set[str] = set()
     for source in _route_enum_sources(router):
         for enum_cls in iter_enum_classes(source):
             if not isinstance(enum_cls, enum.EnumMeta):
                 continue
             values = [member.value for member in enum_cls]
             identity = f"{enum_cls.__module__}.{enum_cls.__qualname__}:{values!r}"
+            identities.add(identity)
             registry.setdefault(
                 identity,
                 {
@@ -667,15 +815,18 @@ def _register_route_enums(app: FastAPI, router: Router) -> None:
                     ],
                 },
             )
+    return identities
 
 
-def _register_route_schemas(app: FastAPI, router: Router, route_id: str) -> None:
+def _register_route_schemas(app: FastAPI, router: Router, route_id: str) -> set[str]:
     if router.connection_kind not in {ConnectionKind.STREAM, ConnectionKind.CHANNEL}:
-        return
+        return set()
     registry = _docs_schema_registry(app)
     contexts = _docs_schema_contexts(app)
+    names: set[str] = set()
     for source, role in _route_schema_sources(router):
-        _register_schema_source(registry, contexts, source, router, route_id, role)
+        names.update(_register_schema_source(registry, contexts, source, router, route_id, role))
+    return names
 
 
 def _register_schema_source(
@@ -685,24 +836,28 @@ def _register_schema_source(
     router: Router,
     route_id: str,
     role: str,
-) -> None:
+) -> set[str]:
     if source is None:
-        return
+        return set()
     model_cls = source.__class__ if not isinstance(source, type) else source
     try:
         root_key, schema, definitions = _model_to_schema(model_cls, router)
     except Exception:
-        return
+        return set()
     context = _schema_context(router, route_id, role)
+    names: set[str] = set()
     for name, definition in definitions.items():
         if isinstance(name, str) and name and isinstance(definition, dict):
             definition.setdefault("title", _clean_schema_name(name))
             registry.setdefault(name, definition)
             contexts.setdefault(name, context)
+            names.add(name)
     if root_key and isinstance(schema, dict):
         schema.setdefault("title", _clean_schema_name(root_key))
         registry.setdefault(root_key, schema)
         contexts.setdefault(root_key, context)
+        names.add(root_key)
+    return names
 
 
 def _model_to_schema(model_cls: type[Any], router: Router) -> tuple[str, dict[str, Any], dict[str, Any]]:
@@ -773,7 +928,15 @@ def _docs_routes(app: FastAPI) -> list[dict[str, Any]]:
     return routes
 
 
-def _docs_cache(app: FastAPI) -> dict[object, dict[str, Any]]:
+def _docs_owners(app: FastAPI) -> dict[str, _DocsOwner]:
+    owners = getattr(app.state, _DOCS_OWNERS, None)
+    if owners is None:
+        owners = {}
+        setattr(app.state, _DOCS_OWNERS, owners)
+    return owners
+
+
+def _docs_cache(app: FastAPI) -> dict[object, Any]:
     cache = getattr(app.state, _DOCS_CACHE, None)
     if cache is None:
         cache = {}
@@ -957,21 +1120,13 @@ def _protocol_route_entry(route: Mapping[str, Any], protocol_filter: ProtocolFil
 
 def _public_protocol_route_models(
     routes: list[dict[str, Any]],
-    raw_schemas: Mapping[str, Any],
-    schema_contexts: Mapping[str, Mapping[str, str]],
-    schema_name_map: Mapping[str, str],
+    public: _PublicSchemaComponents,
 ) -> list[dict[str, Any]]:
     result: list[dict[str, Any]] = []
     for route in routes:
         item = dict(route)
         item["messages"] = [
-            _public_protocol_message_models(
-                message,
-                route,
-                raw_schemas,
-                schema_contexts,
-                schema_name_map,
-            )
+            _public_protocol_message_models(message, route, public)
             for message in list(route.get("messages") or [])
             if isinstance(message, Mapping)
         ]
@@ -982,21 +1137,12 @@ def _public_protocol_route_models(
 def _public_protocol_message_models(
     message: Mapping[str, Any],
     route: Mapping[str, Any],
-    raw_schemas: Mapping[str, Any],
-    schema_contexts: Mapping[str, Mapping[str, str]],
-    schema_name_map: Mapping[str, str],
+    public: _PublicSchemaComponents,
 ) -> dict[str, Any]:
     item = dict(message)
     direction = str(item.get("direction") or "")
     item["variants"] = [
-        _public_protocol_variant_model(
-            variant,
-            route,
-            direction,
-            raw_schemas,
-            schema_contexts,
-            schema_name_map,
-        )
+        _public_protocol_variant_model(variant, route, direction, public)
         for variant in list(item.get("variants") or [])
         if isinstance(variant, Mapping)
     ]
@@ -1007,9 +1153,7 @@ def _public_protocol_variant_model(
     variant: Mapping[str, Any],
     route: Mapping[str, Any],
     direction: str,
-    raw_schemas: Mapping[str, Any],
-    schema_contexts: Mapping[str, Mapping[str, str]],
-    schema_name_map: Mapping[str, str],
+    public: _PublicSchemaComponents,
 ) -> dict[str, Any]:
     item = dict(variant)
     model = item.get("model")
@@ -1019,9 +1163,7 @@ def _public_protocol_variant_model(
             model,
             str(route.get("route_id") or route.get("id") or ""),
             role,
-            raw_schemas,
-            schema_contexts,
-            schema_name_map,
+            public,
         )
     return item
 
@@ -1030,22 +1172,16 @@ def _public_schema_name_for_model(
     model_name: str,
     route_id: str,
     role: str,
-    raw_schemas: Mapping[str, Any],
-    schema_contexts: Mapping[str, Mapping[str, str]],
-    schema_name_map: Mapping[str, str],
+    public: _PublicSchemaComponents,
 ) -> str:
-    candidates = [
-        key
-        for key, schema in raw_schemas.items()
-        if _schema_public_base_name(str(key), schema) == model_name
-    ]
+    candidates = public.keys_by_base.get(model_name)
     if not candidates:
-        return schema_name_map.get(model_name, model_name)
+        return public.name_map.get(model_name, model_name)
 
     route_candidates = [
         key
         for key in candidates
-        if schema_contexts.get(key, {}).get("route_id") == route_id
+        if public.contexts.get(key, {}).get("route_id") == route_id
     ]
     if route_candidates:
         candidates = route_candidates
@@ -1054,12 +1190,12 @@ def _public_schema_name_for_model(
         role_candidates = [
             key
             for key in candidates
-            if schema_contexts.get(key, {}).get("role") == role
+            if public.contexts.get(key, {}).get("role") == role
         ]
         if role_candidates:
             candidates = role_candidates
 
-    return schema_name_map.get(candidates[0], model_name)
+    return public.name_map.get(candidates[0], model_name)
 
 
 def _filter_protocol_catalog(catalog: dict[str, Any], protocol_filter: ProtocolFilter) -> dict[str, Any]:
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+from fastapi import FastAPI
+
+from api_blueprint.engine.runtime.docs import (
+    DocsFilter,
+    ProtocolFilter,
+    asyncapi_document,
+    docs_index,
+    protocol_index,
+    render_docs_page,
+    sliced_openapi,
+    swagger_ui_response,
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional extra
+    brotli = None
+
+
+STATIC_DIR = Path(__file__).resolve().parents[2] / "static"
+EXPORT_MANIFEST = "manifest.json"
+_ASSETS_DIR = "assets"
+_HASH_LENGTH = 12
+_COMPRESSIBLE_SUFFIXES = {".html", ".json", ".css", ".js"}
+_STATIC_ASSETS = ("bootstrap.min.css", "bootstrap.bundle.min.js", "swagger-ui-bundle.js", "swagger-ui.css")
+_PAGES = {
+    "index.html": "docs_index.html",
+    "protocol.html": "docs_protocol.html",
+    "asyncapi.html": "docs_asyncapi.html",
+}
+# Page-local JS functions that build the filtered document URL, with the
+# unfiltered document they fall back to.
+_SLICED_PAGES = {
+    "protocol.html": ("protocolUrl", "/docs/protocol.json"),
+    "asyncapi.html": ("asyncapiUrl", "/asyncapi.json"),
+}
+_PAGE_URLS = {
+    "/docs": "index.html",
+    "/docs/swagger": "swagger.html",
+    "/docs/protocol": "protocol.html",
+    "/docs/asyncapi": "asyncapi.html",
+}
+# Quoted absolute paths in the docs templates, including JS string and template
+# literals that append a query string (`"/docs/protocol?" + query`).
+_QUOTED_PATH_RE = re.compile(r"""(?P<quote>["'`])(?P<path>/[A-Za-z0-9_./-]*)(?=[?#"'`])""")
+_SWAGGER_URL_PLACEHOLDER = "__api_blueprint_openapi_url__"
+
+
+@dataclass(frozen=True)
+class DocsExportResult:
+    out_dir: Path
+    files: tuple[Path, ...]
+    manifest: dict[str, str]
+
+
+def export_static_docs(app: FastAPI, out_dir: str | Path) -> DocsExportResult:
+    """Prerender the docs center for a static file server or CDN.
+
+    HTML entry pages keep stable names; JSON documents and static assets are
+    written under content-hashed names next to `.gz` / `.br` siblings.
+    """
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    writer = _ExportWriter(out)
+
+    for name in _STATIC_ASSETS:
+        writer.asset(f"/static/{name}", name, (STATIC_DIR / name).read_bytes())
+
+    writer.asset("/docs/index.json", "index.json", _json_bytes(docs_index(app)))
+    writer.asset("/docs/protocol.json", "protocol.json", _json_bytes(protocol_index(app)))
+    writer.asset("/asyncapi.json", "asyncapi.json", _json_bytes(asyncapi_document(app)))
+    writer.asset("/openapi.json", "openapi.json", _json_bytes(app.openapi()))
+    writer.asset("/docs/openapi.json", "docs-openapi.json", _json_bytes(sliced_openapi(app, DocsFilter())))
+
+    group_slices: dict[str, str] = {}
+    page_slices: dict[str, dict[str, str]] = {page: {} for page in _SLICED_PAGES}
+    for group in _group_filters(app):
+        spec = sliced_openapi(app, DocsFilter(groups=(group,)))
+        group_slices[group] = writer.asset(
+            f"/docs/openapi.json?group={group}",
+            f"openapi.{_slug(group)}.json",
+            _json_bytes(spec),
+        )
+        protocol_filter = ProtocolFilter(groups=(group,))
+        page_slices["protocol.html"][group] = writer.asset(
+            f"/docs/protocol.json?group={group}",
+            f"protocol.{_slug(group)}.json",
+            _json_bytes(protocol_index(app, protocol_filter)),
+        )
+        page_slices["asyncapi.html"][group] = writer.asset(
+            f"/asyncapi.json?group={group}",
+            f"asyncapi.{_slug(group)}.json",
+            _json_bytes(asyncapi_document(app, protocol_filter)),
+        )
+
+    urls = {**_PAGE_URLS, **writer.manifest}
+    for page, template_name in _PAGES.items():
+        html = _rewrite_urls(render_docs_page(app, template_name), urls)
+        if page in _SLICED_PAGES:
+            url_function, full_url = _SLICED_PAGES[page]
+            html = _sliced_page(html, url_function, urls[full_url], page_slices[page])
+        writer.page(page, html)
+    writer.page("swagger.html", _swagger_page(app, urls, group_slices))
+    writer.page(EXPORT_MANIFEST, json.dumps(writer.manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n")
+    return DocsExportResult(out_dir=out, files=tuple(writer.files), manifest=dict(writer.manifest))
+
+
+class _ExportWriter:
+    def __init__(self, out_dir: Path) -> None:
+        self.out_dir = out_dir
+        self.files: list[Path] = []
+        self.manifest: dict[str, str] = {}
+
+    def asset(self, url: str, name: str, data: bytes) -> str:
+        stem, dot, suffix = name.rpartition(".")
+        digest = hashlib.sha256(data).hexdigest()[:_HASH_LENGTH]
+        rel = f"{_ASSETS_DIR}/{stem}.{digest}{dot}{suffix}"
+        self._write(rel, data)
+        self.manifest[url] = rel
+        return rel
+
+    def page(self, rel: str, text: str) -> None:
+        self._write(rel, text.encode("utf-8"))
+
+    def _write(self, rel: str, data: bytes) -> None:
+        path = self.out_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.files.append(path)
+        if path.suffix not in _COMPRESSIBLE_SUFFIXES:
+            return
+        gz_path = path.with_name(path.name + ".gz")
+        gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        self.files.append(gz_path)
+        if brotli is not None:
+            br_path = path.with_name(path.name + ".br")
+            br_path.write_bytes(brotli.compress(data))
+            self.files.append(br_path)
+
+
+def _swagger_page(app: FastAPI, urls: Mapping[str, str], group_slices: Mapping[str, str]) -> str:
+    html = swagger_ui_response(
+        app,
+        _SWAGGER_URL_PLACEHOLDER,
+        swagger_js_url=urls["/static/swagger-ui-bundle.js"],
+        swagger_css_url=urls["/static/swagger-ui.css"],
+    ).body.decode("utf-8")
+    # Static hosts ignore query strings, so the group filter picks a prerendered
+    # slice client-side; any other filter falls back to the unsliced document.
+    resolver = (
+        "<script>\n"
+        f"const API_BLUEPRINT_OPENAPI_SLICES = {json.dumps(dict(group_slices), ensure_ascii=False)};\n"
+        "function apiBlueprintOpenapiUrl() {\n"
+        '    const group = new URLSearchParams(window.location.search).get("group");\n'
+        f"    return API_BLUEPRINT_OPENAPI_SLICES[group] || {json.dumps(urls['/docs/openapi.json'])};\n"
+        "}\n"
+        "</script>\n"
+    )
+    html = html.replace(f"'{_SWAGGER_URL_PLACEHOLDER}'", "apiBlueprintOpenapiUrl()")
+    return html.replace("<script src=", resolver + "<script src=", 1)
+
+
+def _sliced_page(html: str, url_function: str, full_url: str, group_slices: Mapping[str, str]) -> str:
+    # Same lookup as the Swagger page: the page's own URL builder is renamed and
+    # replaced by one that maps `?group=` to a prerendered slice.
+    definition = f"function {url_function}() {{"
+    if definition not in html:
+        raise RuntimeError(f"docs page no longer defines {url_function}(); update the static export")
+    resolver = (
+        f"const API_BLUEPRINT_{url_function.upper()}_SLICES = {json.dumps(dict(group_slices), ensure_ascii=False)};\n"
+        f"        {definition}\n"
+        '            const group = new URLSearchParams(window.location.search).get("group");\n'
+        f"            return API_BLUEPRINT_{url_function.upper()}_SLICES[group] || {json.dumps(full_url)};\n"
+        "        }\n"
+        "\n"
+        f"        function {url_function}Unsliced() {{"
+    )
+    return html.replace(definition, resolver, 1)
+
+
+def _rewrite_urls(html: str, urls: Mapping[str, str]) -> str:
+    def replace(match: re.Match[str]) -> str:
+        target = urls.get(match.group("path"))
+        if target is None:
+            return match.group(0)
+        return match.group("quote") + target
+
+    return _QUOTED_PATH_RE.sub(replace, html).replace('href="/"', 'href="index.html"')
+
+
+def _group_filters(app: FastAPI) -> list[str]:
+    groups: set[str] = set()
+    for group in docs_index(app)["groups"]:
+        path = ""
+        for part in str(group["path"] or "/").split("/"):
+            if not part:
+                continue
+            path += f"/{part}"
+            groups.add(path)
+    return sorted(groups)
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", value).strip("-").lower() or "root"
+
+
+def _json_bytes(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
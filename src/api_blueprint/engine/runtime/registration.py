@@ -5,12 +5,14 @@ from typing import TYPE_CHECKING, Any
 
 import httpx
 from fastapi import FastAPI, Request, Response, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
 from api_blueprint.engine.connection import ConnectionKind
 from api_blueprint.engine.runtime.docs import register_docs_route
 from api_blueprint.engine.runtime.endpoint import make_endpoint
 from api_blueprint.engine.runtime.responses import XMLResponse
+from api_blueprint.engine.runtime.upstream import UpstreamClient
 from api_blueprint.engine.schema import model_to_pydantic
 from api_blueprint.engine.utils import snake_to_pascal_case
 
@@ -18,71 +20,77 @@ if TYPE_CHECKING:
     from api_blueprint.engine.blueprint.router import Router
 
 
+_HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+
 async def proxy_upstream_request(router: "Router", request: Request, **kwargs: Any):
     upstream_url = router.bp.upstream
     if upstream_url is None:
         raise Exception("[upstream_handler] 没有设置 upstream，无法转发给上游服务")
 
-    upstream_path = request.url.path
-    upstream_full_url = upstream_url.rstrip("/") + upstream_path
-    params = dict(request.query_params)
-    content_type = request.headers.get("content-type", "")
-    body_bytes = await request.body()
-    headers = dict(request.headers)
-    cookies = request.cookies
-
-    for header_name in ["host", "content-length", "transfer-encoding", "content-encoding", "connection"]:
-        headers.pop(header_name, None)
-
+    upstream = router.bp.upstream_client
+    owned: UpstreamClient | None = None
+    if upstream is None or upstream.base_url != upstream_url.rstrip("/"):
+        # `upstream` was assigned without `set_upstream`; use a client scoped to
+        # this request and close it once the relayed response is done.
+        upstream = owned = UpstreamClient(upstream_url)
+
+    has_body = "content-length" in request.headers or "transfer-encoding" in request.headers
+    headers = [
+        (key, value)
+        for key, value in request.headers.items()
+        if key not in _HOP_BY_HOP_HEADERS and key != "host" and (has_body or key != "content-length")
+    ]
+
+    client = upstream.client()
+    # Bodies and JSON payloads are relayed as raw bytes in both directions; the
+    # upstream stays responsible for decoding and content negotiation.
+    upstream_request = client.build_request(
+        request.method,
+        upstream.url(request.url.path, request.url.query),
+        headers=headers,
+        content=request.stream() if has_body else None,
+    )
     try:
-        async with httpx.AsyncClient(follow_redirects=False, timeout=10.0) as client:
-            request_kwargs = {
-                "method": request.method,
-                "url": upstream_full_url,
-                "headers": headers,
-                "params": params,
-                "cookies": cookies,
-            }
-
-            if content_type.startswith("application/json"):
-                try:
-                    request_kwargs["json"] = await request.json()
-                except Exception:
-                    request_kwargs["json"] = None
-            else:
-                request_kwargs["content"] = body_bytes
-
-            upstream_response = await client.request(**request_kwargs)
+        upstream_response = await client.send(upstream_request, stream=True)
     except httpx.RequestError as exc:
+        if owned is not None:
+            await owned.aclose()
         return Response(
             content=f"Bad Gateway: 无法请求上游 ({exc})",
             status_code=status.HTTP_502_BAD_GATEWAY,
         )
 
-    excluded_headers = {
-        "transfer-encoding",
-        "content-encoding",
-        "connection",
-        "keep-alive",
-        "proxy-authenticate",
-        "proxy-authorization",
-        "te",
-        "trailers",
-        "upgrade",
-    }
-
-    response_headers = {
-        key: value
-        for key, value in upstream_response.headers.items()
-        if key.lower() not in excluded_headers
-    }
-
-    return Response(
-        content=upstream_response.content,
+    response = StreamingResponse(
+        upstream_response.aiter_raw(),
         status_code=upstream_response.status_code,
-        headers=response_headers,
-        media_type=upstream_response.headers.get("content-type"),
+        background=BackgroundTask(_close_upstream_response, upstream_response, owned),
     )
+    response.raw_headers = [
+        (key.encode("latin-1"), value.encode("latin-1"))
+        for key, value in upstream_response.headers.multi_items()
+        if key.lower() not in _HOP_BY_HOP_HEADERS
+    ]
+    return response
+
+
+async def _close_upstream_response(upstream_response: httpx.Response, owned: UpstreamClient | None) -> None:
+    try:
+        await upstream_response.aclose()
+    finally:
+        if owned is not None:
+            await owned.aclose()
 
 
 def register_router(router: "Router", app: FastAPI) -> None:
@@ -141,6 +149,7 @@ def register_router(router: "Router", app: FastAPI) -> None:
             },
         }
 
+    registered_from = len(app.router.routes)
     ws_methods = [method for method in router.methods if method == "CHANNEL"]
     if ws_methods:
         app.add_api_websocket_route(router.url, endpoint)
@@ -177,7 +186,7 @@ def register_router(router: "Router", app: FastAPI) -> None:
             **copy_extra,
         )
 
-    register_docs_route(app, router, contract)
+    register_docs_route(app, router, contract, app.router.routes[registered_from:])
 
 
 def _default_operation_id(router: "Router") -> str:
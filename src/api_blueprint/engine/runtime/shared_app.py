@@ -23,6 +23,13 @@ def reset_shared_app() -> None:
     _SHARED_APP = None
 
 
+def replace_shared_app(app: FastAPI | None) -> FastAPI | None:
+    """Install `app` as the shared app and return the one it replaces."""
+    global _SHARED_APP
+    previous, _SHARED_APP = _SHARED_APP, app
+    return previous
+
+
 def build_default_app(title: str) -> FastAPI:
     app = FastAPI(
         title=title or "api-blueprint",
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import weakref
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass(frozen=True)
+class UpstreamClientOptions:
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    http2: bool = False
+    connect_timeout: float | None = 10.0
+    read_timeout: float | None = 10.0
+    write_timeout: float | None = 10.0
+    pool_timeout: float | None = 10.0
+    transport: httpx.AsyncBaseTransport | None = None
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+class UpstreamClient:
+    """Pooled `httpx.AsyncClient` for one blueprint upstream.
+
+    httpx connection pools are bound to the event loop that opened them, so one
+    client is kept per running loop and reused by every proxied request on it.
+    """
+
+    def __init__(self, base_url: str, options: UpstreamClientOptions | None = None) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.options = options or UpstreamClientOptions()
+        if self.options.http2 and self.options.transport is None and importlib.util.find_spec("h2") is None:
+            raise RuntimeError(
+                "upstream http2=True requires the `h2` package; install it with `pip install api-blueprint[http2]`"
+            )
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                follow_redirects=False,
+                limits=self.options.limits(),
+                timeout=self.options.timeout(),
+                http2=self.options.http2,
+                transport=self.options.transport,
+            )
+            self._clients[loop] = client
+        return client
+
+    def url(self, path: str, query: str = "") -> str:
+        return self.base_url + path + (f"?{query}" if query else "")
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def close_soon(self) -> None:
+        """Close every pooled client on the loop that opened it.
+
+        Used when the upstream is replaced, possibly from another thread or
+        with no loop running; loops that are already closed took their
+        connections with them.
+        """
+        clients = list(self._clients.items())
+        self._clients.clear()
+        for loop, client in clients:
+            if loop.is_closed() or client.is_closed:
+                continue
+            loop.call_soon_threadsafe(loop.create_task, client.aclose())
@@ -603,6 +603,9 @@ class GolangBlueprint(BaseBlueprint["GolangWriter"]):
         with self.writer.write_file(self.writer.http_transport_dir / "gen_engine.go", overwrite=True) as handle:
             if handle:
                 handle.write(render(LANG, "gen_engine.go", ctx, "server/views/transports/http"))
+        with self.writer.write_file(self.writer.http_transport_dir / "gen_observer.go", overwrite=True) as handle:
+            if handle:
+                handle.write(render(LANG, "gen_observer.go", ctx, "server/views/transports/http"))
         with self.writer.write_file(self.writer.http_transport_dir / "gen_mount.go", overwrite=True) as handle:
             if handle:
                 handle.write(render(LANG, "gen_mount.go", ctx, "server/views/transports/http"))
@@ -117,6 +117,8 @@ class JavaServerWriter(JavaBaseWriter):
             ("GenSpringRequestContext.java", "GenSpringRequestContext.java"),
             ("GenSpringRequestBinder.java", "GenSpringRequestBinder.java"),
             ("GenSpringResponseWriter.java", "GenSpringResponseWriter.java"),
+            ("GenSpringRouteMetrics.java", "GenSpringRouteMetrics.java"),
+            ("GenSpringRouteHistogram.java", "GenSpringRouteHistogram.java"),
         ):
             self._write_generated(
                 plan.root_directory / "spring" / output_name,
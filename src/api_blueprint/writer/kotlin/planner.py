@@ -125,6 +125,7 @@ def _runtime_generated_files(writer: "KotlinBaseWriter") -> tuple[tuple[str, str
             (
                 ("GenApiServerContext.kt", "GenApiServerContext.kt"),
                 ("GenApiServerResponse.kt", "GenApiServerResponse.kt"),
+                ("GenApiServerMetrics.kt", "GenApiServerMetrics.kt"),
             )
         )
     return tuple(files)
@@ -3,6 +3,7 @@ from api_blueprint.writer.core.registry import GeneratorTargetSpec, register_tar
 from .blueprint import PythonBlueprint, PythonRequestParam, PythonRoute, PythonRouteGroup
 from .naming import to_package_segments, to_path_segments, to_py_class_name, to_py_identifier
 from .planner import (
+    PythonAsgiTransportPlan,
     PythonBlueprintPlan,
     PythonHttpTransportPlan,
     PythonRouteGroupPlan,
@@ -24,11 +25,12 @@ register_target(
         name="python-server",
         implemented=True,
         writer_factory=PythonServerWriter,
-        description="Generate Python service contracts and FastAPI transport scaffolding.",
+        description="Generate Python service contracts with FastAPI and plain ASGI transport scaffolding.",
     )
 )
 
 __all__ = (
+    "PythonAsgiTransportPlan",
     "PythonBlueprint",
     "PythonBlueprintPlan",
     "PythonClientWriter",
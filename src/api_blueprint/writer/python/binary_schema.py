@@ -54,6 +54,21 @@ READ_METHODS = {
     "f64": "read_f64",
     "bool": "read_bool",
 }
+WIRE_SIZES = {
+    "u8": 1,
+    "u16": 2,
+    "u24": 3,
+    "u32": 4,
+    "u64": 8,
+    "i8": 1,
+    "i16": 2,
+    "i24": 3,
+    "i32": 4,
+    "i64": 8,
+    "f32": 4,
+    "f64": 8,
+    "bool": 1,
+}
 INTEGER_TYPES = {"u8", "u16", "u24", "u32", "u64", "i8", "i16", "i24", "i32", "i64"}
 EXPR_TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+|[()+\-*/]")
 
@@ -376,6 +391,76 @@ class PythonBinarySchema:
     def value_set_type_name(self, value_set_name: str) -> str:
         return _scope_py_type_name(self.name, value_set_name)
 
+    @property
+    def fixed_size(self) -> int | None:
+        """Encoded byte length when every count in the packet is a literal."""
+        return self._packet_size(bounded=False)
+
+    @property
+    def max_size(self) -> int | None:
+        """Upper bound of the encoded length using literal `max` rules for dynamic counts."""
+        return self._packet_size(bounded=True)
+
+    def _packet_size(self, *, bounded: bool) -> int | None:
+        packet_fields = {field.name: field for section in self.schema.sections for field in section.fields}
+        total = 0
+        for section in self.schema.sections:
+            size = self._object_size(section, packet_fields, bounded=bounded, seen=())
+            if size is None:
+                return None
+            total += size
+        return total
+
+    def _object_size(
+        self,
+        obj: BinaryObject,
+        packet_fields: dict[str, BinaryField],
+        *,
+        bounded: bool,
+        seen: tuple[str, ...],
+    ) -> int | None:
+        if obj.name in seen:
+            return None
+        fields = {**packet_fields, **obj.field_map()} if obj.kind == "section" else obj.field_map()
+        total = 0
+        for field in obj.fields:
+            count = _literal_count(field, fields, bounded=bounded)
+            unit = self._unit_size(field, packet_fields, bounded=bounded, seen=(*seen, obj.name))
+            if count is None or unit is None:
+                return None
+            total += count * unit
+        return total
+
+    def _unit_size(
+        self,
+        field: BinaryField,
+        packet_fields: dict[str, BinaryField],
+        *,
+        bounded: bool,
+        seen: tuple[str, ...],
+    ) -> int | None:
+        if field.type in {"bytes", "string", "padding", "reserved"}:
+            return 1
+        value_type = self.schema.value_type_map().get(field.type)
+        wire_type = value_type.base_type if value_type is not None else field.type
+        if wire_type in WIRE_SIZES:
+            return WIRE_SIZES[wire_type]
+        struct = self.schema.structs.get(field.type)
+        if struct is None:
+            return None
+        return self._object_size(struct, packet_fields, bounded=bounded, seen=seen)
+
+
+def _literal_count(field: BinaryField, fields: dict[str, BinaryField], *, bounded: bool) -> int | None:
+    if field.count.isdigit():
+        return int(field.count)
+    if not bounded:
+        return None
+    maximum = field.rule.get("max")
+    if maximum is None and field.count in fields:
+        maximum = fields[field.count].rule.get("max")
+    return int(maximum) if maximum is not None and maximum.isdigit() else None
+
 
 def unique_python_binary_schemas(schemas: Iterable[BinarySchema]) -> list[PythonBinarySchema]:
     unique: dict[str, BinarySchema] = {}
@@ -6,6 +6,7 @@ from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Mapping
 
+from api_blueprint.engine.connection import ConnectionScope
 from api_blueprint.engine.model import Model
 from api_blueprint.engine.router import Router
 from api_blueprint.writer.core.base import BaseBlueprint
@@ -15,12 +16,21 @@ from api_blueprint.writer.core.sdk_names import RoutePublicNames
 
 from .naming import to_path_segments, to_py_class_name, to_py_identifier
 from .binary_schema import PythonBinarySchema, unique_python_binary_schemas
-from .schema_types import PythonDtoModel, PythonEnumModel, PythonResolvedType, PythonSchemaRegistry
+from .schema_types import (
+    PythonContainerDecoder,
+    PythonDtoModel,
+    PythonEnumModel,
+    PythonResolvedType,
+    PythonSchemaRegistry,
+)
 
 if TYPE_CHECKING:
     from .writer import PythonBaseWriter
 
 
+_PATH_PARAM_RE = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)(?::([A-Za-z_]+))?\}")
+
+
 @dataclass(frozen=True)
 class PythonRequestParam:
     name: str
@@ -42,11 +52,24 @@ class PythonRequestParam:
             return value_expr
         return f"_api_to_json({value_expr})"
 
+    def json_bytes_expr(self, value_expr: str) -> str | None:
+        if self.call_name == "json" and self.type is not None and self.type.writer == "_write_json_model":
+            return f"_api_json_bytes({value_expr})"
+        return None
+
     def decode_expr(self, value_expr: str, path_expr: str) -> str:
         if self.type is None:
             return value_expr
         return self.type.decode_expr(value_expr, path_expr)
 
+    @property
+    def decodes_query_string(self) -> bool:
+        # Query and open-data DTOs are parsed by the server straight from the raw ASGI query string.
+        return self.name in {"query", "open_data"} and self.type is not None and self.type.writer == "_write_json_model"
+
+    def query_string_decode_expr(self, query_string_expr: str, path_expr: str) -> str:
+        return f"{self.annotation}.from_query_string({query_string_expr}, {path_expr})"
+
 
 @dataclass(frozen=True)
 class PythonMessageVariant:
@@ -73,6 +96,88 @@ class PythonMessageHelper:
     variants: tuple[PythonMessageVariant, ...]
 
 
+@dataclass(frozen=True)
+class PythonEnvelopeWriter:
+    """Server-side envelope writers specialized for one envelope spec.
+
+    The FastAPI transport uses the `wrap_*` pair, which returns responses; the
+    ASGI transport uses the `encode_*` pair, which returns encoded bodies.
+    """
+
+    suffix: str
+    kind: str
+    error_identity: str
+    success_code: Any
+    success_message: Any
+    fields: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_spec(cls, spec: Mapping[str, Any], suffix: str) -> "PythonEnvelopeWriter":
+        return cls(
+            suffix=suffix,
+            kind=str(spec.get("kind") or "none"),
+            error_identity=str(spec.get("error_identity") or "none"),
+            success_code=spec.get("success_code", 0),
+            success_message=spec.get("success_message", "ok"),
+            fields=tuple((spec.get("fields") or {}).items()),
+        )
+
+    @property
+    def wrap_ok_name(self) -> str:
+        return f"_wrap_ok_{self.suffix}"
+
+    @property
+    def wrap_error_name(self) -> str:
+        return f"_wrap_error_{self.suffix}"
+
+    @property
+    def encode_ok_name(self) -> str:
+        return f"_encode_ok_{self.suffix}"
+
+    @property
+    def encode_error_name(self) -> str:
+        return f"_encode_error_{self.suffix}"
+
+    @property
+    def includes_error(self) -> bool:
+        return self.error_identity != "none"
+
+    def field_literal(self, key: str) -> str:
+        return _py_literal(dict(self.fields).get(key, key))
+
+    @property
+    def success_code_literal(self) -> str:
+        return _py_literal(self.success_code)
+
+    @property
+    def success_message_literal(self) -> str:
+        return _py_literal(self.success_message)
+
+    @property
+    def json_ok_prefix_literal(self) -> str:
+        """Compact JSON text the success envelope has before the `data` value."""
+        fields = dict(self.fields)
+
+        def key(name: str) -> str:
+            return json.dumps(fields.get(name, name), ensure_ascii=False) + ":"
+
+        def value(item: Any) -> str:
+            return json.dumps(item, ensure_ascii=False, separators=(",", ":"))
+
+        if self.kind == "code_message_data":
+            prefix = "{" + key("code") + value(self.success_code) + "," + key("message")
+            prefix += value(self.success_message) + "," + key("data")
+        elif self.kind == "ok_data_error":
+            prefix = "{" + key("ok") + "true," + key("data")
+        else:
+            prefix = ""
+        return repr(prefix)
+
+    @property
+    def wraps_data(self) -> bool:
+        return self.kind in {"code_message_data", "ok_data_error"}
+
+
 class PythonRoute:
     def __init__(self, router: Router, protocol: RouteProtocolContract, *, registry: PythonSchemaRegistry):
         self.router = router
@@ -86,6 +191,7 @@ class PythonRoute:
         self.response_type = _model_name(protocol.response.model.model)
         self.response_schema = protocol.response.model.schema
         self.response_envelope = protocol.response.envelope.envelope_spec()
+        self.envelope_writer: PythonEnvelopeWriter | None = None
         self.binary_schema = protocol.request.binary_schema
         self.response_binary_schema = protocol.response.binary_schema
         self.registry = registry
@@ -116,6 +222,26 @@ class PythonRoute:
     def supports_channel(self) -> bool:
         return self.contract.supports_channel
 
+    @property
+    def is_topic_scoped(self) -> bool:
+        return not self.is_rpc and self.contract.connection_scope in {ConnectionScope.APP, ConnectionScope.TOPIC}
+
+    @property
+    def is_app_scoped(self) -> bool:
+        return not self.is_rpc and self.contract.connection_scope == ConnectionScope.APP
+
+    @property
+    def publish_method_name(self) -> str:
+        return f"publish_{self.method_name}"
+
+    @property
+    def has_multipart(self) -> bool:
+        return self.protocol.request.multipart.model is not None
+
+    @property
+    def upload_sink_method_name(self) -> str:
+        return f"{self.method_name}_upload_sink"
+
     @property
     def subscribe_method_name(self) -> str:
         method = self.contract.stream.connect_method if self.contract.stream is not None else f"subscribe_{self.method_name}"
@@ -256,6 +382,14 @@ class PythonRoute:
             )
         return self.response_type_info.decode_expr(value_expr, json.dumps(f"{self.method_name}.response"))
 
+    def response_trusted_decode_expr(self, value_expr: str) -> str | None:
+        """Response decode for transports with `trusted_decode`; None keeps the validating path."""
+        if self.is_binary_schema_response or self.is_raw_response or self.response_type_info is None:
+            return None
+        if self.is_enveloped_empty_object_response or self.response_type_info.writer == "_write_json_enum":
+            return None
+        return self.response_type_info.trusted_expr(value_expr)
+
     @property
     def has_binary_schema(self) -> bool:
         return self.binary_schema is not None
@@ -288,12 +422,40 @@ class PythonRoute:
             return repr(("identity",))
         return repr(tuple(self.binary_schema.content_encoding or ("identity",)))
 
+    @property
+    def response_binary_content_encodings_literal(self) -> str:
+        if self.response_binary_schema is None:
+            return repr(())
+        return repr(tuple(self.response_binary_schema.content_encoding or ("identity",)))
+
     @property
     def response_binary_wire_name(self) -> str | None:
         if self.response_binary_schema is None:
             return None
         return f"{self.response_binary_schema.name}Wire"
 
+    @property
+    def serves_over_asgi(self) -> bool:
+        # JSON RPC routes are dispatched by the plain ASGI transport; bodies that
+        # need form/multipart parsing, binary payloads, raw responses, SSE and
+        # WebSocket routes are delegated to the FastAPI transport.
+        if not self.is_rpc or self.is_raw_response or self.is_binary_schema_response:
+            return False
+        return all(param.name in {"path", "query", "json"} for param in self.params)
+
+    @property
+    def asgi_path_pattern_literal(self) -> str | None:
+        if "{" not in self.url:
+            return None
+        parts: list[str] = []
+        position = 0
+        for match in _PATH_PARAM_RE.finditer(self.url):
+            parts.append(re.escape(self.url[position : match.start()]))
+            parts.append(f"(?P<{match.group(1)}>{'.*' if match.group(2) == 'path' else '[^/]+'})")
+            position = match.end()
+        parts.append(re.escape(self.url[position:]))
+        return json.dumps("^" + "".join(parts) + "$")
+
     @property
     def http_method_literal(self) -> str:
         return json.dumps(self.http_methods[0])
@@ -306,6 +468,10 @@ class PythonRoute:
     def method_list_literal(self) -> str:
         return json.dumps(list(self.http_methods))
 
+    @property
+    def method_tuple_literal(self) -> str:
+        return "(" + ", ".join(json.dumps(method) for method in self.http_methods) + ",)"
+
     @property
     def method_name_literal(self) -> str:
         return json.dumps(self.method_name)
@@ -427,6 +593,16 @@ class PythonRouteGroup:
     def runtime_import_prefix(self) -> str:
         return "." * (len(self.segments) + 2)
 
+    @property
+    def topics_class(self) -> str:
+        return f"{to_py_class_name(self.alias, default='Api')}Topics"
+
+    def topic_routes(self) -> tuple[PythonRoute, ...]:
+        return tuple(route for route in self.routes if route.is_topic_scoped)
+
+    def multipart_routes(self) -> tuple[PythonRoute, ...]:
+        return tuple(route for route in self.routes if route.is_rpc and route.has_multipart)
+
     def binary_schemas(self) -> list[PythonBinarySchema]:
         schemas = []
         for route in self.routes:
@@ -442,6 +618,21 @@ class PythonRouteGroup:
     def enums(self) -> tuple[PythonEnumModel, ...]:
         return self.registry.enums()
 
+    def container_decoders(self) -> tuple[PythonContainerDecoder, ...]:
+        # Message payload types are resolved lazily; make sure their shapes are registered.
+        self.message_helpers()
+        return self.registry.container_decoders()
+
+    def trusted_decoder_names(self) -> tuple[str, ...]:
+        return tuple(decoder.trusted_name for decoder in self.container_decoders() if decoder.trusted_name)
+
+    def core_refs_literal(self, model: PythonDtoModel) -> str:
+        refs = [json.dumps(ref) for ref in self.registry.core_refs(model)]
+        return f"({refs[0]},)" if len(refs) == 1 else f"({', '.join(refs)})"
+
+    def query_string_models(self) -> frozenset[str]:
+        return frozenset(param.annotation for route in self.routes for param in route.params if param.decodes_query_string)
+
     def type_import_names(self) -> tuple[str, ...]:
         names = [model.class_name for model in self.route_models()]
         names.extend(enum.class_name for enum in self.enums())
@@ -464,6 +655,12 @@ class PythonRouteGroup:
                 f"{self.server_type_module_alias}.{name}",
                 result,
             )
+        for decoder in self.container_decoders():
+            result = re.sub(
+                rf"(?<![\w.]){re.escape(decoder.name)}(?!\w)",
+                f"{self.server_type_module_alias}.{decoder.name}",
+                result,
+            )
         return result
 
     def message_helpers(self) -> tuple[PythonMessageHelper, ...]:
@@ -479,11 +676,16 @@ class PythonBlueprint(BaseBlueprint["PythonBaseWriter"]):
         super().__init__(writer, bp)
         self.routes: list[PythonRoute] = []
         self.groups: "OrderedDict[tuple[str, ...], PythonRouteGroup]" = OrderedDict()
+        self.envelope_writers: tuple[PythonEnvelopeWriter, ...] = ()
 
     @property
     def root_segments(self) -> tuple[str, ...]:
         return to_path_segments(self.bp.root_slug, default="root")
 
+    @property
+    def has_asgi_fallback_routes(self) -> bool:
+        return any(not route.serves_over_asgi for route in self.routes)
+
     def collect(self) -> None:
         self.routes = []
         self.groups = OrderedDict()
@@ -508,6 +710,28 @@ class PythonBlueprint(BaseBlueprint["PythonBaseWriter"]):
             route = PythonRoute(router, protocol, registry=group.registry)
             self.routes.append(route)
             group.routes.append(route)
+        self.envelope_writers = self._collect_envelope_writers()
+
+    def _collect_envelope_writers(self) -> tuple[PythonEnvelopeWriter, ...]:
+        writers: dict[str, PythonEnvelopeWriter] = {}
+        suffixes: set[str] = set()
+        for route in self.routes:
+            if not route.is_rpc:
+                continue
+            key = route.response_envelope_literal
+            writer = writers.get(key)
+            if writer is None:
+                base = to_py_identifier(str(route.response_envelope.get("name") or ""), default="envelope")
+                suffix = base
+                index = 2
+                while suffix in suffixes:
+                    suffix = f"{base}_{index}"
+                    index += 1
+                suffixes.add(suffix)
+                writer = PythonEnvelopeWriter.from_spec(route.response_envelope, suffix)
+                writers[key] = writer
+            route.envelope_writer = writer
+        return tuple(writers.values())
 
     def _group_segments(self, router: Router) -> tuple[str, ...]:
         branch_segments = self._branch_segments(router)
@@ -526,6 +750,12 @@ class PythonBlueprint(BaseBlueprint["PythonBaseWriter"]):
         return to_path_segments(branch, default="root")
 
 
+def _py_literal(value: Any) -> str:
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    return repr(value)
+
+
 def _model_name(model: type[Model] | Model | None) -> str | None:
     if model is None:
         return None
@@ -23,6 +23,13 @@ class PythonHttpTransportPlan:
     public_file: Path
 
 
+@dataclass(frozen=True)
+class PythonAsgiTransportPlan:
+    directory: Path
+    generated_file: Path
+    public_file: Path
+
+
 @dataclass(frozen=True)
 class PythonRouteGroupPlan:
     group: "PythonRouteGroup"
@@ -40,6 +47,7 @@ class PythonBlueprintPlan:
     runtime: PythonRuntimePlan
     http_transport: PythonHttpTransportPlan
     route_groups: tuple[PythonRouteGroupPlan, ...]
+    asgi_transport: PythonAsgiTransportPlan | None = None
 
 
 def build_python_blueprint_plan(writer: "PythonBaseWriter", bp: "PythonBlueprint") -> PythonBlueprintPlan:
@@ -48,6 +56,7 @@ def build_python_blueprint_plan(writer: "PythonBaseWriter", bp: "PythonBlueprint
     routes_dir = root_directory / "routes"
     transports_dir = root_directory / "transports"
     http_dir = transports_dir / "http"
+    asgi_dir = transports_dir / "asgi"
     route_groups = tuple(
         PythonRouteGroupPlan(
             group=group,
@@ -73,6 +82,15 @@ def build_python_blueprint_plan(writer: "PythonBaseWriter", bp: "PythonBlueprint
             public_file=http_dir / writer.transport_template.replace("gen_", ""),
         ),
         route_groups=route_groups,
+        asgi_transport=(
+            PythonAsgiTransportPlan(
+                directory=asgi_dir,
+                generated_file=asgi_dir / writer.asgi_transport_template,
+                public_file=asgi_dir / writer.asgi_transport_template.replace("gen_", ""),
+            )
+            if writer.asgi_transport_template is not None
+            else None
+        ),
     )
 
 
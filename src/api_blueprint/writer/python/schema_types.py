@@ -15,10 +15,19 @@ from .naming import to_py_class_name, to_py_identifier
 class PythonResolvedType:
     annotation: str
     decoder: str = "_decode_any"
+    writer: str = "_write_json_any"
+    core: str = "_core_any()"
+    refs: tuple[str, ...] = ()
+    # `from_trusted` conversion with `{}` for the wire value; None keeps the value as-is.
+    trusted: str | None = None
+    # Item type of list containers; query strings repeat the key once per item.
+    items: PythonResolvedType | None = None
 
     def decode_expr(self, value_expr: str, path_expr: str) -> str:
-        decoder = f"({self.decoder})" if self.decoder.strip().startswith("lambda ") else self.decoder
-        return f"{decoder}({value_expr}, {path_expr})"
+        return f"{self.decoder}({value_expr}, {path_expr})"
+
+    def trusted_expr(self, value_expr: str) -> str:
+        return value_expr if self.trusted is None else self.trusted.format(value_expr)
 
 
 @dataclass(frozen=True)
@@ -34,7 +43,7 @@ class PythonDtoField:
 
     @property
     def path_expr(self) -> str:
-        return f"_field_path(path, {self.wire_literal})"
+        return f"(path, {self.wire_literal})"
 
     @property
     def decode_expr(self) -> str:
@@ -42,6 +51,68 @@ class PythonDtoField:
         helper = "_decode_optional" if self.optional else "_decode_required"
         return f"{helper}({self.type.decoder}, {raw_expr}, {self.path_expr})"
 
+    @property
+    def core_expr(self) -> str:
+        optional = ", optional=True" if self.optional else ""
+        return f"_core_field({json.dumps(self.name)}, {self.wire_literal}, {self.type.core}{optional})"
+
+    @property
+    def column_expr(self) -> str:
+        args = ["rows", "path", self.wire_literal, self.type.decoder]
+        exact_type = _SCALAR_ITEM_TYPES.get(self.type.decoder)
+        if exact_type is not None:
+            args.append(exact_type)
+        if self.optional:
+            args.append("optional=True")
+        return f"_decode_column({', '.join(args)})"
+
+    @property
+    def trusted_local(self) -> str | None:
+        # Optional fields that need a conversion read the wire value once.
+        if self.optional and self.type.trusted is not None:
+            return f"{self.name}_value"
+        return None
+
+    @property
+    def trusted_expr(self) -> str:
+        local = self.trusted_local
+        if local is not None:
+            return f"None if {local} is None else {self.type.trusted_expr(local)}"
+        if self.optional:
+            return f"value.get({self.wire_literal})"
+        return self.type.trusted_expr(f"value[{self.wire_literal}]")
+
+    @property
+    def query_local(self) -> str:
+        return f"{self.name}_value"
+
+    @property
+    def query_repeated(self) -> bool:
+        return self.type.items is not None
+
+    @property
+    def query_expr(self) -> str:
+        """Decode expression for the raw string(s) `from_query_string` collected in `query_local`."""
+        if self.type.items is not None:
+            args = [self.query_local, self.path_expr, _query_decoder(self.type.items) or "None"]
+            if self.optional:
+                args.append("optional=True")
+            return f"_decode_query_list({', '.join(args)})"
+        helper = "_decode_optional" if self.optional else "_decode_required"
+        decoder = _query_decoder(self.type) or "_decode_str"
+        return f"{helper}({decoder}, {self.query_local}, {self.path_expr})"
+
+
+@dataclass(frozen=True)
+class PythonContainerDecoder:
+    name: str
+    annotation: str
+    body: str
+    writer_name: str | None = None
+    writer_body: str | None = None
+    trusted_name: str | None = None
+    trusted_body: str | None = None
+
 
 @dataclass(frozen=True)
 class PythonDtoModel:
@@ -49,6 +120,72 @@ class PythonDtoModel:
     schema_name: str
     fields: tuple[PythonDtoField, ...]
 
+    @property
+    def batch_build_lines(self) -> tuple[str, ...]:
+        """Return statement of `from_values`, zipping the decoded columns into DTOs."""
+        if not self.fields:
+            return ("return [cls() for _ in rows]",)
+        items = ", ".join(f"{field.name}_item" for field in self.fields)
+        if len(self.fields) == 1:
+            field = self.fields[0]
+            return ("return [", f"    cls({field.name}={field.name}_item)", f"    for {items} in {field.name}_column", "]")
+        if len(self.fields) <= 3:
+            kwargs = ", ".join(f"{field.name}={field.name}_item" for field in self.fields)
+            columns = ", ".join(f"{field.name}_column" for field in self.fields)
+            return ("return [", f"    cls({kwargs})", f"    for {items} in zip({columns})", "]")
+        return (
+            "return [",
+            "    cls(",
+            *(f"        {field.name}={field.name}_item," for field in self.fields),
+            "    )",
+            f"    for {items} in zip(",
+            *(f"        {field.name}_column," for field in self.fields),
+            "    )",
+            "]",
+        )
+
+    @property
+    def query_keys_literal(self) -> str:
+        if not self.fields:
+            return "frozenset()"
+        return "frozenset({" + ", ".join(field.wire_literal for field in self.fields) + "})"
+
+    @property
+    def json_write_lines(self) -> tuple[str, ...]:
+        """Statements of `_write_json`, with separators resolved at codegen time.
+
+        The separator before a field stays a literal until an optional field
+        might have been skipped; from there a local `sep` tracks whether the
+        object is still empty.
+        """
+        lines: list[str] = []
+        state = "empty"  # "empty": nothing written, "open": written, "dynamic": unknown
+        for field in self.fields:
+            key = json.dumps(field.wire_name, ensure_ascii=False) + ":"
+            indent = ""
+            if field.optional:
+                lines.append(f"if self.{field.name} is not None:")
+                indent = "    "
+            if state == "empty" and field.optional:
+                lines.insert(0, 'sep = "{"')
+                state = "dynamic"
+            if state == "dynamic":
+                lines.append(f"{indent}out.append(sep + {key!r})")
+            else:
+                lines.append(f"{indent}out.append({('{' if state == 'empty' else ',') + key!r})")
+            lines.append(f"{indent}{field.type.writer}(out, self.{field.name})")
+            if state == "dynamic" and field.optional:
+                lines.append(f'{indent}sep = ","')
+            elif not field.optional:
+                state = "open"
+        if state == "empty":
+            lines.append('out.append("{}")')
+        elif state == "dynamic":
+            lines.append('out.append("{}" if sep == "{" else "}")')
+        else:
+            lines.append('out.append("}")')
+        return tuple(lines)
+
 
 @dataclass(frozen=True)
 class PythonEnumMember:
@@ -77,6 +214,7 @@ class PythonSchemaRegistry:
         self.schemas = schemas
         self._models: "OrderedDict[tuple[str, str], PythonDtoModel]" = OrderedDict()
         self._enums: "OrderedDict[str, PythonEnumModel]" = OrderedDict()
+        self._container_decoders: "OrderedDict[str, PythonContainerDecoder]" = OrderedDict()
         self._used_names: dict[str, int] = {}
 
     def models(self) -> tuple[PythonDtoModel, ...]:
@@ -85,6 +223,9 @@ class PythonSchemaRegistry:
     def enums(self) -> tuple[PythonEnumModel, ...]:
         return tuple(self._enums.values())
 
+    def container_decoders(self) -> tuple[PythonContainerDecoder, ...]:
+        return tuple(self._container_decoders.values())
+
     def resolve_schema(self, schema_name: str | None, *, class_name: str | None = None) -> PythonResolvedType | None:
         if not schema_name:
             return None
@@ -96,7 +237,7 @@ class PythonSchemaRegistry:
             return self.resolve_value(target) if isinstance(target, Mapping) else PythonResolvedType("Any")
         if schema.get("type") == "object":
             model = self.ensure_model(schema_name, class_name=class_name)
-            return PythonResolvedType(model.class_name, f"{model.class_name}.from_value")
+            return _model_type(model)
         return self.resolve_value(schema)
 
     def ensure_model(self, schema_name: str, *, class_name: str | None = None) -> PythonDtoModel:
@@ -143,32 +284,84 @@ class PythonSchemaRegistry:
         if value.get("ref"):
             ref = str(value["ref"])
             model = self.ensure_model(ref)
-            return PythonResolvedType(model.class_name, f"{model.class_name}.from_value")
+            return _model_type(model)
         value_type = str(value.get("type") or "any")
         if value_type == "array":
             item_type = self.resolve_value(_mapping(value.get("items")), strict_wire=strict_wire)
-            return PythonResolvedType(
+            scalar = _SCALAR_ITEM_TYPES.get(item_type.decoder)
+            if scalar is not None:
+                body = f"_decode_scalar_list(value, path, {scalar}, {item_type.decoder})"
+                writer_body = f"_write_json_scalar_list(out, value, {scalar}, {item_type.writer})"
+            else:
+                # Lists of DTOs decode column by column through the batched constructor.
+                if item_type.writer == "_write_json_model":
+                    body = f"{item_type.annotation}.from_values(value, path)"
+                else:
+                    body = f"_decode_list(value, path, {item_type.decoder})"
+                writer_body = f"_write_json_list(out, value, {item_type.writer})"
+            return self._container_decoder(
+                f"list_of_{_decoder_label(item_type.decoder)}",
                 f"list[{item_type.annotation}]",
-                f"lambda item, path: _decode_list(item, path, {item_type.decoder})",
+                body,
+                writer_body,
+                core=f"_core_list({item_type.core})",
+                refs=item_type.refs,
+                trusted_body=(
+                    None if item_type.trusted is None else f"[{item_type.trusted_expr('item')} for item in value]"
+                ),
+                items=item_type,
             )
         if value_type == "map":
             key_type = self.resolve_value(_mapping(value.get("keys")) or {"type": "string"}, strict_wire=strict_wire)
             item_type = self.resolve_value(_mapping(value.get("values")), strict_wire=strict_wire)
-            return PythonResolvedType(
+            scalar = _SCALAR_ITEM_TYPES.get(item_type.decoder)
+            if scalar is not None and key_type.decoder == "_decode_str":
+                body = f"_decode_scalar_map(value, path, {scalar}, {item_type.decoder})"
+                writer_body = f"_write_json_scalar_map(out, value, {scalar}, {item_type.writer})"
+            else:
+                body = f"_decode_map(value, path, {key_type.decoder}, {item_type.decoder})"
+                writer_body = f"_write_json_map(out, value, {item_type.writer})"
+            key_trusted = _trusted_key(key_type)
+            trusted_body = None
+            if key_trusted is not None or item_type.trusted is not None:
+                key_expr = "key" if key_trusted is None else key_trusted.format("key")
+                trusted_body = "{" + f"{key_expr}: {item_type.trusted_expr('item')} for key, item in value.items()" + "}"
+            return self._container_decoder(
+                f"map_of_{_decoder_label(key_type.decoder)}_to_{_decoder_label(item_type.decoder)}",
                 f"dict[{key_type.annotation}, {item_type.annotation}]",
-                f"lambda item, path: _decode_map(item, path, {key_type.decoder}, {item_type.decoder})",
+                body,
+                writer_body,
+                core=f"_core_map({key_type.core}, {item_type.core})",
+                refs=tuple(dict.fromkeys(key_type.refs + item_type.refs)),
+                trusted_body=trusted_body,
             )
         if value_type == "one_of":
             variants = [_mapping(item) for item in value.get("variants", []) if isinstance(item, Mapping)]
             variant_types = [self.resolve_value(variant, strict_wire=True) for variant in variants if variant is not None]
             annotation = " | ".join(dict.fromkeys(item.annotation for item in variant_types)) or "Any"
             decoders = ", ".join(item.decoder for item in variant_types) or "_decode_any"
-            return PythonResolvedType(annotation, f"lambda item, path: _decode_one_of(item, path, ({decoders},))")
+            label = "_or_".join(_decoder_label(item.decoder) for item in variant_types) or "any"
+            # Variants are told apart by their shape, so only all-scalar unions skip the decoder.
+            converts = any(item.trusted is not None for item in variant_types)
+            return self._container_decoder(
+                f"one_of_{label}",
+                annotation,
+                f"_decode_one_of(value, path, ({decoders},))",
+                trusted_body=f'_decode_one_of_{label}(value, "value")' if converts else None,
+            )
         if value_type == "coerce_string":
-            return PythonResolvedType("str", "_decode_coerce_string")
+            return PythonResolvedType(
+                "str", "_decode_coerce_string", "_write_json_str", "_core_coerce_string()", trusted="str({})"
+            )
         if value_type == "enum" or value.get("enum_values") or value.get("enum"):
             enum_model = self.ensure_enum(value)
-            return PythonResolvedType(enum_model.class_name, f"{enum_model.class_name}.from_value")
+            return PythonResolvedType(
+                enum_model.class_name,
+                f"{enum_model.class_name}.from_value",
+                "_write_json_enum",
+                f"_core_decoder({enum_model.class_name}.from_value)",
+                trusted=f"_{enum_model.class_name}_BY_VALUE[{{}}]",
+            )
         if strict_wire:
             return _STRICT_PRIMITIVE_TYPES.get(value_type, _PRIMITIVE_TYPES.get(value_type, PythonResolvedType("Any")))
         return _PRIMITIVE_TYPES.get(value_type, PythonResolvedType("Any"))
@@ -210,6 +403,49 @@ class PythonSchemaRegistry:
         self._enums[identity] = enum_model
         return enum_model
 
+    def _container_decoder(
+        self,
+        label: str,
+        annotation: str,
+        body: str,
+        writer_body: str | None = None,
+        *,
+        core: str | None = None,
+        refs: tuple[str, ...] = (),
+        trusted_body: str | None = None,
+        items: PythonResolvedType | None = None,
+    ) -> PythonResolvedType:
+        # Container shapes get one module-level decoder (and JSON writer) in
+        # gen_types instead of a lambda rebuilt on every call.
+        name = f"_decode_{label}"
+        writer_name = f"_write_json_{label}" if writer_body is not None else None
+        trusted_name = f"_trust_{label}" if trusted_body is not None else None
+        if name not in self._container_decoders:
+            self._container_decoders[name] = PythonContainerDecoder(
+                name, annotation, body, writer_name, writer_body, trusted_name, trusted_body
+            )
+        return PythonResolvedType(
+            annotation,
+            name,
+            writer_name or "_write_json_any",
+            core or f"_core_decoder({name})",
+            refs,
+            None if trusted_name is None else f"{trusted_name}({{}})",
+            items,
+        )
+
+    def core_refs(self, model: PythonDtoModel) -> tuple[str, ...]:
+        """Class names of `model` and every DTO its compiled schema references."""
+        by_name = {item.class_name: item for item in self._models.values()}
+        refs = [model.class_name]
+        for class_name in refs:
+            current = by_name.get(class_name)
+            if current is None:
+                continue
+            for field in current.fields:
+                refs.extend(ref for ref in field.type.refs if ref not in refs)
+        return tuple(refs)
+
     def _unique_name(self, preferred: str) -> str:
         base = preferred or "Model"
         count = self._used_names.get(base, 0) + 1
@@ -219,6 +455,40 @@ class PythonSchemaRegistry:
         return f"{base}{count}"
 
 
+def _model_type(model: PythonDtoModel) -> PythonResolvedType:
+    return PythonResolvedType(
+        model.class_name,
+        f"{model.class_name}.from_value",
+        "_write_json_model",
+        f"_core_ref({json.dumps(model.class_name)})",
+        (model.class_name,),
+        f"{model.class_name}.from_trusted({{}})",
+    )
+
+
+def _trusted_key(key_type: PythonResolvedType) -> str | None:
+    # JSON object keys are always strings; non-string key types still need converting.
+    if key_type.trusted is not None:
+        return key_type.trusted
+    if key_type.decoder in ("_decode_str", "_decode_any"):
+        return None
+    return f'{key_type.decoder}({{}}, "<key>")'
+
+
+def _query_decoder(value_type: PythonResolvedType) -> str | None:
+    # Query values are always strings: None keeps them as-is, scalars parse the
+    # string directly, anything else goes through its regular decoder.
+    if value_type.decoder in _QUERY_STRING_DECODERS:
+        return None
+    return _QUERY_DECODERS.get(value_type.decoder, value_type.decoder)
+
+
+def _decoder_label(decoder: str) -> str:
+    if decoder.endswith(".from_value"):
+        return decoder[: -len(".from_value")]
+    return decoder.removeprefix("_decode_")
+
+
 def _mapping(value: object) -> Mapping[str, Any] | None:
     return value if isinstance(value, Mapping) else None
 
@@ -253,47 +523,69 @@ def _dedupe_enum_members(members: list[PythonEnumMember]) -> tuple[PythonEnumMem
 
 _PRIMITIVE_TYPES: dict[str, PythonResolvedType] = {
     "any": PythonResolvedType("Any"),
-    "object": PythonResolvedType("dict[str, Any]", "_decode_object"),
-    "string": PythonResolvedType("str", "_decode_str"),
-    "str": PythonResolvedType("str", "_decode_str"),
-    "int": PythonResolvedType("int", "_decode_int"),
-    "integer": PythonResolvedType("int", "_decode_int"),
-    "int8": PythonResolvedType("int", "_decode_int"),
-    "int16": PythonResolvedType("int", "_decode_int"),
-    "int32": PythonResolvedType("int", "_decode_int"),
-    "int64": PythonResolvedType("int", "_decode_int"),
-    "uint": PythonResolvedType("int", "_decode_int"),
-    "uint8": PythonResolvedType("int", "_decode_int"),
-    "uint16": PythonResolvedType("int", "_decode_int"),
-    "uint32": PythonResolvedType("int", "_decode_int"),
-    "uint64": PythonResolvedType("int", "_decode_int"),
-    "float": PythonResolvedType("float", "_decode_float"),
-    "float32": PythonResolvedType("float", "_decode_float"),
-    "float64": PythonResolvedType("float", "_decode_float"),
-    "number": PythonResolvedType("float", "_decode_float"),
-    "boolean": PythonResolvedType("bool", "_decode_bool"),
-    "bool": PythonResolvedType("bool", "_decode_bool"),
-    "binary": PythonResolvedType("bytes", "_decode_bytes"),
-    "file": PythonResolvedType("ApiUploadFile", "_decode_file"),
+    "object": PythonResolvedType("dict[str, Any]", "_decode_object", core="_core_object()"),
+    "string": PythonResolvedType("str", "_decode_str", "_write_json_str", "_core_str()"),
+    "str": PythonResolvedType("str", "_decode_str", "_write_json_str", "_core_str()"),
+    "int": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "integer": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "int8": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "int16": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "int32": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "int64": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "uint": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "uint8": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "uint16": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "uint32": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "uint64": PythonResolvedType("int", "_decode_int", "_write_json_int", "_core_int()"),
+    "float": PythonResolvedType("float", "_decode_float", "_write_json_float", "_core_float()"),
+    "float32": PythonResolvedType("float", "_decode_float", "_write_json_float", "_core_float()"),
+    "float64": PythonResolvedType("float", "_decode_float", "_write_json_float", "_core_float()"),
+    "number": PythonResolvedType("float", "_decode_float", "_write_json_float", "_core_float()"),
+    "boolean": PythonResolvedType("bool", "_decode_bool", "_write_json_bool", "_core_bool()"),
+    "bool": PythonResolvedType("bool", "_decode_bool", "_write_json_bool", "_core_bool()"),
+    "binary": PythonResolvedType(
+        "bytes", "_decode_bytes", core="_core_decoder(_decode_bytes)", trusted='_decode_bytes({}, "value")'
+    ),
+    "file": PythonResolvedType("ApiUploadFile", "_decode_file", core="_core_decoder(_decode_file)"),
+}
+
+# Item decoders whose lists/maps take a no-call fast path when every item
+# already has the exact Python type.
+_SCALAR_ITEM_TYPES: dict[str, str] = {
+    "_decode_str": "str",
+    "_decode_int": "int",
+    "_decode_strict_int": "int",
+    "_decode_float": "float",
+    "_decode_strict_float": "float",
+    "_decode_bool": "bool",
+    "_decode_strict_bool": "bool",
+}
+
+_QUERY_STRING_DECODERS = frozenset({"_decode_any", "_decode_str", "_decode_coerce_string"})
+
+_QUERY_DECODERS: dict[str, str] = {
+    "_decode_int": "_decode_query_int",
+    "_decode_float": "_decode_query_float",
+    "_decode_bool": "_decode_query_bool",
 }
 
 _STRICT_PRIMITIVE_TYPES: dict[str, PythonResolvedType] = {
     **_PRIMITIVE_TYPES,
-    "int": PythonResolvedType("int", "_decode_strict_int"),
-    "integer": PythonResolvedType("int", "_decode_strict_int"),
-    "int8": PythonResolvedType("int", "_decode_strict_int"),
-    "int16": PythonResolvedType("int", "_decode_strict_int"),
-    "int32": PythonResolvedType("int", "_decode_strict_int"),
-    "int64": PythonResolvedType("int", "_decode_strict_int"),
-    "uint": PythonResolvedType("int", "_decode_strict_int"),
-    "uint8": PythonResolvedType("int", "_decode_strict_int"),
-    "uint16": PythonResolvedType("int", "_decode_strict_int"),
-    "uint32": PythonResolvedType("int", "_decode_strict_int"),
-    "uint64": PythonResolvedType("int", "_decode_strict_int"),
-    "float": PythonResolvedType("float", "_decode_strict_float"),
-    "float32": PythonResolvedType("float", "_decode_strict_float"),
-    "float64": PythonResolvedType("float", "_decode_strict_float"),
-    "number": PythonResolvedType("float", "_decode_strict_float"),
-    "boolean": PythonResolvedType("bool", "_decode_strict_bool"),
-    "bool": PythonResolvedType("bool", "_decode_strict_bool"),
+    "int": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "integer": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "int8": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "int16": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "int32": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "int64": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "uint": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "uint8": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "uint16": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "uint32": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "uint64": PythonResolvedType("int", "_decode_strict_int", "_write_json_int", "_core_strict_int()"),
+    "float": PythonResolvedType("float", "_decode_strict_float", "_write_json_float", "_core_strict_float()"),
+    "float32": PythonResolvedType("float", "_decode_strict_float", "_write_json_float", "_core_strict_float()"),
+    "float64": PythonResolvedType("float", "_decode_strict_float", "_write_json_float", "_core_strict_float()"),
+    "number": PythonResolvedType("float", "_decode_strict_float", "_write_json_float", "_core_strict_float()"),
+    "boolean": PythonResolvedType("bool", "_decode_strict_bool", "_write_json_bool", "_core_strict_bool()"),
+    "bool": PythonResolvedType("bool", "_decode_strict_bool", "_write_json_bool", "_core_strict_bool()"),
 }
@@ -30,7 +30,7 @@ from .planner import build_python_blueprint_plan
 if TYPE_CHECKING:
     from api_blueprint.contract import ContractGraph
     from .blueprint import PythonRouteGroup
-    from .planner import PythonRouteGroupPlan
+    from .planner import PythonAsgiTransportPlan, PythonRouteGroupPlan
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -42,12 +42,15 @@ ROUTE_BINARY_MODULE = "gen_binary.py"
 LEGACY_ROUTE_BINARY_MODULES = ("wire.py",)
 LEGACY_ROUTE_BINARY_DIR = "binary"
 ROUTE_TYPES_MODULE = "gen_types.py"
+CODEC_BACKENDS = ("builtin", "pydantic-core")
 
 
 class PythonBaseWriter(BaseWriter[PythonBlueprint]):
     runtime_template: str
     route_template: str
     transport_template: str
+    asgi_transport_template: str | None = None
+    writes_server_metrics: bool = False
     target_label: str
     generated_header: str
 
@@ -61,6 +64,9 @@ class PythonBaseWriter(BaseWriter[PythonBlueprint]):
         include: Sequence[str] = (),
         exclude: Sequence[str] = (),
         contract_graph: "ContractGraph | None" = None,
+        model_slots: bool = False,
+        model_frozen: bool = False,
+        codec_backend: str = "builtin",
     ):
         super().__init__(working_dir)
         self.package_segments = to_package_segments(python_package_root)
@@ -71,6 +77,11 @@ class PythonBaseWriter(BaseWriter[PythonBlueprint]):
         self.exclude = normalize_selection_rules(exclude)
         self.contract_graph = contract_graph
         self.route_contract_index = RouteContractIndex.from_graph(contract_graph) if contract_graph is not None else None
+        self.model_slots = bool(model_slots)
+        self.model_frozen = bool(model_frozen)
+        if codec_backend not in CODEC_BACKENDS:
+            raise ValueError(f"unsupported Python codec_backend: {codec_backend} (expected one of {', '.join(CODEC_BACKENDS)})")
+        self.codec_backend = codec_backend
 
     @property
     def package_dir(self) -> Path:
@@ -79,6 +90,21 @@ class PythonBaseWriter(BaseWriter[PythonBlueprint]):
             path /= segment
         return path
 
+    @property
+    def model_dataclass_options(self) -> str:
+        # Route DTOs are only built through their constructor, so slots and frozen
+        # never change what from_value / to_mapping / to_transport_mapping do.
+        options = ["kw_only=True"]
+        if self.model_slots:
+            options.append("slots=True")
+        if self.model_frozen:
+            options.append("frozen=True")
+        return ", ".join(options)
+
+    @property
+    def compiled_codecs(self) -> bool:
+        return self.codec_backend == "pydantic-core"
+
     def gen(self) -> None:
         self._ensure_route_contract_index()
         for bp in self.bps:
@@ -159,6 +185,29 @@ class PythonBaseWriter(BaseWriter[PythonBlueprint]):
             if handle:
                 handle.write(self.generated_header)
                 handle.write(_render_python("gen_codecs.py", context, "runtime"))
+        core_codecs_file = plan.runtime.directory / "gen_core_codecs.py"
+        if self.compiled_codecs:
+            with self.write_file(core_codecs_file, overwrite=True) as handle:
+                if handle:
+                    handle.write(self.generated_header)
+                    handle.write(_render_python("gen_core_codecs.py", context, "runtime"))
+        else:
+            self._cleanup_stale_generated(core_codecs_file)
+        with self.write_file(plan.runtime.directory / "gen_websocket.py", overwrite=True) as handle:
+            if handle:
+                handle.write(self.generated_header)
+                handle.write(_render_python("gen_websocket.py", context, "runtime"))
+        with self.write_file(plan.runtime.directory / "websocket.py", overwrite=False) as handle:
+            if handle:
+                handle.write(self._render_public_facade(("gen_websocket",)))
+        if self.writes_server_metrics:
+            with self.write_file(plan.runtime.directory / "gen_metrics.py", overwrite=True) as handle:
+                if handle:
+                    handle.write(self.generated_header)
+                    handle.write(_render_python("gen_metrics.py", context, "runtime"))
+            with self.write_file(plan.runtime.directory / "metrics.py", overwrite=False) as handle:
+                if handle:
+                    handle.write(self._render_public_facade(("gen_metrics",)))
         binary_runtime_dir = plan.runtime.directory / "binary"
         self._ensure_package_markers(binary_runtime_dir)
         with self.write_file(binary_runtime_dir / "gen_runtime.py", overwrite=True) as handle:
@@ -189,6 +238,8 @@ class PythonBaseWriter(BaseWriter[PythonBlueprint]):
             if handle:
                 handle.write(self.generated_header)
                 handle.write(_render_python(self.transport_template, context, "transports/http"))
+        if plan.asgi_transport is not None:
+            self._gen_asgi_transport(plan.asgi_transport, context)
         self._write_client_facade(bp, plan)
 
     def root_dir(self, bp: PythonBlueprint) -> Path:
@@ -247,6 +298,16 @@ class PythonBaseWriter(BaseWriter[PythonBlueprint]):
                 handle.write(_render_python("gen_types.py", {"writer": self, "group": group_plan.group}, "routes"))
         self._cleanup_legacy_route_dir(group_plan)
 
+    def _gen_asgi_transport(self, asgi_plan: "PythonAsgiTransportPlan", context: dict[str, object]) -> None:
+        self._ensure_package_markers(asgi_plan.directory)
+        with self.write_file(asgi_plan.public_file, overwrite=False) as handle:
+            if handle:
+                handle.write(self._render_public_facade((asgi_plan.generated_file.stem,)))
+        with self.write_file(asgi_plan.generated_file, overwrite=True) as handle:
+            if handle:
+                handle.write(self.generated_header)
+                handle.write(_render_python(asgi_plan.generated_file.name, context, "transports/asgi"))
+
     def _write_client_facade(self, bp: PythonBlueprint, plan) -> None:
         if not isinstance(self, PythonClientWriter):
             return
@@ -394,6 +455,8 @@ class PythonServerWriter(PythonBaseWriter):
     runtime_template = "gen_server.py"
     route_template = "gen_service.py"
     transport_template = "gen_server.py"
+    asgi_transport_template = "gen_server.py"
+    writes_server_metrics = True
     target_label = "Python server"
     generated_header = "# Code generated by api-blueprint (Python server); DO NOT EDIT.\n"
 
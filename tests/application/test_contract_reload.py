@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from api_blueprint.application.contract_reload import ContractReloader
+from api_blueprint.application.entrypoints import load_entrypoints
+from api_blueprint.application.project import build_entrypoints
+
+
+def _write_module(path: Path, root: str, leaves: tuple[str, ...]) -> None:
+    routes = "\n".join(f'    views.GET("/{leaf}").RSP(message=String(description="message"))' for leaf in leaves)
+    path.write_text(
+        f"""
+from api_blueprint.engine import Blueprint
+from api_blueprint.engine.model import String
+
+bp = Blueprint(root="{root}")
+with bp.group("/demo") as views:
+{routes}
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _route_paths(client: TestClient) -> set[str]:
+    return {route["path"] for route in client.get("/docs/index.json").json()["routes"]}
+
+
+def test_contract_reloader_swaps_only_changed_blueprints_in_place(tmp_path):
+    pkg = tmp_path / "reloadbp"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    _write_module(pkg / "alpha.py", "/alpha", ("ping",))
+    _write_module(pkg / "beta.py", "/beta", ("ping",))
+
+    reloader = ContractReloader(tmp_path)
+    entrypoints = load_entrypoints(["reloadbp.alpha:bp", "reloadbp.beta:bp"], tmp_path, on_import=reloader.record)
+    build_entrypoints(entrypoints)
+    app = entrypoints[0].app
+    beta_routes = [route for route in app.router.routes if getattr(route, "path", "").startswith("/beta/")]
+
+    with TestClient(app) as client:
+        assert _route_paths(client) == {"/alpha/demo/ping", "/beta/demo/ping"}
+        version = app.state.api_blueprint_docs_version
+
+        _write_module(pkg / "alpha.py", "/alpha", ("ping", "pong"))
+        assert reloader.poll() == ["reloadbp.alpha:bp"]
+
+        assert _route_paths(client) == {"/alpha/demo/ping", "/alpha/demo/pong", "/beta/demo/ping"}
+        assert "/alpha/demo/pong" in client.get("/openapi.json").json()["paths"]
+        assert app.state.api_blueprint_docs_version > version
+        assert all(route in app.router.routes for route in beta_routes)
+        assert reloader.poll() == []
+
+        (pkg / "alpha.py").write_text("this is not python\n", encoding="utf-8")
+        assert reloader.poll() == []
+        assert "/alpha/demo/pong" in _route_paths(client)
+
+
+def test_contract_reloader_thread_reloads_on_server_loop_and_keeps_shared_app(tmp_path):
+    import asyncio
+    import time
+
+    from api_blueprint.engine.runtime.shared_app import replace_shared_app
+
+    pkg = tmp_path / "loopbp"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    _write_module(pkg / "alpha.py", "/alpha", ("ping",))
+
+    reloader = ContractReloader(tmp_path, interval=0.01)
+    entrypoints = load_entrypoints(["loopbp.alpha:bp"], tmp_path, on_import=reloader.record)
+    build_entrypoints(entrypoints)
+    app = entrypoints[0].app
+    reload_loops: list[asyncio.AbstractEventLoop] = []
+    reload = reloader.reload
+
+    def tracked_reload(specs: list[str]) -> None:
+        reload_loops.append(asyncio.get_running_loop())
+        reload(specs)
+
+    reloader.reload = tracked_reload  # type: ignore[method-assign]
+    previous_shared = replace_shared_app(app)
+    try:
+        with TestClient(app) as client:
+            server_loop = reloader._loops[app]
+            reloader.start()
+            try:
+                _write_module(pkg / "alpha.py", "/alpha", ("ping", "pong"))
+                deadline = time.monotonic() + 5
+                while "/alpha/demo/pong" not in _route_paths(client) and time.monotonic() < deadline:
+                    time.sleep(0.01)
+            finally:
+                reloader.stop()
+
+            assert "/alpha/demo/pong" in _route_paths(client)
+            assert reload_loops == [server_loop]
+            assert replace_shared_app(app) is app
+    finally:
+        replace_shared_app(previous_shared)
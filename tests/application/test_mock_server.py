@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api_blueprint.application.mock import MockOptions, _evaluate, build_mock_app
+from api_blueprint.contract import build_contract_graph
+from api_blueprint.engine import Blueprint, CodeMessageDataEnvelope, Model, reset_shared_app
+from api_blueprint.engine.binary_schema import parse_binary_schema
+from api_blueprint.engine.model import Array, Int, String
+from api_blueprint.includes import Error
+
+PACKET_SCHEMA = """
+# packet MockPacket
+
+endian: little
+content-type: application/octet-stream
+
+## header
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| magic | bytes | 4 | const="MOCK" | magic |
+| item_num | u16 | 1 | min=2,max=8,sizeof=items | item count |
+
+## body
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| items | MockItem | item_num | | items |
+| checksum | u32 | 1 | assert=item_num * 3 | checksum |
+
+## struct MockItem
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| id | u32 | 1 | min=7 | id |
+""".strip()
+
+
+class MockErr(Model):
+    RATE_LIMITED = Error(42901, "too many requests")
+
+
+class MockItem(Model):
+    name = String(description="name")
+    count = Int(description="count")
+
+
+class MockTick(Model):
+    seq = Int(description="seq")
+
+
+def _build_graph():
+    reset_shared_app()
+    bp = Blueprint(root="/api", response_envelope=CodeMessageDataEnvelope, errors=[MockErr])
+    with bp.group("/mock") as views:
+        views.GET("/items").RSP(items=Array[MockItem](description="items"))
+        views.GET("/packet").RSP_BINARY_SCHEMA(parse_binary_schema(PACKET_SCHEMA, source_path="mock_packet.md"))
+        views.STREAM("/ticks").SERVER_MESSAGE("MockTickMessage", tick=MockTick)
+    bp.build()
+    return build_contract_graph([bp])
+
+
+def test_mock_server_replays_schema_examples_for_json_binary_and_stream_routes() -> None:
+    client = TestClient(build_mock_app(_build_graph()))
+
+    items = client.get("/api/mock/items")
+    assert items.json() == {"code": 0, "message": "ok", "data": {"items": [{"name": "string", "count": 0}]}}
+    assert items.headers["content-length"] == str(len(items.content))
+
+    packet = client.get("/api/mock/packet")
+    assert packet.headers["content-type"] == "application/octet-stream"
+    assert packet.content == b"MOCK" + (2).to_bytes(2, "little") + (7).to_bytes(4, "little") * 2 + (6).to_bytes(4, "little")
+
+    with client.stream("GET", "/api/mock/ticks") as stream:
+        frames = stream.read().decode("utf-8").split("\n\n")
+    assert json.loads(frames[0].removeprefix("data: ")) == {"type": "tick", "data": {"seq": 0}}
+    assert frames[1].startswith("event: close\ndata: ")
+
+
+def test_mock_server_injects_declared_errors_in_the_route_envelope() -> None:
+    client = TestClient(build_mock_app(_build_graph(), MockOptions(error_rate=1.0, seed=7)))
+
+    response = client.get("/api/mock/items")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["code"] == 42901
+    assert body["data"] is None
+    assert body["error"]["id"] == "MockErr.RATE_LIMITED"
+
+
+def test_mock_server_evaluates_min_expressions_without_eval() -> None:
+    schema = parse_binary_schema(
+        """
+# packet MockRange
+
+endian: little
+content-type: application/octet-stream
+
+## body
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| low | u16 | 1 | min=3 | low |
+| high | u16 | 1 | min=(low + 1) * 2 | high |
+""".strip(),
+        source_path="mock_range.md",
+    )
+    reset_shared_app()
+    bp = Blueprint(root="/api")
+    with bp.group("/mock") as views:
+        views.GET("/range").RSP_BINARY_SCHEMA(schema)
+    bp.build()
+    client = TestClient(build_mock_app(build_contract_graph([bp])))
+
+    assert client.get("/api/mock/range").content == (3).to_bytes(2, "little") + (8).to_bytes(2, "little")
+
+    with pytest.raises(ValueError, match="unsupported rule expression"):
+        _evaluate("low.__class__", {"low": 3})
+    with pytest.raises(ValueError, match="unsupported rule expression"):
+        _evaluate("low ** 2", {"low": 3})
@@ -17,3 +17,42 @@ def test_api_gen_help_only_lists_unified_1_0_commands() -> None:
         assert command in result.output
     for legacy in ("gen-golang", "gen-typescript", "gen-kotlin", "gen-grpc", "gen-wails"):
         assert legacy not in result.output
+
+def test_api_gen_docs_export_writes_hashed_precompressed_static_site(tmp_path):
+    _write_blueprint(tmp_path)
+    config_path = tmp_path / "api-blueprint.toml"
+    config_path.write_text(
+        """
+[blueprint]
+entrypoints = ["blueprints.app:bp"]
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+    out_dir = tmp_path / "site"
+
+    result = CliRunner().invoke(api_gen, ["docs", "export", "-c", str(config_path), "--out", str(out_dir)])
+
+    assert result.exit_code == 0, result.output
+    manifest = json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))
+    for url in ("/docs/index.json", "/docs/protocol.json", "/asyncapi.json", "/openapi.json", "/static/swagger-ui.css"):
+        assert manifest[url].startswith("assets/")
+        assert (out_dir / manifest[url]).is_file()
+        assert (out_dir / (manifest[url] + ".gz")).is_file()
+    group_slice = manifest["/docs/openapi.json?group=/api/demo"]
+    assert "/api/demo/ping" in json.loads((out_dir / group_slice).read_text(encoding="utf-8"))["paths"]
+
+    index_html = (out_dir / "index.html").read_text(encoding="utf-8")
+    assert f'fetch("{manifest["/docs/index.json"]}")' in index_html
+    assert 'href="swagger.html"' in index_html
+    assert '"/docs/' not in index_html
+    swagger_html = (out_dir / "swagger.html").read_text(encoding="utf-8")
+    assert manifest["/static/swagger-ui-bundle.js"] in swagger_html
+    assert "url: apiBlueprintOpenapiUrl()" in swagger_html
+    assert group_slice in swagger_html
+    for page, url in (("protocol.html", "/docs/protocol.json"), ("asyncapi.html", "/asyncapi.json")):
+        page_slice = manifest[f"{url}?group=/api/demo"]
+        assert (out_dir / page_slice).is_file()
+        page_html = (out_dir / page).read_text(encoding="utf-8")
+        assert json.dumps(page_slice) in page_html
+        assert f"|| {json.dumps(manifest[url])};" in page_html
@@ -419,6 +419,28 @@ emit_contract_metadata = true
     assert 'options: {"emit_contract_metadata": true}' in result.output
 
 
+def test_api_gen_explain_target_shows_python_model_options(tmp_path):
+    config_path = tmp_path / "api-blueprint.toml"
+    config_path.write_text(
+        """
+[[targets]]
+id = "python.client"
+kind = "python-client"
+out_dir = "python/client"
+
+[targets.options]
+model_slots = true
+model_frozen = true
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+
+    result = CliRunner().invoke(api_gen, ["explain-target", "-c", str(config_path), "--target", "python.client"])
+    assert result.exit_code == 0, result.output
+    assert 'options: {"model_frozen": true, "model_slots": true}' in result.output
+
+
 def test_api_gen_inspect_route_uses_operation_id_for_channel_operation(tmp_path):
     _write_connection_inspect_blueprint(tmp_path)
     config_path = _write_inspect_config(tmp_path)
@@ -74,6 +74,34 @@ protocol_docs_plugins = ["docs_plugins.protocol:plugin"]
     assert config.blueprint is not None
     assert config.blueprint.protocol_docs_plugins == ["docs_plugins.protocol:plugin"]
 
+
+def test_blueprint_upstream_options_load_from_config(tmp_path) -> None:
+    from api_blueprint.application.docs import _docs_upstream
+    from api_blueprint.engine import UpstreamClientOptions
+
+    config_path = tmp_path / "api-blueprint.toml"
+    config_path.write_text(
+        """
+[blueprint]
+entrypoints = ["blueprints.app:*"]
+
+[blueprint.upstream]
+url = "http://127.0.0.1:9000"
+max_connections = 8
+read_timeout = 30.0
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+
+    config = Config.load(config_path)
+
+    assert _docs_upstream(config) == (
+        "http://127.0.0.1:9000",
+        UpstreamClientOptions(max_connections=8, read_timeout=30.0),
+    )
+
+
 def test_target_manifest_keeps_sibling_go_output_portable(tmp_path) -> None:
     service_root = tmp_path / "services" / "agent"
     scripts_dir = service_root / "scripts"
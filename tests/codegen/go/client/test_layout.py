@@ -204,6 +204,8 @@ def test_golang_client_writer_generates_layout_preserves_user_files_and_compiles
     assert '"CommonErr.UNKNOWN"' in catalog_text
     assert "ApiErrorsByID" in catalog_text
     assert "routeApiErrorsByCode" in catalog_text
+    assert '\tCommonErrTokenExpire: ApiErrorsByID["CommonErr.TOKEN_EXPIRE"],' in catalog_text
+    assert "entry, ok := apiErrorsByCode[code]" in catalog_text
     assert "CommonErrTokenExpire ApiErrorCode = 55555" in catalog_text
     assert '"CommonErr.TOKEN_EXPIRE": {\n' in catalog_text
     assert 'ID:      "CommonErr.TOKEN_EXPIRE",' in catalog_text
@@ -461,3 +461,42 @@ func TestHTTPAdapterFallsBackForTypedNilAdapter(t *testing.T) {
         check=False,
     )
     assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_golang_http_adapter_times_rpc_routes_through_optional_observer(tmp_path):
+    output_dir = tmp_path / "golang"
+    output_dir.mkdir()
+    (tmp_path / "go.mod").write_text(
+        """
+module example.com/generated
+
+go 1.23.8
+        """.strip()
+        + "\n",
+        encoding="utf-8",
+    )
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.GET("/ping").RSP()
+
+    writer = GolangWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+
+    http_dir = output_dir / "transports" / "http"
+    observer = (http_dir / "gen_observer.go").read_text(encoding="utf-8")
+    engine = (http_dir / "gen_engine.go").read_text(encoding="utf-8")
+    rsp = (output_dir / "providers" / "gen_rsp.go").read_text(encoding="utf-8")
+    assert "func SetRouteObserver(observer RouteObserver)" in observer
+    assert "StartRoute(ctx context.Context, routeID string) (context.Context, any)" in observer
+    assert "func NewRouteHistogram(buckets ...float64) *RouteHistogram" in observer
+    assert "func (histogram *RouteHistogram) WritePrometheus(w io.Writer) error" in observer
+    assert "api_blueprint_route_duration_seconds_bucket%s %d" in observer
+    assert "probe := startRouteProbe(ginCtx, executor.Route.RouteID)" in engine
+    assert "ctx := newContext(ginCtx, executor, probe)" in engine
+    assert "defer probe.bindDone(started)" in engine
+    assert "errorCode, invokeErr = provider.ResolveError(executor.Route, executor.Runtime, invokeErr)" in engine
+    assert "probe.finish(ginCtx, errorCode)" in engine
+    assert "func ResolveError(route RouteInfo, runtime RuntimeOptions, err error) (int, error)" in rsp
+    assert "if resolved, ok := err.(*resolvedError); ok {" in rsp
@@ -472,3 +472,22 @@ def test_java_writer_name_filter_uses_resolved_operation_name(tmp_path: Path) ->
     ).read_text(encoding="utf-8")
     assert "currentGet(" in route_text
     assert "currentPut(" not in route_text
+
+
+def test_java_server_generates_route_metrics_interceptor(tmp_path: Path) -> None:
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.GET("/ping").RSP(message=String(description="message"))
+
+    writer = JavaServerWriter(tmp_path / "java", package="com.example.generated", spring_public_paths=["/api/**"])
+    writer.register(bp)
+    writer.gen()
+
+    spring_dir = tmp_path / "java" / "com" / "example" / "generated" / "api" / "spring"
+    interceptor = (spring_dir / "GenSpringRouteMetrics.java").read_text(encoding="utf-8")
+    histogram = (spring_dir / "GenSpringRouteHistogram.java").read_text(encoding="utf-8")
+    assert "public final class GenSpringRouteMetrics implements HandlerInterceptor" in interceptor
+    assert "method.getMethodAnnotation(ApiBlueprintOperation.class)" in interceptor
+    assert "ex instanceof GenApiError error ? Integer.valueOf(error.code()) : null" in interceptor
+    assert "public final class GenSpringRouteHistogram implements GenSpringRouteMetrics.Hooks" in histogram
+    assert "public synchronized String prometheusText()" in histogram
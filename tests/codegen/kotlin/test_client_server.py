@@ -169,6 +169,8 @@ def test_kotlin_writer_generates_root_runtime_routes_and_http_transport_for_full
     assert '"CommonErr.UNKNOWN"' in catalog_text
     assert "val ApiErrorsByID" in catalog_text
     assert "routeApiErrorsByCode" in catalog_text
+    assert "    return apiErrorsByCode[code]" in catalog_text
+    assert "        if (seed.repeats(catalog)) {" in catalog_text
     assert "const val TOKEN_EXPIRE: Int = 55555" in catalog_text
     assert 'default = "登录状态已失效，请重新登录"' in catalog_text
     assert "\\u767b" not in catalog_text
@@ -289,3 +291,31 @@ def test_kotlin_writer_generates_custom_response_envelope_spec(tmp_path):
     assert ": GenApiClient(transport)" in client_facade_text
     assert "public fun createHttpApiClient" in http_facade_text
     assert "config: HttpApiConfig = HttpApiConfig()" in http_facade_text
+
+
+def test_kotlin_server_reports_rpc_route_timings_to_optional_hooks(tmp_path: Path) -> None:
+    class DemoErr(Model):
+        BUSY = Error(42901, "busy")
+
+    bp = Blueprint(root="/api", errors=[DemoErr])
+    with bp.group("/demo") as views:
+        views.POST("/submit").REQ(value=String(description="value")).RSP(status=String(description="status"))
+
+    writer = KotlinServerWriter(tmp_path / "kotlin", package="com.example.generated")
+    writer.register(bp)
+    writer.gen()
+
+    root_dir = tmp_path / "kotlin" / "com" / "example" / "generated" / "api"
+    metrics_text = (root_dir / "runtime" / "GenApiServerMetrics.kt").read_text(encoding="utf-8")
+    runtime_text = (root_dir / "runtime" / "GenApiServerResponse.kt").read_text(encoding="utf-8")
+    ktor_text = (root_dir / "transports" / "ktor" / "api" / "demo" / "GenDemoKtorRoutes.kt").read_text(encoding="utf-8")
+
+    assert "public val routeHooks: ApiRouteHooks? = null," in runtime_text
+    assert "public interface ApiRouteHooks {" in metrics_text
+    assert "public class ApiRouteHistogram(buckets: List<Double> = DEFAULT_ROUTE_BUCKETS) : ApiRouteHooks {" in metrics_text
+    assert "public fun prometheusText(): String" in metrics_text
+    assert 'val probe = config.routeHooks?.let { startRouteProbe(it, "api.demo.post.submit", call) }' in ktor_text
+    assert "            probe?.decoded()\n" in ktor_text
+    assert "                probe?.handled()\n" in ktor_text
+    assert "                probe?.errorCode = error.code\n" in ktor_text
+    assert "            probe?.finish(call.response.status()?.value ?: HttpStatusCode.OK.value)\n" in ktor_text
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import gzip
+import struct
+import threading
+import zlib
+from typing import Any
+
 from .helpers import *
 
 
@@ -41,8 +47,9 @@ content-encoding: identity,gzip,br
     assert "binary: DemoPacket" in service_text
     assert "binary: bytes | None = None" not in service_text
     assert "binary: dict[str, Any] | None = None" not in service_text
-    assert "binary_body = await _binary_body(" in adapter_text
-    assert "binary = api_binary_types.DemoPacketWire.from_bytes(binary_body)" in adapter_text
+    assert "binary = await _binary_schema_body(" in adapter_text
+    assert "from_bytes=api_binary_types.DemoPacketWire.from_bytes," in adapter_text
+    assert "from_stream=api_binary_types.DemoPacketWire.from_stream," in adapter_text
     assert "class HttpRouteInfo:" in adapter_text
     assert "binary_content_encodings=('identity', 'gzip', 'br')" in adapter_text
     assert "request_info=route_info.request" in adapter_text
@@ -51,6 +58,7 @@ content-encoding: identity,gzip,br
     assert "UnsupportedContentEncodingError" in adapter_text
     assert "decompressed_binary_max_bytes: int = 16 * 1024 * 1024" in runtime_text
     assert "binary_content_decoders: Mapping[str, Callable[[bytes], bytes]]" in runtime_text
+    assert "binary_stream_min_bytes: int = 64 * 1024" in runtime_text
     _compile_generated_files(output_dir)
     asyncio.run(_assert_python_server_br_stub_decoder(output_dir))
 
@@ -124,6 +132,328 @@ async def _assert_python_server_br_stub_decoder(output_dir: Path) -> None:
                 del sys.modules[name]
 
 
+def test_python_server_streams_binary_schema_requests_through_incremental_reader(tmp_path: Path):
+    schema = parse_binary_schema(
+        """
+# packet TelemetryPacket
+
+endian: little
+content-encoding: identity,gzip
+
+## header
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| magic | bytes | 4 | const="TLM1" | magic |
+| sample_count | u32 | 1 | max=100000,sizeof=samples | sample count |
+
+## body
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| samples | Sample | sample_count | | samples |
+
+## struct Sample
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| id | u32 | 1 | | sample id |
+| value | f64 | 1 | | sample value |
+""".strip(),
+        source_path="telemetry_packet.md",
+    )
+    bp = Blueprint(root="/api")
+    with bp.group("/binary") as views:
+        views.POST("/telemetry").REQ_BINARY(schema).RSP(Result)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+    asyncio.run(_assert_python_server_streams_binary_requests(output_dir))
+
+
+async def _assert_python_server_streams_binary_requests(output_dir: Path) -> None:
+    gen_server = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+    runtime_server = sys.modules["api_blueprint_generated.api.runtime.server"]
+    gen_types = sys.modules["api_blueprint_generated.api.routes.api.binary.gen_types"]
+    samples = 5000
+    packet = b"TLM1" + struct.pack("<I", samples) + b"".join(
+        struct.pack("<Id", index, index / 2) for index in range(samples)
+    )
+    compressed = gzip.compress(packet) + gzip.compress(b"")
+
+    class BinaryService:
+        async def telemetry(self, binary):
+            assert isinstance(binary, gen_types.TelemetryPacket)
+            assert len(binary.body.samples) == samples
+            assert binary.body.samples[-1].value == (samples - 1) / 2
+            return gen_types.TelemetryResponse(status="decoded")
+
+    async def upload(data: bytes):
+        for offset in range(0, len(data), 997):
+            yield data[offset : offset + 997]
+
+    def app_with(config) -> Any:
+        from fastapi import FastAPI
+
+        app = FastAPI()
+        app.include_router(gen_server.create_router(binary_service=BinaryService(), config=config))
+        return app
+
+    from_stream = gen_types.TelemetryPacketWire.from_stream
+    reader_threads: list[str] = []
+
+    def tracked_from_stream(source):
+        reader_threads.append(threading.current_thread().name.rsplit("_", 1)[0])
+        return from_stream(source)
+
+    gen_types.TelemetryPacketWire.from_stream = staticmethod(tracked_from_stream)
+
+    default_app = app_with(runtime_server.ApiServerConfig())
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=default_app), base_url="http://testserver") as client:
+        streamed_identity = await client.post("/api/binary/telemetry", content=upload(packet))
+        streamed_gzip = await client.post(
+            "/api/binary/telemetry",
+            content=upload(compressed),
+            headers={"Content-Encoding": "gzip"},
+        )
+        buffered_gzip = await client.post(
+            "/api/binary/telemetry",
+            content=gzip.compress(packet[:8] + packet[8:20]),
+            headers={"Content-Encoding": "gzip"},
+        )
+        truncated_gzip = await client.post(
+            "/api/binary/telemetry",
+            content=upload(compressed[:-40]),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    assert streamed_identity.status_code == 200, streamed_identity.text
+    assert streamed_gzip.status_code == 200, streamed_gzip.text
+    assert set(reader_threads) == {"api-binary-stream"}
+    assert buffered_gzip.status_code == 400
+    assert truncated_gzip.status_code == 400
+
+    limited_app = app_with(runtime_server.ApiServerConfig(decompressed_binary_max_bytes=len(packet) // 2))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=limited_app), base_url="http://testserver") as client:
+        too_large = await client.post(
+            "/api/binary/telemetry",
+            content=upload(compressed),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    assert too_large.status_code == 413
+
+    reader_threads.clear()
+    buffered_app = app_with(runtime_server.ApiServerConfig(binary_stream_workers=0))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=buffered_app), base_url="http://testserver") as client:
+        buffered_upload = await client.post("/api/binary/telemetry", content=upload(packet))
+
+    assert buffered_upload.status_code == 200, buffered_upload.text
+    assert reader_threads == []
+
+
+def test_python_server_streams_binary_schema_responses_with_negotiated_encoding(tmp_path: Path):
+    telemetry = parse_binary_schema(
+        """
+# packet TelemetryFrame
+
+endian: little
+content-encoding: identity,zstd,gzip
+
+## header
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| sample_count | u32 | 1 | max=100000,sizeof=samples | sample count |
+
+## body
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| samples | Sample | sample_count | | samples |
+
+## struct Sample
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| id | u32 | 1 | | sample id |
+| value | f64 | 1 | | sample value |
+""".strip(),
+        source_path="telemetry_frame.md",
+    )
+    status = parse_binary_schema(
+        """
+# packet StatusFrame
+
+endian: little
+
+## header
+
+| field | type | count | rule | comment |
+|---|---|---:|---|---|
+| magic | bytes | 4 | const="STS1" | magic |
+| code | u16 | 1 | | status code |
+| reserved | reserved | 2 | | reserved |
+""".strip(),
+        source_path="status_frame.md",
+    )
+    bp = Blueprint(root="/api")
+    with bp.group("/binary") as views:
+        views.GET("/telemetry").RSP_BINARY_SCHEMA(telemetry)
+        views.GET("/status").RSP_BINARY_SCHEMA(status)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    types_text = (output_dir / "api_blueprint_generated/api/routes/api/binary/gen_binary.py").read_text(encoding="utf-8")
+    assert "FIXED_SIZE: int | None = 8" in types_text
+    assert "MAX_SIZE: int | None = 1200004" in types_text
+    asyncio.run(_assert_python_server_streams_binary_responses(output_dir))
+
+
+async def _assert_python_server_streams_binary_responses(output_dir: Path) -> None:
+    gen_server = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+    runtime_server = sys.modules["api_blueprint_generated.api.runtime.server"]
+    gen_types = sys.modules["api_blueprint_generated.api.routes.api.binary.gen_types"]
+    samples = 20000
+    expected = struct.pack("<I", samples) + b"".join(struct.pack("<Id", index, index * 1.5) for index in range(samples))
+    id_offset = 0
+    held_body: Any = None
+
+    class BinaryService:
+        async def telemetry(self):
+            if held_body is not None:
+                return held_body
+            return gen_types.TelemetryFrame(
+                header=gen_types.TelemetryFrameHeader(sample_count=samples),
+                body=gen_types.TelemetryFrameBody(
+                    samples=[gen_types.TelemetryFrameSample(id=index + id_offset, value=index * 1.5) for index in range(samples)]
+                ),
+            )
+
+        async def status(self):
+            return gen_types.StatusFrame(header=gen_types.StatusFrameHeader(code=7))
+
+    class FakeZstd:
+        def __init__(self) -> None:
+            self.inner = zlib.compressobj()
+
+        def compress(self, data: bytes) -> bytes:
+            return self.inner.compress(data)
+
+        def flush(self) -> bytes:
+            return self.inner.flush()
+
+    from fastapi import FastAPI
+
+    def app_with(config) -> Any:
+        app = FastAPI()
+        app.include_router(gen_server.create_router(binary_service=BinaryService(), config=config))
+        return app
+
+    app = app_with(runtime_server.ApiServerConfig(binary_response_encoders={"zstd": FakeZstd}))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+        status = await client.get("/api/binary/status", headers={"Accept-Encoding": "gzip"})
+        identity = await client.get("/api/binary/telemetry", headers={"Accept-Encoding": "identity"})
+        gzipped = await client.get("/api/binary/telemetry", headers={"Accept-Encoding": "gzip;q=1.0, zstd;q=0"})
+        async with client.stream("GET", "/api/binary/telemetry", headers={"Accept-Encoding": "zstd, gzip"}) as zstd:
+            zstd_raw = b"".join([chunk async for chunk in zstd.aiter_raw()])
+
+    assert status.status_code == 200
+    assert status.headers["content-length"] == "8"
+    assert "content-encoding" not in status.headers
+    assert status.content == b"STS1\x07\x00\x00\x00"
+
+    assert identity.status_code == 200
+    assert "content-length" not in identity.headers
+    assert identity.headers["vary"] == "Accept-Encoding"
+    assert identity.content == expected
+
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.content == expected
+
+    assert zstd.headers["content-encoding"] == "zstd"
+    assert "content-length" not in zstd.headers
+    assert zlib.decompress(zstd_raw) == expected
+
+    streamed_app = app_with(runtime_server.ApiServerConfig(binary_stream_min_bytes=0))
+    buffered_app = app_with(runtime_server.ApiServerConfig(binary_stream_workers=0))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=streamed_app), base_url="http://testserver") as client:
+        fixed = await client.get("/api/binary/status")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=buffered_app), base_url="http://testserver") as client:
+        buffered = await client.get("/api/binary/telemetry", headers={"Accept-Encoding": "gzip"})
+
+    assert fixed.headers["content-length"] == "8"
+    assert fixed.content == b"STS1\x07\x00\x00\x00"
+    assert buffered.headers["content-encoding"] == "gzip"
+    assert buffered.content == expected
+
+    id_offset = -1
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        invalid = await client.get("/api/binary/telemetry", headers={"Accept-Encoding": "gzip"})
+
+    assert invalid.status_code == 500
+    assert "content-encoding" not in invalid.headers
+
+    # The first chunk must reach the client while the writer is still running.
+    first_sent = threading.Event()
+    writer_saw_first_chunk: list[bool] = []
+
+    def write_held(writer) -> None:
+        writer.write_raw(b"a" * (20 * 1024))
+        writer_saw_first_chunk.append(first_sent.wait(5))
+        writer.write_raw(b"b" * 1024)
+
+    held_body = gen_types.TelemetryFrameWire.body(write_held)
+    sent: list[dict[str, Any]] = []
+    requested: list[bool] = []
+    disconnected = asyncio.Event()
+
+    async def receive() -> dict[str, Any]:
+        if not requested:
+            requested.append(True)
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+        if message["type"] == "http.response.body" and message.get("body"):
+            first_sent.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/binary/telemetry",
+        "raw_path": b"/api/binary/telemetry",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 1234),
+    }
+    await app(scope, receive, send)
+    disconnected.set()
+
+    start = next(message for message in sent if message["type"] == "http.response.start")
+    bodies = [message["body"] for message in sent if message["type"] == "http.response.body" and message.get("body")]
+    assert start["status"] == 200
+    assert b"content-length" not in dict(start["headers"])
+    assert writer_saw_first_chunk == [True]
+    assert len(bodies) == 2
+    assert b"".join(bodies) == b"a" * (20 * 1024) + b"b" * 1024
+
+
 def test_python_codegen_generates_binary_schema_response_encoder_and_decoder(tmp_path: Path):
     schema = parse_binary_schema(
         """
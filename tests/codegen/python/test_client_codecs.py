@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from .helpers import *
 from api_blueprint.engine import CodeMessageDataEnvelope, NoEnvelope
 from api_blueprint.engine.model import Int, Int64, OneOf, LegacyStringID
@@ -44,8 +46,9 @@ def test_python_client_generates_recursive_nested_dto_codecs(tmp_path: Path):
     assert "items: list[NestedItem]" in types_text
     assert "item_map: dict[str, NestedItem]" in types_text
     assert "def from_mapping(cls, value: Mapping[str, Any]) -> Self:" in types_text
-    assert 'def from_value(cls, value: object, path: str = "NestedResponse") -> Self:' in types_text
-    assert "def _from_mapping(cls, value: Mapping[str, Any], path: str) -> Self:" in types_text
+    assert 'def from_value(cls, value: object, path: _DecodePath = "NestedResponse") -> Self:' in types_text
+    assert "def _from_mapping(cls, value: Mapping[str, Any], path: _DecodePath) -> Self:" in types_text
+    assert 'item=_decode_required(NestedItem.from_value, value.get("item", _MISSING), (path, "item")),' in types_text
     assert "-> NestedResponse:" not in types_text
     assert "def to_mapping(self) -> dict[str, Any]:" in types_text
     client_text = (package_root / "routes" / "api" / "demo" / "gen_client.py").read_text(encoding="utf-8")
@@ -80,6 +83,17 @@ def test_python_client_generates_recursive_nested_dto_codecs(tmp_path: Path):
     with pytest.raises(TypeError, match=r"NestedResponse\.items: expected list"):
         client_module.NestedResponse.from_value({"item": {"value": "one"}, "items": {}, "item_map": {}})
 
+    with pytest.raises(TypeError, match=r"^NestedResponse\.items\[1\]\.value: expected string$"):
+        client_module.NestedResponse.from_value(
+            {"item": {"value": "one"}, "items": [{"value": "two"}, {"value": 2}], "item_map": {}}
+        )
+
+    with pytest.raises(ValueError, match=r"^NestedResponse\.item_map\.three\.value: missing required field$"):
+        client_module.NestedResponse.from_value({"item": {"value": "one"}, "items": [], "item_map": {"three": {}}})
+
+    with pytest.raises(TypeError, match=r"^value: expected string$"):
+        client_module.NestedItem.from_value({"value": 1}, "")
+
 def test_python_client_generates_enum_and_wire_name_codecs(tmp_path: Path):
     class WireEnum(enum.StrEnum):
         first = "first"  # First option
@@ -119,8 +133,11 @@ def test_python_client_generates_enum_and_wire_name_codecs(tmp_path: Path):
     assert "status_map: dict[StatusEnum, WireEnum]" in types_text
     assert 'value.get("class", _MISSING)' in types_text
     assert 'result["class"] = _api_to_json(self.class_)' in types_text
-    assert "return lambda item, path:" not in client_text
-    assert "return (lambda item, path: _decode_list" in client_text
+    assert "lambda item, path:" not in client_text
+    assert 'return _decode_list_of_StatusEnum(payload, "enum_list.response")' in client_text
+    assert "def _decode_list_of_StatusEnum(value: object, path: _DecodePath) -> list[StatusEnum]:" in types_text
+    assert "_StatusEnum_BY_VALUE = _enum_lookup(StatusEnum)" in types_text
+    assert "for item in cls:" not in types_text
 
     client_module = _import_generated_module(
         output_dir,
@@ -143,6 +160,11 @@ def test_python_client_generates_enum_and_wire_name_codecs(tmp_path: Path):
         "statuses": [1, 2],
         "status_map": {"1": "second"},
     }
+    assert client_module.StatusEnum.from_value(True) is client_module.StatusEnum.OK
+    assert client_module.WireEnum.from_value(client_module.WireEnum.SECOND) is client_module.WireEnum.SECOND
+    for bad in ("3", ["first"], None):
+        with pytest.raises(ValueError, match=r"^EnumJSON\.kind: expected WireEnum value$"):
+            client_module.WireEnum.from_value(bad, ("EnumJSON", "kind"))
 
 def test_python_client_decodes_top_level_array_response_when_list_alias_collides(tmp_path: Path):
     class Permission(Model):
@@ -170,8 +192,8 @@ def test_python_client_decodes_top_level_array_response_when_list_alias_collides
 
     assert ") -> list[Permission]:" in perm_client
     assert "response_type: str | None = 'list[Permission]'" in perm_client
-    assert "_decode_list(" in perm_client
-    assert "Permission.from_value" in perm_client
+    assert 'return _decode_list_of_Permission(payload, "list.response")' in perm_client
+    assert "    return Permission.from_values(value, path)" in perm_types
     assert 'return ListResponse.from_value(payload, "list.response")' not in perm_client
     assert "@dataclass(kw_only=True)\nclass Permission:" in perm_types
 
@@ -180,6 +202,449 @@ def test_python_client_decodes_top_level_array_response_when_list_alias_collides
     assert 'return ListResponse.from_value(payload, "list.response")' in role_client
     assert "@dataclass(kw_only=True)\nclass ListResponse:" in role_types
 
+def test_python_codegen_hoists_container_decoders_with_scalar_fast_paths(tmp_path: Path):
+    from api_blueprint.engine.model import Int
+
+    class ScalarBag(Model):
+        tags = Array[String](description="tags")
+        counts = Map[String, Int](description="counts")
+        groups = Map[String, Array[String]](description="groups")
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.GET("/bag").RSP(ScalarBag)
+
+    output_dir = tmp_path / "python"
+    writer = PythonClientWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    types_text = (
+        output_dir / "api_blueprint_generated" / "api" / "routes" / "api" / "demo" / "gen_types.py"
+    ).read_text(encoding="utf-8")
+    assert "lambda" not in types_text
+    assert "    return _decode_scalar_list(value, path, str, _decode_str)" in types_text
+    assert "    return _decode_scalar_map(value, path, int, _decode_int)" in types_text
+    assert "    return _decode_map(value, path, _decode_str, _decode_list_of_str)" in types_text
+    assert types_text.count("def _decode_list_of_str(") == 1
+    assert 'groups=_decode_required(_decode_map_of_str_to_list_of_str, value.get("groups", _MISSING), (path, "groups")),' in types_text
+
+    types_module = _import_generated_module(output_dir, "api_blueprint_generated.api.routes.api.demo.gen_types")
+    tags = ["a", "b"]
+    bag = types_module.BagResponse.from_value({"tags": tags, "counts": {"x": 1, "y": "2"}, "groups": {"g": ["c"]}})
+    assert bag.tags == tags and bag.tags is not tags
+    assert bag.counts == {"x": 1, "y": 2}
+    assert bag.groups == {"g": ["c"]}
+
+    with pytest.raises(TypeError, match=r"^BagResponse\.tags\[1\]: expected string$"):
+        types_module.BagResponse.from_value({"tags": ["a", 1], "counts": {}, "groups": {}})
+    with pytest.raises(TypeError, match=r"^BagResponse\.groups\.g\[0\]: expected string$"):
+        types_module.BagResponse.from_value({"tags": [], "counts": {}, "groups": {"g": [None]}})
+
+
+def test_python_codegen_emits_slotted_frozen_models_when_configured(tmp_path: Path):
+    import dataclasses
+
+    class CompactItem(Model):
+        value = String(description="value")
+
+    class CompactResponse(Model):
+        item = CompactItem(description="item")
+        items = Array[CompactItem](description="items")
+        note = String(description="note", omitempty=True)
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.GET("/compact").RSP(CompactResponse)
+
+    output_dir = tmp_path / "python"
+    writer = PythonClientWriter(output_dir, model_slots=True, model_frozen=True)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    types_text = (
+        output_dir / "api_blueprint_generated" / "api" / "routes" / "api" / "demo" / "gen_types.py"
+    ).read_text(encoding="utf-8")
+    assert "@dataclass(kw_only=True, slots=True, frozen=True)\nclass CompactItem:" in types_text
+    assert "@dataclass(kw_only=True, slots=True, frozen=True)\nclass CompactResponse:" in types_text
+
+    types_module = _import_generated_module(output_dir, "api_blueprint_generated.api.routes.api.demo.gen_types")
+    payload = {"item": {"value": "one"}, "items": [{"value": "two"}]}
+    response = types_module.CompactResponse.from_value(payload)
+    assert not hasattr(response, "__dict__")
+    assert not hasattr(response.item, "__dict__")
+    assert types_module.CompactResponse.from_value(response) is response
+    assert response.to_mapping() == payload
+    assert response.to_transport_mapping() == payload
+    assert response == types_module.CompactResponse.from_value(payload)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        response.note = "changed"
+
+
+def test_python_models_write_json_bytes_matching_the_mapping_encoder(tmp_path: Path):
+    from api_blueprint.engine.model import Float, Int
+
+    class Shade(enum.StrEnum):
+        light = "light"
+        dark = "dark"
+
+    class Swatch(Model):
+        label = String(description="label")
+
+    class Palette(Model):
+        note = String(description="note", omitempty=True)
+        name = String(description="name")
+        shade = Enum[Shade](description="shade")
+        weight = Float(description="weight")
+        tags = Array[String](description="tags")
+        counts = Map[String, Int](description="counts")
+        swatches = Array[Swatch](description="swatches")
+        by_name = Map[String, Swatch](description="by name")
+        extra = Map[String, String](description="extra", omitempty=True)
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.POST("/palette").REQ(Palette).RSP(Palette)
+
+    output_dir = tmp_path / "python"
+    writer = PythonClientWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    types_text = (
+        output_dir / "api_blueprint_generated" / "api" / "routes" / "api" / "demo" / "gen_types.py"
+    ).read_text(encoding="utf-8")
+    assert "    def to_json_bytes(self) -> bytes:" in types_text
+    assert "        out.append(sep + '\"name\":')\n        _write_json_str(out, self.name)" in types_text
+    assert "        out.append(',\"shade\":')\n        _write_json_enum(out, self.shade)" in types_text
+    assert "    _write_json_scalar_list(out, value, str, _write_json_str)" in types_text
+    assert "    _write_json_map(out, value, _write_json_model)" in types_text
+
+    types_module = _import_generated_module(output_dir, "api_blueprint_generated.api.routes.api.demo.gen_types")
+    client_module = importlib.import_module("api_blueprint_generated.api.routes.api.demo.gen_client")
+    codecs = sys.modules["api_blueprint_generated.api.runtime.gen_codecs"]
+
+    def encode(value: object) -> bytes:
+        return codecs._JSON_ENCODER.encode(value).encode("utf-8")
+
+    Palette = types_module.PaletteJSON
+    Swatch = types_module.Swatch
+    palettes = [
+        Palette(name="plain", shade=types_module.Shade.LIGHT, weight=0.5, tags=[], counts={}, swatches=[], by_name={}),
+        Palette(
+            note="ünïcode \"quoted\"\n",
+            name="full",
+            shade=types_module.Shade.DARK,
+            weight=2.0,
+            tags=["a", "b"],
+            counts={"x": 1, "y": 2},
+            swatches=[Swatch(label="one"), Swatch(label="two")],
+            by_name={"one": Swatch(label="one")},
+            extra={"kept": "yes", "dropped": None},
+        ),
+        # Values outside the declared types take the mapping fallback.
+        Palette(name="loose", shade="dark", weight=3, tags=["a", None], counts={"n": True}, swatches=[{"label": "raw"}], by_name={}),
+    ]
+    for palette in palettes:
+        assert palette.to_json_bytes() == encode(palette.to_mapping())
+    assert palettes[0].to_json_bytes() == b'{"name":"plain","shade":"light","weight":0.5,"tags":[],"counts":{},"swatches":[],"by_name":{}}'
+    with pytest.raises(ValueError):
+        Palette(name="nan", shade="light", weight=float("nan"), tags=[], counts={}, swatches=[], by_name={}).to_json_bytes()
+
+    sent: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        body = b'{"code":0,"message":"ok","data":' + request.read() + b"}"
+        return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+    transport_module = importlib.import_module("api_blueprint_generated.api.transports.http.gen_client")
+    async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = client_module.DemoClient(transport_module.HttpClientTransport("https://api.example.test", client=async_client))
+    echoed = asyncio.run(client.palette(palettes[1]))
+
+    assert sent[0].headers["content-type"] == "application/json"
+    assert sent[0].content == palettes[1].to_json_bytes()
+    assert echoed.by_name["one"].label == "one"
+
+    class RecordingTransport:
+        def __init__(self) -> None:
+            self.requests: list[object] = []
+
+        async def request(self, request: object) -> object:
+            self.requests.append(request)
+            return json.loads(json.dumps(request.json))
+
+    recording = RecordingTransport()
+    asyncio.run(client_module.DemoClient(recording).palette(palettes[1]))
+    recorded = recording.requests[0]
+    assert recorded.json == palettes[1].to_mapping()
+    assert recorded.json_bytes == palettes[1].to_json_bytes()
+
+
+def test_python_pydantic_core_codec_backend_matches_builtin_codecs(tmp_path: Path):
+    from api_blueprint.engine.model import Bool, Float
+
+    class Shade(enum.StrEnum):
+        light = "light"
+        dark = "dark"
+
+    class Swatch(Model):
+        label = String(description="label")
+
+    class Palette(Model):
+        note = String(description="note", omitempty=True)
+        name = String(description="name")
+        shade = Enum[Shade](description="shade")
+        weight = Float(description="weight")
+        count = Int(description="count")
+        enabled = Bool(description="enabled")
+        code = LegacyStringID(description="code", omitempty=True)
+        tags = Array[String](description="tags")
+        counts = Map[String, Int](description="counts")
+        swatches = Array[Swatch](description="swatches")
+        by_name = Map[String, Swatch](description="by name", omitempty=True)
+        ids = Map[Int, Int](description="ids", omitempty=True)
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.POST("/palette").REQ(Palette).RSP(Palette)
+
+    with pytest.raises(ValueError, match="unsupported Python codec_backend: msgspec"):
+        PythonClientWriter(tmp_path / "unused", codec_backend="msgspec")
+
+    modules = {}
+    for backend in ("builtin", "pydantic-core"):
+        output_dir = tmp_path / backend
+        writer = PythonClientWriter(output_dir, codec_backend=backend)
+        writer.register(bp)
+        writer.gen()
+        _compile_generated_files(output_dir)
+        runtime_dir = output_dir / "api_blueprint_generated" / "api" / "runtime"
+        assert (runtime_dir / "gen_core_codecs.py").exists() is (backend == "pydantic-core")
+        modules[backend] = _import_generated_module(output_dir, "api_blueprint_generated.api.routes.api.demo.gen_types")
+
+    types_text = (
+        tmp_path / "pydantic-core" / "api_blueprint_generated" / "api" / "routes" / "api" / "demo" / "gen_types.py"
+    ).read_text(encoding="utf-8")
+    assert "        return _PaletteJSON_CODEC.decode(value, path)" in types_text
+    assert '_core_field("shade", "shade", _core_decoder(Shade.from_value))' in types_text
+    assert '_core_field("swatches", "swatches", _core_list(_core_ref("Swatch")))' in types_text
+    assert '_PaletteJSON_CODEC = _CoreCodec(_CORE_SCHEMAS, ("PaletteJSON", "Swatch"))' in types_text
+
+    valid = {
+        "note": "ünïcode",
+        "name": "full",
+        "shade": "dark",
+        "weight": 2,
+        "count": "3",
+        "enabled": "yes",
+        "code": 7,
+        "tags": ["a", "b"],
+        "counts": {"x": 1},
+        "swatches": [{"label": "one"}],
+        "by_name": {"one": {"label": "one"}},
+    }
+    payloads = [
+        valid,
+        {key: value for key, value in valid.items() if key not in {"note", "code", "by_name"}},
+        {**valid, "count": True},
+        {**valid, "weight": False},
+        {**valid, "enabled": "maybe"},
+        {**valid, "code": 1.5},
+        {**valid, "shade": "neon"},
+        {**valid, "tags": ["a", 1]},
+        {**valid, "tags": ("a",)},
+        {**valid, "counts": {"x": "nope"}},
+        {**valid, "swatches": [{"label": 1}]},
+        {**valid, "swatches": ["one"]},
+        {**valid, "by_name": {"one": {}}},
+        {key: value for key, value in valid.items() if key != "name"},
+        {**valid, "name": None},
+        {**valid, "weight": None},
+        {**valid, "swatches": None},
+        {**valid, "note": None, "counts": {"x": None}, "tags": [None]},
+        {**valid, "ids": {"1": 2}},
+        {**valid, "ids": {"z": 1}},
+    ]
+
+    def outcome(module, payload):
+        try:
+            palette = module.PaletteJSON.from_value(payload)
+        except (TypeError, ValueError) as err:
+            return type(err).__name__, str(err)
+        assert type(palette.shade) is module.Shade
+        assert type(palette.swatches[0]) is module.Swatch
+        return palette.to_json_bytes(), palette.to_mapping()
+
+    for payload in payloads:
+        assert outcome(modules["pydantic-core"], payload) == outcome(modules["builtin"], payload), payload
+
+
+def test_python_from_values_decodes_rows_column_by_column(tmp_path: Path):
+    from api_blueprint.engine.model import Float
+
+    class Shade(enum.StrEnum):
+        light = "light"
+        dark = "dark"
+
+    class Swatch(Model):
+        label = String(description="label")
+
+    class Row(Model):
+        id = String(description="id")
+        quantity = Int(description="quantity")
+        price = Float(description="price")
+        shade = Enum[Shade](description="shade")
+        note = String(description="note", omitempty=True)
+        swatches = Array[Swatch](description="swatches", omitempty=True)
+
+    bp = Blueprint(root="/api")
+    with bp.group("/report") as views:
+        views.GET("/rows").RSP(Array[Row](description="rows"))
+
+    output_dir = tmp_path / "python"
+    writer = PythonClientWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    types_text = (
+        output_dir / "api_blueprint_generated" / "api" / "routes" / "api" / "report" / "gen_types.py"
+    ).read_text(encoding="utf-8")
+    assert '        quantity_column = _decode_column(rows, path, "quantity", _decode_int, int)' in types_text
+    assert '        note_column = _decode_column(rows, path, "note", _decode_str, str, optional=True)' in types_text
+    assert '        shade_column = _decode_column(rows, path, "shade", Shade.from_value)' in types_text
+    assert "    return Row.from_values(value, path)" in types_text
+    assert "    return Swatch.from_values(value, path)" in types_text
+
+    types_module = _import_generated_module(output_dir, "api_blueprint_generated.api.routes.api.report.gen_types")
+    Row = types_module.Row
+
+    def per_item(value: object) -> object:
+        try:
+            return [Row.from_value(item, ("Row", index)) for index, item in enumerate(value)]
+        except (TypeError, ValueError) as err:
+            return type(err).__name__, str(err)
+
+    def batched(value: object) -> object:
+        try:
+            return Row.from_values(value)
+        except (TypeError, ValueError) as err:
+            return type(err).__name__, str(err)
+
+    rows = [
+        {"id": f"row-{index}", "quantity": index, "price": 1.5, "shade": "dark", "note": None if index % 2 else "n"}
+        for index in range(4)
+    ]
+    rows[3]["swatches"] = [{"label": "one"}]
+    batches = [
+        [],
+        rows,
+        [*rows, {**rows[0], "quantity": "7", "price": 2}],
+        [*rows, {**rows[0], "quantity": "seven"}],
+        [*rows, {key: value for key, value in rows[0].items() if key != "id"}],
+        [*rows, {**rows[0], "shade": "neon"}],
+        [*rows, {**rows[0], "swatches": [{"label": 1}]}],
+        [*rows, Row(id="kept", quantity=1, price=1.0, shade=types_module.Shade.LIGHT)],
+    ]
+    for batch in batches:
+        assert batched(batch) == per_item(batch), batch
+    assert batched(batches[3]) == ("ValueError", "Row[4].quantity: expected int")
+    assert type(Row.from_values(batches[2])[4].price) is float
+    with pytest.raises(TypeError, match="rows: expected list"):
+        Row.from_values({"id": "x"}, "rows")
+
+
+def test_python_trusted_decode_builds_the_same_dtos_without_checks(tmp_path: Path):
+    class Shade(enum.StrEnum):
+        light = "light"
+        dark = "dark"
+
+    class Swatch(Model):
+        label = String(description="label")
+        shade = Enum[Shade](description="shade", omitempty=True)
+
+    class Palette(Model):
+        name = String(description="name")
+        shade = Enum[Shade](description="shade")
+        tags = Array[String](description="tags")
+        main = Swatch(description="main")
+        accent = Swatch(description="accent", omitempty=True)
+        swatches = Array[Swatch](description="swatches")
+        by_rank = Map[Int, Swatch](description="by rank")
+        shades = Array[Enum[Shade]](description="shades", omitempty=True)
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.GET("/palette").RSP(Palette)
+        views.GET("/names").RSP(Array[String](description="names"))
+
+    output_dir = tmp_path / "python"
+    writer = PythonClientWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    route_root = output_dir / "api_blueprint_generated" / "api" / "routes" / "api" / "demo"
+    types_text = (route_root / "gen_types.py").read_text(encoding="utf-8")
+    client_text = (route_root / "gen_client.py").read_text(encoding="utf-8")
+    assert "            name=value[\"name\"],\n            shade=_Shade_BY_VALUE[value[\"shade\"]],\n            tags=value[\"tags\"]," in types_text
+    assert "            accent=None if accent_value is None else Swatch.from_trusted(accent_value)," in types_text
+    assert '    return {_decode_int(key, "<key>"): Swatch.from_trusted(item) for key, item in value.items()}' in types_text
+    assert "            return PaletteResponse.from_trusted(payload)" in client_text
+    assert "            return payload\n        return _decode_list_of_str(payload, \"names.response\")" in client_text
+
+    types_module = _import_generated_module(output_dir, "api_blueprint_generated.api.routes.api.demo.gen_types")
+    client_module = importlib.import_module("api_blueprint_generated.api.routes.api.demo.gen_client")
+    transport_module = importlib.import_module("api_blueprint_generated.api.transports.http.gen_client")
+    payloads = [
+        {
+            "name": "full",
+            "shade": "dark",
+            "tags": ["a", "b"],
+            "main": {"label": "main", "shade": "light"},
+            "accent": {"label": "accent"},
+            "swatches": [{"label": "one", "shade": "dark"}],
+            "by_rank": {"1": {"label": "one"}},
+            "shades": ["light", "dark"],
+        },
+        {"name": "plain", "shade": "light", "tags": [], "main": {"label": "main"}, "swatches": [], "by_rank": {}},
+    ]
+    for payload in payloads:
+        trusted = types_module.PaletteResponse.from_trusted(payload)
+        assert trusted == types_module.PaletteResponse.from_value(payload)
+        assert type(trusted.shade) is types_module.Shade
+        assert trusted.to_json_bytes() == types_module.PaletteResponse.from_value(payload).to_json_bytes()
+    assert types_module.PaletteResponse.from_trusted(payloads[0]).by_rank == {1: types_module.Swatch(label="one")}
+
+    # The trusted path takes the input as-is instead of rejecting it.
+    loose = {**payloads[1], "tags": "not-a-list"}
+    assert types_module.PaletteResponse.from_trusted(loose).tags == "not-a-list"
+    with pytest.raises(TypeError, match=r"palette\.response\.tags: expected list"):
+        types_module.PaletteResponse.from_value(loose, "palette.response")
+
+    async def fetch(trusted_decode: bool) -> object:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"code": 0, "message": "ok", "data": loose})
+
+        async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        transport = transport_module.HttpClientTransport(
+            "https://api.example.test", client=async_client, trusted_decode=trusted_decode
+        )
+        try:
+            return await client_module.DemoClient(transport).palette()
+        finally:
+            await async_client.aclose()
+
+    assert asyncio.run(fetch(True)).tags == "not-a-list"
+    with pytest.raises(TypeError, match="expected list"):
+        asyncio.run(fetch(False))
+
+
 def test_python_client_decodes_enveloped_rsp_empty_null_and_object_data(tmp_path: Path):
     class AdminEnvelope(CodeMessageDataEnvelope):
         __success_code__ = 200
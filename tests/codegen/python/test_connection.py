@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from typing import Any
+
+from api_blueprint.engine import ConnectionScope
+
 from .helpers import *
 
 
@@ -28,9 +32,9 @@ def test_python_server_generates_connection_adapter_scaffolds(tmp_path: Path):
     assert "from starlette.responses import StreamingResponse" in adapter_text
     assert "@router.api_route(\"/api/demo/events\", methods=[\"GET\"])" in adapter_text
     assert "@router.websocket(\"/api/demo/chat\")" in adapter_text
-    assert "stream = _SseStream(api_config.sse_queue_capacity)" in adapter_text
+    assert "stream = _SseStream(ApiTopicQueue(api_config.sse_queue_capacity), api_config)" in adapter_text
     assert "async for chunk in stream:" in adapter_text
-    assert "channel = _WebSocketChannel(websocket, api_demo_types.Event.from_value, api_config)" in adapter_text
+    assert "channel = _WebSocketChannel(websocket, api_demo_types.Event.from_value, api_config, codec=codec)" in adapter_text
     assert "except _WebSocketClosed:" in adapter_text
     assert "except (UnicodeDecodeError, json.JSONDecodeError) as err:" in adapter_text
     assert 'await self.abort(1003, "invalid WebSocket message")' in adapter_text
@@ -43,6 +47,326 @@ def test_python_server_generates_connection_adapter_scaffolds(tmp_path: Path):
     assert "channel: ApiServerChannel[Event, Event, ChatClose] | None = None" in service_text
     _compile_generated_files(output_dir)
 
+
+def test_python_server_fans_out_topic_scoped_connections_through_broker(tmp_path: Path):
+    class Tick(Model):
+        value = String(description="value")
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.STREAM("/ticks", scope=ConnectionScope.TOPIC).SERVER_MESSAGE(Tick)
+        views.CHANNEL("/lobby", scope=ConnectionScope.APP).CLIENT_MESSAGE(Tick).SERVER_MESSAGE(Tick)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    service_text = (
+        output_dir / "api_blueprint_generated" / "api" / "routes" / "api" / "demo" / "gen_service.py"
+    ).read_text(encoding="utf-8")
+    assert "stream: ApiServerTopicStream[Tick, TicksClose] | None = None" in service_text
+    assert "channel: ApiServerTopicChannel[Tick, Tick, LobbyClose] | None = None" in service_text
+    assert "class DemoTopics:" in service_text
+    assert "def publish_ticks(self, topic: str, message: Tick) -> int:" in service_text
+    assert "def publish_lobby(self, message: Tick) -> int:" in service_text
+
+    runtime = _import_generated_module(output_dir, "api_blueprint_generated.api.runtime.server")
+    encoded: list[Any] = []
+    broker = runtime.ApiTopicBroker(queue_capacity=2)
+    broker.register("demo", lambda message: encoded.append(message) or f"frame:{message}")
+    first, second = broker.queue(), broker.queue()
+    broker.subscribe("demo", "a", first)
+    broker.subscribe("demo", "a", second)
+    assert [broker.publish("demo", index, topic="a") for index in range(3)] == [2, 2, 2]
+    assert encoded == [0, 1, 2]
+    assert broker.publish("demo", 3, topic="b") == 0
+    assert first.dropped == 1
+    assert asyncio.run(first.get()) == "frame:1"
+
+    strict = runtime.ApiTopicBroker(queue_capacity=1, slow_consumer="disconnect")
+    strict.register("demo", str)
+    queue = strict.queue()
+    strict.subscribe("demo", "", queue)
+    assert strict.publish("demo", 1) == 1
+    assert strict.publish("demo", 2) == 0
+    assert queue.overflowed and strict.subscriber_count("demo") == 0
+    assert asyncio.run(queue.get()) is None
+    with pytest.raises(ValueError):
+        runtime.ApiTopicBroker(slow_consumer="block")
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    adapter = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+    service_module = sys.modules["api_blueprint_generated.api.routes.api.demo.gen_service"]
+    config = adapter.ApiServerConfig()
+    topics = service_module.DemoTopics(config.topic_broker)
+
+    class Service:
+        async def ticks(self, stream=None):
+            stream.subscribe("gold")
+
+        async def lobby(self, channel=None):
+            message = await channel.receive()
+            topics.publish_lobby(message)
+
+    app = FastAPI()
+    app.include_router(adapter.create_router(demo_service=Service(), config=config))
+    with TestClient(app) as client:
+        with client.websocket_connect("/api/demo/lobby") as watcher, client.websocket_connect("/api/demo/lobby") as speaker:
+            speaker.send_text('{"value":"hi"}')
+            assert watcher.receive_json() == {"type": "message", "data": {"value": "hi"}}
+            assert speaker.receive_json() == {"type": "message", "data": {"value": "hi"}}
+    assert config.topic_broker.subscriber_count("api.demo.lobby") == 0
+
+    gen_types = sys.modules["api_blueprint_generated.api.routes.api.demo.gen_types"]
+    cancelled: list[bool] = []
+
+    class TopicService:
+        def __init__(self, topics: Any, publishes: int) -> None:
+            self.topics = topics
+            self.publishes = publishes
+
+        async def ticks(self, stream=None):
+            stream.subscribe("gold")
+            assert self.topics.publish_ticks("silver", gen_types.Tick(value="skipped")) == 0
+            for index in range(self.publishes):
+                self.topics.publish_ticks("gold", gen_types.Tick(value=str(index)))
+            if self.publishes == 1:
+                await stream.close({"code": 0})
+                return
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+    def serve_topic(config: Any, publishes: int) -> str:
+        app = FastAPI()
+        service = TopicService(service_module.DemoTopics(config.topic_broker), publishes)
+        app.include_router(adapter.create_router(demo_service=service, config=config))
+
+        async def fetch() -> str:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                response = await asyncio.wait_for(client.get("/api/demo/ticks"), 5)
+            return response.text
+
+        return asyncio.run(fetch())
+
+    published = adapter.ApiServerConfig(sse_heartbeat_seconds=0)
+    text = serve_topic(published, 1)
+    assert 'data: {"value": "0"}' in text and "skipped" not in text
+    assert text.endswith('event: close\ndata: {"code": 0}\n\n')
+    assert published.topic_broker.subscriber_count("api.demo.ticks", "gold") == 0
+
+    # Overflow under the disconnect policy ends the response and cancels a
+    # service that would otherwise keep running.
+    overflowing = adapter.ApiServerConfig(
+        sse_heartbeat_seconds=0,
+        topic_broker=runtime.ApiTopicBroker(queue_capacity=1, slow_consumer="disconnect"),
+    )
+    assert serve_topic(overflowing, 2) == ""
+    assert cancelled == [True]
+    assert overflowing.topic_broker.subscriber_count("api.demo.ticks", "gold") == 0
+
+
+def test_python_server_topic_channel_close_follows_queued_messages(tmp_path: Path):
+    class Tick(Model):
+        value = String(description="value")
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.CHANNEL("/lobby", scope=ConnectionScope.APP).CLIENT_MESSAGE(Tick).SERVER_MESSAGE(Tick)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    adapter = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from starlette.websockets import WebSocketDisconnect
+
+    class Service:
+        async def lobby(self, channel=None):
+            for index in range(3):
+                await channel.send({"value": str(index)})
+            await channel.close({"code": 0})
+
+    config = adapter.ApiServerConfig()
+    app = FastAPI()
+    app.include_router(adapter.create_router(demo_service=Service(), config=config))
+    with TestClient(app) as client, client.websocket_connect("/api/demo/lobby") as websocket:
+        received = [websocket.receive_json() for _ in range(4)]
+        with pytest.raises(WebSocketDisconnect) as disconnect:
+            websocket.receive_json()
+
+    assert received == [
+        {"type": "message", "data": {"value": "0"}},
+        {"type": "message", "data": {"value": "1"}},
+        {"type": "message", "data": {"value": "2"}},
+        {"type": "close", "data": {"code": 0}},
+    ]
+    assert disconnect.value.code == 1000
+    assert config.topic_broker.subscriber_count("api.demo.lobby") == 0
+
+
+def test_python_server_sse_batches_coalesces_and_heartbeats(tmp_path: Path):
+    class Tick(Model):
+        key = String(description="key")
+        value = String(description="value")
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.STREAM("/ticks").SERVER_MESSAGE(Tick)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    adapter = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+
+    from fastapi import FastAPI
+
+    class Service:
+        def __init__(self, keys: str, idle: float = 0.0):
+            self.keys = keys
+            self.idle = idle
+
+        async def ticks(self, stream=None):
+            await asyncio.sleep(self.idle)
+            for index, key in enumerate(self.keys):
+                await stream.send({"key": key, "value": str(index)})
+            await stream.close({"code": 0})
+
+    def serve(service: Service, config: Any) -> str:
+        app = FastAPI()
+        app.include_router(adapter.create_router(demo_service=service, config=config))
+
+        async def fetch() -> str:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                response = await client.get("/api/demo/ticks")
+            return response.text
+
+        return asyncio.run(fetch())
+
+    batched = adapter.ApiServerConfig(sse_heartbeat_seconds=0)
+    text = serve(Service("a" * 100), batched)
+    assert text.count('data: {"key"') == 100
+    assert text.endswith('event: close\ndata: {"code": 0}\n\n')
+    assert batched.sse_counters.messages == 101
+    assert batched.sse_counters.writes <= 3
+
+    latest = adapter.ApiServerConfig(
+        sse_queue_capacity=4,
+        sse_overflow="coalesce_latest",
+        sse_coalesce_key=lambda message: message["key"],
+        sse_heartbeat_seconds=0,
+    )
+    text = serve(Service("ababab"), latest)
+    assert '"value": "4"' in text and '"value": "5"' in text and '"value": "3"' not in text
+    assert latest.sse_counters.coalesced == 4
+
+    dropping = adapter.ApiServerConfig(sse_queue_capacity=2, sse_overflow="drop_oldest", sse_heartbeat_seconds=0)
+    text = serve(Service("abcde"), dropping)
+    assert text.count('data: {"key"') == 2
+    assert dropping.sse_counters.dropped == 3
+
+    idle = adapter.ApiServerConfig(sse_heartbeat_seconds=0.01)
+    text = serve(Service("a", idle=0.1), idle)
+    assert text.startswith(": keep-alive\n\n")
+    assert idle.sse_counters.heartbeats >= 1
+
+
+def test_python_server_channel_negotiates_binary_codecs_by_subprotocol(tmp_path: Path):
+    from fastapi.testclient import TestClient
+    from starlette.websockets import WebSocketDisconnect
+
+    adapter, codecs = _generate_echo_channel(tmp_path)
+    app = _echo_channel_app(adapter, adapter.ApiServerConfig())
+    tagged = codecs.TAGGED_JSON_WEBSOCKET_CODEC
+    with TestClient(app) as client:
+        with client.websocket_connect("/api/demo/echo") as websocket:
+            assert websocket.accepted_subprotocol is None
+            websocket.send_text('{"value":"plain"}')
+            assert websocket.receive_json() == {"type": "message", "data": {"value": "plain"}}
+            assert websocket.receive_json() == {"type": "close", "data": {"code": 0}}
+
+        with client.websocket_connect("/api/demo/echo", subprotocols=["x-unknown", tagged.subprotocol]) as websocket:
+            assert websocket.accepted_subprotocol == tagged.subprotocol
+            websocket.send_bytes(tagged.dumps({"value": "tagged"}))
+            frame = websocket.receive_bytes()
+            assert frame == b'\x01{"value":"tagged"}'
+            assert tagged.decode_envelope(frame) == ("message", {"value": "tagged"})
+            assert tagged.decode_envelope(websocket.receive_bytes()) == ("close", {"code": 0})
+
+        with client.websocket_connect("/api/demo/echo", subprotocols=[tagged.subprotocol]) as websocket:
+            websocket.send_text('{"value":"text"}')
+            assert tagged.decode_envelope(websocket.receive_bytes())[1]["code"] == 1003
+            with pytest.raises(WebSocketDisconnect) as closed:
+                websocket.receive_bytes()
+            assert closed.value.code == 1003
+
+    assert codecs.select_websocket_codec(["api-blueprint.cbor", "api-blueprint.json"]) is codecs.JSON_WEBSOCKET_CODEC
+    assert codecs.select_websocket_codec(["api-blueprint.cbor"]) is None
+
+
+def test_python_server_channel_negotiates_msgpack_codec(tmp_path: Path):
+    msgpack = pytest.importorskip("msgpack")
+    from fastapi.testclient import TestClient
+
+    adapter, codecs = _generate_echo_channel(tmp_path)
+    config = adapter.ApiServerConfig(
+        websocket_codecs={**codecs.default_websocket_codecs(), "api-blueprint.msgpack": codecs.msgpack_websocket_codec()},
+    )
+    with TestClient(_echo_channel_app(adapter, config)) as client:
+        with client.websocket_connect("/api/demo/echo", subprotocols=["api-blueprint.msgpack"]) as websocket:
+            assert websocket.accepted_subprotocol == "api-blueprint.msgpack"
+            websocket.send_bytes(msgpack.packb({"value": "packed"}))
+            assert msgpack.unpackb(websocket.receive_bytes()) == {"type": "message", "data": {"value": "packed"}}
+            assert msgpack.unpackb(websocket.receive_bytes()) == {"type": "close", "data": {"code": 0}}
+
+
+def _generate_echo_channel(tmp_path: Path) -> tuple[Any, Any]:
+    class Event(Model):
+        value = String(description="value")
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.CHANNEL("/echo").CLIENT_MESSAGE(Event).SERVER_MESSAGE(Event)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+    assert (output_dir / "api_blueprint_generated" / "api" / "runtime" / "websocket.py").read_text(
+        encoding="utf-8"
+    ) == "from .gen_websocket import *\n"
+
+    adapter = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+    return adapter, sys.modules["api_blueprint_generated.api.runtime.gen_websocket"]
+
+
+def _echo_channel_app(adapter: Any, config: Any) -> Any:
+    from fastapi import FastAPI
+
+    class Service:
+        async def echo(self, channel=None):
+            message = await channel.receive()
+            await channel.send(message)
+            await channel.close({"code": 0})
+
+    app = FastAPI()
+    app.include_router(adapter.create_router(demo_service=Service(), config=config))
+    return app
+
+
 def test_python_client_generates_connection_bridge_methods(tmp_path: Path):
     class OpenPayload(Model):
         value = String(description="value")
@@ -84,6 +408,7 @@ def test_python_client_generates_connection_bridge_methods(tmp_path: Path):
     assert "default httpx adapter" in transport_text
     _compile_generated_files(output_dir)
 
+
 def test_python_client_and_server_generate_named_message_helpers(tmp_path: Path):
     class OpenPayload(Model):
         value = String(description="value")
@@ -91,3 +91,63 @@ def test_python_client_and_server_generate_error_catalog_runtime(tmp_path: Path)
     server_writer.gen()
     assert (server_dir / "api_blueprint_generated" / "api" / "runtime" / "errors.py").is_file()
     _compile_generated_files(tmp_path)
+
+
+def test_python_error_lookup_indexes_codes_and_reuses_catalog_payloads(tmp_path: Path):
+    class CommonErr(Model):
+        UNKNOWN = Error(-1, "unknown")
+        BUSY = Error(503, "busy", toast=Toast(key="common.busy", default="Busy", level="warning"))
+
+    class LegacyErr(Model):
+        BUSY = Error(503, "legacy busy")
+
+    bp = Blueprint(root="/api", errors=[CommonErr, LegacyErr])
+    with bp.group("/demo") as views:
+        views.GET("/ping").RSP(Result)
+
+    output_dir = tmp_path / "client"
+    writer = PythonClientWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    catalog_text = (output_dir / "api_blueprint_generated" / "api" / "runtime" / "gen_error_lookup.py").read_text(
+        encoding="utf-8"
+    )
+    assert '    503: API_ERRORS_BY_ID["CommonErr.BUSY"],\n}' in catalog_text
+    assert "API_ERRORS_BY_ID.values() if entry.code" not in catalog_text
+
+    lookup = _import_generated_module(output_dir, "api_blueprint_generated.api.runtime.gen_error_lookup")
+    assert lookup.lookup_api_error_by_code(503).id == "CommonErr.BUSY"
+    assert lookup.lookup_api_error_by_code(404) is None
+    assert lookup.lookup_api_error_by_code(503, "api.demo.get.missing").id == "CommonErr.BUSY"
+
+    catalog = lookup.API_ERROR_PAYLOADS_BY_ID["CommonErr.BUSY"]
+    full = {
+        "id": "CommonErr.BUSY",
+        "group": "CommonErr",
+        "key": "BUSY",
+        "code": 503,
+        "message": "busy",
+        "toast": {"key": "common.busy", "level": "warning", "default": "Busy"},
+    }
+    assert lookup.make_api_error_payload({"code": 503}) is catalog
+    assert lookup.make_api_error_payload(full) is catalog
+    assert lookup.make_api_error_payload({"id": "LegacyErr.BUSY", "code": 503}) is lookup.API_ERROR_PAYLOADS_BY_ID[
+        "LegacyErr.BUSY"
+    ]
+
+    custom = lookup.make_api_error_payload({**full, "message": "busy until 10:00"})
+    assert custom is not catalog
+    assert custom == lookup.ApiErrorPayload(
+        id="CommonErr.BUSY",
+        group="CommonErr",
+        key="BUSY",
+        code=503,
+        message="busy until 10:00",
+        toast=catalog.toast,
+    )
+    with_text = lookup.make_api_error_payload({"code": 503, "toast": {"text": "Try later"}})
+    assert with_text.toast.text == "Try later"
+    assert with_text.toast.key == "common.busy"
+    assert lookup.make_api_error_payload({"id": "CommonErr.BUSY", "code": 500}).code == 500
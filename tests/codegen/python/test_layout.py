@@ -192,7 +192,8 @@ def test_python_generated_files_use_pep8_blank_line_spacing(tmp_path: Path):
     assert "\n    async def ping(" in service_text
     assert "async def demo_health(request: Request) -> Any:" in adapter_text
     assert "result = await service.health(" in adapter_text
-    assert "return _wrap_response(" in adapter_text
+    assert "response = _wrap_ok_code_message_data_envelope(result, api_config)" in adapter_text
+    assert "def _wrap_ok_code_message_data_envelope(data: Any, config: ApiServerConfig) -> Response:" in adapter_text
     assert (
         '@router.api_route("/api/demo/health", methods=["GET"])\n'
         "    async def demo_health(request: Request) -> Any:"
@@ -44,3 +44,95 @@ def test_python_codegen_emits_multipart_and_raw_response_contracts(tmp_path: Pat
     assert "filename=None" in server_transport
     assert "FileResponse(" in server_transport
     assert "StreamingResponse(" in server_transport
+
+
+def test_python_server_streams_multipart_files_and_stops_oversized_uploads(tmp_path: Path):
+    bp = Blueprint(root="/api")
+    with bp.group("/media") as views:
+        views.POST("/preview").REQ_MULTIPART(MediaUpload).RSP(Result)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+    service_text = (
+        output_dir / "api_blueprint_generated" / "api" / "routes" / "api" / "media" / "gen_service.py"
+    ).read_text(encoding="utf-8")
+    assert "def preview_upload_sink(self, field: str, filename: str, content_type: str | None) -> ApiUploadSink | None:" in service_text
+    asyncio.run(_assert_python_server_streams_multipart(output_dir))
+
+
+async def _assert_python_server_streams_multipart(output_dir: Path) -> None:
+    gen_http = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+    runtime_server = sys.modules["api_blueprint_generated.api.runtime.server"]
+    gen_service = sys.modules["api_blueprint_generated.api.routes.api.media.gen_service"]
+    gen_types = sys.modules["api_blueprint_generated.api.routes.api.media.gen_types"]
+    boundary = "api-blueprint-boundary"
+    sent_chunks: list[int] = []
+    sinks: list[object] = []
+
+    class MemorySink:
+        def __init__(self, filename):
+            self.filename = filename
+            self.chunks: list[bytes] = []
+            self.aborted = False
+
+        async def write(self, chunk):
+            self.chunks.append(chunk)
+
+        async def close(self):
+            return f"stored:{self.filename}:{sum(len(chunk) for chunk in self.chunks)}"
+
+        async def abort(self):
+            self.aborted = True
+
+    class SpoolService(gen_service.MediaServiceStub):
+        async def preview(self, multipart):
+            data = await multipart.image.read()
+            return gen_types.PreviewResponse(status=f"{multipart.title}:{multipart.image.filename}:{len(data)}")
+
+    class SinkService(SpoolService):
+        async def preview(self, multipart):
+            return gen_types.PreviewResponse(status=f"{multipart.title}:{multipart.image}")
+
+        def preview_upload_sink(self, field, filename, content_type):
+            sink = MemorySink(filename)
+            sinks.append((field, content_type, sink))
+            return sink
+
+    async def body(file_bytes: int):
+        yield (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="title"\r\n\r\n'
+            "clip\r\n"
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="image"; filename="clip.mp4"\r\n'
+            "Content-Type: video/mp4\r\n\r\n"
+        ).encode()
+        for _ in range(file_bytes // 65536):
+            sent_chunks.append(65536)
+            yield b"v" * 65536
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    config = runtime_server.ApiServerConfig(multipart_file_max_bytes=256 * 1024, multipart_spool_max_bytes=1024)
+    headers = {"content-type": f"multipart/form-data; boundary={boundary}"}
+    from fastapi import FastAPI
+
+    for service, expected in ((SpoolService(), "clip:clip.mp4:131072"), (SinkService(), "clip:stored:clip.mp4:131072")):
+        app = FastAPI()
+        app.include_router(gen_http.create_router(media_service=service, config=config))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+            response = await client.post("/api/media/preview", content=body(128 * 1024), headers=headers)
+            assert response.status_code == 200
+            assert response.json()["data"]["status"] == expected
+
+            sent_chunks.clear()
+            oversized = await client.post("/api/media/preview", content=body(4 * 1024 * 1024), headers=headers)
+            assert oversized.status_code == 413
+            assert oversized.json() == {"detail": "multipart file exceeds configured limit"}
+            assert len(sent_chunks) < 8
+
+    assert [(field, content_type) for field, content_type, _ in sinks] == [("image", "video/mp4")] * 2
+    assert not sinks[0][2].aborted
+    assert sinks[1][2].aborted
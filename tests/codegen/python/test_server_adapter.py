@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from .helpers import *
+from api_blueprint.engine import OkDataErrorEnvelope
+from api_blueprint.engine.model import Bool, Int
 
 
 def test_python_server_json_encoder_handles_enum_map_keys_and_nested_dtos(tmp_path: Path):
@@ -30,7 +32,7 @@ def test_python_server_json_encoder_handles_enum_map_keys_and_nested_dtos(tmp_pa
         "api_blueprint_generated.api.transports.http.gen_server",
     )
 
-    assert adapter_module._jsonable(
+    assert adapter_module.jsonable(
         {types_module.StatusEnum.OK: types_module.MapItem(value="ok")}
     ) == {"1": {"value": "ok"}}
 
@@ -65,7 +67,7 @@ def test_python_server_generates_service_core_and_fastapi_adapter(tmp_path: Path
     assert "await service.submit(" in adapter_text
     assert "await request.form(max_part_size=config.multipart_part_max_bytes)" in adapter_text
     assert "PayloadTooLargeError" in adapter_text
-    assert "asyncio.Queue(maxsize=max(1, queue_capacity))" in adapter_text
+    assert "self.capacity = max(1, capacity)" in runtime_text
     assert "except (UnicodeDecodeError, json.JSONDecodeError) as err:" in adapter_text
     assert 'raise HTTPException(status_code=400, detail="invalid JSON body") from err' in adapter_text
     assert "parse_qs" not in adapter_text
@@ -137,6 +139,407 @@ def test_python_server_adapter_qualifies_group_type_imports(tmp_path: Path):
     assert "from ...routes.api.demo import gen_types as api_demo_types" in adapter_text
     assert "from ...routes.api.hello import gen_types as api_hello_types" in adapter_text
     assert "from ...routes.api.demo.gen_types import" not in adapter_text
-    assert "query = api_demo_types.AbcQuery.from_value(query_raw, \"query\")" in adapter_text
-    assert "query = api_hello_types.AbcQuery.from_value(query_raw, \"query\")" in adapter_text
+    assert 'query = api_demo_types.AbcQuery.from_query_string(request.scope["query_string"], "query")' in adapter_text
+    assert 'query = api_hello_types.AbcQuery.from_query_string(request.scope["query_string"], "query")' in adapter_text
     _compile_generated_files(output_dir)
+
+
+def test_python_server_serializes_json_envelopes_with_configured_encoder(tmp_path: Path):
+    class DemoErr(Model):
+        BUSY = Error(42901, "busy")
+
+    bp = Blueprint(root="/api", errors=[DemoErr])
+    with bp.group("/demo") as views:
+        views.GET("/ok").RSP(Result)
+        views.GET("/busy").RSP(Result)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+    asyncio.run(_assert_python_server_json_encoder(output_dir))
+
+
+async def _assert_python_server_json_encoder(output_dir: Path) -> None:
+    gen_server = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+    runtime_server = sys.modules["api_blueprint_generated.api.runtime.server"]
+    runtime_errors = sys.modules["api_blueprint_generated.api.runtime.errors"]
+    gen_types = sys.modules["api_blueprint_generated.api.routes.api.demo.gen_types"]
+    encoded: list[object] = []
+
+    def encoder(value: object) -> bytes:
+        encoded.append(value)
+        return runtime_server.encode_json(value)
+
+    class DemoService:
+        async def ok(self):
+            return gen_types.OkResponse(status="ready")
+
+        async def busy(self):
+            raise runtime_errors.ApiError(runtime_errors.make_api_error_payload({"id": "DemoErr.BUSY"}))
+
+    from fastapi import FastAPI
+
+    app = FastAPI()
+    app.include_router(
+        gen_server.create_router(
+            demo_service=DemoService(),
+            config=runtime_server.ApiServerConfig(json_encoder=encoder),
+        )
+    )
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+        ok = await client.get("/api/demo/ok")
+        busy = await client.get("/api/demo/busy")
+
+    assert ok.status_code == 200
+    assert ok.headers["content-type"] == "application/json"
+    assert ok.content == b'{"code":0,"message":"ok","data":{"status":"ready"}}'
+    assert busy.status_code == 200
+    assert busy.json()["code"] == 42901
+    assert busy.json()["error"]["id"] == "DemoErr.BUSY"
+    assert len(encoded) == 2
+
+
+def test_python_server_emits_one_specialized_writer_pair_per_envelope(tmp_path: Path):
+    bp = Blueprint(root="/api", response_envelope=OkDataErrorEnvelope)
+    with bp.group("/demo") as views:
+        views.GET("/ok").RSP(Result)
+        views.GET("/again").RSP(Result)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    adapter_text = (output_dir / "api_blueprint_generated/api/transports/http/gen_server.py").read_text(encoding="utf-8")
+    assert adapter_text.count("def _wrap_ok_") == 1
+    assert adapter_text.count("def _wrap_error_") == 1
+    assert adapter_text.count("response = _wrap_ok_ok_data_error_envelope(result, api_config)") == 2
+    assert '"kind":' not in adapter_text
+
+    gen_server = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+    config = sys.modules["api_blueprint_generated.api.runtime.server"].ApiServerConfig()
+    assert gen_server._wrap_ok_ok_data_error_envelope({"status": "ready"}, config).body == (
+        b'{"ok":true,"data":{"status":"ready"}}'
+    )
+    assert " = envelope_json_bytes(write, '{\"ok\":true,\"data\":', \"}\")" in adapter_text
+    gen_types = sys.modules["api_blueprint_generated.api.routes.api.demo.gen_types"]
+    assert gen_server._wrap_ok_ok_data_error_envelope(gen_types.OkResponse(status="réady"), config).body == (
+        '{"ok":true,"data":{"status":"réady"}}'.encode("utf-8")
+    )
+
+
+def test_python_server_pydantic_core_backend_decodes_and_encodes_json_routes(tmp_path: Path):
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.POST("/submit").REQ(Payload).RSP(Result)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir, codec_backend="pydantic-core", model_slots=True)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+    asyncio.run(_assert_python_server_pydantic_core_backend(output_dir))
+
+
+async def _assert_python_server_pydantic_core_backend(output_dir: Path) -> None:
+    gen_server = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+    runtime_server = sys.modules["api_blueprint_generated.api.runtime.server"]
+    gen_types = sys.modules["api_blueprint_generated.api.routes.api.demo.gen_types"]
+
+    class DemoService:
+        async def submit(self, json):
+            assert type(json) is gen_types.SubmitJSON
+            return gen_types.SubmitResponse(status=json.value)
+
+    from fastapi import FastAPI
+
+    app = FastAPI()
+    app.include_router(gen_server.create_router(demo_service=DemoService(), config=runtime_server.ApiServerConfig()))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+        ok = await client.post("/api/demo/submit", json={"value": "sent"})
+        wrong_type = await client.post("/api/demo/submit", json={"value": 1})
+        missing = await client.post("/api/demo/submit", json={})
+
+    assert ok.content == b'{"code":0,"message":"ok","data":{"status":"sent"}}'
+    assert (wrong_type.status_code, wrong_type.json()) == (400, {"detail": "json.value: expected string"})
+    assert (missing.status_code, missing.json()) == (400, {"detail": "json.value: missing required field"})
+
+
+def test_python_server_asgi_transport_dispatches_json_routes_without_fastapi(tmp_path: Path):
+    class DemoErr(Model):
+        BUSY = Error(42901, "busy")
+
+    class ItemPath(Model):
+        item = String(description="item")
+
+    bp = Blueprint(root="/api", errors=[DemoErr])
+    with bp.group("/demo") as views:
+        views.GET("/ok").ARGS(trace=String(description="trace", omitempty=True)).RSP(Result)
+        views.GET("/items/{item}", operation_id="GetItem").REQ_PATH(ItemPath).RSP(Result)
+        views.POST("/submit").REQ(Payload).RSP(Result)
+        views.GET("/busy").RSP(Result)
+        views.POST("/form").REQ_FORM(Payload).RSP(Result)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    asgi_root = output_dir / "api_blueprint_generated" / "api" / "transports" / "asgi"
+    asgi_text = (asgi_root / "gen_server.py").read_text(encoding="utf-8")
+    assert (asgi_root / "server.py").read_text(encoding="utf-8").strip() == "from .gen_server import *"
+    assert "from fastapi" not in asgi_text.split("def _fastapi_fallback(", 1)[0]
+    assert 'routes.append(AsgiRoute("/api/demo/ok", ("GET",), demo_ok))' in asgi_text
+    assert 're.compile("^/api/demo/items/(?P<item>[^/]+)$")' in asgi_text
+    assert "async def demo_form(" not in asgi_text
+    assert "def _jsonable(" not in asgi_text
+    assert "api_error_payload, encode_json, envelope_json_bytes, jsonable" in asgi_text
+    asyncio.run(_assert_python_server_asgi_transport(output_dir))
+
+
+async def _assert_python_server_asgi_transport(output_dir: Path) -> None:
+    gen_asgi = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.asgi.gen_server")
+    runtime_server = sys.modules["api_blueprint_generated.api.runtime.server"]
+    runtime_errors = sys.modules["api_blueprint_generated.api.runtime.errors"]
+    gen_types = sys.modules["api_blueprint_generated.api.routes.api.demo.gen_types"]
+    calls: list[tuple[str, object]] = []
+
+    class DemoService:
+        async def ok(self, query):
+            calls.append(("ok", query.trace))
+            return gen_types.OkResponse(status="ready")
+
+        async def get_item(self, path):
+            calls.append(("get_item", path.item))
+            return gen_types.GetItemResponse(status=path.item)
+
+        async def submit(self, json):
+            calls.append(("submit", json.value))
+            return gen_types.SubmitResponse(status=json.value)
+
+        async def busy(self):
+            raise runtime_errors.ApiError(runtime_errors.make_api_error_payload({"id": "DemoErr.BUSY"}))
+
+        async def form(self, form):
+            calls.append(("form", form.value))
+            return gen_types.FormResponse(status=form.value)
+
+    from fastapi import FastAPI
+
+    config = runtime_server.ApiServerConfig(body_max_bytes=64)
+    service = DemoService()
+    app = gen_asgi.create_app(demo_service=service, config=config)
+    assert isinstance(app.fallback, FastAPI)
+    gen_http = sys.modules["api_blueprint_generated.api.transports.http.gen_server"]
+    fastapi_app = FastAPI()
+    fastapi_app.include_router(gen_http.create_router(demo_service=service, config=config))
+
+    async with (
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client,
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=fastapi_app), base_url="http://testserver") as reference,
+    ):
+        for method, url, kwargs in (
+            ("GET", "/api/demo/ok?trace=a&trace=b", {}),
+            ("GET", "/api/demo/items/hello%20world", {}),
+            ("POST", "/api/demo/submit", {"json": {"value": "sent"}}),
+            ("GET", "/api/demo/busy", {}),
+            ("POST", "/api/demo/submit", {"json": {"other": 1}}),
+        ):
+            response = await client.request(method, url, **kwargs)
+            expected = await reference.request(method, url, **kwargs)
+            assert (response.status_code, response.content) == (expected.status_code, expected.content), url
+            assert response.headers["content-type"] == "application/json"
+            assert response.headers["content-length"] == str(len(response.content))
+
+        invalid = await client.post("/api/demo/submit", content=b"{", headers={"content-type": "application/json"})
+        too_large = await client.post("/api/demo/submit", json={"value": "x" * 128})
+        form = await client.post("/api/demo/form", data={"value": "posted"})
+        missing = await client.get("/api/demo/missing")
+
+    assert invalid.status_code == 400
+    assert invalid.json() == {"detail": "invalid JSON body"}
+    assert too_large.status_code == 413
+    assert too_large.json() == {"detail": "request body exceeds configured limit"}
+    assert form.json()["data"] == {"status": "posted"}
+    assert missing.status_code == 404
+    assert ("get_item", "hello world") in calls
+    assert calls.count(("ok", "b")) == 2
+    assert gen_asgi._query_params({"query_string": b"tag=a&tag=b&tag=c&q=x+y&empty="}) == {
+        "tag": ["a", "b", "c"],
+        "q": "x y",
+        "empty": "",
+    }
+
+    bare = gen_asgi.ApiAsgiApp(gen_asgi.create_demo_routes(service, config=config))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=bare), base_url="http://testserver") as client:
+        not_allowed = await client.delete("/api/demo/ok")
+        not_found = await client.post("/api/demo/form", data={"value": "posted"})
+
+    assert not_allowed.status_code == 405
+    assert not_allowed.headers["allow"] == "GET"
+    assert not_found.status_code == 404
+
+
+def test_python_server_parses_raw_query_strings_per_route(tmp_path: Path):
+    class Sort(enum.StrEnum):
+        NEW = "new"
+        TOP = "top"
+
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as views:
+        views.GET("/search").ARGS(
+            q=String(description="q"),
+            page=Int(description="page", omitempty=True),
+            exact=Bool(description="exact", omitempty=True),
+            sort=Enum[Sort](description="sort", omitempty=True),
+            tags=Array[String](description="tags", omitempty=True),
+            ids=Array[Int](description="ids", omitempty=True),
+        ).RSP(Result)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+
+    types_text = (
+        output_dir / "api_blueprint_generated" / "api" / "routes" / "api" / "demo" / "gen_types.py"
+    ).read_text(encoding="utf-8")
+    asgi_text = (
+        output_dir / "api_blueprint_generated" / "api" / "transports" / "asgi" / "gen_server.py"
+    ).read_text(encoding="utf-8")
+    assert '_SearchQuery_QUERY_KEYS = frozenset({"q", "page", "exact", "sort", "tags", "ids"})' in types_text
+    assert "            elif key == \"tags\":\n                tags_value.append(item)\n" in types_text
+    assert 'ids=_decode_query_list(ids_value, (path, "ids"), _decode_query_int, optional=True),' in types_text
+    assert 'query = api_demo_types.SearchQuery.from_query_string(scope.get("query_string", b""), "query")' in asgi_text
+    assert "query_raw" not in asgi_text
+    asyncio.run(_assert_python_server_raw_query_strings(output_dir))
+
+
+async def _assert_python_server_raw_query_strings(output_dir: Path) -> None:
+    gen_asgi = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.asgi.gen_server")
+    gen_http = importlib.import_module("api_blueprint_generated.api.transports.http.gen_server")
+    gen_types = sys.modules["api_blueprint_generated.api.routes.api.demo.gen_types"]
+    calls: list[object] = []
+
+    class DemoService:
+        async def search(self, query):
+            calls.append(query)
+            return gen_types.SearchResponse(status="ok")
+
+    from fastapi import FastAPI
+
+    service = DemoService()
+    fastapi_app = FastAPI()
+    fastapi_app.include_router(gen_http.create_router(demo_service=service))
+    for app in (gen_asgi.create_app(demo_service=service), fastapi_app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+            full = await client.get(
+                "/api/demo/search?q=caf%C3%A9+bar&tags=a&other=%ZZ&tags=b%2Cc&ids=1&ids=2&page=3&exact=true&sort=top"
+            )
+            sparse = await client.get("/api/demo/search?q=&page=4&page=5")
+            bad_int = await client.get("/api/demo/search?q=x&ids=1&ids=two")
+            missing = await client.get("/api/demo/search?tags=a")
+
+        assert full.status_code == 200
+        assert sparse.status_code == 200
+        assert bad_int.status_code == 400
+        assert "query.ids[1]: expected int" in bad_int.text
+        assert missing.status_code == 400
+        assert "query.q: missing required field" in missing.text
+        assert calls[-2:] == [
+            gen_types.SearchQuery(q="café bar", page=3, exact=True, sort=gen_types.Sort.TOP, tags=["a", "b,c"], ids=[1, 2]),
+            gen_types.SearchQuery(q="", page=5),
+        ]
+
+
+def test_python_server_reports_route_timings_to_configured_hooks(tmp_path: Path):
+    class DemoErr(Model):
+        BUSY = Error(42901, "busy")
+
+    bp = Blueprint(root="/api", errors=[DemoErr])
+    with bp.group("/demo") as views:
+        views.POST("/submit").REQ(Payload).RSP(Result)
+        views.GET("/busy").RSP(Result)
+
+    output_dir = tmp_path / "python"
+    writer = PythonServerWriter(output_dir)
+    writer.register(bp)
+    writer.gen()
+    _compile_generated_files(output_dir)
+    runtime_root = output_dir / "api_blueprint_generated" / "api" / "runtime"
+    assert (runtime_root / "metrics.py").read_text(encoding="utf-8") == "from .gen_metrics import *\n"
+    asyncio.run(_assert_python_server_route_hooks(output_dir))
+
+
+async def _assert_python_server_route_hooks(output_dir: Path) -> None:
+    gen_http = _import_generated_module(output_dir, "api_blueprint_generated.api.transports.http.gen_server")
+    gen_asgi = importlib.import_module("api_blueprint_generated.api.transports.asgi.gen_server")
+    runtime_server = sys.modules["api_blueprint_generated.api.runtime.server"]
+    runtime_metrics = sys.modules["api_blueprint_generated.api.runtime.metrics"]
+    runtime_errors = sys.modules["api_blueprint_generated.api.runtime.errors"]
+    gen_types = sys.modules["api_blueprint_generated.api.routes.api.demo.gen_types"]
+    observations: list[object] = []
+
+    class Recorder(runtime_metrics.ApiRouteHistogram):
+        def on_request_start(self, route_id):
+            return f"span:{route_id}"
+
+        def on_request_end(self, observation):
+            observations.append(observation)
+            super().on_request_end(observation)
+
+    class DemoService:
+        async def submit(self, json):
+            return gen_types.SubmitResponse(status=json.value)
+
+        async def busy(self):
+            raise runtime_errors.ApiError(runtime_errors.make_api_error_payload({"id": "DemoErr.BUSY"}))
+
+    from fastapi import FastAPI
+
+    hooks = Recorder(buckets=(60.0,))
+    config = runtime_server.ApiServerConfig(route_hooks=hooks)
+    fastapi_app = FastAPI()
+    fastapi_app.include_router(gen_http.create_router(demo_service=DemoService(), config=config))
+    asgi_app = gen_asgi.create_app(demo_service=DemoService(), config=config)
+    for app in (fastapi_app, asgi_app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+            ok = await client.post("/api/demo/submit", json={"value": "sent"})
+            await client.get("/api/demo/busy")
+            await client.post("/api/demo/submit", json={"other": 1})
+
+    assert [(item.route_id, item.status, item.error_code) for item in observations] == [
+        ("api.demo.post.submit", 200, None),
+        ("api.demo.get.busy", 200, 42901),
+        ("api.demo.post.submit", 400, None),
+    ] * 2
+    submitted = observations[0]
+    assert submitted.method == "POST"
+    assert submitted.span == "span:api.demo.post.submit"
+    assert submitted.bytes_in == len(b'{"value":"sent"}')
+    assert submitted.bytes_out == len(ok.content)
+    assert submitted.total_seconds == pytest.approx(
+        submitted.decode_seconds + submitted.handler_seconds + submitted.encode_seconds
+    )
+    assert observations[2].handler_seconds == observations[2].encode_seconds == 0
+
+    assert hooks.quantile("api.demo.post.submit", 0.99) == pytest.approx(59.4)
+    assert hooks.quantile("api.demo.missing", 0.99) is None
+    text = hooks.prometheus_text()
+    assert '# TYPE api_blueprint_route_duration_seconds histogram' in text
+    assert 'api_blueprint_route_duration_seconds_count{route="api.demo.post.submit",phase="handler"} 4' in text
+    assert 'api_blueprint_route_duration_seconds_bucket{route="api.demo.get.busy",phase="total",le="60"} 2' in text
+    assert 'api_blueprint_route_requests_total{route="api.demo.post.submit",status="400"} 2' in text
+    assert 'api_blueprint_route_errors_total{route="api.demo.get.busy",code="42901"} 2' in text
+    assert f'api_blueprint_route_bytes_in_total{{route="api.demo.post.submit"}} {2 * (16 + 11)}' in text
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi_app), base_url="http://testserver") as client:
+        invalid = await client.post("/api/demo/submit", content=b"{", headers={"content-type": "application/json"})
+
+    assert invalid.status_code == 400
+    assert (observations[-1].route_id, observations[-1].status) == ("api.demo.post.submit", 400)
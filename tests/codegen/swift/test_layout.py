@@ -217,7 +217,8 @@ def test_swift_writer_generates_spm_runtime_routes_transport_and_preserved_files
 
     assert "{\n\n    public static let" not in runtime_error_lookup
     assert "commonErrUnknown = 40000\n\n    public static let demoErrUnknown" not in runtime_error_lookup
-    assert "switch code {\n\n" not in runtime_error_lookup
+    assert "[Int: APIErrorPayload] = [\n\n" not in runtime_error_lookup
+    assert "public func lookupAPIError(code: Int) -> APIErrorPayload? {\n    apiErrorPayloadsByCode[code]\n}" in runtime_error_lookup
     assert "{\n\n    case " not in runtime_types
     assert "{\n\n    case " not in route_types
     assert "switch type {\n\n" not in route_types
@@ -40,6 +40,7 @@ def test_typescript_writer_generates_error_catalog_runtime(tmp_path: Path):
     assert '"CommonErr.UNKNOWN"' in catalog_text
     assert "ApiErrorsByID" in catalog_text
     assert "RouteApiErrorsByCode" in catalog_text
+    assert "  return ApiErrorsByCode[code];" in catalog_text
     assert "lookupApiError(payload" in catalog_text
     assert "TOKEN_EXPIRE: 55555" in catalog_text
     assert 'default: "登录状态已失效，请重新登录"' in catalog_text
@@ -65,9 +65,9 @@ def test_markdown_binary_schema_parses_fenced_metadata_block() -> None:
 
 
 def test_markdown_binary_schema_rejects_unknown_content_encoding() -> None:
-    bad_schema = VALID_SCHEMA.replace("content-encoding: identity,gzip,br", "content-encoding: identity,zstd")
+    bad_schema = VALID_SCHEMA.replace("content-encoding: identity,gzip,br", "content-encoding: identity,deflate")
 
-    with pytest.raises(BinarySchemaError, match="unsupported content-encoding: zstd"):
+    with pytest.raises(BinarySchemaError, match="unsupported content-encoding: deflate"):
         parse_binary_schema(bad_schema, source_path="bad_encoding.md")
 
 
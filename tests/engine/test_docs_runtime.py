@@ -9,7 +9,7 @@ from fastapi.testclient import TestClient
 
 from api_blueprint.engine import Blueprint, message_variant, reset_shared_app
 from api_blueprint.engine.model import Array, Enum, Int, Model, String
-from api_blueprint.engine.runtime.docs import set_protocol_docs_plugins
+from api_blueprint.engine.runtime.docs import _SchemaNameRewriter, set_protocol_docs_plugins
 
 
 class MessageMeta(Model):
@@ -744,6 +744,41 @@ def test_protocol_and_asyncapi_use_public_schema_names_without_internal_hashes()
     assert "#/components/schemas/MessageApiSocketBChannelServerItem" in payload_refs
 
 
+def test_public_schema_names_are_computed_once_per_docs_version() -> None:
+    bp = _build_duplicate_protocol_schema_docs_blueprint()
+    client = TestClient(bp.app)
+
+    first = client.get("/docs/protocol.json").json()
+    cache = bp.app.state.api_blueprint_docs_openapi_cache
+    public = next(value for key, value in cache.items() if key[1] == "protocol-schemas")
+    client.get("/asyncapi.json")
+    assert [key for key in cache if key[1] == "protocol-schemas"] == [(bp.app.state.api_blueprint_docs_version, "protocol-schemas")]
+    assert cache[(bp.app.state.api_blueprint_docs_version, "protocol-schemas")] is public
+    assert client.get("/docs/protocol.json").json() == first
+
+    openapi = bp.app.openapi()
+    assert bp.app.openapi() is openapi
+
+
+def test_schema_name_rewriter_prefers_the_longest_raw_name() -> None:
+    rewriter = _SchemaNameRewriter({"User": "UserA", "User__abc123": "UserB", "Same": "Same"})
+    node = {
+        "$ref": "#/components/schemas/User__abc123",
+        "description": "[User__abc123] or [User]",
+        "required": ["User"],
+        "items": [{"$ref": "#/components/schemas/User"}],
+    }
+
+    rewriter.rewrite(node)
+
+    assert node == {
+        "$ref": "#/components/schemas/UserB",
+        "description": "[UserB] or [UserA]",
+        "required": ["User"],
+        "items": [{"$ref": "#/components/schemas/UserA"}],
+    }
+
+
 def test_openapi_enum_values_and_names_are_exposed_in_full_and_sliced_specs() -> None:
     bp = _build_enum_docs_blueprint()
     client = TestClient(bp.app)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from api_blueprint.engine import Blueprint, Model, UpstreamClientOptions, reset_shared_app
+from api_blueprint.engine.model import Int, String
+
+
+class EchoBody(Model):
+    name = String(description="name")
+    count = Int(description="count")
+
+
+async def _upstream_echo(request: Request) -> Response:
+    body = await request.body()
+    response = Response(
+        content=body,
+        media_type=request.headers.get("content-type", "application/octet-stream"),
+        headers={"x-upstream-query": request.url.query},
+    )
+    response.raw_headers.append((b"set-cookie", b"a=1"))
+    response.raw_headers.append((b"set-cookie", b"b=2"))
+    return response
+
+
+def _build_proxy_blueprint(transport: httpx.AsyncBaseTransport) -> Blueprint:
+    reset_shared_app()
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as demo:
+        demo.POST("/echo").REQ(EchoBody).RSP(message=String(description="message"))
+        demo.GET("/ping").RSP(message=String(description="message"))
+    bp.set_upstream("http://upstream.test/", UpstreamClientOptions(transport=transport))
+    bp.build()
+    return bp
+
+
+def test_upstream_proxy_relays_json_bytes_verbatim_and_reuses_pooled_client() -> None:
+    upstream_app = Starlette(
+        routes=[
+            Route("/api/demo/echo", _upstream_echo, methods=["POST"]),
+            Route("/api/demo/ping", _upstream_echo, methods=["GET"]),
+        ]
+    )
+    bp = _build_proxy_blueprint(httpx.ASGITransport(app=upstream_app))
+    raw_json = b'{"name":  "demo",   "count": 1}'
+
+    with TestClient(bp.app) as client:
+        response = client.post(
+            "/api/demo/echo",
+            content=raw_json,
+            headers={"content-type": "application/json"},
+        )
+        ping = client.get("/api/demo/ping?tag=a&tag=b")
+        pooled_clients = list(bp.upstream_client._clients.values())  # type: ignore[union-attr]
+
+    assert response.status_code == 200
+    assert response.content == raw_json
+    assert response.headers.get_list("set-cookie") == ["a=1", "b=2"]
+    assert ping.headers["x-upstream-query"] == "tag=a&tag=b"
+    assert len(pooled_clients) == 1
+    assert pooled_clients[0].is_closed
+
+
+def test_set_upstream_closes_replaced_client_and_registers_one_shutdown_hook() -> None:
+    upstream_app = Starlette(routes=[Route("/api/demo/ping", _upstream_echo, methods=["GET"])])
+    bp = _build_proxy_blueprint(httpx.ASGITransport(app=upstream_app))
+    hooks = len(bp.app.router.on_shutdown)
+
+    with TestClient(bp.app) as client:
+        client.get("/api/demo/ping")
+        replaced = list(bp.upstream_client._clients.values())  # type: ignore[union-attr]
+        bp.set_upstream("http://upstream.test/", UpstreamClientOptions(transport=httpx.ASGITransport(app=upstream_app)))
+        response = client.get("/api/demo/ping")
+        current = list(bp.upstream_client._clients.values())  # type: ignore[union-attr]
+
+    assert response.status_code == 200
+    assert len(bp.app.router.on_shutdown) == hooks
+    assert len(replaced) == 1 and replaced[0].is_closed
+    assert len(current) == 1 and current[0].is_closed
+
+
+def test_upstream_http2_without_h2_fails_with_install_hint(monkeypatch) -> None:
+    import importlib.util
+
+    from api_blueprint.engine.runtime.upstream import UpstreamClient
+
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name, *args: None if name == "h2" else find_spec(name, *args))
+
+    with pytest.raises(RuntimeError, match=r"api-blueprint\[http2\]"):
+        UpstreamClient("http://upstream.test", UpstreamClientOptions(http2=True))
+
+
+def test_upstream_proxy_returns_bad_gateway_when_upstream_is_unreachable() -> None:
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    bp = _build_proxy_blueprint(httpx.MockTransport(refuse))
+
+    with TestClient(bp.app) as client:
+        response = client.get("/api/demo/ping")
+
+    assert response.status_code == 502
+    assert "Bad Gateway" in response.text
+
+
+def test_upstream_proxy_closes_the_request_scoped_client_when_upstream_is_assigned_directly(monkeypatch) -> None:
+    from api_blueprint.engine.runtime import registration
+    from api_blueprint.engine.runtime.upstream import UpstreamClient
+
+    upstream_app = Starlette(routes=[Route("/api/demo/ping", _upstream_echo, methods=["GET"])])
+    created: list[UpstreamClient] = []
+
+    class RecordingUpstreamClient(UpstreamClient):
+        def __init__(self, base_url: str) -> None:
+            super().__init__(base_url, UpstreamClientOptions(transport=httpx.ASGITransport(app=upstream_app)))
+            created.append(self)
+
+    monkeypatch.setattr(registration, "UpstreamClient", RecordingUpstreamClient)
+    reset_shared_app()
+    bp = Blueprint(root="/api")
+    with bp.group("/demo") as demo:
+        demo.GET("/ping").RSP(message=String(description="message"))
+    bp.upstream = "http://upstream.test"
+    bp.build()
+
+    with TestClient(bp.app) as client:
+        response = client.get("/api/demo/ping?tag=a")
+        opened = [pooled for upstream in created for pooled in upstream._clients.values()]
+
+    assert response.status_code == 200
+    assert response.headers["x-upstream-query"] == "tag=a"
+    assert bp.upstream_client is None
+    assert len(created) == 1
+    assert opened == []
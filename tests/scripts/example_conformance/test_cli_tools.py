@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import tomllib
+
 from .helpers import *
 from scripts.example_conformance import workspace as conformance_workspace
 
@@ -24,7 +26,7 @@ def test_cli_list_reports_servers_clients_and_scenarios(capsys: pytest.CaptureFi
     assert "- binary" in output
 
 def test_cli_run_invokes_runner_with_filters(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    calls: list[tuple[Path, tuple[str, ...], tuple[str, ...], tuple[str, ...], bool, str]] = []
+    calls: list[tuple[Path, tuple[str, ...], tuple[str, ...], tuple[str, ...], bool, str, str]] = []
 
     def fake_run(
         repo_root: Path,
@@ -34,8 +36,11 @@ def test_cli_run_invokes_runner_with_filters(monkeypatch: pytest.MonkeyPatch, tm
         scenario_names: tuple[str, ...],
         keep_workspace: bool,
         swift_runtime_profile: str,
+        python_codec_backend: str,
     ) -> None:
-        calls.append((repo_root, servers, clients, scenario_names, keep_workspace, swift_runtime_profile))
+        calls.append(
+            (repo_root, servers, clients, scenario_names, keep_workspace, swift_runtime_profile, python_codec_backend)
+        )
 
     monkeypatch.setattr(cli.runner, "run_conformance", fake_run)
 
@@ -52,13 +57,15 @@ def test_cli_run_invokes_runner_with_filters(monkeypatch: pytest.MonkeyPatch, tm
             "rpc,binary",
             "--swift-runtime-profile",
             "ios14-compat",
+            "--python-codec-backend",
+            "pydantic-core",
             "--keep-workspace",
         ]
     )
 
     assert result == 0
     assert calls == [
-        (tmp_path.resolve(), ("go", "kotlin"), ("go", "flutter"), ("rpc", "binary"), True, "ios14-compat")
+        (tmp_path.resolve(), ("go", "kotlin"), ("go", "flutter"), ("rpc", "binary"), True, "ios14-compat", "pydantic-core")
     ]
 
 def test_cli_generate_invokes_runner(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
@@ -114,9 +121,52 @@ runtime_profile = "modern"
     assert result.root == tmp_path
     assert 'runtime_profile = "ios14-compat"' in generated_configs[0]
 
+def test_prepare_generated_workspace_overrides_python_codec_backend(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    config = tmp_path / "api-blueprint.toml"
+    config.write_text(
+        """
+[[python.server]]
+id = "python.server"
+out_dir = "python/server"
+options = { model_slots = true }
+
+[[python.client]]
+id = "python.client"
+out_dir = "python/client"
+
+[[transport.http]]
+id = "http.python"
+""".lstrip(),
+        encoding="utf-8",
+    )
+    fake_workspace = SimpleNamespace(root=tmp_path, config_path=config)
+    generated_configs: list[str] = []
+
+    monkeypatch.setattr(
+        conformance_workspace.example_validation,
+        "prepare_blueprint_workspace",
+        lambda repo_root: fake_workspace,
+    )
+    monkeypatch.setattr(
+        conformance_workspace.example_validation,
+        "regenerate_blueprint_examples",
+        lambda workspace: generated_configs.append(workspace.config_path.read_text(encoding="utf-8")),
+    )
+
+    conformance_workspace.prepare_generated_workspace(tmp_path, python_codec_backend="pydantic-core")
+
+    targets = tomllib.loads(generated_configs[0])["python"]
+    assert targets["server"][0]["options"] == {"model_slots": True, "codec_backend": "pydantic-core"}
+    assert targets["client"][0]["options"] == {"codec_backend": "pydantic-core"}
+    with pytest.raises(ValueError, match="python codec backend"):
+        conformance_workspace.prepare_generated_workspace(tmp_path, python_codec_backend="msgspec")
+
 def test_cli_check_and_refresh_invoke_runner(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    check_calls: list[tuple[Path, tuple[str, ...], tuple[str, ...], tuple[str, ...], bool, str]] = []
-    refresh_calls: list[tuple[Path, tuple[str, ...], tuple[str, ...], tuple[str, ...], str]] = []
+    check_calls: list[tuple[Path, tuple[str, ...], tuple[str, ...], tuple[str, ...], bool, str, str]] = []
+    refresh_calls: list[tuple[Path, tuple[str, ...], tuple[str, ...], tuple[str, ...], str, str]] = []
 
     def fake_check(
         repo_root: Path,
@@ -126,8 +176,11 @@ def test_cli_check_and_refresh_invoke_runner(monkeypatch: pytest.MonkeyPatch, tm
         scenario_names: tuple[str, ...],
         keep_workspace: bool,
         swift_runtime_profile: str,
+        python_codec_backend: str,
     ) -> None:
-        check_calls.append((repo_root, servers, clients, scenario_names, keep_workspace, swift_runtime_profile))
+        check_calls.append(
+            (repo_root, servers, clients, scenario_names, keep_workspace, swift_runtime_profile, python_codec_backend)
+        )
 
     def fake_refresh(
         repo_root: Path,
@@ -136,8 +189,9 @@ def test_cli_check_and_refresh_invoke_runner(monkeypatch: pytest.MonkeyPatch, tm
         clients: tuple[str, ...],
         scenario_names: tuple[str, ...],
         swift_runtime_profile: str,
+        python_codec_backend: str,
     ) -> None:
-        refresh_calls.append((repo_root, servers, clients, scenario_names, swift_runtime_profile))
+        refresh_calls.append((repo_root, servers, clients, scenario_names, swift_runtime_profile, python_codec_backend))
 
     monkeypatch.setattr(cli.runner, "check_conformance", fake_check)
     monkeypatch.setattr(cli.runner, "refresh_and_check", fake_refresh)
@@ -174,8 +228,10 @@ def test_cli_check_and_refresh_invoke_runner(monkeypatch: pytest.MonkeyPatch, tm
 
     assert check_result == 0
     assert refresh_result == 0
-    assert check_calls == [(tmp_path.resolve(), ("go",), ("typescript", "kotlin"), ("form", "error"), True, "modern")]
-    assert refresh_calls == [(tmp_path.resolve(), ("go", "kotlin"), ("flutter",), ("sse",), "ios14-compat")]
+    assert check_calls == [
+        (tmp_path.resolve(), ("go",), ("typescript", "kotlin"), ("form", "error"), True, "modern", "builtin")
+    ]
+    assert refresh_calls == [(tmp_path.resolve(), ("go", "kotlin"), ("flutter",), ("sse",), "ios14-compat", "builtin")]
 
 def test_cli_rejects_conflicting_server_flags(capsys: pytest.CaptureFixture[str]) -> None:
     result = cli.main(["run", "--server", "go", "--servers", "java"])
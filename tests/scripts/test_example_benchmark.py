@@ -9,7 +9,16 @@ from types import SimpleNamespace
 
 import pytest
 
-from scripts.example_benchmark import binary, cli, protocol, swift_runtime
+from scripts.example_benchmark import (
+    binary,
+    cli,
+    protocol,
+    python_asgi,
+    python_codecs,
+    python_envelope,
+    python_models,
+    swift_runtime,
+)
 
 
 def test_example_benchmark_help_and_list() -> None:
@@ -44,6 +53,10 @@ def test_example_benchmark_help_and_list() -> None:
     assert "sdk smoke scenarios:" in list_result.stdout
     assert "swift runtime scenarios:" in list_result.stdout
     assert "- json-envelope" in list_result.stdout
+    assert "python envelope scenarios:" in list_result.stdout
+    assert "python asgi scenarios:" in list_result.stdout
+    assert "python models scenarios:" in list_result.stdout
+    assert "python codecs scenarios:" in list_result.stdout
 
 
 def test_example_benchmark_protocol_rejects_unknown_filter() -> None:
@@ -313,6 +326,53 @@ def test_swift_runtime_benchmark_rejects_unknown_scenario() -> None:
         swift_runtime.parse_scenarios("missing")
 
 
+def test_python_envelope_benchmark_compares_generated_writers(capsys: pytest.CaptureFixture[str]) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+
+    assert cli.main(["--repo-root", str(repo_root), "python-envelope", "--count", "5"]) == 0
+
+    output = capsys.readouterr().out
+    assert "scenario=wrap-ok count=5" in output
+    assert "scenario=wrap-error count=5" in output
+    with pytest.raises(ValueError, match="unknown Python envelope benchmark scenario"):
+        python_envelope.parse_scenarios("missing")
+
+
+def test_python_asgi_benchmark_compares_transports(capsys: pytest.CaptureFixture[str]) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+
+    assert cli.main(["--repo-root", str(repo_root), "python-asgi", "--count", "3"]) == 0
+
+    output = capsys.readouterr().out
+    for scenario in python_asgi.SCENARIOS:
+        assert f"scenario={scenario} count=3" in output
+    with pytest.raises(ValueError, match="unknown Python ASGI benchmark scenario"):
+        python_asgi.parse_scenarios("missing")
+
+
+def test_python_models_benchmark_compares_model_modes(capsys: pytest.CaptureFixture[str]) -> None:
+    assert cli.main(["python-models", "--count", "20"]) == 0
+
+    output = capsys.readouterr().out
+    for scenario in python_models.SCENARIOS:
+        assert f"scenario={scenario} count=20 dict=" in output
+    assert "slots-frozen=" in output
+    with pytest.raises(ValueError, match="unknown Python models benchmark scenario"):
+        python_models.parse_scenarios("missing")
+
+
+def test_python_codecs_benchmark_reports_speedup_per_shape(capsys: pytest.CaptureFixture[str]) -> None:
+    assert cli.main(["python-codecs", "--count", "5"]) == 0
+
+    output = capsys.readouterr().out
+    for scenario in python_codecs.SCENARIOS:
+        assert f"scenario={scenario} count=5 decode-builtin=" in output
+    assert "decode-speedup=" in output
+    assert "encode-pydantic-core=" in output
+    with pytest.raises(ValueError, match="unknown Python codecs benchmark scenario"):
+        python_codecs.parse_scenarios("missing")
+
+
 def test_protocol_benchmark_suppresses_setup_noise(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,